@@ -0,0 +1,187 @@
+"""Event-driven dashboard runtime on asyncio (``ASYNC_RUNTIME=1``).
+
+The polling :func:`src.main.main_loop` wakes every second to look for
+changes. :func:`run_event_driven` drives the same
+:class:`~src.main.DashboardLoop` steps from events instead:
+
+* the wall-clock minute tick,
+* bus and weather fetch completions (fetches run on a two-thread pool, on
+  their usual refresh intervals, so they start concurrently at startup),
+* Discord message arrival (:meth:`MessageBridge.add_listener`),
+* the animation frame timer, only while a weather animation is active,
+* a housekeeping tick every few seconds: keep-alive ping and reboot
+  recovery, Discord bot death, the watchdog heartbeat and stop requests.
+
+A frame is built only when one of these fires, so without an animation the
+loop wakes about fifteen times a minute instead of sixty, and a message
+is shown as soon as it arrives rather than on the next poll. Staleness
+flags are re-evaluated on the minute tick, not every second.
+
+Device I/O stays on the event loop thread: a hung push starves the
+heartbeat and trips the watchdog exactly as in the polling loop. So do
+all state changes: only the provider network fetches run on the pool, and
+their results (staleness, breakers, animation swaps) are applied back on
+the loop thread. The replay harness's simulated clock only drives the
+polling loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timezone
+from typing import TYPE_CHECKING, Any
+
+from src import timesource
+from src.config import BUS_REFRESH_INTERVAL, WEATHER_REFRESH_INTERVAL
+
+if TYPE_CHECKING:
+    from src.main import DashboardLoop
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive, bot death, heartbeat and stop checks; well inside the
+# watchdog timeout and the device ping interval
+HOUSEKEEPING_INTERVAL = 5.0
+
+
+def seconds_to_next_minute() -> float:
+    """Seconds until just after the next wall-clock minute boundary."""
+    now = timesource.now()
+    return 60.0 - now.second - now.microsecond / 1_000_000 + 0.05
+
+
+async def run_event_driven(
+    loop: DashboardLoop, *, startup_marks: list[tuple[str, float]] | None = None
+) -> None:
+    """Run *loop* until its stop event is set, rendering only on events.
+
+    The watchdog must already be running (``loop.start_watchdog()``).
+
+    Args:
+        loop: Dashboard collaborators and steps, shared with the polling loop.
+        startup_marks: Optional startup milestones; the first paint is
+            appended and the breakdown logged.
+    """
+    aio = asyncio.get_running_loop()
+    wake = asyncio.Event()
+    ds = loop.ds
+
+    def notify() -> None:
+        aio.call_soon_threadsafe(wake.set)
+
+    if loop.message_bridge is not None:
+        loop.message_bridge.add_listener(notify)
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="provider-fetch")
+
+    async def refresher(
+        name: str,
+        due: Callable[[], bool],
+        fetch: Callable[[], Any],
+        apply: Callable[[Any], None],
+        interval: float,
+    ) -> None:
+        # DashboardState gates fetches on their interval and circuit breaker.
+        # Only the network fetch runs on the pool; the due check and applying
+        # the result (staleness, breakers, animation swap) stay on this
+        # thread with the renderer. Timed with record(), not stage(): the
+        # in-progress stage names what the loop thread is doing, for the
+        # watchdog's hang report.
+        while True:
+            started = time.perf_counter()
+            if due():
+                apply(await aio.run_in_executor(executor, fetch))
+            loop.timings.record(name, time.perf_counter() - started)
+            wake.set()
+            await asyncio.sleep(interval)
+
+    async def minute_ticker() -> None:
+        while True:
+            await asyncio.sleep(seconds_to_next_minute())
+            wake.set()
+
+    async def housekeeping() -> None:
+        while not loop.stop_event.is_set():
+            loop.check_bot()
+            loop.tick_keepalive(timesource.monotonic())
+            loop.heartbeat.beat()
+            await asyncio.sleep(HOUSEKEEPING_INTERVAL)
+
+    async def renderer() -> None:
+        # Keep the first paint (e.g. the snapshot) until something happens,
+        # normally the first fetch completing
+        await wake.wait()
+        while True:
+            started = time.perf_counter()
+            wake.clear()
+            loop.step(timesource.now(), timesource.now(timezone.utc))
+            elapsed = time.perf_counter() - started
+            loop.timings.record("iteration", elapsed)
+            ds.iterations += 1
+            if ds.weather_anim is not None:
+                # Frame timer: hold the device's push cadence; events in
+                # between are picked up by the next frame
+                interval = loop.client.push_interval
+                if elapsed > interval:
+                    ds.overruns += 1
+                await asyncio.sleep(max(0.0, interval - elapsed))
+            elif ds.needs_push:
+                # A skipped push: retry once the device accepts one, or sooner
+                # on an event
+                await _wait(wake, loop.retry_delay())
+            else:
+                await wake.wait()
+                # Render for the device's next push slot rather than one that
+                # would be skipped
+                await asyncio.sleep(loop.client.next_push_delay())
+
+    loop.first_paint(startup_marks)
+    tasks = [
+        asyncio.create_task(renderer(), name="renderer"),
+        asyncio.create_task(
+            refresher(
+                "bus_refresh",
+                lambda: ds.bus_due(timesource.monotonic(), loop.bus_breaker),
+                ds.fetch_bus,
+                loop.apply_bus,
+                BUS_REFRESH_INTERVAL,
+            ),
+            name="bus-refresh",
+        ),
+        asyncio.create_task(
+            refresher(
+                "weather_refresh",
+                lambda: loop.weather_due(timesource.monotonic(), timesource.now(timezone.utc)),
+                ds.fetch_weather,
+                lambda weather: loop.apply_weather(weather, timesource.now(timezone.utc)),
+                WEATHER_REFRESH_INTERVAL,
+            ),
+            name="weather-refresh",
+        ),
+        asyncio.create_task(minute_ticker(), name="minute-tick"),
+        asyncio.create_task(housekeeping(), name="housekeeping"),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()  # re-raise a crashed task's exception
+        logger.info("Event-driven loop stopped")
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if loop.message_bridge is not None:
+            loop.message_bridge.remove_listener(notify)
+        # In-flight fetches finish on their own; do not wait for them
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _wait(event: asyncio.Event, timeout: float) -> None:
+    """Wait for *event* at most *timeout* seconds."""
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+    except asyncio.TimeoutError:  # not the builtin TimeoutError before 3.11
+        pass
@@ -10,7 +10,8 @@ backing off when the failure threshold is reached. Three states:
 
 import logging
 import threading
-import time
+
+from src import events, timesource
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,12 @@ class CircuitBreaker:
                     "%s circuit breaker CLOSED -- service recovered",
                     self.name,
                 )
+                events.record(
+                    events.EventType.BREAKER_CLOSED,
+                    duration=timesource.monotonic() - self._opened_at,  # outage length
+                    value=self.failure_count,
+                    source=self.name,
+                )
             self.failure_count = 0
             self.state = "closed"
 
@@ -54,8 +61,14 @@ class CircuitBreaker:
                         self.name,
                         self.reset_timeout,
                     )
+                    events.record(
+                        events.EventType.BREAKER_OPEN,
+                        events.EventResult.ERROR,
+                        value=self.failure_count,
+                        source=self.name,
+                    )
                 self.state = "open"
-                self._opened_at = time.monotonic()
+                self._opened_at = timesource.monotonic()
 
     def should_attempt(self) -> bool:
         """Return True if a request should be attempted."""
@@ -63,12 +76,13 @@ class CircuitBreaker:
             if self.state == "closed":
                 return True
             if self.state == "open":
-                if time.monotonic() - self._opened_at >= self.reset_timeout:
+                if timesource.monotonic() - self._opened_at >= self.reset_timeout:
                     self.state = "half_open"
                     logger.info(
                         "%s circuit breaker testing recovery...",
                         self.name,
                     )
+                    events.record(events.EventType.BREAKER_HALF_OPEN, source=self.name)
                     return True
                 return False
             # half_open: allow one attempt
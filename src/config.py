@@ -1,20 +1,25 @@
 """Configuration constants for Pixoo Dashboard."""
 
+import functools
 import ipaddress
 import logging
 import os
 import subprocess
 import sys
 import threading
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from types import MappingProxyType
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+_N = TypeVar("_N")
+_D = TypeVar("_D")
+
 
 def _get_keychain_secret(service: str, account: str) -> str | None:
     """Retrieve a secret from macOS Keychain. Returns None on any failure."""
@@ -47,11 +52,20 @@ class Config:
     def __init__(self) -> None:
         load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
+        # Numeric env vars that failed to parse (name, raw value); the default
+        # is used instead and validate_config() reports them
+        self.INVALID_ENV: list[tuple[str, str]] = []
+
         # Project root (parent of src/)
         self.PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
         # Device settings
-        self.DEVICE_IP = os.environ.get("DIVOOM_IP", "192.168.1.100")
+        # DIVOOM_IP may list several comma-separated devices showing the same
+        # dashboard; DEVICE_IP is the first (primary) one.
+        self.DEVICE_IPS = [
+            ip.strip() for ip in os.environ.get("DIVOOM_IP", "192.168.1.100").split(",")
+        ]
+        self.DEVICE_IP = self.DEVICE_IPS[0]
         self.DISPLAY_SIZE = 64
         # Font settings
         self.FONT_DIR = self.PROJECT_ROOT / "assets" / "fonts"
@@ -76,13 +90,34 @@ class Config:
         self.DEVICE_REBOOT_THRESHOLD = 5
         self.DEVICE_REBOOT_RECOVERY_WAIT = 30
         self.WATCHDOG_TIMEOUT = 120
+        # Thread stacks + loop state captured by the watchdog before it kills
+        self.WATCHDOG_REPORT_PATH = self.PROJECT_ROOT / "hang_report.json"
 
         # --- Device communication ---
         self.DEVICE_HTTP_TIMEOUT = 5
-        self.DEVICE_MIN_PUSH_INTERVAL = 1.0
+        # Adaptive push rate: fastest allowed interval (floor), slowest
+        # back-off interval (ceiling) and the congestion latency threshold.
+        # Only lower the floor for firmware known to handle faster pushes.
+        self.DEVICE_MIN_PUSH_INTERVAL = self._env_number("DIVOOM_MIN_PUSH_INTERVAL", 1.0, float)
+        self.DEVICE_MAX_PUSH_INTERVAL = 5.0
+        self.DEVICE_PUSH_LATENCY_TARGET = 0.8
         self.DEVICE_ERROR_COOLDOWN_BASE = 3.0
         self.DEVICE_ERROR_COOLDOWN_MAX = 60.0
 
+        # --- Rendering ---
+        self.FRAME_CACHE_SIZE = 32  # rendered frames kept for repeated display states
+        self.HEADLESS_RING_SIZE = 600  # frames kept in memory by --headless (~10 min)
+        # Weather animation swaps cross-fade over this many frames (0 = cut);
+        # a blended frame slower than the budget ends the fade early
+        self.ANIM_TRANSITION_FRAMES = 4
+        self.ANIM_TRANSITION_BUDGET = 0.05  # seconds of animation work per frame
+        # Animation sub-frames per push, uploaded as one multi-frame device
+        # animation (1 = one frame per push; only for real devices)
+        self.ANIM_SUBFRAMES = max(1, self._env_number("ANIM_SUBFRAMES", 1, int))
+        # Smoothed animated frame time (tick + render + encode) above which
+        # particle counts are scaled down; well inside the 1s push interval
+        self.ANIM_FRAME_BUDGET = 0.25
+
         # --- Health tracker debounce (frozen to prevent accidental mutation) ---
         self.HEALTH_DEBOUNCE = MappingProxyType(
             {
@@ -118,15 +153,45 @@ class Config:
             "pixoo-dashboard/1.0",
         )
 
-        # Discord message override settings
-        self.DISCORD_BOT_TOKEN = _get_keychain_secret(
-            "discord-bot-token", "discord-bot-token"
-        ) or os.environ.get("DISCORD_BOT_TOKEN")
+        # Discord message override settings (DISCORD_BOT_TOKEN: see property)
         self.DISCORD_CHANNEL_ID = os.environ.get("DISCORD_CHANNEL_ID")
         self.DISCORD_MONITOR_CHANNEL_ID = os.environ.get(
             "DISCORD_MONITOR_CHANNEL_ID",
         )
 
+        # Local observability (optional): per-stage loop timings and an HTTP
+        # metrics endpoint bound to localhost. Timings are on by default (they
+        # cost ~15 us per iteration) so watchdog hang reports can name the
+        # stuck stage; STAGE_TIMING=0 disables them unless a port is set.
+        self.METRICS_PORT: int | None = self._env_number("METRICS_PORT", None, int)
+        self.STAGE_TIMING_ENABLED = (
+            os.environ.get("STAGE_TIMING", "1").lower() not in ("0", "false", "no", "off")
+            or self.METRICS_PORT is not None
+        )
+        # Event-driven asyncio loop instead of the 1s polling loop (--async-runtime)
+        _async_runtime = os.environ.get("ASYNC_RUNTIME", "").strip().lower()
+        self.ASYNC_RUNTIME = _async_runtime in ("1", "true", "yes", "on")
+        # Structured event ring (python -m src.events); EVENT_LOG=off disables
+        _event_log = os.environ.get("EVENT_LOG", "").strip()
+        self.EVENT_LOG_PATH: Path | None = (
+            None
+            if _event_log.lower() in ("off", "0", "false", "no")
+            else Path(_event_log or self.PROJECT_ROOT / "events.ring")
+        )
+        self.EVENT_LOG_CAPACITY = 50_000  # 40-byte records, ~2 MB
+        # Last display state, painted (marked stale) on the next start;
+        # STATE_SNAPSHOT=off disables
+        _snapshot = os.environ.get("STATE_SNAPSHOT", "").strip()
+        self.STATE_SNAPSHOT_PATH: Path | None = (
+            None
+            if _snapshot.lower() in ("off", "0", "false", "no")
+            else Path(_snapshot or self.PROJECT_ROOT / "display_state.json")
+        )
+        # Runtime sampling profiler (SIGUSR1 / Discord "profile" command)
+        self.PROFILE_DIR = Path(os.environ.get("PROFILE_DIR", self.PROJECT_ROOT / "profiles"))
+        self.PROFILE_DURATION = 30.0  # seconds sampled per trigger
+        self.PROFILE_SAMPLE_INTERVAL = 0.01  # 100 Hz
+
         # Birthday easter egg
         self.BIRTHDAY_DATES_RAW = os.environ.get("BIRTHDAY_DATES", "")
         self.BIRTHDAY_DATES: list[tuple[int, int]] = []
@@ -145,6 +210,32 @@ class Config:
                             _d,
                         )
 
+    @functools.cached_property
+    def DISCORD_BOT_TOKEN(self) -> str | None:
+        """Discord bot token: macOS Keychain first, then the environment.
+
+        Resolved on first access rather than in ``__init__``: the Keychain
+        lookup shells out to ``security`` (up to 5s), so the dashboard reads
+        it from its deferred startup thread, after the first frame. The
+        Keychain is only consulted on macOS.
+        """
+        if sys.platform == "darwin":
+            secret = _get_keychain_secret("discord-bot-token", "discord-bot-token")
+            if secret:
+                return secret
+        return os.environ.get("DISCORD_BOT_TOKEN")
+
+    def _env_number(self, name: str, default: _D, parse: Callable[[str], _N]) -> _N | _D:
+        """Parse env var *name* with *parse*, falling back to *default* if unset or invalid."""
+        raw = os.environ.get(name, "").strip()
+        if not raw:
+            return default
+        try:
+            return parse(raw)
+        except ValueError:
+            self.INVALID_ENV.append((name, raw))
+            return default
+
     @classmethod
     def get(cls) -> "Config":
         """Return the singleton Config instance, creating it on first access."""
@@ -208,16 +299,17 @@ def validate_config() -> None:
         ):
             missing.append("WEATHER_LAT / WEATHER_LON (defaulted to 0,0)")
 
-    # Validate IP address format
-    try:
-        ip = ipaddress.ip_address(cfg.DEVICE_IP)
-        if not ip.is_private:
-            print(
-                f"Warning: DIVOOM_IP ({cfg.DEVICE_IP}) is not a private IP address",
-                file=sys.stderr,
-            )
-    except ValueError:
-        missing.append(f"DIVOOM_IP (invalid IP address: {cfg.DEVICE_IP!r})")
+    # Validate IP address format (one entry per device)
+    for device_ip in cfg.DEVICE_IPS:
+        try:
+            ip = ipaddress.ip_address(device_ip)
+            if not ip.is_private:
+                print(
+                    f"Warning: DIVOOM_IP ({device_ip}) is not a private IP address",
+                    file=sys.stderr,
+                )
+        except ValueError:
+            missing.append(f"DIVOOM_IP (invalid IP address: {device_ip!r})")
 
     # Validate quay ID format
     for label, quay in [
@@ -230,19 +322,17 @@ def validate_config() -> None:
                 file=sys.stderr,
             )
 
-    # Warn on partial Discord config
-    discord_vars = {
-        "DISCORD_BOT_TOKEN": cfg.DISCORD_BOT_TOKEN,
-        "DISCORD_CHANNEL_ID": cfg.DISCORD_CHANNEL_ID,
-    }
-    set_vars = {k for k, v in discord_vars.items() if v}
-    if set_vars and set_vars != set(discord_vars.keys()):
-        missing_discord = set(discord_vars.keys()) - set_vars
-        print(
-            f"Warning: Discord partially configured. Set {missing_discord} to enable bot.",
-            file=sys.stderr,
+    for name, raw in cfg.INVALID_ENV:
+        missing.append(f"{name} (not a valid number: {raw!r})")
+    if not 0 < cfg.DEVICE_MIN_PUSH_INTERVAL <= cfg.DEVICE_MAX_PUSH_INTERVAL:
+        missing.append(
+            f"DIVOOM_MIN_PUSH_INTERVAL (must be > 0 and <= {cfg.DEVICE_MAX_PUSH_INTERVAL:g}:"
+            f" {cfg.DEVICE_MIN_PUSH_INTERVAL:g})"
         )
 
+    if cfg.METRICS_PORT is not None and not 0 <= cfg.METRICS_PORT <= 65535:
+        missing.append(f"METRICS_PORT (not a valid port: {cfg.METRICS_PORT})")
+
     # Validate channel IDs are numeric
     if cfg.DISCORD_CHANNEL_ID:
         try:
@@ -262,10 +352,33 @@ def validate_config() -> None:
         sys.exit(1)
 
 
+def validate_discord_config() -> None:
+    """Warn when only part of the Discord bot config is set.
+
+    Separate from :func:`validate_config` because it resolves
+    ``DISCORD_BOT_TOKEN`` (a possible Keychain lookup); the dashboard calls
+    it from its deferred startup thread.
+    """
+    cfg = Config.get()
+    discord_vars = {
+        "DISCORD_BOT_TOKEN": cfg.DISCORD_BOT_TOKEN,
+        "DISCORD_CHANNEL_ID": cfg.DISCORD_CHANNEL_ID,
+    }
+    set_vars = {k for k, v in discord_vars.items() if v}
+    if set_vars and set_vars != set(discord_vars.keys()):
+        missing_discord = set(discord_vars.keys()) - set_vars
+        print(
+            f"Warning: Discord partially configured. Set {missing_discord} to enable bot.",
+            file=sys.stderr,
+        )
+
+
 if TYPE_CHECKING:
     # Type stubs for all config attributes exposed via __getattr__.
     # These have zero runtime cost and only exist for static analysis / IDE support.
+    INVALID_ENV: list[tuple[str, str]]
     PROJECT_ROOT: Path
+    DEVICE_IPS: list[str]
     DEVICE_IP: str
     DISPLAY_SIZE: int
     FONT_DIR: Path
@@ -282,10 +395,19 @@ if TYPE_CHECKING:
     DEVICE_REBOOT_THRESHOLD: int
     DEVICE_REBOOT_RECOVERY_WAIT: int
     WATCHDOG_TIMEOUT: int
+    WATCHDOG_REPORT_PATH: Path
     DEVICE_HTTP_TIMEOUT: int
     DEVICE_MIN_PUSH_INTERVAL: float
+    DEVICE_MAX_PUSH_INTERVAL: float
+    DEVICE_PUSH_LATENCY_TARGET: float
     DEVICE_ERROR_COOLDOWN_BASE: float
     DEVICE_ERROR_COOLDOWN_MAX: float
+    FRAME_CACHE_SIZE: int
+    HEADLESS_RING_SIZE: int
+    ANIM_TRANSITION_FRAMES: int
+    ANIM_TRANSITION_BUDGET: float
+    ANIM_SUBFRAMES: int
+    ANIM_FRAME_BUDGET: float
     HEALTH_DEBOUNCE: MappingProxyType
     HEALTH_DEBOUNCE_DEFAULT: MappingProxyType
     BUS_QUAY_DIRECTION1: str
@@ -302,6 +424,15 @@ if TYPE_CHECKING:
     DISCORD_BOT_TOKEN: str | None
     DISCORD_CHANNEL_ID: str | None
     DISCORD_MONITOR_CHANNEL_ID: str | None
+    METRICS_PORT: int | None
+    STAGE_TIMING_ENABLED: bool
+    ASYNC_RUNTIME: bool
+    EVENT_LOG_PATH: Path | None
+    EVENT_LOG_CAPACITY: int
+    STATE_SNAPSHOT_PATH: Path | None
+    PROFILE_DIR: Path
+    PROFILE_DURATION: float
+    PROFILE_SAMPLE_INTERVAL: float
     BIRTHDAY_DATES_RAW: str
     BIRTHDAY_DATES: list[tuple[int, int]]
 
@@ -0,0 +1,146 @@
+"""Prometheus collectors for the dashboard main loop and its devices.
+
+:func:`register_dashboard_metrics` wires the loop's existing state
+objects (device clients, circuit breakers, staleness tracker, frame
+cache, animation quality, stage timings, dashboard counters, health
+tracker) into a :class:`MetricsRegistry`. Collectors only read counters
+and snapshots the loop already maintains, so a scrape costs the loop
+nothing; the work happens on the metrics server thread.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from src.circuit_breaker import CircuitBreaker
+from src.dashboard_state import DashboardState
+from src.device.pixoo_client import PushResult
+from src.display.anim_quality import AdaptiveAnimationQuality
+from src.display.frame_cache import FrameCache
+from src.metrics import MetricFamily, MetricsRegistry, StageTimings
+from src.staleness import StalenessTracker
+
+if TYPE_CHECKING:
+    from src.providers.discord_monitor import HealthTracker
+
+# Numeric encoding of CircuitBreaker.state for the gauge
+BREAKER_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+_QUANTILES = {0.5: "p50_ms", 0.95: "p95_ms", 0.99: "p99_ms"}
+
+
+def register_dashboard_metrics(
+    registry: MetricsRegistry,
+    *,
+    devices: Mapping[str, object],
+    breakers: Mapping[str, CircuitBreaker],
+    staleness: StalenessTracker,
+    frame_cache: FrameCache,
+    timings: StageTimings,
+    dashboard_state: DashboardState,
+    anim_quality: AdaptiveAnimationQuality | None = None,
+    health_tracker: HealthTracker | None = None,
+) -> None:
+    """Register collectors for the main loop's state on *registry*.
+
+    Args:
+        registry: Registry served by the metrics endpoint.
+        devices: Device clients by label; each must expose ``metrics``
+            (:class:`DeviceMetrics`) and ``push_interval``.
+        breakers: Circuit breakers by API label.
+        staleness: Provider data staleness tracker.
+        frame_cache: Rendered-frame cache.
+        timings: Main-loop stage timings.
+        dashboard_state: Loop counters (iterations, renders, overruns).
+        anim_quality: Optional animation quality governor.
+        health_tracker: Optional component health source.
+    """
+
+    def collect_devices() -> list[MetricFamily]:
+        pushes = MetricFamily("pushes_total", "counter", "Device push attempts by result")
+        latency = MetricFamily("push_latency_seconds", "histogram", "Device push round-trip time")
+        interval = MetricFamily(
+            "push_interval_seconds", "gauge", "Adaptive minimum interval between pushes"
+        )
+        reboots = MetricFamily("device_reboots_total", "counter", "Reboot commands sent")
+        for name, client in devices.items():
+            results = dict(client.metrics.results)
+            for result in PushResult:
+                pushes.add(results.get(result.value, 0), device=name, result=result.value)
+            latency.add_histogram(client.metrics.latency, device=name)
+            interval.add(client.push_interval, device=name)
+            reboots.add(client.metrics.reboots, device=name)
+        return [pushes, latency, interval, reboots]
+
+    def collect_providers() -> list[MetricFamily]:
+        state = MetricFamily(
+            "circuit_breaker_state", "gauge", "Circuit breaker state (0=closed 1=half_open 2=open)"
+        )
+        for api, breaker in breakers.items():
+            state.add(BREAKER_STATE_VALUES.get(breaker.state, -1), api=api)
+        age = MetricFamily(
+            "data_age_seconds", "gauge", "Age of the last good provider data (0 = never fetched)"
+        )
+        age.add(staleness.bus_data_age, source="bus")
+        age.add(staleness.weather_data_age, source="weather")
+        return [state, age]
+
+    def collect_loop() -> list[MetricFamily]:
+        cache = frame_cache.stats()
+        families = [
+            MetricFamily("frame_cache_hits_total", "counter", "Frame cache hits").add(
+                cache["hits"]
+            ),
+            MetricFamily("frame_cache_misses_total", "counter", "Frame cache misses").add(
+                cache["misses"]
+            ),
+            MetricFamily("loop_iterations_total", "counter", "Main-loop iterations").add(
+                dashboard_state.iterations
+            ),
+            MetricFamily("renders_total", "counter", "Frames rendered").add(
+                dashboard_state.renders
+            ),
+            MetricFamily(
+                "loop_overruns_total", "counter", "Iterations whose work exceeded the tick period"
+            ).add(dashboard_state.overruns),
+        ]
+        stages = MetricFamily(
+            "stage_duration_seconds", "summary", "Main-loop stage durations (recent window)"
+        )
+        for name, s in timings.summary().items():
+            stages.add_summary(
+                {q: s[key] / 1000 for q, key in _QUANTILES.items()},
+                s["total_s"],
+                s["count"],
+                stage=name,
+            )
+        if stages.samples:
+            families.append(stages)
+        if anim_quality is not None:
+            quality = anim_quality.stats()
+            families.append(
+                MetricFamily(
+                    "animation_quality", "gauge", "Fraction of full animation particle counts"
+                ).add(quality["level"])
+            )
+            changes = MetricFamily(
+                "animation_quality_changes_total", "counter", "Animation quality level changes"
+            )
+            changes.add(quality["decreases"], direction="down")
+            changes.add(quality["increases"], direction="up")
+            families.append(changes)
+        return families
+
+    def collect_health() -> list[MetricFamily]:
+        up = MetricFamily("component_up", "gauge", "1 if the component's last check succeeded")
+        for name, status in health_tracker.get_status().items():
+            up.add(1 if status.get("status") == "ok" else 0, component=name)
+        uptime = MetricFamily("uptime_seconds", "gauge", "Seconds since the dashboard started")
+        return [up, uptime.add(health_tracker.uptime_s)]
+
+    registry.register(collect_devices)
+    registry.register(collect_providers)
+    registry.register(collect_loop)
+    if health_tracker is not None:
+        registry.register(collect_health)
@@ -9,10 +9,13 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections.abc import Callable
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from src.circuit_breaker import CircuitBreaker
 from src.config import (
+    ANIM_TRANSITION_FRAMES,
     BUS_REFRESH_INTERVAL,
     WEATHER_LAT,
     WEATHER_LON,
@@ -20,17 +23,21 @@ from src.config import (
     get_target_brightness,
 )
 from src.device.pixoo_client import PixooClient
-from src.display.animation_selector import select_animation
 from src.display.state import DisplayState
-from src.display.weather_anim import WeatherAnimation
 from src.providers.bus import fetch_bus_data
-from src.providers.discord_bot import MessageBridge
-from src.providers.discord_monitor import HealthTracker
 from src.providers.weather import WeatherData, fetch_weather_safe
 from src.staleness import StalenessTracker
 
+if TYPE_CHECKING:
+    from src.display.weather_anim import WeatherAnimation
+    from src.providers.discord_bot import MessageBridge
+    from src.providers.discord_monitor import HealthTracker
+
 logger = logging.getLogger(__name__)
 
+BusFetcher = Callable[[], tuple[list[int] | None, list[int] | None]]
+WeatherFetcher = Callable[[float, float], WeatherData | None]
+
 
 class DashboardState:
     """Encapsulates the mutable state of the main dashboard loop.
@@ -38,9 +45,20 @@ class DashboardState:
     Centralizes bus/weather data, animation tracking, brightness, and
     Discord bot death detection into a single object instead of 8+
     loose local variables.
+
+    Args:
+        bus_fetcher: Replacement for ``fetch_bus_data`` (e.g. recorded or
+            synthetic responses in the replay harness).
+        weather_fetcher: Replacement for ``fetch_weather_safe``.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        bus_fetcher: BusFetcher | None = None,
+        weather_fetcher: WeatherFetcher | None = None,
+    ) -> None:
+        self._bus_fetcher = bus_fetcher
+        self._weather_fetcher = weather_fetcher
         self.last_state: DisplayState | None = None
         self.last_bus_fetch: float = 0.0
         self.last_weather_fetch: float = 0.0
@@ -52,6 +70,10 @@ class DashboardState:
         self.last_brightness: int = -1
         self.needs_push: bool = False
         self.bot_dead_logged: bool = False
+        # Loop counters (read by the replay harness and metrics endpoint)
+        self.iterations: int = 0
+        self.renders: int = 0
+        self.overruns: int = 0  # iterations whose work outlasted the tick period
 
     def refresh_bus(
         self,
@@ -61,13 +83,28 @@ class DashboardState:
         bus_breaker: CircuitBreaker,
     ) -> None:
         """Fetch bus data and update staleness tracker."""
+        if self.bus_due(now_mono, bus_breaker):
+            self.apply_bus(self.fetch_bus(), staleness, health_tracker, bus_breaker)
+
+    def bus_due(self, now_mono: float, bus_breaker: CircuitBreaker) -> bool:
+        """Whether a bus fetch should start now; if so, it counts as started."""
         if now_mono - self.last_bus_fetch < BUS_REFRESH_INTERVAL:
-            return
-        if not bus_breaker.should_attempt():
-            self.last_bus_fetch = now_mono
-            return
-        fresh_bus = fetch_bus_data()
+            return False
         self.last_bus_fetch = now_mono
+        return bus_breaker.should_attempt()
+
+    def fetch_bus(self) -> tuple[list[int] | None, list[int] | None]:
+        """Fetch bus departures; touches no state, so any thread may call it."""
+        return (self._bus_fetcher or fetch_bus_data)()
+
+    def apply_bus(
+        self,
+        fresh_bus: tuple[list[int] | None, list[int] | None],
+        staleness: StalenessTracker,
+        health_tracker: HealthTracker | None,
+        bus_breaker: CircuitBreaker,
+    ) -> None:
+        """Record a :meth:`fetch_bus` result (on the loop thread)."""
         if fresh_bus != (None, None):
             staleness.update_bus(fresh_bus)
             bus_breaker.record_success()
@@ -94,6 +131,27 @@ class DashboardState:
         test_weather_data: WeatherData | None = None,
     ) -> None:
         """Fetch weather data and swap animation if needed."""
+        if self.weather_due(
+            now_mono, now_utc, staleness, weather_breaker, test_weather_data=test_weather_data
+        ):
+            self.apply_weather(
+                self.fetch_weather(), now_utc, staleness, health_tracker, weather_breaker
+            )
+
+    def weather_due(
+        self,
+        now_mono: float,
+        now_utc: datetime,
+        staleness: StalenessTracker,
+        weather_breaker: CircuitBreaker,
+        *,
+        test_weather_data: WeatherData | None = None,
+    ) -> bool:
+        """Whether a weather fetch should start now; if so, it counts as started.
+
+        In test mode the hardcoded weather is applied here instead (once) and
+        no fetch is ever due.
+        """
         if test_weather_data is not None:
             # TEST MODE: use hardcoded weather, skip API
             if staleness.last_good_weather is None:
@@ -106,15 +164,26 @@ class DashboardState:
                     self.last_precip_mm,
                     self.last_wind_speed,
                 )
-            return
+            return False
 
         if now_mono - self.last_weather_fetch < WEATHER_REFRESH_INTERVAL:
-            return
-        if not weather_breaker.should_attempt():
-            self.last_weather_fetch = now_mono
-            return
-        fresh_weather = fetch_weather_safe(WEATHER_LAT, WEATHER_LON)
+            return False
         self.last_weather_fetch = now_mono
+        return weather_breaker.should_attempt()
+
+    def fetch_weather(self) -> WeatherData | None:
+        """Fetch the forecast; touches no state, so any thread may call it."""
+        return (self._weather_fetcher or fetch_weather_safe)(WEATHER_LAT, WEATHER_LON)
+
+    def apply_weather(
+        self,
+        fresh_weather: WeatherData | None,
+        now_utc: datetime,
+        staleness: StalenessTracker,
+        health_tracker: HealthTracker | None,
+        weather_breaker: CircuitBreaker,
+    ) -> None:
+        """Record a :meth:`fetch_weather` result (on the loop thread)."""
         if fresh_weather:
             staleness.update_weather(fresh_weather)
             weather_breaker.record_success()
@@ -136,8 +205,27 @@ class DashboardState:
             if health_tracker:
                 health_tracker.record_failure("weather_api", "Weather API returned no data")
 
+    def _transition_to(self, new_anim: WeatherAnimation) -> WeatherAnimation:
+        """Wrap *new_anim* in a cross-fade from the current animation, if any."""
+        from src.display.transition import CrossFade
+
+        outgoing = self.weather_anim
+        if outgoing is None or ANIM_TRANSITION_FRAMES <= 0:
+            return new_anim
+        if isinstance(outgoing, CrossFade):
+            # Fade from whatever is on screen: the finished fade's target, or
+            # the unfinished fade as a whole
+            outgoing = outgoing.incoming if outgoing.finished else outgoing
+        fade = CrossFade(outgoing, new_anim)
+        fade.start_prewarm()
+        return fade
+
     def _maybe_swap_animation(self, weather_data: WeatherData, now_utc: datetime) -> None:
         """Swap animation if weather conditions changed."""
+        # Imported on first weather data: the animation modules (and astral)
+        # are not needed to paint the first frame
+        from src.display.animation_selector import select_animation
+
         result = select_animation(
             weather_data,
             now_utc,
@@ -156,7 +244,7 @@ class DashboardState:
             self.last_wind_speed,
         ) = result
         if new_anim is not None:
-            self.weather_anim = new_anim
+            self.weather_anim = self._transition_to(new_anim)
             logger.info(
                 "Weather animation: %s (night=%s, precip=%.1fmm, wind=%.1fm/s)",
                 self.last_weather_group,
@@ -0,0 +1,315 @@
+"""Local HTTP stand-in for a Pixoo 64, for load testing without hardware.
+
+The pixoo library's ``--simulated`` mode draws into a Tkinter window and
+never touches HTTP, so it cannot exercise :class:`PixooClient`'s transport:
+timeouts, connection resets, rate limiting and device freezes. This module
+serves the subset of the Divoom HTTP API the dashboard uses on
+``POST /post`` and models the device's failure modes:
+
+- ``latency``: seconds added before every response;
+- ``max_rate``: requests/second the device tolerates; faster requests have
+  their connection dropped, like the real embedded server;
+- ``drop_probability``: chance of dropping any request's connection;
+- ``freeze_after``: stop responding after this many frame pushes;
+- ``pic_id_limit``: freeze once a pushed PicID exceeds this without a
+  ``Draw/ResetHttpGifId`` -- the ~300-push lockup.
+
+A frozen device accepts connections but never answers (clients hit their
+read timeout) until it receives ``Device/SysReboot``. Every frame push is
+recorded in :attr:`PixooEmulator.frames`.
+
+Run standalone for manual benchmarking::
+
+    python -m src.device.emulator --port 8080 --latency 0.2 --pic-id-limit 300
+    python src/main.py --ip 127.0.0.1:8080
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# How long a frozen device holds a connection open before closing it
+_FREEZE_HOLD = 30.0
+
+
+@dataclass(frozen=True)
+class ReceivedFrame:
+    """One ``Draw/SendHttpGif`` request as seen by the emulated device."""
+
+    received_at: float
+    pic_id: int
+    pic_num: int
+    offset: int
+    width: int
+    pic_data: bytes
+
+    def to_image(self) -> Image.Image:
+        """Decode the frame into a ``width`` x ``width`` RGB image."""
+        raw = base64.b64decode(self.pic_data)
+        return Image.frombytes("RGB", (self.width, self.width), raw)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _EmulatorHTTPServer
+
+    def do_POST(self) -> None:  # noqa: N802 -- http.server naming
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        response = self.server.emulator.handle(body)
+        if response is None:
+            # Drop the connection without an HTTP response
+            self.close_connection = True
+            return
+        payload = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        logger.debug("emulator: " + format, *args)
+
+
+class _EmulatorHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], emulator: PixooEmulator) -> None:
+        super().__init__(address, _Handler)
+        self.emulator = emulator
+
+
+class PixooEmulator:
+    """Fake Pixoo 64 HTTP server with configurable latency and failure modes.
+
+    Usable as a context manager; :attr:`address` is the ``host:port`` string
+    to pass as a PixooClient ``ip``.
+
+    Args:
+        host: Interface to bind.
+        port: Port to bind (0 picks a free port).
+        latency: Seconds to wait before answering each request.
+        max_rate: Requests/second tolerated before connections are dropped
+            (None = unlimited).
+        drop_probability: Probability (0-1) of dropping any request.
+        freeze_after: Freeze after this many frame pushes (None = never).
+        pic_id_limit: Freeze when a pushed PicID exceeds this (None = never).
+        seed: Seed for the drop-probability RNG, for reproducible runs.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        latency: float = 0.0,
+        max_rate: float | None = None,
+        drop_probability: float = 0.0,
+        freeze_after: int | None = None,
+        pic_id_limit: int | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.latency = latency
+        self.max_rate = max_rate
+        self.drop_probability = drop_probability
+        self.freeze_after = freeze_after
+        self.pic_id_limit = pic_id_limit
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._unfrozen = threading.Event()
+        self._unfrozen.set()
+        self._last_request = 0.0
+        self._pic_id = 0
+        self._pushes_since_boot = 0
+        self.frames: list[ReceivedFrame] = []
+        self.commands: list[str] = []
+        self.brightness: int | None = None
+        self.requests = 0
+        self.dropped = 0
+        self.rate_limited = 0
+        self.reboots = 0
+        self._server = _EmulatorHTTPServer((host, port), self)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> str:
+        """``host:port`` of the listening socket."""
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def frozen(self) -> bool:
+        """True while the device ignores requests (until SysReboot)."""
+        return not self._unfrozen.is_set()
+
+    def start(self) -> PixooEmulator:
+        """Serve requests from a background daemon thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="pixoo-emulator", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release any connections held by a freeze."""
+        self._unfrozen.set()
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(5)
+
+    def __enter__(self) -> PixooEmulator:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> dict:
+        """Request counters for benchmarks and assertions."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "frames": len(self.frames),
+                "dropped": self.dropped,
+                "rate_limited": self.rate_limited,
+                "reboots": self.reboots,
+                "frozen": self.frozen,
+            }
+
+    # -- request handling -------------------------------------------------------
+
+    def handle(self, body: bytes) -> dict | None:
+        """Process one request body; None means drop the connection."""
+        try:
+            request = json.loads(body)
+            command = request["Command"]
+        except (ValueError, KeyError, TypeError):
+            return {"error_code": 1}
+
+        if command == "Device/SysReboot":
+            return self._reboot()
+
+        if self.frozen:
+            # Hold the connection open like a hung device, then give up
+            self._unfrozen.wait(_FREEZE_HOLD)
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            self.commands.append(command)
+            too_fast = (
+                self.max_rate is not None
+                and self._last_request > 0
+                and now - self._last_request < 1.0 / self.max_rate
+            )
+            self._last_request = now
+            if too_fast:
+                self.rate_limited += 1
+                return None
+            if self.drop_probability and self._rng.random() < self.drop_probability:
+                self.dropped += 1
+                return None
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            return self._dispatch(command, request, now)
+
+    def _dispatch(self, command: str, request: dict, now: float) -> dict:
+        if command == "Draw/SendHttpGif":
+            return self._receive_frame(request, now)
+        if command == "Draw/CommandList":
+            for sub_request in request.get("CommandList", []):
+                self._dispatch(sub_request.get("Command", ""), sub_request, now)
+            return {"error_code": 0}
+        if command == "Draw/GetHttpGifId":
+            return {"error_code": 0, "PicId": self._pic_id}
+        if command == "Draw/ResetHttpGifId":
+            self._pic_id = 0
+            return {"error_code": 0}
+        if command == "Channel/SetBrightness":
+            self.brightness = int(request.get("Brightness", 0))
+            return {"error_code": 0}
+        if command == "Channel/GetAllConf":
+            return {"error_code": 0, "Brightness": self.brightness or 0}
+        return {"error_code": 0}
+
+    def _receive_frame(self, request: dict, now: float) -> dict:
+        pic_id = int(request.get("PicID", 0))
+        self.frames.append(
+            ReceivedFrame(
+                received_at=now,
+                pic_id=pic_id,
+                pic_num=int(request.get("PicNum", 1)),
+                offset=int(request.get("PicOffset", 0)),
+                width=int(request.get("PicWidth", 64)),
+                pic_data=request.get("PicData", "").encode(),
+            )
+        )
+        self._pic_id = pic_id
+        self._pushes_since_boot += 1
+        if (self.freeze_after is not None and self._pushes_since_boot >= self.freeze_after) or (
+            self.pic_id_limit is not None and pic_id > self.pic_id_limit
+        ):
+            logger.info("Emulated device froze after %d pushes", self._pushes_since_boot)
+            self._unfrozen.clear()
+        return {"error_code": 0}
+
+    def _reboot(self) -> dict:
+        with self._lock:
+            self.reboots += 1
+            self._pic_id = 0
+            self._pushes_since_boot = 0
+            self._last_request = 0.0
+        self._unfrozen.set()
+        return {"error_code": 0}
+
+
+def main() -> None:
+    """Run the emulator in the foreground until interrupted."""
+    parser = argparse.ArgumentParser(description="Fake Pixoo 64 HTTP server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="response delay (s)")
+    parser.add_argument("--max-rate", type=float, default=None, help="requests/second")
+    parser.add_argument("--drop-probability", type=float, default=0.0)
+    parser.add_argument("--freeze-after", type=int, default=None, help="frame pushes")
+    parser.add_argument("--pic-id-limit", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(message)s")
+    emulator = PixooEmulator(
+        args.host,
+        args.port,
+        latency=args.latency,
+        max_rate=args.max_rate,
+        drop_probability=args.drop_probability,
+        freeze_after=args.freeze_after,
+        pic_id_limit=args.pic_id_limit,
+    )
+    logger.info("Emulated Pixoo listening on %s", emulator.address)
+    emulator.start()
+    try:
+        while True:
+            time.sleep(10)
+            logger.info("%s", emulator.stats())
+    except KeyboardInterrupt:
+        emulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Fan one rendered frame stream out to several Pixoo devices.
+
+Each device gets a :class:`DeviceWorker` with its own ``PixooClient``
+(rate limiter and error cooldown), :class:`DeviceKeepAlive` and push
+thread. The main loop renders once and hands the encoded payload to
+:meth:`DeviceFanout.submit`, which never blocks on the network.
+
+Workers keep only the *latest* frame: if a device is slow (or in error
+cooldown) intermediate frames are dropped rather than queued, so a
+lagging display catches up on the next push instead of replaying stale
+animation ticks, and it can never hold back the other devices.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from src import timesource
+from src.device.keepalive import DeviceKeepAlive
+from src.device.payload import AnimationPayload, FramePayload
+from src.device.pixoo_client import PixooClient, PushResult
+
+if TYPE_CHECKING:
+    from src.providers.discord_monitor import HealthTracker
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a worker sleeps without new work, so keep-alive
+# pings and reboot checks run at roughly the main loop's 1s cadence.
+_IDLE_INTERVAL = 1.0
+
+
+class DeviceWorker:
+    """Drive one device from a background thread with a latest-frame mailbox.
+
+    Args:
+        client: Device client for this display.
+        name: Short label (usually the IP) used in logs and health output.
+        health_tracker: Optional tracker; results are recorded under
+            ``device:<name>``.
+    """
+
+    def __init__(
+        self,
+        client: PixooClient,
+        name: str,
+        health_tracker: HealthTracker | None = None,
+    ) -> None:
+        self.client = client
+        self.name = name
+        self.component = f"device:{name}"
+        self.keepalive = DeviceKeepAlive(component=self.component)
+        self._health_tracker = health_tracker
+        self._cond = threading.Condition()
+        self._pending: FramePayload | AnimationPayload | None = None
+        self._brightness: int | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.pushed = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def submit(self, payload: FramePayload | AnimationPayload) -> None:
+        """Replace the pending frame with *payload* and wake the worker."""
+        with self._cond:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = payload
+            self._cond.notify()
+
+    def set_brightness(self, level: int) -> None:
+        """Queue a brightness change, applied from the worker thread."""
+        with self._cond:
+            self._brightness = level
+            self._cond.notify()
+
+    def start(self) -> None:
+        """Start the push thread (daemon, so it never blocks shutdown)."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"pixoo-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Signal the push thread to exit and wait up to *timeout* seconds."""
+        self._stop.set()
+        with self._cond:
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: (
+                        self._pending is not None
+                        or self._brightness is not None
+                        or self._stop.is_set()
+                    ),
+                    timeout=_IDLE_INTERVAL,
+                )
+            if self._stop.is_set():
+                break
+            self.run_once()
+            # Sleep out the rate limit / cooldown instead of spinning on SKIPPED
+            delay = self.client.next_push_delay()
+            if delay > 0:
+                self._stop.wait(min(delay, _IDLE_INTERVAL))
+
+    def run_once(self) -> PushResult | None:
+        """Apply pending brightness, push the pending frame, run keep-alive.
+
+        Returns:
+            The push outcome, or None if no frame was pending.
+        """
+        with self._cond:
+            payload, self._pending = self._pending, None
+            brightness, self._brightness = self._brightness, None
+
+        if brightness is not None:
+            self.client.set_brightness(brightness)
+
+        result = None
+        if payload is not None:
+            result = self.client.push_frame(payload)
+            if result is PushResult.SUCCESS:
+                self.pushed += 1
+                self.keepalive.record_success()
+                if self._health_tracker:
+                    self._health_tracker.record_success(self.component)
+            elif result is PushResult.ERROR:
+                self.errors += 1
+                self.keepalive.record_failure()
+                if self._health_tracker:
+                    self._health_tracker.record_failure(self.component, "Device unreachable")
+            else:
+                # Rate limited or cooling down: keep the frame unless a newer one arrived
+                with self._cond:
+                    if self._pending is None:
+                        self._pending = payload
+
+        self.keepalive.tick(
+            self.client, timesource.monotonic(), health_tracker=self._health_tracker
+        )
+        return result
+
+
+class DeviceFanout:
+    """Distribute frames and brightness changes to several device workers.
+
+    Quacks like :class:`PixooClient` for ``set_brightness`` so the existing
+    auto-brightness logic works unchanged.
+    """
+
+    def __init__(
+        self,
+        clients: dict[str, PixooClient],
+        health_tracker: HealthTracker | None = None,
+    ) -> None:
+        self.workers = [
+            DeviceWorker(client, name, health_tracker=health_tracker)
+            for name, client in clients.items()
+        ]
+
+    def start(self) -> None:
+        """Start every worker's push thread."""
+        for worker in self.workers:
+            worker.start()
+        logger.info("Fan-out started for %d devices", len(self.workers))
+
+    def stop(self, timeout: float | None = 2.0) -> None:
+        """Stop every worker's push thread."""
+        for worker in self.workers:
+            worker.stop(timeout)
+
+    def submit(self, payload: FramePayload | AnimationPayload) -> None:
+        """Hand the same encoded frame to every device (non-blocking)."""
+        for worker in self.workers:
+            worker.submit(payload)
+
+    def set_brightness(self, level: int) -> None:
+        """Queue a brightness change on every device."""
+        for worker in self.workers:
+            worker.set_brightness(level)
+
+    @property
+    def supports_multi_frame(self) -> bool:
+        """True when every device accepts multi-frame animation uploads."""
+        return all(worker.client.supports_multi_frame for worker in self.workers)
+
+    @property
+    def push_interval(self) -> float:
+        """Shortest current push interval across devices, in seconds."""
+        return min(worker.client.push_interval for worker in self.workers)
+
+    def next_push_delay(self) -> float:
+        """Submitting never waits: each worker holds the frame for its device's next slot."""
+        return 0.0
+
+    def stats(self) -> dict:
+        """Per-device push counters and adaptive interval for status output."""
+        result = {}
+        for worker in self.workers:
+            result[f"{worker.name} pushed"] = worker.pushed
+            result[f"{worker.name} dropped"] = worker.dropped
+            result[f"{worker.name} errors"] = worker.errors
+            result[f"{worker.name} interval_s"] = round(worker.client.push_interval, 2)
+        return result
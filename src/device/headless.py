@@ -0,0 +1,239 @@
+"""Headless frame sink standing in for a Pixoo device.
+
+:class:`HeadlessClient` implements the :class:`PixooClient` interface the
+main loop uses but sends nothing anywhere: every pushed frame is appended
+to an in-memory ring buffer, so developers and CI can run the dashboard
+without hardware or a Tkinter display.
+
+Frames are kept as :class:`FramePayload` objects (the main loop already
+produces them), so capturing a frame costs a deque append. When a
+recording path is given, a background :class:`FrameRecorder` thread
+decodes and writes the frames; the main loop never waits for disk or an
+image encoder and, if the writer falls behind, frames are dropped from the
+recording rather than slowing the loop.
+
+Recording formats are chosen by file extension:
+
+- ``.raw``: streamed continuously; each record is a little-endian float64
+  capture timestamp followed by ``width * width * 3`` RGB bytes. Read it
+  back with :func:`read_raw_frames`.
+- ``.gif`` / ``.png`` (APNG): frames are streamed to a ``.raw`` spool next
+  to the output (``<name>.raw``, e.g. ``dash.gif.raw``) and encoded as an
+  animation from it when the recorder is closed; the spool is then removed.
+  Memory stays flat however long the capture runs, and if the process dies
+  the spool keeps every frame written so far.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import queue
+import struct
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image
+
+from src.config import DEVICE_MIN_PUSH_INTERVAL, DISPLAY_SIZE
+from src.device.payload import FramePayload
+from src.device.pixoo_client import PushResult
+from src.metrics import DeviceMetrics
+
+logger = logging.getLogger(__name__)
+
+_RAW_HEADER = struct.Struct("<d")
+_ANIMATED_SUFFIXES = {".gif", ".png"}
+# File extensions FrameRecorder accepts
+RECORDING_SUFFIXES = (".raw", *sorted(_ANIMATED_SUFFIXES))
+# Frames waiting for the writer thread before new ones are dropped
+_RECORDER_QUEUE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class CapturedFrame:
+    """A frame received by the headless sink."""
+
+    captured_at: float  # wall-clock time.time()
+    payload: FramePayload
+
+    def to_image(self) -> Image.Image:
+        """Decode the captured frame into an RGB image."""
+        return self.payload.to_image()
+
+
+class FrameRecorder:
+    """Write captured frames to disk from a background thread.
+
+    Args:
+        path: Output file; the suffix selects the format (``.raw``,
+            ``.gif`` or ``.png``).
+        frame_duration_ms: Per-frame display time for animated formats.
+    """
+
+    def __init__(self, path: str | Path, frame_duration_ms: int = 1000) -> None:
+        self.path = Path(path)
+        suffix = self.path.suffix.lower()
+        if suffix not in RECORDING_SUFFIXES:
+            raise ValueError(f"Unsupported recording format {suffix!r} (use .raw, .gif or .png)")
+        self._animated = suffix in _ANIMATED_SUFFIXES
+        # Animated formats are spooled as raw frames and encoded on close
+        self.spool_path = (
+            self.path.with_name(self.path.name + ".raw") if self._animated else self.path
+        )
+        self._frame_duration_ms = frame_duration_ms
+        # Opened here so an unwritable path raises OSError to the caller
+        self._raw_file = open(self.spool_path, "wb")
+        self._queue: queue.Queue[CapturedFrame | None] = queue.Queue(_RECORDER_QUEUE_SIZE)
+        self.written = 0
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="frame-recorder", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame: CapturedFrame) -> None:
+        """Queue a frame for writing without blocking (drops if the writer lags)."""
+        try:
+            self._queue.put_nowait(frame)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush pending frames, finish the file and stop the writer thread."""
+        # A writer that died (e.g. disk full) no longer drains the queue;
+        # never block forever handing it the stop sentinel
+        while self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        with self._raw_file as raw_file:
+            while (frame := self._queue.get()) is not None:
+                raw_file.write(_RAW_HEADER.pack(frame.captured_at))
+                raw_file.write(frame.to_image().tobytes())
+                raw_file.flush()
+                self.written += 1
+        if self._animated:
+            self._write_animation()
+        logger.info("Recorded %d frames to %s", self.written, self.path)
+
+    def _write_animation(self) -> None:
+        if self.written:
+            _, first = next(read_raw_frames(self.spool_path))
+            first.save(
+                self.path,
+                save_all=True,
+                append_images=_SpooledFrames(self.spool_path, skip=1),
+                duration=self._frame_duration_ms,
+                loop=0,
+            )
+        self.spool_path.unlink(missing_ok=True)
+
+
+class _SpooledFrames:
+    """Frames of a ``.raw`` spool, decoded on each pass rather than held.
+
+    Re-iterable: Pillow's APNG writer walks ``append_images`` twice.
+    """
+
+    def __init__(self, path: Path, skip: int = 0) -> None:
+        self.path = path
+        self.skip = skip
+
+    def __iter__(self) -> Iterator[Image.Image]:
+        frames = itertools.islice(read_raw_frames(self.path), self.skip, None)
+        return (image for _, image in frames)
+
+
+def read_raw_frames(
+    path: str | Path, size: int = DISPLAY_SIZE
+) -> Iterator[tuple[float, Image.Image]]:
+    """Yield ``(captured_at, image)`` pairs from a ``.raw`` recording."""
+    frame_bytes = size * size * 3
+    with open(path, "rb") as f:
+        while header := f.read(_RAW_HEADER.size):
+            (captured_at,) = _RAW_HEADER.unpack(header)
+            yield captured_at, Image.frombytes("RGB", (size, size), f.read(frame_bytes))
+
+
+class HeadlessClient:
+    """PixooClient stand-in that captures frames instead of sending them.
+
+    Args:
+        ring_size: Number of most recent frames kept in memory.
+        recorder: Optional background writer receiving every frame.
+        push_interval: Reported minimum push interval; defaults to the
+            device floor so the main loop keeps its normal cadence.
+    """
+
+    def __init__(
+        self,
+        ring_size: int,
+        recorder: FrameRecorder | None = None,
+        push_interval: float = DEVICE_MIN_PUSH_INTERVAL,
+    ) -> None:
+        self.frames: deque[CapturedFrame] = deque(maxlen=ring_size)
+        self.recorder = recorder
+        self.brightness: int | None = None
+        self.pushed = 0
+        self._push_interval = push_interval
+        self.metrics = DeviceMetrics()
+        # One captured image per push; sub-frame batching stays off
+        self.supports_multi_frame = False
+
+    @property
+    def push_interval(self) -> float:
+        """Minimum interval the main loop should leave between frames."""
+        return self._push_interval
+
+    def push_frame(self, frame: Image.Image | FramePayload) -> PushResult:
+        """Capture a frame into the ring buffer (and recorder, if any)."""
+        if not isinstance(frame, FramePayload):
+            frame = FramePayload.from_image(frame)
+        captured = CapturedFrame(captured_at=time.time(), payload=frame)
+        self.frames.append(captured)
+        self.pushed += 1
+        self.metrics.record_result(PushResult.SUCCESS.value)
+        if self.recorder is not None:
+            self.recorder.submit(captured)
+        return PushResult.SUCCESS
+
+    def next_push_delay(self) -> float:
+        """Headless pushes are never rate limited."""
+        return 0.0
+
+    def ping(self) -> PushResult:
+        """Always healthy."""
+        return PushResult.SUCCESS
+
+    def reboot(self) -> bool:
+        """Nothing to reboot; report success."""
+        return True
+
+    def set_brightness(self, level: int) -> None:
+        """Remember the requested brightness (no device to apply it to)."""
+        self.brightness = level
+
+    def test_connection(self) -> bool:
+        """Always connected."""
+        return True
+
+    def push_rate_stats(self) -> dict:
+        """Capture counters for status output."""
+        stats = {"pushed": self.pushed, "buffered": len(self.frames)}
+        if self.recorder is not None:
+            stats["recorded"] = self.recorder.written
+            stats["record_dropped"] = self.recorder.dropped
+        return stats
+
+    def close(self) -> None:
+        """Flush and close the recorder, if any."""
+        if self.recorder is not None:
+            self.recorder.close()
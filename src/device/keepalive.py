@@ -8,15 +8,18 @@ wait period before resuming pings.
 from __future__ import annotations
 
 import logging
-import time
+from typing import TYPE_CHECKING
 
+from src import events, timesource
 from src.config import (
     DEVICE_PING_INTERVAL,
     DEVICE_REBOOT_RECOVERY_WAIT,
     DEVICE_REBOOT_THRESHOLD,
 )
 from src.device.pixoo_client import PixooClient, PushResult
-from src.providers.discord_monitor import HealthTracker
+
+if TYPE_CHECKING:
+    from src.providers.discord_monitor import HealthTracker
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +30,21 @@ class DeviceKeepAlive:
     The main loop calls :meth:`record_success` / :meth:`record_failure`
     after each frame push and :meth:`tick` once per iteration to handle
     background pings and reboot recovery.
+
+    Args:
+        component: HealthTracker component name used for ping results
+            (one per device when driving several displays).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, component: str = "device") -> None:
+        self.component = component
         self.consecutive_failures: int = 0
         self.last_success_time: float = 0.0
         self._reboot_wait_until: float = 0.0
 
     def record_success(self) -> None:
         """Record a successful device communication (push or ping)."""
-        self.last_success_time = time.monotonic()
+        self.last_success_time = timesource.monotonic()
         self.consecutive_failures = 0
 
     def record_failure(self) -> None:
@@ -55,7 +63,7 @@ class DeviceKeepAlive:
 
         Args:
             client: Pixoo device client for ping/reboot commands.
-            now_mono: Current ``time.monotonic()`` value.
+            now_mono: Current ``timesource.monotonic()`` value.
             health_tracker: Optional health tracker for monitoring integration.
         """
         if now_mono <= self._reboot_wait_until:
@@ -67,8 +75,13 @@ class DeviceKeepAlive:
                 "Device has %d consecutive failures, attempting reboot",
                 self.consecutive_failures,
             )
+            events.record(
+                events.EventType.KEEPALIVE_REBOOT,
+                value=self.consecutive_failures,
+                source=self.component,
+            )
             if client.reboot():
-                self._reboot_wait_until = time.monotonic() + DEVICE_REBOOT_RECOVERY_WAIT
+                self._reboot_wait_until = timesource.monotonic() + DEVICE_REBOOT_RECOVERY_WAIT
                 logger.info(
                     "Waiting %ds for device to recover after reboot",
                     DEVICE_REBOOT_RECOVERY_WAIT,
@@ -76,7 +89,7 @@ class DeviceKeepAlive:
             else:
                 wait = DEVICE_REBOOT_RECOVERY_WAIT * 2
                 logger.warning("Reboot command failed, backing off for %ds", wait)
-                self._reboot_wait_until = time.monotonic() + DEVICE_REBOOT_RECOVERY_WAIT * 2
+                self._reboot_wait_until = timesource.monotonic() + DEVICE_REBOOT_RECOVERY_WAIT * 2
             self.consecutive_failures = 0
             return
 
@@ -87,8 +100,8 @@ class DeviceKeepAlive:
             if ping_result is PushResult.SUCCESS:
                 self.record_success()
                 if health_tracker:
-                    health_tracker.record_success("device")
+                    health_tracker.record_success(self.component)
             elif ping_result is PushResult.ERROR:
                 self.record_failure()
                 if health_tracker:
-                    health_tracker.record_failure("device", "Device ping failed")
+                    health_tracker.record_failure(self.component, "Device ping failed")
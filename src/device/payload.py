@@ -0,0 +1,116 @@
+"""Pre-encoded device payloads for the Pixoo 64 ``Draw/SendHttpGif`` command.
+
+The device expects each frame as base64-encoded raw RGB bytes (row-major,
+3 bytes per pixel) in the ``PicData`` field of a JSON request. The pixoo
+library rebuilds this on every push: ``draw_image`` copies the image
+pixel-by-pixel into a Python list and ``push`` base64-encodes that list
+and serialises the whole request with ``json.dumps``.
+
+A :class:`FramePayload` does the encoding once, straight from the image's
+raw bytes, and assembles the JSON body with a single bytes format. Only
+``PicID`` changes between pushes, so cached frames can be re-sent without
+touching the pixels again.
+
+An :class:`AnimationPayload` packs several encoded frames into one
+``Draw/CommandList`` request: one ``Draw/SendHttpGif`` per frame, sharing a
+``PicID``, with ``PicNum``/``PicOffset`` numbering them and ``PicSpeed``
+setting the on-device frame time. The device then plays the frames itself,
+so animation runs faster than one HTTP request per frame.
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass
+
+from PIL import Image
+
+# JSON body template for one frame of a device animation
+_SEND_GIF_TEMPLATE = (
+    b'{"Command":"Draw/SendHttpGif","PicNum":%d,"PicWidth":%d,'
+    b'"PicOffset":%d,"PicID":%d,"PicSpeed":%d,"PicData":"%s"}'
+)
+_COMMAND_LIST_TEMPLATE = b'{"Command":"Draw/CommandList","CommandList":[%s]}'
+
+
+def encode_frame(image: Image.Image) -> bytes:
+    """Encode a PIL image as the device's base64 ``PicData`` payload.
+
+    Args:
+        image: Frame to encode (converted to RGB if needed).
+
+    Returns:
+        ASCII bytes of the base64-encoded raw RGB pixel data.
+    """
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return base64.b64encode(image.tobytes())
+
+
+@dataclass(frozen=True)
+class FramePayload:
+    """A frame already encoded for the device, ready to send.
+
+    Attributes:
+        pic_data: Base64 ASCII bytes of the raw RGB pixels.
+        width: Frame width/height in pixels (the Pixoo is square).
+    """
+
+    pic_data: bytes
+    width: int = 64
+
+    @classmethod
+    def from_image(cls, image: Image.Image) -> FramePayload:
+        """Encode a PIL image into a payload."""
+        return cls(pic_data=encode_frame(image), width=image.width)
+
+    def to_image(self) -> Image.Image:
+        """Decode the payload back into an RGB image (for the simulator)."""
+        return Image.frombytes("RGB", (self.width, self.width), base64.b64decode(self.pic_data))
+
+    def body(self, pic_id: int) -> bytes:
+        """Return the complete ``Draw/SendHttpGif`` JSON request body.
+
+        Args:
+            pic_id: Device animation id; must increase between pushes
+                until the device counter is reset.
+        """
+        return _SEND_GIF_TEMPLATE % (1, self.width, 0, pic_id, 1000, self.pic_data)
+
+
+@dataclass(frozen=True)
+class AnimationPayload:
+    """Several encoded frames uploaded as one device animation.
+
+    The device shows each frame for ``speed_ms`` and loops until the next
+    upload replaces the animation.
+
+    Attributes:
+        frames: Encoded frames in playback order.
+        speed_ms: On-device time per frame, in milliseconds.
+    """
+
+    frames: tuple[FramePayload, ...]
+    speed_ms: int
+
+    @property
+    def width(self) -> int:
+        """Frame width/height in pixels."""
+        return self.frames[0].width
+
+    def to_image(self) -> Image.Image:
+        """Decode the last frame (for the simulator, which shows one image)."""
+        return self.frames[-1].to_image()
+
+    def body(self, pic_id: int) -> bytes:
+        """Return the ``Draw/CommandList`` request body uploading every frame.
+
+        Args:
+            pic_id: Device animation id shared by all frames.
+        """
+        count = len(self.frames)
+        commands = b",".join(
+            _SEND_GIF_TEMPLATE % (count, frame.width, offset, pic_id, self.speed_ms, frame.pic_data)
+            for offset, frame in enumerate(self.frames)
+        )
+        return _COMMAND_LIST_TEMPLATE % commands
@@ -7,6 +7,12 @@ causes the device to drop connections and eventually freeze.
 This wrapper enforces safe timing, adds timeouts to all device HTTP calls
 (the upstream pixoo library uses none), and implements error cooldown to
 prevent cascading failures when the device is in a degraded state.
+
+Frames can be pushed either as PIL images (through the pixoo library's
+``draw_image`` + ``push``) or as pre-encoded :class:`FramePayload` objects,
+which are posted directly so a cached frame costs little more than the
+HTTP request itself. An :class:`AnimationPayload` uploads several frames
+in one request for the device to play back on its own.
 """
 
 import enum
@@ -18,6 +24,7 @@ from PIL import Image
 from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
+from src import events
 from src.config import (
     DEVICE_ERROR_COOLDOWN_BASE,
     DEVICE_ERROR_COOLDOWN_MAX,
@@ -26,6 +33,9 @@ from src.config import (
     DISPLAY_SIZE,
     MAX_BRIGHTNESS,
 )
+from src.device.payload import AnimationPayload, FramePayload
+from src.device.rate_controller import AdaptivePushRate
+from src.metrics import DeviceMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +54,16 @@ _MIN_PUSH_INTERVAL = DEVICE_MIN_PUSH_INTERVAL
 _ERROR_COOLDOWN_BASE = DEVICE_ERROR_COOLDOWN_BASE
 _ERROR_COOLDOWN_MAX = DEVICE_ERROR_COOLDOWN_MAX
 
+# Reset the device's animation id counter after this many pushes. Mirrors the
+# pixoo library's refresh_connection_automatically behaviour, which prevents
+# the device from locking up after ~300 pushes.
+_PIC_ID_REFRESH_LIMIT = 32
+_RESET_PIC_ID_BODY = b'{"Command":"Draw/ResetHttpGifId"}'
+
+
+class DeviceRejectedError(RequestException):
+    """The device answered a command with a non-zero ``error_code``."""
+
 
 class _TimeoutHTTPAdapter(HTTPAdapter):
     """HTTPAdapter that injects a default timeout on every request."""
@@ -84,7 +104,8 @@ class PixooClient:
     """Wrapper around the pixoo library's Pixoo class.
 
     Provides:
-    - Safe rate limiting (minimum 1.0s between pushes, matching device capacity)
+    - Adaptive rate limiting (AIMD on push latency/errors, never faster than
+      DEVICE_MIN_PUSH_INTERVAL -- 1.0s by default, matching device capacity)
     - Timeout injection for all device HTTP calls (5s default)
     - Error cooldown to prevent cascading failures on degraded device
     - Connection refresh to prevent the ~300-push lockup (pixoo lib feature)
@@ -105,7 +126,8 @@ class PixooClient:
         # device HTTP calls go through _TimeoutHTTPAdapter (default timeout).
         import pixoo.objects.pixoo as _pixoo_module
 
-        _pixoo_module.requests = _RequestsShim(timeout=_DEVICE_TIMEOUT)
+        self._http = _RequestsShim(timeout=_DEVICE_TIMEOUT)
+        _pixoo_module.requests = self._http
 
         from pixoo import Pixoo
 
@@ -127,14 +149,34 @@ class PixooClient:
         self._last_push_time: float = 0.0
         self._error_until: float = 0.0  # monotonic time when cooldown expires
         self._ip = ip
+        self._url = f"http://{ip}/post"
+        self._simulated = simulated
+        # Last animation id sent; None = device counter must be reset first
+        self._pic_id: int | None = None
         self._current_cooldown: float = _ERROR_COOLDOWN_BASE
-
-    def push_frame(self, image: Image.Image) -> PushResult:
-        """Push a PIL Image frame to the device.
-
-        Enforces a minimum 1.0-second interval between pushes. The Pixoo 64
-        can only reliably handle ~1 push per second over HTTP. Calls arriving
-        too soon are silently skipped (no warning spam at animation tick rate).
+        self._rate = AdaptivePushRate()
+        self.metrics = DeviceMetrics()
+        # Multi-frame uploads; the simulator only shows single images
+        self.supports_multi_frame = not simulated
+
+    @property
+    def push_interval(self) -> float:
+        """Current adaptive minimum interval between pushes, in seconds."""
+        return self._rate.interval
+
+    def push_rate_stats(self) -> dict:
+        """Adaptive push-rate controller state for status output."""
+        return self._rate.stats()
+
+    def push_frame(self, frame: Image.Image | FramePayload | AnimationPayload) -> PushResult:
+        """Push a frame to the device.
+
+        Enforces the adaptive minimum interval between pushes (never below
+        1.0s by default). The Pixoo 64 can only reliably handle ~1 push per
+        second over HTTP, and slows down further when degraded; push latency
+        feeds the rate controller so it backs off before the device freezes.
+        Calls arriving too soon are silently skipped (no warning spam at
+        animation tick rate).
 
         After a communication error, a cooldown period prevents rapid retries
         that would further overwhelm the device.
@@ -143,7 +185,10 @@ class PixooClient:
         so the main loop can continue and retry on the next iteration.
 
         Args:
-            image: A PIL RGB Image (should be 64x64 for Pixoo 64).
+            frame: A PIL RGB Image (should be 64x64 for Pixoo 64), or a
+                pre-encoded FramePayload which skips per-pixel buffering
+                and base64 encoding, or an AnimationPayload of several
+                pre-encoded frames for the device to play back in order.
 
         Returns:
             PushResult.SUCCESS if the frame was delivered to the device.
@@ -154,29 +199,100 @@ class PixooClient:
 
         # Respect error cooldown
         if now < self._error_until:
+            self.metrics.record_result(PushResult.SKIPPED.value)
             return PushResult.SKIPPED
 
         # Rate limit: enforce minimum interval
         elapsed = now - self._last_push_time
-        if self._last_push_time > 0 and elapsed < _MIN_PUSH_INTERVAL:
+        if self._last_push_time > 0 and elapsed < self._rate.interval:
+            self.metrics.record_result(PushResult.SKIPPED.value)
             return PushResult.SKIPPED
 
+        started = time.monotonic()
         try:
-            self._pixoo.draw_image(image)
-            self._pixoo.push()
+            if isinstance(frame, (FramePayload, AnimationPayload)):
+                if not self._push_payload(frame):
+                    # The animation id reset used this push slot; the device
+                    # drops a frame sent straight after it
+                    self._last_push_time = time.monotonic()
+                    self.metrics.record_result(PushResult.SKIPPED.value)
+                    return PushResult.SKIPPED
+            else:
+                self._pixoo.draw_image(frame)
+                self._pixoo.push()
         except (RequestException, OSError) as exc:
             logger.warning("Device communication error during push_frame: %s", exc)
+            self._rate.record_error()
+            self._pic_id = None  # device may have rebooted -- resync its counter
             self._error_until = time.monotonic() + self._current_cooldown
             logger.info(
                 "Device cooldown: pausing pushes for %.0fs (backoff)",
                 self._current_cooldown,
             )
             self._current_cooldown = min(self._current_cooldown * 2, _ERROR_COOLDOWN_MAX)
+            self.metrics.record_result(PushResult.ERROR.value)
+            events.record(
+                events.EventType.PUSH,
+                events.EventResult.ERROR,
+                duration=time.monotonic() - started,
+                value=self._current_cooldown,
+                source=self._ip,
+            )
             return PushResult.ERROR
         self._current_cooldown = _ERROR_COOLDOWN_BASE
         self._last_push_time = time.monotonic()
+        latency = self._last_push_time - started
+        self._rate.record_success(latency)
+        self.metrics.record_result(PushResult.SUCCESS.value)
+        self.metrics.latency.observe(latency)
+        events.record(events.EventType.PUSH, duration=latency, source=self._ip)
         return PushResult.SUCCESS
 
+    def next_push_delay(self) -> float:
+        """Seconds until :meth:`push_frame` would stop skipping (0 = ready now).
+
+        Covers both the adaptive push interval and any active error cooldown.
+        """
+        now = time.monotonic()
+        delay = self._error_until - now
+        if self._last_push_time > 0:
+            delay = max(delay, self._last_push_time + self._rate.interval - now)
+        return max(delay, 0.0)
+
+    def _push_payload(self, payload: FramePayload | AnimationPayload) -> bool:
+        """Send a pre-encoded frame or animation, managing the animation id counter.
+
+        When the device's counter is due for a reset, only the reset is sent
+        and the payload is left for the next push slot.
+
+        Returns:
+            True if the payload was sent, False if the slot went to the reset.
+
+        Raises:
+            RequestException, OSError: On device communication failure or a
+                rejected command.
+        """
+        if self._simulated:
+            # The Tkinter simulator only consumes the library's pixel buffer
+            self._pixoo.draw_image(payload.to_image())
+            self._pixoo.push()
+            return True
+        if self._pic_id is None or self._pic_id >= _PIC_ID_REFRESH_LIMIT:
+            self._post(_RESET_PIC_ID_BODY)
+            self._pic_id = 0
+            return False
+        self._pic_id += 1
+        self._post(payload.body(self._pic_id))
+        return True
+
+    def _post(self, body: bytes) -> None:
+        """POST a command body, raising unless the device accepted it."""
+        response = self._http.post(self._url, data=body)
+        response.raise_for_status()
+        error_code = response.json().get("error_code", 0)
+        if error_code != 0:
+            raise DeviceRejectedError(f"Device rejected command (error_code {error_code})")
+
     def ping(self) -> PushResult:
         """Send a lightweight health-check to keep the device WiFi alive.
 
@@ -194,11 +310,19 @@ class PixooClient:
         try:
             self._pixoo.validate_connection()
             self._current_cooldown = _ERROR_COOLDOWN_BASE
+            events.record(events.EventType.PING, duration=time.monotonic() - now, source=self._ip)
             return PushResult.SUCCESS
         except (RequestException, OSError) as exc:
             logger.warning("Device ping failed: %s", exc)
+            self._rate.record_error()
             self._error_until = time.monotonic() + self._current_cooldown
             self._current_cooldown = min(self._current_cooldown * 2, _ERROR_COOLDOWN_MAX)
+            events.record(
+                events.EventType.PING,
+                events.EventResult.ERROR,
+                duration=time.monotonic() - now,
+                source=self._ip,
+            )
             return PushResult.ERROR
 
     def reboot(self) -> bool:
@@ -210,6 +334,7 @@ class PixooClient:
         Returns:
             True if the reboot command was acknowledged, False otherwise.
         """
+        self.metrics.reboots += 1
         try:
             _requests_module.post(
                 f"http://{self._ip}/post",
@@ -217,9 +342,11 @@ class PixooClient:
                 timeout=_DEVICE_TIMEOUT,
             )
             logger.warning("Device reboot command sent to %s", self._ip)
+            events.record(events.EventType.REBOOT, source=self._ip)
             return True
         except (RequestException, OSError) as exc:
             logger.warning("Device reboot failed: %s", exc)
+            events.record(events.EventType.REBOOT, events.EventResult.ERROR, source=self._ip)
             return False
 
     def set_brightness(self, level: int) -> None:
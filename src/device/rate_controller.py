@@ -0,0 +1,109 @@
+"""Adaptive (AIMD) push-rate control for a single Pixoo device.
+
+The Pixoo's embedded HTTP server degrades before it freezes: round-trip
+times climb well before connections start failing. :class:`AdaptivePushRate`
+watches a smoothed push latency and the error signal and adjusts the push
+rate the way TCP adjusts its congestion window:
+
+- additive increase: each healthy push raises the rate by a fixed step,
+  until the configured floor interval (fastest allowed rate) is reached;
+- multiplicative decrease: a push slower than the latency target, or any
+  error, divides the rate, down to the configured ceiling interval.
+
+With the default floor of 1.0s the controller never pushes faster than the
+historical fixed limit; it only backs off early when the device struggles.
+Newer firmware can opt into faster animation by lowering the floor.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from src.config import (
+    DEVICE_MAX_PUSH_INTERVAL,
+    DEVICE_MIN_PUSH_INTERVAL,
+    DEVICE_PUSH_LATENCY_TARGET,
+)
+
+# Pushes/second added after each healthy push
+_RATE_INCREASE_STEP = 0.05
+# Rate multiplier applied on congestion (slow push) or error
+_RATE_DECREASE_FACTOR = 0.5
+# Weight of the newest sample in the latency moving average
+_LATENCY_SMOOTHING = 0.3
+
+
+class AdaptivePushRate:
+    """Track push latency/errors and derive the current minimum push interval.
+
+    Thread-safe: a device worker records results while the main loop or
+    status command reads :attr:`interval`.
+
+    Args:
+        floor: Shortest allowed interval between pushes (seconds).
+        ceiling: Longest interval the controller backs off to (seconds).
+        latency_target: Smoothed round-trip time above which the device is
+            treated as congested (seconds).
+    """
+
+    def __init__(
+        self,
+        floor: float = DEVICE_MIN_PUSH_INTERVAL,
+        ceiling: float = DEVICE_MAX_PUSH_INTERVAL,
+        latency_target: float = DEVICE_PUSH_LATENCY_TARGET,
+    ) -> None:
+        if not 0 < floor <= ceiling:
+            raise ValueError(f"need 0 < floor <= ceiling, got {floor}, {ceiling}")
+        self._lock = threading.Lock()
+        self._max_rate = 1.0 / floor
+        self._min_rate = 1.0 / ceiling
+        self._latency_target = latency_target
+        self._rate = self._max_rate
+        self._latency: float | None = None
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def interval(self) -> float:
+        """Current minimum number of seconds between pushes."""
+        with self._lock:
+            return 1.0 / self._rate
+
+    @property
+    def latency(self) -> float | None:
+        """Smoothed push round-trip time in seconds (None before any push)."""
+        with self._lock:
+            return self._latency
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed push and its round-trip time in seconds."""
+        with self._lock:
+            if self._latency is None:
+                self._latency = latency
+            else:
+                self._latency += _LATENCY_SMOOTHING * (latency - self._latency)
+            if self._latency > self._latency_target:
+                self._decrease()
+            elif self._rate < self._max_rate:
+                self._rate = min(self._rate + _RATE_INCREASE_STEP, self._max_rate)
+                self.increases += 1
+
+    def record_error(self) -> None:
+        """Record a failed device request (timeout, reset, refused)."""
+        with self._lock:
+            self._decrease()
+
+    def _decrease(self) -> None:
+        if self._rate > self._min_rate:
+            self._rate = max(self._rate * _RATE_DECREASE_FACTOR, self._min_rate)
+            self.decreases += 1
+
+    def stats(self) -> dict:
+        """Controller state for status output."""
+        with self._lock:
+            return {
+                "interval_s": round(1.0 / self._rate, 2),
+                "latency_ms": None if self._latency is None else round(self._latency * 1000),
+                "increases": self.increases,
+                "decreases": self.decreases,
+            }
@@ -0,0 +1,124 @@
+"""Adaptive weather animation quality under a per-frame CPU budget.
+
+An animated frame costs an animation tick plus a render and encode per
+sub-frame, and that cost grows with the particle count: extreme rain
+with a fog overlay and wind drift does several times the work of a
+drizzle. On a slow or thermally throttled host that can push a loop
+iteration past its tick deadline.
+
+:class:`AdaptiveAnimationQuality` watches the smoothed animated frame time
+and steps a quality level down when it exceeds the budget, and back up
+after a sustained run of frames well under it:
+
+- a frame slower than the whole tick deadline drops straight to the
+  lowest level, so one overrun is never followed by another;
+- the smoothed time is restarted after every change, so the next
+  decision measures the new level rather than the old one.
+
+Animations apply the level through
+:meth:`~src.display.weather_anim.WeatherAnimation.set_quality`: particle
+counts scale with it and composites drop their overlay layers at the
+lowest levels.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from src.config import ANIM_FRAME_BUDGET
+
+# Fraction of each animation's full particle count, best first
+QUALITY_LEVELS = (1.0, 0.75, 0.5, 0.25)
+
+# Weight of the newest sample in the frame-time moving average
+_FRAME_TIME_SMOOTHING = 0.3
+# Frames measured at a level before the average is trusted
+_MIN_SAMPLES = 3
+# Smoothed frame time, as a fraction of the budget, that counts as headroom
+_HEADROOM = 0.5
+# Consecutive frames with headroom before stepping back up
+_RECOVER_FRAMES = 30
+
+
+class AdaptiveAnimationQuality:
+    """Track animated frame times and derive the current quality level.
+
+    Thread-safe: the loop records frame times while the metrics endpoint
+    or status command reads :meth:`stats`.
+
+    Args:
+        budget: Smoothed animated frame time to stay under (seconds).
+    """
+
+    def __init__(self, budget: float = ANIM_FRAME_BUDGET) -> None:
+        if budget <= 0:
+            raise ValueError(f"need a positive budget, got {budget}")
+        self._lock = threading.Lock()
+        self._budget = budget
+        self._index = 0
+        self._frame_time: float | None = None
+        self._samples = 0
+        self._headroom_frames = 0
+        self.decreases = 0
+        self.increases = 0
+
+    @property
+    def level(self) -> float:
+        """Current fraction of the full particle count (1.0 = full quality)."""
+        with self._lock:
+            return QUALITY_LEVELS[self._index]
+
+    def record(self, elapsed: float, deadline: float | None = None) -> float:
+        """Record one animated frame's tick, render and encode time.
+
+        Args:
+            elapsed: Seconds spent producing the frame.
+            deadline: Loop tick period; a frame slower than this drops
+                to the lowest level at once.
+
+        Returns:
+            The quality level for the next frame.
+        """
+        with self._lock:
+            if deadline is not None and elapsed > deadline:
+                self._set(len(QUALITY_LEVELS) - 1)
+                return QUALITY_LEVELS[self._index]
+            if self._frame_time is None:
+                self._frame_time = elapsed
+            else:
+                self._frame_time += _FRAME_TIME_SMOOTHING * (elapsed - self._frame_time)
+            self._samples += 1
+            if self._samples < _MIN_SAMPLES:
+                return QUALITY_LEVELS[self._index]
+
+            if self._frame_time > self._budget:
+                self._set(self._index + 1)
+            elif self._frame_time < self._budget * _HEADROOM:
+                self._headroom_frames += 1
+                if self._headroom_frames >= _RECOVER_FRAMES:
+                    self._set(self._index - 1)
+            else:
+                self._headroom_frames = 0
+            return QUALITY_LEVELS[self._index]
+
+    def _set(self, index: int) -> None:
+        index = max(0, min(index, len(QUALITY_LEVELS) - 1))
+        if index > self._index:
+            self.decreases += 1
+        elif index < self._index:
+            self.increases += 1
+        self._index = index
+        self._frame_time = None
+        self._samples = 0
+        self._headroom_frames = 0
+
+    def stats(self) -> dict:
+        """Governor state for status output."""
+        with self._lock:
+            return {
+                "level": QUALITY_LEVELS[self._index],
+                "frame_ms": None if self._frame_time is None else round(self._frame_time * 1000),
+                "budget_ms": round(self._budget * 1000),
+                "decreases": self.decreases,
+                "increases": self.increases,
+            }
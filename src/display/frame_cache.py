@@ -0,0 +1,106 @@
+"""Bounded memoisation of rendered dashboard frames.
+
+Rendering a frame and encoding it for the device depend only on the
+:class:`~src.display.state.DisplayState` (plus the animation frame, when
+one is active). The cache maps a stable digest of the state and an
+optional animation frame id to the rendered image and its encoded device
+payload, so repeated states skip both rendering and base64 encoding.
+
+Hit/miss counters are exposed via :meth:`FrameCache.stats` for the
+monitoring status command.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from PIL import Image
+
+from src.device.payload import FramePayload
+from src.display.state import DisplayState
+
+CacheKey = tuple[str, Hashable]
+
+
+class CachedFrame:
+    """A rendered frame with its lazily encoded device payload."""
+
+    __slots__ = ("image", "_payload")
+
+    def __init__(self, image: Image.Image) -> None:
+        self.image = image
+        self._payload: FramePayload | None = None
+
+    @property
+    def payload(self) -> FramePayload:
+        """Device payload for this frame, encoded once on first use."""
+        if self._payload is None:
+            self._payload = FramePayload.from_image(self.image)
+        return self._payload
+
+
+class FrameCache:
+    """LRU cache of rendered frames keyed on display state and animation frame.
+
+    Thread-safe: the status command reads :meth:`stats` from the Discord
+    bot thread while the main loop reads and writes entries.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, CachedFrame] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(state: DisplayState, anim_frame_id: Hashable = None) -> CacheKey:
+        """Build a cache key from a display state and optional animation frame id.
+
+        Frames with an active animation are only cacheable when the
+        animation can name the frame it produced (``anim_frame_id``).
+        """
+        return state.stable_hash(), anim_frame_id
+
+    def get(self, key: CacheKey) -> CachedFrame | None:
+        """Return the cached frame for *key*, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: CacheKey, image: Image.Image) -> CachedFrame:
+        """Store a rendered frame, evicting the least recently used entry if full."""
+        entry = CachedFrame(image)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached frames (counters are preserved)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size for monitoring."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+            }
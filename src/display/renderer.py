@@ -31,6 +31,7 @@ from src.display.layout import (
     WEATHER_ZONE,
     urgency_color,
 )
+from src.display.sparse_layer import Layer, SparseLayer
 from src.display.state import DisplayState
 from src.display.text_utils import strip_non_latin1
 from src.display.weather_icons import get_weather_icon
@@ -122,8 +123,15 @@ def _draw_bus_line(
         cursor_x += text_width
 
 
-def _composite_layer(img: Image.Image, layer: Image.Image, zone_y: int) -> None:
-    """Alpha-composite an RGBA layer onto the image at the weather zone position."""
+def _composite_layer(img: Image.Image, layer: Layer, zone_y: int) -> None:
+    """Alpha-composite an animation layer onto the image at the weather zone position.
+
+    Sparse layers are blitted record-by-record; RGBA images go through a
+    full-zone crop and ``Image.alpha_composite``.
+    """
+    if isinstance(layer, SparseLayer):
+        layer.composite_onto(img, (0, zone_y))
+        return
     zone_region = img.crop((0, zone_y, layer.width, zone_y + layer.height)).convert("RGBA")
     composited = Image.alpha_composite(zone_region, layer)
     img.paste(composited.convert("RGB"), (0, zone_y))
@@ -134,7 +142,7 @@ def render_weather_zone(
     img: Image.Image,
     state: DisplayState,
     fonts: dict,
-    anim_layers: tuple[Image.Image, Image.Image] | None = None,
+    anim_layers: tuple[Layer, Layer] | None = None,
 ) -> None:
     """Render the weather zone with 3D layered animation.
 
@@ -148,7 +156,8 @@ def render_weather_zone(
         img: The base RGB image (for compositing animation overlays).
         state: Current display state with weather data.
         fonts: Font dictionary with "small" (5x8) and "tiny" (4x6) keys.
-        anim_layers: Optional (bg_layer, fg_layer) RGBA overlays (64x24 each).
+        anim_layers: Optional (bg_layer, fg_layer) overlays (64x24 each), either
+            RGBA images or SparseLayer records.
     """
     zone_y = WEATHER_ZONE.y
 
@@ -355,7 +364,7 @@ def _draw_birthday_sparkles(draw: ImageDraw.ImageDraw, date_str: str) -> None:
 def render_frame(
     state: DisplayState,
     fonts: dict,
-    anim_frame: tuple[Image.Image, Image.Image] | None = None,
+    anim_frame: tuple[Layer, Layer] | None = None,
 ) -> Image.Image:
     """Render the dashboard state into a 64x64 RGB PIL Image.
 
@@ -366,7 +375,8 @@ def render_frame(
         state: Current display data (time string, date string).
         fonts: Dictionary with keys "small", "tiny" mapping
                to PIL ImageFont objects.
-        anim_frame: Optional (bg_layer, fg_layer) RGBA tuple for weather zone (64x24 each).
+        anim_frame: Optional (bg_layer, fg_layer) tuple for weather zone (64x24 each),
+            as RGBA images or SparseLayer records.
 
     Returns:
         A 64x64 RGB PIL Image ready for pushing to the device.
@@ -0,0 +1,106 @@
+"""Persisted display state for the first frame after a restart.
+
+The main loop saves each new :class:`~src.display.state.DisplayState` to a
+small JSON file. On startup :func:`load_snapshot` rebuilds it for the
+current time, so the device shows the last known bus and weather data
+(flagged stale) within a frame of process start instead of placeholders
+until the slower of the two APIs responds.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+
+from src.config import BUS_TOO_OLD_THRESHOLD, WEATHER_TOO_OLD_THRESHOLD
+from src.display.state import DisplayState
+from src.providers.clock import format_date_norwegian, format_time
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+_WEATHER_FIELDS = (
+    "weather_temp",
+    "weather_symbol",
+    "weather_high",
+    "weather_low",
+    "weather_precip_mm",
+)
+
+
+def save_snapshot(state: DisplayState, path: str | Path, saved_at: float) -> None:
+    """Write *state* atomically to *path*.
+
+    Args:
+        state: Display state to persist.
+        path: Snapshot file location.
+        saved_at: Wall-clock timestamp of the state (``datetime.timestamp()``).
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    data = {"version": SNAPSHOT_VERSION, "saved_at": saved_at, "state": dataclasses.asdict(state)}
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+def _shift_countdown(minutes: list[int] | None, elapsed_min: int) -> tuple[int, ...] | None:
+    """Advance saved departure countdowns by the minutes since the save."""
+    if minutes is None:
+        return None
+    return tuple(m - elapsed_min for m in minutes if m - elapsed_min >= 0)
+
+
+def load_snapshot(
+    path: str | Path, now: datetime, *, is_birthday: bool = False
+) -> DisplayState | None:
+    """Rebuild the persisted state for *now*, with its provider data marked stale.
+
+    Time, date and the birthday flag come from *now*. Bus countdowns are
+    shifted by the whole minutes elapsed since the save; bus and weather
+    data older than their too-old thresholds are dropped (placeholders).
+    The Discord message is not restored; the message bridge starts empty.
+
+    Returns:
+        The rebuilt state, or None if there is no usable snapshot.
+    """
+    try:
+        data = json.loads(Path(path).read_text())
+        if data.get("version") != SNAPSHOT_VERSION:
+            return None
+        saved = data["state"]
+        age = max(0.0, now.timestamp() - float(data["saved_at"]))
+        state = DisplayState(**saved)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+        logger.warning("Ignoring unreadable display snapshot %s: %s", path, exc)
+        return None
+
+    changes: dict = {
+        "time_str": format_time(now),
+        "date_str": format_date_norwegian(now),
+        "is_birthday": is_birthday,
+        "message_text": None,
+    }
+    if state.bus_too_old or age > BUS_TOO_OLD_THRESHOLD:
+        changes.update(bus_direction1=None, bus_direction2=None, bus_too_old=True)
+    else:
+        elapsed_min = int(age // 60)
+        changes.update(
+            bus_direction1=_shift_countdown(saved["bus_direction1"], elapsed_min),
+            bus_direction2=_shift_countdown(saved["bus_direction2"], elapsed_min),
+        )
+    if state.weather_too_old or age > WEATHER_TOO_OLD_THRESHOLD:
+        changes.update(dict.fromkeys(_WEATHER_FIELDS), weather_too_old=True)
+    state = dataclasses.replace(state, **changes)
+    state.bus_stale = state.bus_direction1 is not None or state.bus_direction2 is not None
+    state.weather_stale = state.weather_temp is not None
+    return state
@@ -0,0 +1,187 @@
+"""Sparse RGBA pixel layers for mostly-transparent animation overlays.
+
+Particle animations (rain, snow, stars) light only a few dozen of the
+1,536 pixels in the 64x24 weather zone, yet a full RGBA ``Image`` costs
+6 KB of allocation plus a full-zone alpha composite per layer per tick.
+A :class:`SparseLayer` instead stores one compact 6-byte record
+``(x, y, r, g, b, a)`` per lit pixel.
+
+The class implements the subset of the ``ImageDraw`` API the particle
+animations use (``point`` and ``line``), so the same drawing code can
+target either representation. Records are composited in insertion order
+with standard "over" alpha blending, which makes merging layers (e.g. in
+``CompositeAnimation``) a plain concatenation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+
+from PIL import Image
+
+Color = tuple[int, int, int, int]
+
+# Bytes per record: x, y, r, g, b, a (all 0-255)
+RECORD_SIZE = 6
+
+
+class SparseLayer:
+    """Compact list of RGBA pixel records with ImageDraw-style drawing.
+
+    Pixels outside ``width`` x ``height`` are silently clipped, matching
+    PIL's behaviour for drawing outside image bounds.
+    """
+
+    __slots__ = ("width", "height", "_records")
+
+    def __init__(self, width: int = 64, height: int = 24) -> None:
+        self.width = width
+        self.height = height
+        self._records = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._records) // RECORD_SIZE
+
+    def __iter__(self) -> Iterator[tuple[int, int, int, int, int, int]]:
+        rec = self._records
+        for i in range(0, len(rec), RECORD_SIZE):
+            yield rec[i], rec[i + 1], rec[i + 2], rec[i + 3], rec[i + 4], rec[i + 5]
+
+    # -- ImageDraw-compatible drawing ---------------------------------------
+
+    def point(self, xy: tuple[int, int], fill: Color) -> None:
+        """Add a single pixel record (clipped to layer bounds)."""
+        x, y = int(xy[0]), int(xy[1])
+        if 0 <= x < self.width and 0 <= y < self.height:
+            rec = self._records
+            rec.append(x)
+            rec.append(y)
+            rec.extend(fill)
+
+    def line(self, xy: Sequence[tuple[int, int]], fill: Color, width: int = 1) -> None:
+        """Rasterise a 1px line between two points (Bresenham).
+
+        Only the first two points of *xy* are used; *width* is accepted for
+        ImageDraw compatibility and ignored (particles are 1px wide).
+        """
+        (x0, y0), (x1, y1) = (int(xy[0][0]), int(xy[0][1])), (int(xy[1][0]), int(xy[1][1]))
+        if x0 == x1:
+            # Fast path for vertical streaks (rain)
+            if not 0 <= x0 < self.width:
+                return
+            lo, hi = max(min(y0, y1), 0), min(max(y0, y1), self.height - 1)
+            rec = self._records
+            for y in range(lo, hi + 1):
+                rec.append(x0)
+                rec.append(y)
+                rec.extend(fill)
+            return
+        dx, dy = abs(x1 - x0), -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        while True:
+            self.point((x0, y0), fill)
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+
+    def scatter(
+        self,
+        xs: Sequence[int],
+        ys: Sequence[int],
+        rgb: tuple[int, int, int],
+        alphas: Sequence[int],
+    ) -> None:
+        """Add one same-coloured record per ``(x, y, alpha)`` in a single write.
+
+        Pixels with alpha 0 or outside the layer are skipped.
+        """
+        r, g, b = rgb
+        width, height = self.width, self.height
+        self._records += bytes(
+            value
+            for x, y, a in zip(xs, ys, alphas, strict=True)
+            if a and 0 <= x < width and 0 <= y < height
+            for value in (x, y, r, g, b, a)
+        )
+
+    # -- Merging and rasterising ----------------------------------------------
+
+    def extend(self, other: SparseLayer) -> None:
+        """Append all records of *other* (composited after this layer's own)."""
+        self._records += other._records
+
+    def faded(self, factor: float) -> SparseLayer:
+        """Return a copy with every record's alpha scaled by *factor* (0-1)."""
+        factor = max(0.0, min(factor, 1.0))
+        table = bytes(round(a * factor) for a in range(256))
+        out = SparseLayer(self.width, self.height)
+        out._records = rec = bytearray(self._records)
+        rec[5::RECORD_SIZE] = rec[5::RECORD_SIZE].translate(table)
+        return out
+
+    def composite_onto(self, img: Image.Image, offset: tuple[int, int] = (0, 0)) -> None:
+        """Alpha-blend every record onto an opaque RGB image in place.
+
+        Args:
+            img: Target RGB image (e.g. the 64x64 dashboard frame).
+            offset: (x, y) position of the layer's origin on *img*.
+        """
+        if not self._records:
+            return
+        px = img.load()
+        ox, oy = offset
+        img_w, img_h = img.size
+        rec = self._records
+        for i in range(0, len(rec), RECORD_SIZE):
+            x, y, r, g, b, a = rec[i : i + RECORD_SIZE]
+            tx, ty = x + ox, y + oy
+            if a == 0 or not (0 <= tx < img_w and 0 <= ty < img_h):
+                continue
+            if a == 255:
+                px[tx, ty] = (r, g, b)
+                continue
+            dr, dg, db = px[tx, ty][:3]
+            inv = 255 - a
+            px[tx, ty] = (
+                (r * a + dr * inv + 127) // 255,
+                (g * a + dg * inv + 127) // 255,
+                (b * a + db * inv + 127) // 255,
+            )
+
+    def to_image(self) -> Image.Image:
+        """Rasterise the records into a transparent RGBA image.
+
+        Useful for debugging and tests; the renderer blits sparse layers
+        directly via :meth:`composite_onto` instead.
+        """
+        img = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
+        px = img.load()
+        for x, y, r, g, b, a in self:
+            if a == 0:
+                continue
+            dr, dg, db, da = px[x, y]
+            if da == 0 or a == 255:
+                px[x, y] = (r, g, b, a)
+                continue
+            # Straight-alpha "over" operator
+            dst_weight = da * (255 - a) // 255
+            out_a = a + dst_weight
+            px[x, y] = (
+                (r * a + dr * dst_weight) // out_a,
+                (g * a + dg * dst_weight) // out_a,
+                (b * a + db * dst_weight) // out_a,
+                out_a,
+            )
+        return img
+
+
+# An animation layer is either a full RGBA image or a sparse record list.
+Layer = Image.Image | SparseLayer
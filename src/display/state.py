@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+from dataclasses import astuple, dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -41,6 +42,14 @@ class DisplayState:
     weather_stale: bool = False  # weather data is aging (>1800s) but still usable
     weather_too_old: bool = False  # weather data too old (>3600s) -- show dashes
 
+    def stable_hash(self) -> str:
+        """Return a digest of all fields that is stable across processes.
+
+        Unlike ``hash()``, the result does not depend on PYTHONHASHSEED,
+        so it can key render caches and persisted snapshots.
+        """
+        return hashlib.blake2b(repr(astuple(self)).encode(), digest_size=16).hexdigest()
+
     @classmethod
     def from_now(
         cls,
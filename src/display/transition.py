@@ -0,0 +1,213 @@
+"""Cross-fade between weather animations when the conditions change.
+
+Swapping ``DashboardState.weather_anim`` outright makes the particle field
+jump, and the incoming animation's first frames are computed in the same
+tick as the swap. :class:`CrossFade` instead plays both animations for a
+few frames, fading the outgoing one out and the incoming one in:
+
+* The incoming animation's first frames are pre-warmed on a background
+  thread (:meth:`CrossFade.start_prewarm`). Until they are ready the
+  outgoing animation keeps playing on its own; the frame loop never waits
+  for them. Under a :class:`~src.timesource.SimulatedClock` the pre-warm
+  runs inline, so replays do not depend on thread timing.
+* A blended frame costs one outgoing tick plus an alpha scale of both
+  layer pairs. Before each blend that cost is estimated from the last
+  blended frame (or, for the first, the incoming animation's pre-warm
+  ticks); if it would not fit in the per-frame budget the fade ends and
+  the remaining pre-warmed frames play unblended.
+
+Once the fade is over the wrapper delegates to the incoming animation.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+
+from PIL import Image
+
+from src import timesource
+from src.config import ANIM_TRANSITION_BUDGET, ANIM_TRANSITION_FRAMES
+from src.display.sparse_layer import Layer, SparseLayer
+from src.display.weather_anim import WeatherAnimation
+
+logger = logging.getLogger(__name__)
+
+
+def _fade(layer: Layer, factor: float) -> Layer:
+    """Copy of *layer* with its alpha scaled by *factor*."""
+    if isinstance(layer, SparseLayer):
+        return layer.faded(factor)
+    faded = layer.copy()
+    faded.putalpha(layer.getchannel("A").point(lambda a: round(a * factor)))
+    return faded
+
+
+def _over(bottom: Layer, top: Layer) -> Layer:
+    """Composite *top* over *bottom*, staying sparse when both are."""
+    if isinstance(bottom, SparseLayer) and isinstance(top, SparseLayer):
+        bottom.extend(top)
+        return bottom
+    if isinstance(bottom, SparseLayer):
+        bottom = bottom.to_image()
+    if isinstance(top, SparseLayer):
+        top = top.to_image()
+    return Image.alpha_composite(bottom, top)
+
+
+def _as_image(layer: Layer) -> Image.Image:
+    return layer.to_image() if isinstance(layer, SparseLayer) else layer
+
+
+class CrossFade(WeatherAnimation):
+    """Blend from *outgoing* to *incoming* over *frames* frames.
+
+    Args:
+        outgoing: Animation being replaced; ticked until the fade ends.
+        incoming: New animation; shown alone once the fade is over.
+        frames: Blended frames (incoming weight 1/(n+1) ... n/(n+1)).
+        budget_s: Longest allowed blended frame, in seconds; a blend
+            estimated to take longer is not started.
+    """
+
+    def __init__(
+        self,
+        outgoing: WeatherAnimation,
+        incoming: WeatherAnimation,
+        *,
+        frames: int = ANIM_TRANSITION_FRAMES,
+        budget_s: float = ANIM_TRANSITION_BUDGET,
+    ) -> None:
+        super().__init__(incoming.width, incoming.height, seed=incoming.seed)
+        self.outgoing = outgoing
+        self.incoming = incoming
+        self.frames = frames
+        self.budget_s = budget_s
+        self._step = 0
+        self._blending = True
+        self._prewarm_started = False
+        self._prewarm_lock = threading.Lock()
+        self._prewarmed: deque[tuple[Layer, Layer]] | None = None
+        # Expected seconds per blended frame; set by the pre-warm, then
+        # measured on each blend
+        self._blend_cost = 0.0
+
+    @property
+    def finished(self) -> bool:
+        """True once only the incoming animation is being shown."""
+        return not self._blending and not self._prewarmed
+
+    @property
+    def supports_sparse(self) -> bool:
+        if self.finished:
+            return self.incoming.supports_sparse
+        return self.outgoing.supports_sparse and self.incoming.supports_sparse
+
+    @property
+    def supports_substeps(self) -> bool:
+        return self.finished and self.incoming.supports_substeps
+
+    def set_quality(self, quality: float) -> None:
+        """Apply *quality* to both animations.
+
+        The incoming animation is skipped while the pre-warm thread is
+        ticking it; the next frame's call applies it instead.
+        """
+        self.outgoing.set_quality(quality)
+        if self._prewarm_lock.acquire(blocking=False):
+            try:
+                self.incoming.set_quality(quality)
+                self.quality = quality
+            finally:
+                self._prewarm_lock.release()
+
+    def start_prewarm(self) -> None:
+        """Compute the incoming animation's first frames on a daemon thread.
+
+        Inline instead under a simulated clock (replays).
+        """
+        self._prewarm_started = True
+        if timesource.is_simulated():
+            self.prewarm()
+            return
+        threading.Thread(target=self.prewarm, name="anim-prewarm", daemon=True).start()
+
+    def prewarm(self) -> None:
+        """Compute the incoming frames now, unless already done.
+
+        Blocks while the pre-warm thread is still running.
+        """
+        with self._prewarm_lock:
+            if self._prewarmed is None:
+                started = time.perf_counter()
+                frames = deque(self.incoming.tick_layers() for _ in range(self.frames))
+                self._blend_cost = (time.perf_counter() - started) / max(1, self.frames)
+                self._prewarmed = frames
+
+    def tick_layers(self) -> tuple[Layer, Layer]:
+        started = time.perf_counter()
+        if self._prewarmed is None:
+            # Keep showing the outgoing animation rather than wait
+            if not self._prewarm_started:
+                self.start_prewarm()
+            if self._prewarmed is None:
+                return self.outgoing.tick_layers()
+        if not self._prewarmed:
+            return self.incoming.tick_layers()
+        incoming = self._prewarmed.popleft()
+        if not self._blending:
+            return incoming
+        remaining = self.budget_s - (time.perf_counter() - started)
+        if self._blend_cost > remaining:
+            logger.info(
+                "Animation cross-fade frame would take ~%.0f ms (budget %.0f ms); ending fade",
+                self._blend_cost * 1000,
+                self.budget_s * 1000,
+            )
+            self._blending = False
+            return incoming
+
+        blend_started = time.perf_counter()
+        self._step += 1
+        weight = self._step / (self.frames + 1)
+        out_bg, out_fg = self.outgoing.tick_layers()
+        bg = _over(_fade(out_bg, 1.0 - weight), _fade(incoming[0], weight))
+        fg = _over(_fade(out_fg, 1.0 - weight), _fade(incoming[1], weight))
+        self._blend_cost = time.perf_counter() - blend_started
+        if self._step >= self.frames:
+            self._blending = False
+        return bg, fg
+
+    def tick(self) -> tuple[Image.Image, Image.Image]:
+        bg, fg = self.tick_layers()
+        return _as_image(bg), _as_image(fg)
+
+    def tick_sparse(self) -> tuple[SparseLayer, SparseLayer]:
+        if not self.supports_sparse:
+            raise NotImplementedError("cross-fade between these animations has no sparse form")
+        return self.tick_layers()  # type: ignore[return-value]
+
+    def tick_batch(self, substeps: int) -> list[tuple[Layer, Layer]]:
+        """Single frames while fading; the incoming animation's batches after."""
+        if self.finished:
+            return self.incoming.tick_batch(substeps)
+        return [self.tick_layers()]
+
+    def snapshot(self) -> dict:
+        """Snapshot of the incoming animation; the fade itself is transient."""
+        return self.incoming.snapshot()
+
+    def restore(self, snapshot: dict) -> None:
+        """Restore the incoming animation and skip the rest of the fade."""
+        self.incoming.restore(snapshot)
+        with self._prewarm_lock:
+            self._prewarmed = deque()
+        self._blending = False
+
+    def reset(self) -> None:
+        self.incoming.reset()
+        with self._prewarm_lock:
+            self._prewarmed = deque()
+        self._blending = False
@@ -11,13 +11,40 @@ must be high enough that the composited result exceeds this threshold.
 Color palette: vivid, LED-friendly colors per weather type.
 Rain=blue, snow=bright white, sun=warm yellow, fog=soft white, clouds=grey-white.
 Night clear=twinkling white/blue stars with organic per-star randomness.
+
+Pixel-particle animations (rain, snow, stars) can also emit
+:class:`~src.display.sparse_layer.SparseLayer` records instead of full
+RGBA images via :meth:`WeatherAnimation.tick_sparse`, avoiding two 64x24
+image allocations per tick.
+
+Every animation owns a seeded :class:`random.Random`, reseeded from
+``(seed, frame number)`` before each frame, so the frame sequence depends
+only on the seed: frame N of a given seed is reproducible in any process.
+:meth:`WeatherAnimation.snapshot` captures the seed, frame number and
+particle state as a small JSON-serialisable dict, and
+:meth:`WeatherAnimation.restore` resumes from one exactly where it left off.
+
+Animations with ``supports_substeps`` can also advance in fractions of a
+tick: :meth:`WeatherAnimation.tick_batch` returns several sub-frames
+covering one tick of motion, for devices that play a multi-frame upload
+on their own. Speeds are scaled by the sub-step length and per-tick
+jitter happens with matching probability, so particles move as far per
+second as with :meth:`~WeatherAnimation.tick`, in smaller steps.
+
+:meth:`WeatherAnimation.set_quality` scales particle counts down (and
+back up) under CPU pressure; see :mod:`src.display.anim_quality`.
 """
 
+import copy
+import functools
 import math
 import random
+from collections.abc import Callable
 
 from PIL import Image, ImageDraw
 
+from src.display.sparse_layer import Layer, SparseLayer
+
 # --- Rain particle configuration ---
 RAIN_FAR_ALPHA = 140
 RAIN_NEAR_ALPHA = 230
@@ -56,10 +83,38 @@ SUN_FAR_RAY_ALPHA = (90, 130)
 SUN_NEAR_RAY_ALPHA = (150, 210)
 SUN_FAR_RAY_COLOR = (240, 200, 40)
 SUN_NEAR_RAY_COLOR = (255, 240, 60)
+# Ray path table resolution: angle bucket (degrees) and distance step (px)
+SUN_RAY_ANGLE_STEP = 0.5
+SUN_RAY_DISTANCE_STEP = 0.25
+
+# --- Thunder configuration ---
+# Pre-generated bolt shapes a strike picks from
+THUNDER_BOLT_VARIANTS = 12
+THUNDER_BOLT_COLOR = (255, 255, 200)
+# Bolt alpha on the strike frame and the afterglow frame after it
+THUNDER_STRIKE_ALPHA = 220
+THUNDER_AFTERGLOW_ALPHA = 150
+THUNDER_FLASH_FILL = (255, 255, 180, 120)
+THUNDER_FADE_FILL = (200, 200, 150, 40)
+# Fixed seed of the shared bolt bank; animations vary the pick order
+_THUNDER_BANK_SEED = 0x7B017
+
+# --- Fog configuration ---
+FOG_FAR_BLOB_COUNT = 3
+FOG_NEAR_BLOB_COUNT = 3
+
+# --- Scrolling texture configuration (fog and clouds) ---
+# Pre-shifted copies per texture; scrolling moves in 1/N px steps
+SCROLL_SUBPIXEL_PHASES = 8
 
 # --- Clear night star configuration ---
-NIGHT_FAR_STAR_COUNT = 14
-NIGHT_NEAR_STAR_COUNT = 6
+NIGHT_FAR_STAR_COUNT = 24
+NIGHT_NEAR_STAR_COUNT = 9
+
+
+def _derive_seed(seed: int, index: int) -> int:
+    """Seed for the *index*-th sub-animation of one seeded with *seed*."""
+    return (seed * 1_000_003 + index) & 0xFFFFFFFF
 
 
 class WeatherAnimation:
@@ -68,22 +123,195 @@ class WeatherAnimation:
     Produces two 64x24 RGBA overlay images per tick:
     - bg_layer: composited before text (behind)
     - fg_layer: composited after text (in front)
+
+    Subclasses that only plot points and lines implement :meth:`_draw` and
+    set ``supports_sparse = True``; they then get both :meth:`tick` (RGBA
+    images) and :meth:`tick_sparse` (sparse records) from the same code.
+    Subclasses drawing filled shapes override :meth:`tick` directly.
     """
 
-    def __init__(self, width: int = 64, height: int = 24) -> None:
+    # True when tick_sparse() is available (the animation only uses point/line)
+    supports_sparse: bool = False
+
+    # True when tick_batch() can split a tick into sub-steps
+    supports_substeps: bool = False
+
+    # Attributes holding the mutable per-frame state captured by snapshot()
+    _STATE_ATTRS: tuple[str, ...] = ()
+
+    def __init__(self, width: int = 64, height: int = 24, *, seed: int | None = None) -> None:
         self.width = width
         self.height = height
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.frame = 0
+        self.rng = random.Random(self.seed)
+        # Fraction of a tick the next frame advances (below 1 in tick_batch)
+        self._dt = 1.0
+        # Fraction of the full particle count in use (set_quality)
+        self.quality = 1.0
+
+    def _next_frame(self) -> None:
+        """Reseed the RNG for the frame about to be drawn.
+
+        A frame's random draws depend only on the seed, the frame number and
+        the particle state, so a restored snapshot continues identically.
+        """
+        self.rng.seed((self.seed << 32) | self.frame)
+        self.frame += 1
+
+    def _rewind(self) -> None:
+        """Restart the RNG at frame 0, as after construction (for reset())."""
+        self.rng.seed(self.seed)
+        self.frame = 0
+
+    def _children(self) -> list["WeatherAnimation"]:
+        """Wrapped or layered animations whose state belongs to this one."""
+        return []
+
+    def _set_dt(self, dt: float) -> None:
+        self._dt = dt
+        for child in self._children():
+            child._set_dt(dt)
+
+    def set_quality(self, quality: float) -> None:
+        """Scale particle counts (and layering) to *quality* of the full amount.
+
+        Args:
+            quality: Fraction in (0, 1]; 1.0 restores full quality.
+        """
+        if quality == self.quality:
+            return
+        self.quality = quality
+        self._apply_quality()
+        for child in self._children():
+            child.set_quality(quality)
+
+    def _apply_quality(self) -> None:
+        """Resize particle lists after a quality change."""
+
+    def _quality_count(self, full_count: int) -> int:
+        """Particle count for the current quality (at least one)."""
+        return max(1, round(full_count * self.quality))
+
+    def _fit(self, particles: list, full_count: int, spawn: Callable[[int], None]) -> None:
+        """Trim or spawn *particles* to the quality-scaled *full_count*."""
+        target = self._quality_count(full_count)
+        if len(particles) > target:
+            del particles[target:]
+        else:
+            spawn(target - len(particles))
+
+    def _scaled(self, amount: float) -> float:
+        """*amount* per tick, scaled to the current step length."""
+        return amount if self._dt == 1.0 else amount * self._dt
+
+    def _jitters(self) -> bool:
+        """Whether a once-per-tick random nudge happens in this step.
+
+        Always true for whole ticks (without drawing from the RNG, so the
+        1-step frame sequence is unchanged); with probability ``dt`` for
+        sub-steps.
+        """
+        return self._dt >= 1.0 or self.rng.random() < self._dt
 
     def _empty(self) -> Image.Image:
         return Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
 
+    def _empty_sparse(self) -> SparseLayer:
+        return SparseLayer(self.width, self.height)
+
+    def _draw(self, bg_draw, fg_draw) -> None:
+        """Advance one frame, drawing onto ImageDraw-compatible targets."""
+
     def tick(self) -> tuple[Image.Image, Image.Image]:
         """Return (bg_layer, fg_layer) as RGBA images."""
-        return self._empty(), self._empty()
+        self._next_frame()
+        bg = self._empty()
+        fg = self._empty()
+        self._draw(ImageDraw.Draw(bg), ImageDraw.Draw(fg))
+        return bg, fg
+
+    def tick_sparse(self) -> tuple[SparseLayer, SparseLayer]:
+        """Return (bg_layer, fg_layer) as sparse pixel records.
+
+        Raises:
+            NotImplementedError: If the animation draws filled shapes and
+                has no sparse representation (``supports_sparse`` is False).
+        """
+        if not self.supports_sparse:
+            raise NotImplementedError(f"{type(self).__name__} has no sparse representation")
+        self._next_frame()
+        bg = self._empty_sparse()
+        fg = self._empty_sparse()
+        self._draw(bg, fg)
+        return bg, fg
+
+    def tick_layers(self) -> tuple[Layer, Layer]:
+        """Advance one frame in the cheapest representation available."""
+        if self.supports_sparse:
+            return self.tick_sparse()
+        return self.tick()
+
+    def tick_batch(self, substeps: int) -> list[tuple[Layer, Layer]]:
+        """Advance one tick as *substeps* evenly spaced sub-frames.
+
+        Falls back to a single :meth:`tick_layers` frame when *substeps* is
+        1 or less, or the animation does not support sub-steps.
+        """
+        if substeps <= 1 or not self.supports_substeps:
+            return [self.tick_layers()]
+        self._set_dt(1.0 / substeps)
+        try:
+            return [self.tick_layers() for _ in range(substeps)]
+        finally:
+            self._set_dt(1.0)
 
     def reset(self) -> None:
         """Reset animation state to initial conditions."""
 
+    def snapshot(self) -> dict:
+        """Capture the seed, frame number and particle state.
+
+        Returns:
+            A JSON-serialisable dict for :meth:`restore`.
+        """
+        return {
+            "kind": type(self).__name__,
+            "seed": self.seed,
+            "frame": self.frame,
+            "state": {name: copy.deepcopy(getattr(self, name)) for name in self._STATE_ATTRS},
+            "children": [child.snapshot() for child in self._children()],
+        }
+
+    def _matches(self, snapshot: dict) -> bool:
+        children = self._children()
+        return (
+            snapshot.get("kind") == type(self).__name__
+            and len(snapshot.get("children", ())) == len(children)
+            and all(c._matches(s) for c, s in zip(children, snapshot["children"], strict=True))
+        )
+
+    def restore(self, snapshot: dict) -> None:
+        """Resume from a :meth:`snapshot`; later frames match the original's.
+
+        Raises:
+            ValueError: If the snapshot was taken from a different kind of
+                animation (or one layered differently).
+        """
+        if not self._matches(snapshot):
+            raise ValueError(
+                f"snapshot of {snapshot.get('kind')} does not fit {type(self).__name__}"
+            )
+        self._restore(snapshot)
+
+    def _restore(self, snapshot: dict) -> None:
+        self.seed = snapshot["seed"]
+        self.frame = snapshot["frame"]
+        for name in self._STATE_ATTRS:
+            setattr(self, name, copy.deepcopy(snapshot["state"][name]))
+        for child, child_snapshot in zip(self._children(), snapshot["children"], strict=True):
+            child._restore(child_snapshot)
+
 
 class RainAnimation(WeatherAnimation):
     """Falling blue raindrops at two depths with intensity scaling.
@@ -97,14 +325,24 @@ class RainAnimation(WeatherAnimation):
     - Heavy (> 3mm): dense downpour (22 far, 14 near)
     """
 
-    def __init__(self, width: int = 64, height: int = 24, precipitation_mm: float = 2.0) -> None:
-        super().__init__(width, height)
+    supports_sparse = True
+    supports_substeps = True
+    _STATE_ATTRS = ("far_drops", "near_drops")
+
+    def __init__(
+        self,
+        width: int = 64,
+        height: int = 24,
+        precipitation_mm: float = 2.0,
+        *,
+        seed: int | None = None,
+    ) -> None:
+        super().__init__(width, height, seed=seed)
         self.precipitation_mm = precipitation_mm
         self._far_count, self._near_count = self._particle_counts(precipitation_mm)
-        self.far_drops: list[list[int]] = []
-        self.near_drops: list[list[int]] = []
-        self._spawn_far(self._far_count)
-        self._spawn_near(self._near_count)
+        self.far_drops: list[list[float]] = []
+        self.near_drops: list[list[float]] = []
+        self._apply_quality()
 
     @staticmethod
     def _particle_counts(precipitation_mm: float) -> tuple[int, int]:
@@ -122,8 +360,8 @@ class RainAnimation(WeatherAnimation):
         for _ in range(count):
             self.far_drops.append(
                 [
-                    random.randint(0, self.width - 1),
-                    random.randint(0, self.height - 1),
+                    self.rng.randint(0, self.width - 1),
+                    self.rng.randint(0, self.height - 1),
                 ]
             )
 
@@ -131,55 +369,54 @@ class RainAnimation(WeatherAnimation):
         for _ in range(count):
             self.near_drops.append(
                 [
-                    random.randint(0, self.width - 1),
-                    random.randint(0, self.height - 1),
+                    self.rng.randint(0, self.width - 1),
+                    self.rng.randint(0, self.height - 1),
                 ]
             )
 
-    def tick(self) -> tuple[Image.Image, Image.Image]:
-        bg = self._empty()
-        fg = self._empty()
-        bg_draw = ImageDraw.Draw(bg)
-        fg_draw = ImageDraw.Draw(fg)
-
+    def _draw(self, bg_draw, fg_draw) -> None:
         # Far drops -- behind text, dimmer, 2px streak
         for drop in self.far_drops:
-            x, y = drop[0], drop[1]
+            x, y = int(drop[0]), int(drop[1])
             if 0 <= x < self.width and 0 <= y < self.height:
                 bg_draw.line(
                     [(x, y), (x, min(y + 1, self.height - 1))],
                     fill=(*RAIN_FAR_COLOR, RAIN_FAR_ALPHA),
                 )
-            drop[1] += 1
-            drop[0] += random.choice([-1, 0, 0, 0])
+            drop[1] += self._scaled(1)
+            if self._jitters():
+                drop[0] += self.rng.choice([-1, 0, 0, 0])
             if drop[1] >= self.height:
                 drop[1] = 0
-                drop[0] = random.randint(0, self.width - 1)
+                drop[0] = self.rng.randint(0, self.width - 1)
 
         # Near drops -- in front of text, brighter, 3px streak, faster
         # Heavy rain (>3mm) falls faster with longer streaks
         heavy = self.precipitation_mm > 3.0
         for drop in self.near_drops:
-            x, y = drop[0], drop[1]
+            x, y = int(drop[0]), int(drop[1])
             streak = 3 if heavy else 2
             if 0 <= x < self.width and 0 <= y < self.height:
                 fg_draw.line(
                     [(x, y), (x, min(y + streak, self.height - 1))],
                     fill=(*RAIN_NEAR_COLOR, RAIN_NEAR_ALPHA),
                 )
-            drop[1] += random.randint(2, 4) if heavy else random.randint(2, 3)
-            drop[0] += random.choice([-1, 0, 0, 0])
+            drop[1] += self._scaled(self.rng.randint(2, 4) if heavy else self.rng.randint(2, 3))
+            if self._jitters():
+                drop[0] += self.rng.choice([-1, 0, 0, 0])
             if drop[1] >= self.height:
                 drop[1] = 0
-                drop[0] = random.randint(0, self.width - 1)
+                drop[0] = self.rng.randint(0, self.width - 1)
 
-        return bg, fg
+    def _apply_quality(self) -> None:
+        self._fit(self.far_drops, self._far_count, self._spawn_far)
+        self._fit(self.near_drops, self._near_count, self._spawn_near)
 
     def reset(self) -> None:
+        self._rewind()
         self.far_drops.clear()
         self.near_drops.clear()
-        self._spawn_far(self._far_count)
-        self._spawn_near(self._near_count)
+        self._apply_quality()
 
 
 class SnowAnimation(WeatherAnimation):
@@ -194,14 +431,24 @@ class SnowAnimation(WeatherAnimation):
     - Heavy (> 3mm): dense snowfall (16 far, 10 near)
     """
 
-    def __init__(self, width: int = 64, height: int = 24, precipitation_mm: float = 2.0) -> None:
-        super().__init__(width, height)
+    supports_sparse = True
+    supports_substeps = True
+    _STATE_ATTRS = ("far_flakes", "near_flakes")
+
+    def __init__(
+        self,
+        width: int = 64,
+        height: int = 24,
+        precipitation_mm: float = 2.0,
+        *,
+        seed: int | None = None,
+    ) -> None:
+        super().__init__(width, height, seed=seed)
         self.precipitation_mm = precipitation_mm
         self._far_count, self._near_count = self._particle_counts(precipitation_mm)
-        self.far_flakes: list[list[int]] = []
-        self.near_flakes: list[list[int]] = []
-        self._spawn_far(self._far_count)
-        self._spawn_near(self._near_count)
+        self.far_flakes: list[list[float]] = []
+        self.near_flakes: list[list[float]] = []
+        self._apply_quality()
 
     @staticmethod
     def _particle_counts(precipitation_mm: float) -> tuple[int, int]:
@@ -217,8 +464,8 @@ class SnowAnimation(WeatherAnimation):
         for _ in range(count):
             self.far_flakes.append(
                 [
-                    random.randint(0, self.width - 1),
-                    random.randint(0, self.height - 1),
+                    self.rng.randint(0, self.width - 1),
+                    self.rng.randint(0, self.height - 1),
                 ]
             )
 
@@ -226,12 +473,12 @@ class SnowAnimation(WeatherAnimation):
         for _ in range(count):
             self.near_flakes.append(
                 [
-                    random.randint(1, self.width - 2),
-                    random.randint(0, self.height - 1),
+                    self.rng.randint(1, self.width - 2),
+                    self.rng.randint(0, self.height - 1),
                 ]
             )
 
-    def _draw_crystal(self, draw: ImageDraw.Draw, x: int, y: int, alpha: int) -> None:
+    def _draw_crystal(self, draw, x: int, y: int, alpha: int) -> None:
         """Draw a 3x3 snow crystal (+ shape)."""
         color = (255, 255, 255, alpha)
         if 0 <= x < self.width and 0 <= y < self.height:
@@ -245,95 +492,235 @@ class SnowAnimation(WeatherAnimation):
         if 0 <= x < self.width and 0 <= y + 1 < self.height:
             draw.point((x, y + 1), fill=color)
 
-    def tick(self) -> tuple[Image.Image, Image.Image]:
-        bg = self._empty()
-        fg = self._empty()
-        bg_draw = ImageDraw.Draw(bg)
-        fg_draw = ImageDraw.Draw(fg)
-
+    def _draw(self, bg_draw, fg_draw) -> None:
         # Far flakes -- behind text, 2px horizontal pair, moderate
         for flake in self.far_flakes:
-            x, y = flake[0], flake[1]
+            x, y = int(flake[0]), int(flake[1])
             if 0 <= x < self.width and 0 <= y < self.height:
                 bg_draw.point((x, y), fill=(*SNOW_FAR_COLOR, SNOW_FAR_ALPHA))
                 if x + 1 < self.width:
                     bg_draw.point((x + 1, y), fill=(*SNOW_FAR_COLOR, SNOW_FAR_SECONDARY_ALPHA))
-            flake[1] += random.choice([0, 0, 1])
-            flake[0] += random.choice([-1, 0, 0, 1])
+            flake[1] += self._scaled(self.rng.choice([0, 0, 1]))
+            if self._jitters():
+                flake[0] += self.rng.choice([-1, 0, 0, 1])
             flake[0] = max(0, min(flake[0], self.width - 1))
             if flake[1] >= self.height:
                 flake[1] = 0
-                flake[0] = random.randint(0, self.width - 1)
+                flake[0] = self.rng.randint(0, self.width - 1)
 
         # Near flakes -- in front of text, + crystal, bright
         for flake in self.near_flakes:
-            x, y = flake[0], flake[1]
-            self._draw_crystal(fg_draw, x, y, SNOW_NEAR_ALPHA)
-            flake[1] += random.randint(0, 1)
-            flake[0] += random.choice([-1, 0, 0, 1])
+            self._draw_crystal(fg_draw, int(flake[0]), int(flake[1]), SNOW_NEAR_ALPHA)
+            flake[1] += self._scaled(self.rng.randint(0, 1))
+            if self._jitters():
+                flake[0] += self.rng.choice([-1, 0, 0, 1])
             flake[0] = max(1, min(flake[0], self.width - 2))
             if flake[1] >= self.height:
                 flake[1] = 0
-                flake[0] = random.randint(1, self.width - 2)
+                flake[0] = self.rng.randint(1, self.width - 2)
 
-        return bg, fg
+    def _apply_quality(self) -> None:
+        self._fit(self.far_flakes, self._far_count, self._spawn_far)
+        self._fit(self.near_flakes, self._near_count, self._spawn_near)
 
     def reset(self) -> None:
+        self._rewind()
         self.far_flakes.clear()
         self.near_flakes.clear()
-        self._spawn_far(self._far_count)
-        self._spawn_near(self._near_count)
+        self._apply_quality()
+
+
+def _scroll_phases(
+    window: int,
+    height: int,
+    period: int,
+    rgb: tuple[int, int, int],
+    ellipses: list[tuple[int, int, int, int, int]],
+) -> tuple[Image.Image, ...]:
+    """Wrap-around texture of *ellipses*, pre-shifted to each sub-pixel phase.
+
+    The ellipses ``(x0, y0, x1, y1, alpha)`` are drawn in order on a strip
+    *period* px wide that repeats horizontally. They share one colour, so
+    blending neighbouring columns only interpolates alpha. Phase ``k`` is
+    the strip shifted left by ``k / SCROLL_SUBPIXEL_PHASES`` px, made
+    ``period + window`` px wide so any window is a single crop.
+    """
+    tile = Image.new("RGBA", (period, height), (*rgb, 0))
+    draw = ImageDraw.Draw(tile)
+    for x0, y0, x1, y1, alpha in ellipses:
+        for shift in (0, -period):  # the part past the right edge wraps around
+            draw.ellipse([x0 + shift, y0, x1 + shift, y1], fill=(*rgb, alpha))
+    strip_width = period + window
+    strip = Image.new("RGBA", (strip_width + 1, height))
+    for x in range(0, strip_width + 1, period):
+        strip.paste(tile, (x, 0))
+    base = strip.crop((0, 0, strip_width, height))
+    shifted = strip.crop((1, 0, strip_width + 1, height))
+    return tuple(
+        Image.blend(base, shifted, k / SCROLL_SUBPIXEL_PHASES)
+        for k in range(SCROLL_SUBPIXEL_PHASES)
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _cloud_phases(
+    width: int,
+    height: int,
+    period: int,
+    rgb: tuple[int, int, int],
+    alphas: tuple[int, int],
+    clouds: tuple[tuple[int, int, int, int], ...],
+) -> tuple[Image.Image, ...]:
+    """Scroll phases of one cloud layer, from its ``(x, y, w, h)`` clouds."""
+    ellipses = []
+    for x, y, w, h in clouds:
+        ellipses.append((x, y, x + w, y + h, alphas[0]))
+        ellipses.append((x + w // 3, y - 1, x + w + w // 3, y + h - 1, alphas[1]))
+    return _scroll_phases(width, height, period, rgb, ellipses)
+
+
+@functools.lru_cache(maxsize=16)
+def _fog_phases(
+    window: int,
+    height: int,
+    period: int,
+    rgb: tuple[int, int, int],
+    blobs: tuple[tuple[int, int, int, int, int], ...],
+) -> tuple[Image.Image, ...]:
+    """Scroll phases of one fog layer, from its ``(x, y, w, h, alpha)`` blobs."""
+    ellipses = []
+    for x, y, w, h, alpha in blobs:
+        ellipses.append((x, y, x + w, y + h, alpha))
+        ellipses.append((x + w // 4, y - 1, x + w - w // 4, y + h - 2, max(alpha - 25, 30)))
+    return _scroll_phases(window, height, period, rgb, ellipses)
+
+
+def _scroll_window(phases: tuple[Image.Image, ...], offset: float, window: int) -> Image.Image:
+    """The *window* columns of a scrolling texture starting at *offset* px."""
+    whole = int(offset)
+    phase = phases[int((offset - whole) * SCROLL_SUBPIXEL_PHASES)]
+    return phase.crop((whole, 0, whole + window, phase.height))
 
 
 class CloudAnimation(WeatherAnimation):
-    """Drifting grey-white cloud blobs at two depths."""
+    """Drifting grey-white cloud blobs at two depths.
+
+    Each depth is rendered once into a wrap-around texture (see
+    :func:`_scroll_phases`); a frame is a sub-pixel scrolled window over
+    it, so clouds in one layer drift together.
+    """
 
-    def __init__(self, width: int = 64, height: int = 24) -> None:
-        super().__init__(width, height)
+    supports_substeps = True
+    _STATE_ATTRS = ("far_clouds", "near_clouds", "far_offset", "near_offset")
+
+    # Drift to the right per tick
+    _FAR_SPEED = 0.07
+    _NEAR_SPEED = 0.2
+
+    def __init__(self, width: int = 64, height: int = 24, *, seed: int | None = None) -> None:
+        super().__init__(width, height, seed=seed)
+        # Positions are texture columns; the texture starts aligned with the zone
         self.far_clouds: list[dict] = [
-            {"x": 5.0, "y": 4, "w": 12, "h": 6, "speed": 0.08},
-            {"x": 40.0, "y": 14, "w": 10, "h": 5, "speed": 0.06},
+            {"x": 5, "y": 4, "w": 12, "h": 6},
+            {"x": 40, "y": 14, "w": 10, "h": 5},
         ]
         self.near_clouds: list[dict] = [
-            {"x": 25.0, "y": 8, "w": 14, "h": 6, "speed": 0.2},
+            {"x": 25, "y": 8, "w": 14, "h": 6},
         ]
+        self.far_offset = 0.0
+        self.near_offset = 0.0
+
+    def _period(self, clouds: list[dict]) -> int:
+        # A cloud leaves the zone entirely before it wraps back in on the left
+        return self.width + max(cloud["w"] + cloud["w"] // 3 for cloud in clouds) + 1
+
+    def _layer(
+        self, clouds: list[dict], offset: float, rgb: tuple[int, int, int], alphas: tuple[int, int]
+    ) -> Image.Image:
+        shapes = tuple((c["x"], c["y"], c["w"], c["h"]) for c in clouds)
+        phases = _cloud_phases(self.width, self.height, self._period(clouds), rgb, alphas, shapes)
+        return _scroll_window(phases, offset, self.width)
 
     def tick(self) -> tuple[Image.Image, Image.Image]:
-        bg = self._empty()
-        fg = self._empty()
-        bg_draw = ImageDraw.Draw(bg)
-        fg_draw = ImageDraw.Draw(fg)
+        self._next_frame()
 
         # Far clouds -- behind text, moderate
-        for cloud in self.far_clouds:
-            x, y, w, h = int(cloud["x"]), cloud["y"], cloud["w"], cloud["h"]
-            bg_draw.ellipse([x, y, x + w, y + h], fill=(150, 160, 180, 90))
-            bg_draw.ellipse(
-                [x + w // 3, y - 1, x + w + w // 3, y + h - 1],
-                fill=(150, 160, 180, 70),
-            )
-            cloud["x"] += cloud["speed"]
-            if cloud["x"] > self.width:
-                cloud["x"] = float(-cloud["w"])
-
+        bg = self._layer(self.far_clouds, self.far_offset, (150, 160, 180), (90, 70))
         # Near clouds -- in front of text, brighter
-        for cloud in self.near_clouds:
-            x, y, w, h = int(cloud["x"]), cloud["y"], cloud["w"], cloud["h"]
-            fg_draw.ellipse([x, y, x + w, y + h], fill=(190, 200, 220, 130))
-            fg_draw.ellipse(
-                [x + w // 3, y - 1, x + w + w // 3, y + h - 1],
-                fill=(190, 200, 220, 100),
-            )
-            cloud["x"] += cloud["speed"]
-            if cloud["x"] > self.width:
-                cloud["x"] = float(-cloud["w"])
+        fg = self._layer(self.near_clouds, self.near_offset, (190, 200, 220), (130, 100))
 
+        # The window moves left over the texture, so the clouds drift right
+        self.far_offset = (self.far_offset - self._scaled(self._FAR_SPEED)) % self._period(
+            self.far_clouds
+        )
+        self.near_offset = (self.near_offset - self._scaled(self._NEAR_SPEED)) % self._period(
+            self.near_clouds
+        )
         return bg, fg
 
     def reset(self) -> None:
-        self.far_clouds[0]["x"] = 5.0
-        self.far_clouds[1]["x"] = 40.0
-        self.near_clouds[0]["x"] = 25.0
+        self._rewind()
+        self.far_offset = 0.0
+        self.near_offset = 0.0
+
+
+@functools.cache
+def _sun_ray_path(
+    width: int, height: int, tail_len: int, bucket: int
+) -> tuple[tuple[tuple[int, int], tuple[int, int]] | None, ...]:
+    """Ray segments along one angle bucket, per distance step.
+
+    Each segment runs from the tail, *tail_len* px back toward the sun and
+    clamped to the zone, to the head: ``((x2, y2), (x1, y1))``. Steps whose
+    head is outside the zone are None. Built on first use of the bucket.
+    """
+    rad = math.radians(SunAnimation._FAN_MIN_DEG + bucket * SUN_RAY_ANGLE_STEP)
+    cos, sin = math.cos(rad), math.sin(rad)
+    longest = max(SUN_FAR_RAY_MAX_DIST[1], SUN_NEAR_RAY_MAX_DIST[1])
+    path = []
+    for step in range(round(longest / SUN_RAY_DISTANCE_STEP) + 1):
+        distance = step * SUN_RAY_DISTANCE_STEP
+        x = SunAnimation._SUN_X + cos * distance
+        y = SunAnimation._SUN_Y + sin * distance
+        if x < 0 or x >= width or y < 0 or y >= height:
+            path.append(None)
+            continue
+        tx = x - cos * tail_len
+        ty = y - sin * tail_len
+        tail = (int(max(0, min(tx, width - 1))), int(max(0, min(ty, height - 1))))
+        path.append((tail, (int(x), int(y))))
+    return tuple(path)
+
+
+@functools.cache
+def _sun_body_sprite(
+    width: int, height: int, cx: int, cy: int, r: int
+) -> tuple[Image.Image, Image.Image, tuple[int, int]]:
+    """Corner sun body cropped to its visible box: (sprite, paste mask, offset).
+
+    Two concentric ellipses provide a two-layer glow effect:
+    - Outer: dimmer warm yellow glow extending +2px beyond the body
+    - Inner: bright warm yellow sun body
+
+    PIL clips pixels outside the zone, leaving the visible quarter-sun arc.
+    """
+    full = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(full)
+    glow_r = r + 2
+    # Outer glow (larger, dimmer)
+    draw.ellipse(
+        [cx - glow_r, cy - glow_r, cx + glow_r, cy + glow_r],
+        fill=(255, 200, 40, 60),
+    )
+    # Inner body (bright warm yellow)
+    draw.ellipse(
+        [cx - r, cy - r, cx + r, cy + r],
+        fill=(255, 220, 60, 200),
+    )
+    box = full.getbbox() or (0, 0, 1, 1)
+    sprite = full.crop(box)
+    mask = sprite.getchannel("A").point(lambda a: 255 if a else 0)
+    return sprite, mask, (box[0], box[1])
 
 
 class SunAnimation(WeatherAnimation):
@@ -358,124 +745,172 @@ class SunAnimation(WeatherAnimation):
     _FAN_MIN_DEG = 95.0  # just past straight-down
     _FAN_MAX_DEG = 160.0  # toward bottom-left corner
 
-    def __init__(self, width: int = 64, height: int = 24) -> None:
-        super().__init__(width, height)
+    supports_substeps = True
+    _STATE_ATTRS = ("far_rays", "near_rays")
+
+    def __init__(self, width: int = 64, height: int = 24, *, seed: int | None = None) -> None:
+        super().__init__(width, height, seed=seed)
         self.far_rays: list[list[float]] = []
         self.near_rays: list[list[float]] = []
-        self._spawn_far(SUN_FAR_RAY_COUNT)
-        self._spawn_near(SUN_NEAR_RAY_COUNT)
+        self._apply_quality()
 
     def _spawn_far(self, count: int) -> None:
         for _ in range(count):
-            angle = random.uniform(self._FAN_MIN_DEG, self._FAN_MAX_DEG)
-            speed = random.uniform(*SUN_FAR_RAY_SPEED)
-            max_dist = random.uniform(*SUN_FAR_RAY_MAX_DIST)
-            base_alpha = random.randint(*SUN_FAR_RAY_ALPHA)
-            distance = random.uniform(0, max_dist)  # staggered start (ANIM-07)
+            angle = self.rng.uniform(self._FAN_MIN_DEG, self._FAN_MAX_DEG)
+            speed = self.rng.uniform(*SUN_FAR_RAY_SPEED)
+            max_dist = self.rng.uniform(*SUN_FAR_RAY_MAX_DIST)
+            base_alpha = self.rng.randint(*SUN_FAR_RAY_ALPHA)
+            distance = self.rng.uniform(0, max_dist)  # staggered start (ANIM-07)
             self.far_rays.append([angle, distance, speed, max_dist, float(base_alpha)])
 
     def _spawn_near(self, count: int) -> None:
         for _ in range(count):
-            angle = random.uniform(self._FAN_MIN_DEG, self._FAN_MAX_DEG)
-            speed = random.uniform(*SUN_NEAR_RAY_SPEED)
-            max_dist = random.uniform(*SUN_NEAR_RAY_MAX_DIST)
-            base_alpha = random.randint(*SUN_NEAR_RAY_ALPHA)
-            distance = random.uniform(0, max_dist)  # staggered start (ANIM-07)
+            angle = self.rng.uniform(self._FAN_MIN_DEG, self._FAN_MAX_DEG)
+            speed = self.rng.uniform(*SUN_NEAR_RAY_SPEED)
+            max_dist = self.rng.uniform(*SUN_NEAR_RAY_MAX_DIST)
+            base_alpha = self.rng.randint(*SUN_NEAR_RAY_ALPHA)
+            distance = self.rng.uniform(0, max_dist)  # staggered start (ANIM-07)
             self.near_rays.append([angle, distance, speed, max_dist, float(base_alpha)])
 
-    def _draw_ray(self, draw: ImageDraw.Draw, ray: list[float], color: tuple) -> None:
-        angle, distance, speed, max_dist, base_alpha = ray
-
-        # Advance outward from sun origin
-        distance += speed
-        ray[1] = distance
-
-        # Polar to cartesian
-        rad = math.radians(angle)
-        x = self._SUN_X + math.cos(rad) * distance
-        y = self._SUN_Y + math.sin(rad) * distance
-
-        # Respawn if out of zone or past max distance
-        if distance >= max_dist or x < 0 or x >= self.width or y < 0 or y >= self.height:
-            # Reset distance and re-randomize for organic variety (Pitfall 5)
-            ray[0] = random.uniform(self._FAN_MIN_DEG, self._FAN_MAX_DEG)
-            ray[1] = 0.0
-            is_far = base_alpha < 140
-            far_speed = random.uniform(*SUN_FAR_RAY_SPEED)
-            near_speed = random.uniform(*SUN_NEAR_RAY_SPEED)
-            ray[2] = far_speed if is_far else near_speed
-            far_dist = random.uniform(*SUN_FAR_RAY_MAX_DIST)
-            near_dist = random.uniform(*SUN_NEAR_RAY_MAX_DIST)
-            ray[3] = far_dist if is_far else near_dist
-            far_alpha = random.randint(*SUN_FAR_RAY_ALPHA)
-            near_alpha = random.randint(*SUN_NEAR_RAY_ALPHA)
-            ray[4] = float(far_alpha if is_far else near_alpha)
-            return
-
-        # Distance-based alpha fade (ANIM-04)
-        fade = 1.0 - (distance / max_dist)
-        alpha = int(base_alpha * fade)
-        if alpha < 15:  # below LED visibility threshold
-            return
-
-        # Draw ray segment: short line trailing back toward origin
-        x1, y1 = int(x), int(y)
-        tail_len = 2 if base_alpha < 140 else 3  # far=shorter, near=longer
-        tx = x - math.cos(rad) * tail_len
-        ty = y - math.sin(rad) * tail_len
-        x2 = int(max(0, min(tx, self.width - 1)))
-        y2 = int(max(0, min(ty, self.height - 1)))
-
-        if 0 <= x1 < self.width and 0 <= y1 < self.height:
-            draw.line([(x2, y2), (x1, y1)], fill=(*color, alpha))
-
-    def _draw_sun_body(self, draw: ImageDraw.Draw) -> None:
-        """Draw a corner-anchored quarter-sun arc at the top-right of the zone.
-
-        Two concentric ellipses provide a two-layer glow effect:
-        - Outer: dimmer warm yellow glow extending +2px beyond the body
-        - Inner: bright warm yellow sun body
+    def _respawn_ray(self, ray: list[float], *, is_far: bool) -> None:
+        """Restart *ray* at the sun with fresh values for its depth (Pitfall 5)."""
+        rng = self.rng
+        ray[0] = rng.uniform(self._FAN_MIN_DEG, self._FAN_MAX_DEG)
+        ray[1] = 0.0
+        if is_far:
+            ray[2] = rng.uniform(*SUN_FAR_RAY_SPEED)
+            ray[3] = rng.uniform(*SUN_FAR_RAY_MAX_DIST)
+            ray[4] = float(rng.randint(*SUN_FAR_RAY_ALPHA))
+        else:
+            ray[2] = rng.uniform(*SUN_NEAR_RAY_SPEED)
+            ray[3] = rng.uniform(*SUN_NEAR_RAY_MAX_DIST)
+            ray[4] = float(rng.randint(*SUN_NEAR_RAY_ALPHA))
 
-        PIL automatically clips pixels outside the 64x24 image bounds,
-        creating the visible quarter-sun arc without manual clipping.
+    def _draw_rays(
+        self,
+        draw: ImageDraw.Draw,
+        rays: list[list[float]],
+        color: tuple,
+        *,
+        is_far: bool,
+    ) -> None:
+        """Advance and draw *rays*, looking their segments up in the path table."""
+        width, height = self.width, self.height
+        tail_len = 2 if is_far else 3  # far=shorter, near=longer
+        fan_min = self._FAN_MIN_DEG
+        for ray in rays:
+            angle, distance, speed, max_dist, base_alpha = ray
+
+            # Advance outward from sun origin
+            distance += self._scaled(speed)
+            ray[1] = distance
+
+            # Respawn if past max distance or out of zone (no segment)
+            segment = None
+            if distance < max_dist:
+                bucket = round((angle - fan_min) / SUN_RAY_ANGLE_STEP)
+                path = _sun_ray_path(width, height, tail_len, bucket)
+                segment = path[round(distance / SUN_RAY_DISTANCE_STEP)]
+            if segment is None:
+                self._respawn_ray(ray, is_far=is_far)
+                continue
+
+            # Distance-based alpha fade (ANIM-04)
+            alpha = int(base_alpha * (1.0 - distance / max_dist))
+            if alpha < 15:  # below LED visibility threshold
+                continue
+            draw.line(segment, fill=(*color, alpha))
+
+    def _draw_sun_body(self, layer: Image.Image) -> None:
+        """Blit the cached quarter-sun sprite at the top-right of the zone.
+
+        The sprite replaces (rather than blends with) the pixels under it,
+        as drawing the body's ellipses directly would.
         """
-        cx, cy, r = self._SUN_X, self._SUN_Y, self._SUN_RADIUS
-        glow_r = r + 2
-        # Outer glow (larger, dimmer)
-        draw.ellipse(
-            [cx - glow_r, cy - glow_r, cx + glow_r, cy + glow_r],
-            fill=(255, 200, 40, 60),
-        )
-        # Inner body (bright warm yellow)
-        draw.ellipse(
-            [cx - r, cy - r, cx + r, cy + r],
-            fill=(255, 220, 60, 200),
+        sprite, mask, offset = _sun_body_sprite(
+            self.width, self.height, self._SUN_X, self._SUN_Y, self._SUN_RADIUS
         )
+        layer.paste(sprite, offset, mask)
 
     def tick(self) -> tuple[Image.Image, Image.Image]:
+        self._next_frame()
         bg = self._empty()
         fg = self._empty()
-        bg_draw = ImageDraw.Draw(bg)
-        fg_draw = ImageDraw.Draw(fg)
 
         # Far rays on bg layer (behind text) -- ANIM-06
-        for ray in self.far_rays:
-            self._draw_ray(bg_draw, ray, SUN_FAR_RAY_COLOR)
+        self._draw_rays(ImageDraw.Draw(bg), self.far_rays, SUN_FAR_RAY_COLOR, is_far=True)
 
         # Sun body drawn after far rays so body pixels are not overwritten
-        self._draw_sun_body(bg_draw)
+        self._draw_sun_body(bg)
 
         # Near rays on fg layer (in front of text) -- ANIM-06
-        for ray in self.near_rays:
-            self._draw_ray(fg_draw, ray, SUN_NEAR_RAY_COLOR)
+        self._draw_rays(ImageDraw.Draw(fg), self.near_rays, SUN_NEAR_RAY_COLOR, is_far=False)
 
         return bg, fg
 
+    def _apply_quality(self) -> None:
+        self._fit(self.far_rays, SUN_FAR_RAY_COUNT, self._spawn_far)
+        self._fit(self.near_rays, SUN_NEAR_RAY_COUNT, self._spawn_near)
+
     def reset(self) -> None:
+        self._rewind()
         self.far_rays.clear()
         self.near_rays.clear()
-        self._spawn_far(SUN_FAR_RAY_COUNT)
-        self._spawn_near(SUN_NEAR_RAY_COUNT)
+        self._apply_quality()
+
+
+def _generate_bolt(
+    rng: random.Random, start_x: int, width: int, height: int
+) -> list[tuple[int, int, int, int]]:
+    """Generate jagged lightning bolt segments from top to bottom."""
+    segments = []
+    x = start_x
+    y = 0
+    while y < height - 2:
+        seg_len = rng.randint(2, 4)
+        next_y = min(y + seg_len, height - 1)
+        jag = rng.choice([-3, -2, -1, 1, 2, 3])
+        next_x = max(0, min(x + jag, width - 1))
+        segments.append((x, y, next_x, next_y))
+        x, y = next_x, next_y
+    return segments
+
+
+@functools.cache
+def _thunder_bolt_bank(
+    width: int, height: int
+) -> tuple[tuple[Image.Image, Image.Image, Image.Image, tuple[int, int]], ...]:
+    """Pre-rendered bolts: (strike sprite, afterglow sprite, paste mask, offset).
+
+    Both sprites of a bolt share one shape and are cropped to its box; the
+    mask covers exactly the bolt pixels, so a paste replaces what is under
+    them as drawing the segments would.
+    """
+    rng = random.Random(_THUNDER_BANK_SEED)
+    bank = []
+    for _ in range(THUNDER_BOLT_VARIANTS):
+        segments = _generate_bolt(rng, rng.randint(10, width - 10), width, height)
+        sprites = []
+        for alpha in (THUNDER_STRIKE_ALPHA, THUNDER_AFTERGLOW_ALPHA):
+            full = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(full)
+            for x1, y1, x2, y2 in segments:
+                draw.line([(x1, y1), (x2, y2)], fill=(*THUNDER_BOLT_COLOR, alpha), width=1)
+            sprites.append(full)
+        box = sprites[0].getbbox()
+        strike, afterglow = (sprite.crop(box) for sprite in sprites)
+        mask = strike.getchannel("A").point(lambda a: 255 if a else 0)
+        bank.append((strike, afterglow, mask, (box[0], box[1])))
+    return tuple(bank)
+
+
+@functools.cache
+def _thunder_flash_frames(width: int, height: int) -> tuple[Image.Image, Image.Image]:
+    """Full-zone (flash, fade) overlays; they replace the background layer."""
+    return (
+        Image.new("RGBA", (width, height), THUNDER_FLASH_FILL),
+        Image.new("RGBA", (width, height), THUNDER_FADE_FILL),
+    )
 
 
 class ThunderAnimation(WeatherAnimation):
@@ -485,81 +920,73 @@ class ThunderAnimation(WeatherAnimation):
     - Frame 1: bright white flash + jagged bolt
     - Frame 2: bolt afterglow (same shape)
     - Frame 3: dim fade
+
+    Bolts come from a shared bank of pre-rendered sprites, picked by the
+    animation's seeded RNG, and the flash frames are precomputed, so a
+    strike costs a paste rather than drawing its segments.
+
+    The flash cycle counts whole ticks, so thunder has no sub-steps and
+    :meth:`tick_batch` falls back to single frames.
     """
 
-    def __init__(self, width: int = 64, height: int = 24, precipitation_mm: float = 5.0) -> None:
-        super().__init__(width, height)
-        self._rain = RainAnimation(width, height, precipitation_mm=precipitation_mm)
-        self._tick_count = 0
-        self._flash_remaining = 0
-        self._bolt_x = 0
-        self._bolt_segments: list[tuple[int, int, int, int]] = []
-
-    def _generate_bolt(self, start_x: int) -> list[tuple[int, int, int, int]]:
-        """Generate jagged lightning bolt segments from top to bottom."""
-        segments = []
-        x = start_x
-        y = 0
-        while y < self.height - 2:
-            seg_len = random.randint(2, 4)
-            next_y = min(y + seg_len, self.height - 1)
-            jag = random.choice([-3, -2, -1, 1, 2, 3])
-            next_x = max(0, min(x + jag, self.width - 1))
-            segments.append((x, y, next_x, next_y))
-            x, y = next_x, next_y
-        return segments
-
-    def _draw_bolt(
+    _STATE_ATTRS = ("_tick_count", "_flash_remaining", "_bolt_index")
+
+    def __init__(
         self,
-        draw: ImageDraw.Draw,
-        segments: list[tuple[int, int, int, int]],
-        alpha: int,
+        width: int = 64,
+        height: int = 24,
+        precipitation_mm: float = 5.0,
+        *,
+        seed: int | None = None,
     ) -> None:
-        """Draw a pre-generated lightning bolt."""
-        color = (255, 255, 200, alpha)
-        for x1, y1, x2, y2 in segments:
-            draw.line([(x1, y1), (x2, y2)], fill=color, width=1)
+        super().__init__(width, height, seed=seed)
+        self._rain = RainAnimation(
+            width, height, precipitation_mm=precipitation_mm, seed=_derive_seed(self.seed, 1)
+        )
+        self._tick_count = 0
+        self._flash_remaining = 0
+        self._bolt_index = 0
+
+    def _paste_bolt(self, layer: Image.Image, *, afterglow: bool) -> None:
+        strike, glow, mask, offset = _thunder_bolt_bank(self.width, self.height)[self._bolt_index]
+        layer.paste(glow if afterglow else strike, offset, mask)
 
     def tick(self) -> tuple[Image.Image, Image.Image]:
+        self._next_frame()
         bg, fg = self._rain.tick()
         self._tick_count += 1
 
         # Trigger new lightning every ~4 ticks (~4 seconds at 1 FPS)
         if self._tick_count % 4 == 0:
             self._flash_remaining = 3
-            self._bolt_x = random.randint(10, self.width - 10)
-            self._bolt_segments = self._generate_bolt(self._bolt_x)
+            self._bolt_index = self.rng.randrange(THUNDER_BOLT_VARIANTS)
 
         if self._flash_remaining > 0:
-            fg_draw = ImageDraw.Draw(fg)
-            bg_draw = ImageDraw.Draw(bg)
-
+            flash, fade = _thunder_flash_frames(self.width, self.height)
             if self._flash_remaining == 3:
                 # Bright flash + bolt
-                bg_draw.rectangle(
-                    [0, 0, self.width - 1, self.height - 1],
-                    fill=(255, 255, 180, 120),
-                )
-                self._draw_bolt(fg_draw, self._bolt_segments, 220)
+                bg.paste(flash)
+                self._paste_bolt(fg, afterglow=False)
             elif self._flash_remaining == 2:
                 # Bolt afterglow (same shape)
-                self._draw_bolt(fg_draw, self._bolt_segments, 150)
+                self._paste_bolt(fg, afterglow=True)
             else:
                 # Dim fade
-                bg_draw.rectangle(
-                    [0, 0, self.width - 1, self.height - 1],
-                    fill=(200, 200, 150, 40),
-                )
+                bg.paste(fade)
 
             self._flash_remaining -= 1
 
         return bg, fg
 
+    def _children(self) -> list[WeatherAnimation]:
+        return [self._rain]
+
     def reset(self) -> None:
+        self._rewind()
         self._rain.reset()
         self._tick_count = 0
         self._flash_remaining = 0
-        self._bolt_segments = []
+        self._bolt_index = 0
 
 
 class FogAnimation(WeatherAnimation):
@@ -567,25 +994,58 @@ class FogAnimation(WeatherAnimation):
 
     Far clouds (behind): dimmer, smaller, slower.
     Near clouds (in front): brighter, larger, drift over text for 3D misty effect.
+
+    Each depth is rendered once into a wrap-around texture (see
+    :func:`_scroll_phases`) and a frame is a sub-pixel scrolled window over
+    it, shown right of ``_LEFT``.
     """
 
-    def __init__(self, width: int = 64, height: int = 24) -> None:
-        super().__init__(width, height)
+    supports_substeps = True
+    _STATE_ATTRS = (
+        "far_blobs",
+        "near_blobs",
+        "far_speed",
+        "near_speed",
+        "far_offset",
+        "near_offset",
+    )
+
+    # Fog stays right of this column, clear of the left-hand text
+    _LEFT = 21
+    # Texture columns beyond the visible window, so blobs pass out of view
+    _PERIOD_MARGIN = 20
+
+    def __init__(self, width: int = 64, height: int = 24, *, seed: int | None = None) -> None:
+        super().__init__(width, height, seed=seed)
         self.far_blobs: list[dict] = []
         self.near_blobs: list[dict] = []
-        self._spawn_far(3)
-        self._spawn_near(3)
+        self.far_offset = 0.0
+        self.near_offset = 0.0
+        self._spawn_speeds()
+        self._apply_quality()
+
+    @property
+    def _window(self) -> int:
+        return self.width - self._LEFT
+
+    @property
+    def _period(self) -> int:
+        return self._window + self._PERIOD_MARGIN
+
+    def _spawn_speeds(self) -> None:
+        # Drift to the left per tick
+        self.far_speed = self.rng.uniform(0.05, 0.12)
+        self.near_speed = self.rng.uniform(0.12, 0.25)
 
     def _spawn_far(self, count: int) -> None:
         for _ in range(count):
             self.far_blobs.append(
                 {
-                    "x": float(random.randint(21, self.width + 20)),
-                    "y": random.randint(4, 10),
-                    "w": random.randint(6, 10),
-                    "h": random.randint(3, 4),
-                    "speed": random.uniform(0.05, 0.12),
-                    "alpha": random.randint(65, 90),
+                    "x": self.rng.randrange(self._period),
+                    "y": self.rng.randint(4, 10),
+                    "w": self.rng.randint(6, 10),
+                    "h": self.rng.randint(3, 4),
+                    "alpha": self.rng.randint(65, 90),
                 }
             )
 
@@ -593,52 +1053,44 @@ class FogAnimation(WeatherAnimation):
         for _ in range(count):
             self.near_blobs.append(
                 {
-                    "x": float(random.randint(21, self.width + 20)),
-                    "y": random.randint(3, 11),
-                    "w": random.randint(10, 16),
-                    "h": random.randint(4, 6),
-                    "speed": random.uniform(0.12, 0.25),
-                    "alpha": random.randint(100, 140),
+                    "x": self.rng.randrange(self._period),
+                    "y": self.rng.randint(3, 11),
+                    "w": self.rng.randint(10, 16),
+                    "h": self.rng.randint(4, 6),
+                    "alpha": self.rng.randint(100, 140),
                 }
             )
 
-    def _draw_blob(self, draw: ImageDraw.Draw, blob: dict, bright: bool) -> None:
-        x = int(blob["x"])
-        y, w, h, alpha = blob["y"], blob["w"], blob["h"], blob["alpha"]
+    def _layer(self, blobs: list[dict], offset: float, bright: bool) -> Image.Image:
+        shapes = tuple((b["x"], b["y"], b["w"], b["h"], b["alpha"]) for b in blobs)
         base = (210, 220, 235) if bright else (180, 190, 200)
-        draw.ellipse([x, y, x + w, y + h], fill=(*base, alpha))
-        draw.ellipse(
-            [x + w // 4, y - 1, x + w - w // 4, y + h - 2],
-            fill=(*base, max(alpha - 25, 30)),
-        )
+        phases = _fog_phases(self._window, self.height, self._period, base, shapes)
+        layer = self._empty()
+        layer.paste(_scroll_window(phases, offset, self._window), (self._LEFT, 0))
+        return layer
 
     def tick(self) -> tuple[Image.Image, Image.Image]:
-        bg = self._empty()
-        fg = self._empty()
-        bg_draw = ImageDraw.Draw(bg)
-        fg_draw = ImageDraw.Draw(fg)
-
-        for blob in self.far_blobs:
-            self._draw_blob(bg_draw, blob, bright=False)
-            blob["x"] -= blob["speed"]
-            if blob["x"] + blob["w"] < 21:
-                blob["x"] = float(self.width + random.randint(0, 10))
-                blob["y"] = random.randint(4, 10)
-
-        for blob in self.near_blobs:
-            self._draw_blob(fg_draw, blob, bright=True)
-            blob["x"] -= blob["speed"]
-            if blob["x"] + blob["w"] < 21:
-                blob["x"] = float(self.width + random.randint(0, 10))
-                blob["y"] = random.randint(3, 11)
+        self._next_frame()
+        bg = self._layer(self.far_blobs, self.far_offset, bright=False)
+        fg = self._layer(self.near_blobs, self.near_offset, bright=True)
 
+        # The window moves right over the texture, so the fog drifts left
+        self.far_offset = (self.far_offset + self._scaled(self.far_speed)) % self._period
+        self.near_offset = (self.near_offset + self._scaled(self.near_speed)) % self._period
         return bg, fg
 
+    def _apply_quality(self) -> None:
+        self._fit(self.far_blobs, FOG_FAR_BLOB_COUNT, self._spawn_far)
+        self._fit(self.near_blobs, FOG_NEAR_BLOB_COUNT, self._spawn_near)
+
     def reset(self) -> None:
+        self._rewind()
         self.far_blobs.clear()
         self.near_blobs.clear()
-        self._spawn_far(3)
-        self._spawn_near(3)
+        self.far_offset = 0.0
+        self.near_offset = 0.0
+        self._spawn_speeds()
+        self._apply_quality()
 
 
 class ClearNightAnimation(WeatherAnimation):
@@ -655,163 +1107,178 @@ class ClearNightAnimation(WeatherAnimation):
 
     Far stars (behind text): cool white, dimmer peaks, longer dark intervals.
     Near stars (in front of text): warm white, brighter peaks, + shape at peak.
+
+    Each depth is a star field of parallel lists (``x``, ``state``,
+    ``timer``, ``peak_alpha``, one duration list per phase, ...), indexed
+    by star. A frame computes every alpha in one pass, decrements every
+    timer in another, and only then visits the stars whose phase ended;
+    new durations for all of them are drawn with one ``choices`` call per
+    field. Lit stars reach the layer in one :meth:`SparseLayer.scatter`.
     """
 
+    supports_sparse = True
+    supports_substeps = True
+
     # Star state constants
     _DARK = 0
     _BRIGHTEN = 1
     _PEAK = 2
     _DIM = 3
 
-    def __init__(self, width: int = 64, height: int = 24) -> None:
-        super().__init__(width, height)
-        self.far_stars: list[dict] = []
-        self.near_stars: list[dict] = []
-        self._spawn_far(NIGHT_FAR_STAR_COUNT)
-        self._spawn_near(NIGHT_NEAR_STAR_COUNT)
-
-    def _new_star(self, *, is_near: bool) -> dict:
-        """Create a single star with random position and twinkle parameters."""
-        if is_near:
-            peak_alpha = random.randint(160, 240)
-            dark_ticks = random.randint(4, 20)
-            brighten_ticks = random.randint(2, 6)
-            peak_ticks = random.randint(3, 10)
-            dim_ticks = random.randint(2, 8)
-        else:
-            peak_alpha = random.randint(80, 150)
-            dark_ticks = random.randint(6, 30)
-            brighten_ticks = random.randint(3, 10)
-            peak_ticks = random.randint(2, 8)
-            dim_ticks = random.randint(3, 12)
-
+    # Duration field of each state, indexed by state
+    _PHASE_TICKS = ("dark_ticks", "brighten_ticks", "peak_ticks", "dim_ticks")
+    # Inclusive (low, high) ranges, re-drawn at the end of every cycle
+    _FAR_RANGES = (
+        ("dark_ticks", 6, 30),
+        ("brighten_ticks", 3, 10),
+        ("peak_ticks", 2, 8),
+        ("dim_ticks", 3, 12),
+        ("peak_alpha", 80, 150),
+    )
+    _NEAR_RANGES = (
+        ("dark_ticks", 4, 20),
+        ("brighten_ticks", 2, 6),
+        ("peak_ticks", 3, 10),
+        ("dim_ticks", 2, 8),
+        ("peak_alpha", 160, 240),
+    )
+    _FIELDS = ("x", "y", "state", "timer", *(name for name, _, _ in _FAR_RANGES))
+
+    _FAR_COLOR = (180, 200, 255)
+    _NEAR_COLOR = (255, 250, 230)
+    # Near stars brighter than this get dimmer cross arms
+    _ARM_MIN_ALPHA = 150
+
+    _STATE_ATTRS = ("far_stars", "near_stars")
+
+    def __init__(self, width: int = 64, height: int = 24, *, seed: int | None = None) -> None:
+        super().__init__(width, height, seed=seed)
+        self.far_stars: dict[str, list] = self._empty_field()
+        self.near_stars: dict[str, list] = self._empty_field()
+        self._apply_quality()
+
+    def _empty_field(self) -> dict[str, list]:
+        return {name: [] for name in self._FIELDS}
+
+    def _spawn(self, stars: dict[str, list], count: int, *, is_near: bool) -> None:
+        """Append *count* stars with random positions, durations and phases."""
+        if count <= 0:
+            return
+        rng = self.rng
+        for name, low, high in self._NEAR_RANGES if is_near else self._FAR_RANGES:
+            stars[name] += rng.choices(range(low, high + 1), k=count)
         # Start each star at a random point in its cycle to avoid sync
-        state = random.choice([self._DARK, self._BRIGHTEN, self._PEAK, self._DIM])
-        if state == self._DARK:
-            timer = random.randint(0, dark_ticks)
-        elif state == self._BRIGHTEN:
-            timer = random.randint(0, brighten_ticks)
-        elif state == self._PEAK:
-            timer = random.randint(0, peak_ticks)
-        else:
-            timer = random.randint(0, dim_ticks)
-
-        return {
-            "x": random.randint(0, self.width - 1),
-            "y": random.randint(0, self.height - 1),
-            "peak_alpha": peak_alpha,
-            "state": state,
-            "timer": timer,
-            "dark_ticks": dark_ticks,
-            "brighten_ticks": brighten_ticks,
-            "peak_ticks": peak_ticks,
-            "dim_ticks": dim_ticks,
-        }
-
-    def _randomize_durations(self, star: dict, *, is_near: bool) -> None:
-        """Re-randomize phase durations for the next cycle."""
-        if is_near:
-            star["dark_ticks"] = random.randint(4, 20)
-            star["brighten_ticks"] = random.randint(2, 6)
-            star["peak_ticks"] = random.randint(3, 10)
-            star["dim_ticks"] = random.randint(2, 8)
-            star["peak_alpha"] = random.randint(160, 240)
-        else:
-            star["dark_ticks"] = random.randint(6, 30)
-            star["brighten_ticks"] = random.randint(3, 10)
-            star["peak_ticks"] = random.randint(2, 8)
-            star["dim_ticks"] = random.randint(3, 12)
-            star["peak_alpha"] = random.randint(80, 150)
+        states = rng.choices(range(4), k=count)
+        first = len(stars["x"])
+        stars["state"] += states
+        stars["timer"] += [
+            int(rng.random() * (stars[self._PHASE_TICKS[state]][first + i] + 1))
+            for i, state in enumerate(states)
+        ]
+        stars["x"] += rng.choices(range(self.width), k=count)
+        stars["y"] += rng.choices(range(self.height), k=count)
 
     def _spawn_far(self, count: int) -> None:
-        for _ in range(count):
-            self.far_stars.append(self._new_star(is_near=False))
+        self._spawn(self.far_stars, count, is_near=False)
 
     def _spawn_near(self, count: int) -> None:
-        for _ in range(count):
-            self.near_stars.append(self._new_star(is_near=True))
-
-    def _tick_star(self, star: dict, *, is_near: bool) -> int:
-        """Advance star state machine by one tick, return current alpha (0-255)."""
-        state = star["state"]
-        timer = star["timer"]
-
-        if state == self._DARK:
-            alpha = 0
-            star["timer"] -= 1
-            if star["timer"] <= 0:
-                star["state"] = self._BRIGHTEN
-                star["timer"] = star["brighten_ticks"]
-        elif state == self._BRIGHTEN:
-            # Linear fade in: progress from 0.0 to 1.0
-            total = star["brighten_ticks"]
-            elapsed = total - timer
-            progress = elapsed / max(total, 1)
-            alpha = int(star["peak_alpha"] * progress)
-            star["timer"] -= 1
-            if star["timer"] <= 0:
-                star["state"] = self._PEAK
-                star["timer"] = star["peak_ticks"]
-        elif state == self._PEAK:
-            alpha = star["peak_alpha"]
-            star["timer"] -= 1
-            if star["timer"] <= 0:
-                star["state"] = self._DIM
-                star["timer"] = star["dim_ticks"]
-        else:  # DIM
-            # Linear fade out: progress from 1.0 to 0.0
-            total = star["dim_ticks"]
-            progress = timer / max(total, 1)
-            alpha = int(star["peak_alpha"] * progress)
-            star["timer"] -= 1
-            if star["timer"] <= 0:
-                star["state"] = self._DARK
-                self._randomize_durations(star, is_near=is_near)
-                star["timer"] = star["dark_ticks"]
-
-        return max(0, min(alpha, 255))
+        self._spawn(self.near_stars, count, is_near=True)
 
-    def tick(self) -> tuple[Image.Image, Image.Image]:
-        bg = self._empty()
-        fg = self._empty()
-        bg_draw = ImageDraw.Draw(bg)
-        fg_draw = ImageDraw.Draw(fg)
+    def _randomize_durations(
+        self, stars: dict[str, list], due: list[int], *, is_near: bool
+    ) -> None:
+        """Re-draw phase durations and peak alpha for the stars in *due*."""
+        for name, low, high in self._NEAR_RANGES if is_near else self._FAR_RANGES:
+            values = stars[name]
+            drawn = self.rng.choices(range(low, high + 1), k=len(due))
+            for i, value in zip(due, drawn, strict=True):
+                values[i] = value
+
+    def _advance(self, stars: dict[str, list], *, is_near: bool) -> list[int]:
+        """Advance every star's state machine by one step.
+
+        Returns:
+            Each star's alpha (0-255) for this frame, before the step.
+        """
+        state, timer, peak = stars["state"], stars["timer"], stars["peak_alpha"]
+        brighten, dim = stars["brighten_ticks"], stars["dim_ticks"]
+        dark, bright = self._DARK, self._BRIGHTEN
+        peak_state = self._PEAK
+        # BRIGHTEN fades in linearly (0 -> peak), DIM fades out (peak -> 0)
+        alphas = [
+            0
+            if s == dark
+            else p
+            if s == peak_state
+            else int(p * (b - t) / max(b, 1))
+            if s == bright
+            else int(p * t / max(d, 1))
+            for s, t, p, b, d in zip(state, timer, peak, brighten, dim, strict=True)
+        ]
 
-        # Far stars -- behind text, cool white, single pixel
-        for star in self.far_stars:
-            alpha = self._tick_star(star, is_near=False)
+        step = self._scaled(1)
+        timer[:] = [t - step for t in timer]
+        due = [i for i, t in enumerate(timer) if t <= 0]
+        if due:
+            cycled = [i for i in due if state[i] == self._DIM]
+            if cycled:
+                self._randomize_durations(stars, cycled, is_near=is_near)
+            for i in due:
+                next_state = (state[i] + 1) % 4
+                state[i] = next_state
+                timer[i] = stars[self._PHASE_TICKS[next_state]][i]
+        return alphas
+
+    @staticmethod
+    def _scatter(draw, xs: list, ys: list, rgb: tuple[int, int, int], alphas: list[int]) -> None:
+        if isinstance(draw, SparseLayer):
+            draw.scatter(xs, ys, rgb, alphas)
+            return
+        for x, y, alpha in zip(xs, ys, alphas, strict=True):
             if alpha > 0:
-                x, y = star["x"], star["y"]
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    bg_draw.point((x, y), fill=(180, 200, 255, alpha))
+                draw.point((x, y), fill=(*rgb, alpha))
+
+    def _draw(self, bg_draw, fg_draw) -> None:
+        # Far stars -- behind text, cool white, single pixel
+        far = self.far_stars
+        alphas = self._advance(far, is_near=False)
+        self._scatter(bg_draw, far["x"], far["y"], self._FAR_COLOR, alphas)
 
         # Near stars -- in front of text, warm white, + shape at peak
-        for star in self.near_stars:
-            alpha = self._tick_star(star, is_near=True)
-            if alpha > 0:
-                x, y = star["x"], star["y"]
-                color = (255, 250, 230, alpha)
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    fg_draw.point((x, y), fill=color)
-                    # Cross arms when bright enough
-                    if alpha > 150:
-                        dim_color = (255, 250, 230, alpha // 2)
-                        if 0 <= x - 1 < self.width:
-                            fg_draw.point((x - 1, y), fill=dim_color)
-                        if 0 <= x + 1 < self.width:
-                            fg_draw.point((x + 1, y), fill=dim_color)
-                        if 0 <= y - 1 < self.height:
-                            fg_draw.point((x, y - 1), fill=dim_color)
-                        if 0 <= y + 1 < self.height:
-                            fg_draw.point((x, y + 1), fill=dim_color)
+        near = self.near_stars
+        alphas = self._advance(near, is_near=True)
+        xs, ys = near["x"], near["y"]
+        self._scatter(fg_draw, xs, ys, self._NEAR_COLOR, alphas)
+        arm_xs: list[int] = []
+        arm_ys: list[int] = []
+        arm_alphas: list[int] = []
+        for i, alpha in enumerate(alphas):
+            if alpha > self._ARM_MIN_ALPHA:
+                x, y = xs[i], ys[i]
+                arm_xs += (x - 1, x + 1, x, x)
+                arm_ys += (y, y, y - 1, y + 1)
+                arm_alphas += (alpha // 2,) * 4
+        if arm_xs:
+            self._scatter(fg_draw, arm_xs, arm_ys, self._NEAR_COLOR, arm_alphas)
+
+    def _fit_field(self, stars: dict[str, list], full_count: int, *, is_near: bool) -> None:
+        target = self._quality_count(full_count)
+        count = len(stars["x"])
+        if count > target:
+            for values in stars.values():
+                del values[target:]
+        else:
+            self._spawn(stars, target - count, is_near=is_near)
 
-        return bg, fg
+    def _apply_quality(self) -> None:
+        self._fit_field(self.far_stars, NIGHT_FAR_STAR_COUNT, is_near=False)
+        self._fit_field(self.near_stars, NIGHT_NEAR_STAR_COUNT, is_near=True)
 
     def reset(self) -> None:
-        self.far_stars.clear()
-        self.near_stars.clear()
-        self._spawn_far(NIGHT_FAR_STAR_COUNT)
-        self._spawn_near(NIGHT_NEAR_STAR_COUNT)
+        self._rewind()
+        self.far_stars = self._empty_field()
+        self.near_stars = self._empty_field()
+        self._apply_quality()
 
 
 class CompositeAnimation(WeatherAnimation):
@@ -819,24 +1286,63 @@ class CompositeAnimation(WeatherAnimation):
 
     Each child animation's bg layers are composited together, and fg layers
     are composited together, preserving the depth-layer rendering pipeline.
+    When every child supports sparse layers, their records are concatenated
+    instead, so no intermediate image is rasterised.
+
+    Below ``_OVERLAY_MIN_QUALITY`` only the first (base) animation is
+    ticked; overlays such as heavy rain's fog are left out.
     """
 
+    _OVERLAY_MIN_QUALITY = 0.5
+
     def __init__(self, animations: list[WeatherAnimation]) -> None:
         width = animations[0].width if animations else 64
         height = animations[0].height if animations else 24
-        super().__init__(width, height)
+        # No randomness of its own; the seed only labels the layered whole
+        super().__init__(width, height, seed=animations[0].seed if animations else None)
         self.animations = animations
 
+    def _children(self) -> list[WeatherAnimation]:
+        return self.animations
+
+    def _layers(self) -> list[WeatherAnimation]:
+        """Animations drawn at the current quality."""
+        if self.quality < self._OVERLAY_MIN_QUALITY:
+            return self.animations[:1]
+        return self.animations
+
     def tick(self) -> tuple[Image.Image, Image.Image]:
+        self._next_frame()
         bg = self._empty()
         fg = self._empty()
-        for anim in self.animations:
+        for anim in self._layers():
             child_bg, child_fg = anim.tick()
             bg = Image.alpha_composite(bg, child_bg)
             fg = Image.alpha_composite(fg, child_fg)
         return bg, fg
 
+    @property
+    def supports_sparse(self) -> bool:
+        return all(anim.supports_sparse for anim in self._layers())
+
+    @property
+    def supports_substeps(self) -> bool:
+        return all(anim.supports_substeps for anim in self._layers())
+
+    def tick_sparse(self) -> tuple[SparseLayer, SparseLayer]:
+        if not self.supports_sparse:
+            raise NotImplementedError("a layered animation has no sparse representation")
+        self._next_frame()
+        bg = self._empty_sparse()
+        fg = self._empty_sparse()
+        for anim in self._layers():
+            child_bg, child_fg = anim.tick_sparse()
+            bg.extend(child_bg)
+            fg.extend(child_fg)
+        return bg, fg
+
     def reset(self) -> None:
+        self._rewind()
         for anim in self.animations:
             anim.reset()
 
@@ -856,22 +1362,48 @@ class WindEffect(WeatherAnimation):
         wind_speed: float = 0.0,
         wind_direction: float = 0.0,
     ) -> None:
-        super().__init__(inner.width, inner.height)
+        super().__init__(inner.width, inner.height, seed=inner.seed)
         self.inner = inner
         self.wind_speed = wind_speed
         wind_rad = math.radians(wind_direction)
         self._drift_per_tick = -math.sin(wind_rad) * (wind_speed / 5.0)
 
-    def tick(self) -> tuple[Image.Image, Image.Image]:
+    def _children(self) -> list[WeatherAnimation]:
+        return [self.inner]
+
+    def _apply_drift(self) -> None:
         drift = self._drift_per_tick
+        whole_tick = self._dt == 1.0
+        if not whole_tick:
+            drift *= self._dt
         for attr in ("far_drops", "near_drops", "far_flakes", "near_flakes"):
             particles = getattr(self.inner, attr, None)
             if particles:
                 for p in particles:
-                    p[0] = int((p[0] + drift) % self.width)
+                    # Sub-steps keep the fractional drift so it accumulates
+                    x = (p[0] + drift) % self.width
+                    p[0] = int(x) if whole_tick else x
+
+    def tick(self) -> tuple[Image.Image, Image.Image]:
+        self._next_frame()
+        self._apply_drift()
         return self.inner.tick()
 
+    @property
+    def supports_sparse(self) -> bool:
+        return self.inner.supports_sparse
+
+    @property
+    def supports_substeps(self) -> bool:
+        return self.inner.supports_substeps
+
+    def tick_sparse(self) -> tuple[SparseLayer, SparseLayer]:
+        self._next_frame()
+        self._apply_drift()
+        return self.inner.tick_sparse()
+
     def reset(self) -> None:
+        self._rewind()
         self.inner.reset()
 
 
@@ -909,6 +1441,7 @@ def get_animation(
     precipitation_mm: float = 0.0,
     wind_speed: float = 0.0,
     wind_direction: float = 0.0,
+    seed: int | None = None,
 ) -> WeatherAnimation:
     """Get an animation instance for the given weather conditions.
 
@@ -923,6 +1456,7 @@ def get_animation(
         precipitation_mm: Precipitation amount in mm/h.
         wind_speed: Wind speed in m/s.
         wind_direction: Meteorological wind direction in degrees.
+        seed: Seed fixing the animation's frame sequence; random if None.
 
     Returns:
         A WeatherAnimation (possibly CompositeAnimation or WindEffect).
@@ -931,14 +1465,14 @@ def get_animation(
     if is_night:
         cls = _NIGHT_ANIMATION_MAP.get(weather_group)
         if cls is not None:
-            return cls()
+            return cls(seed=seed)
 
     cls = _ANIMATION_MAP.get(weather_group, CloudAnimation)
 
     # Build the base animation
     wind_applied = False
     if cls is RainAnimation:
-        base = RainAnimation(precipitation_mm=precipitation_mm)
+        base = RainAnimation(precipitation_mm=precipitation_mm, seed=seed)
         # Apply wind to rain BEFORE wrapping in CompositeAnimation
         wind_applicable = wind_speed > 0 and wind_speed > _WIND_THRESHOLD_RAIN
         if wind_applicable:
@@ -946,13 +1480,14 @@ def get_animation(
             wind_applied = True
         # Heavy rain gets fog overlay
         if precipitation_mm > _FOG_OVERLAY_PRECIP:
-            base = CompositeAnimation([base, FogAnimation()])
+            fog_seed = None if seed is None else _derive_seed(seed, 2)
+            base = CompositeAnimation([base, FogAnimation(seed=fog_seed)])
     elif cls is ThunderAnimation:
-        base = ThunderAnimation(precipitation_mm=precipitation_mm)
+        base = ThunderAnimation(precipitation_mm=precipitation_mm, seed=seed)
     elif cls is SnowAnimation:
-        base = SnowAnimation(precipitation_mm=precipitation_mm)
+        base = SnowAnimation(precipitation_mm=precipitation_mm, seed=seed)
     else:
-        base = cls()
+        base = cls(seed=seed)
 
     # Apply wind effect to particle-based animations (if not already applied)
     if not wind_applied:
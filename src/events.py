@@ -0,0 +1,323 @@
+"""Structured operational event log in a memory-mapped ring file.
+
+Device pushes, pings and reboots, circuit breaker transitions and data
+freshness changes are recorded as fixed-size 40-byte binary records::
+
+    offset  size  field
+    0       8     timestamp   float64, wall-clock seconds (time.time())
+    8       2     event       uint16, EventType
+    10      1     result      uint8, EventResult
+    11      1     (padding)
+    12      4     duration    float32, seconds (e.g. push round trip)
+    16      4     value       float32, event-specific (cooldown, data age, ...)
+    20      20    source      ASCII, NUL-padded (device IP[:port], API name, ...)
+
+The file starts with a 32-byte header (magic, version, record size,
+capacity, total records written); record *n* lives in slot
+``n % capacity``. Records are written straight into a shared ``mmap`` of
+the file, so they are in the kernel page cache as soon as
+:meth:`EventLog.record` returns and survive ``os._exit()`` from the
+watchdog, unlike buffered log handlers. Recording costs a struct pack
+under a lock (~1-2 us).
+
+Components call the module-level :func:`record`, a no-op until
+:func:`set_event_log` installs a log (``main()`` does, at
+``EVENT_LOG_PATH``). Inspect a ring with::
+
+    python -m src.events dump events.ring --last 50 --event push
+    python -m src.events summary events.ring
+"""
+
+from __future__ import annotations
+
+import argparse
+import enum
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+_MAGIC = b"PXEV"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIQ12x")
+_RECORD = struct.Struct("<dHBxff20s")
+_COUNT_OFFSET = 12  # byte offset of the total-written counter in the header
+_COUNT = struct.Struct("<Q")
+
+
+class EventType(enum.IntEnum):
+    """Kinds of recorded events."""
+
+    PUSH = 1
+    PING = 2
+    REBOOT = 3
+    BREAKER_OPEN = 10
+    BREAKER_HALF_OPEN = 11
+    BREAKER_CLOSED = 12
+    DATA_UPDATE = 20  # value: age of the replaced data (s)
+    DATA_STALE = 21  # value: data age (s)
+    DATA_EXPIRED = 22  # value: data age (s)
+    DATA_FRESH = 23  # value: data age (s)
+    KEEPALIVE_REBOOT = 30  # value: consecutive failures that triggered it
+
+
+class EventResult(enum.IntEnum):
+    """Outcome attached to an event."""
+
+    OK = 0
+    ERROR = 1
+    SKIPPED = 2
+
+
+@dataclass(frozen=True)
+class Event:
+    """One decoded event record."""
+
+    timestamp: float
+    event: EventType | int
+    result: EventResult | int
+    duration: float
+    value: float
+    source: str
+
+    @property
+    def event_name(self) -> str:
+        """Lower-case event type name (the raw number if unknown)."""
+        return self.event.name.lower() if isinstance(self.event, EventType) else str(self.event)
+
+    @property
+    def result_name(self) -> str:
+        """Lower-case result name (the raw number if unknown)."""
+        if isinstance(self.result, EventResult):
+            return self.result.name.lower()
+        return str(self.result)
+
+    def format(self) -> str:
+        """One-line human-readable rendering."""
+        when = datetime.fromtimestamp(self.timestamp).isoformat(sep=" ", timespec="milliseconds")
+        return (
+            f"{when}  {self.event_name:<17} {self.result_name:<7} {self.source:<15} "
+            f"duration={self.duration * 1000:.1f}ms value={self.value:g}"
+        )
+
+
+def _decode(raw: tuple) -> Event:
+    timestamp, event, result, duration, value, source = raw
+    try:
+        event = EventType(event)
+    except ValueError:
+        pass
+    try:
+        result = EventResult(result)
+    except ValueError:
+        pass
+    return Event(
+        timestamp, event, result, duration, value, source.rstrip(b"\0").decode("ascii", "replace")
+    )
+
+
+class EventLog:
+    """Fixed-capacity ring of event records backed by a memory-mapped file.
+
+    An existing ring with the same capacity is appended to; a missing,
+    foreign or differently sized file is recreated.
+
+    Args:
+        path: Ring file location.
+        capacity: Number of records kept (oldest are overwritten).
+    """
+
+    def __init__(self, path: str | Path, capacity: int) -> None:
+        self.path = Path(path)
+        self.capacity = capacity
+        size = _HEADER.size + capacity * _RECORD.size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if not self._header_matches(fd, size):
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+                os.pwrite(fd, _HEADER.pack(_MAGIC, _VERSION, _RECORD.size, capacity, 0), 0)
+            self._mmap = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        (self._written,) = _COUNT.unpack_from(self._mmap, _COUNT_OFFSET)
+        self._lock = threading.Lock()
+
+    def _header_matches(self, fd: int, size: int) -> bool:
+        if os.fstat(fd).st_size != size:
+            return False
+        magic, version, record_size, capacity, _ = _HEADER.unpack(os.pread(fd, _HEADER.size, 0))
+        return (
+            magic == _MAGIC
+            and version == _VERSION
+            and record_size == _RECORD.size
+            and capacity == self.capacity
+        )
+
+    @property
+    def written(self) -> int:
+        """Total records written over the ring's lifetime."""
+        return self._written
+
+    def record(
+        self,
+        event: EventType,
+        result: EventResult = EventResult.OK,
+        duration: float = 0.0,
+        value: float = 0.0,
+        source: str = "",
+    ) -> None:
+        """Append one event, overwriting the oldest when full."""
+        packed = (time.time(), event, result, duration, value, source.encode("ascii", "replace"))
+        with self._lock:
+            slot = self._written % self.capacity
+            _RECORD.pack_into(self._mmap, _HEADER.size + slot * _RECORD.size, *packed)
+            self._written += 1
+            _COUNT.pack_into(self._mmap, _COUNT_OFFSET, self._written)
+
+    def events(self) -> list[Event]:
+        """All retained events, oldest first."""
+        with self._lock:
+            written = self._written
+            data = bytes(self._mmap)
+        return _decode_ring(data, written, self.capacity)
+
+    def close(self) -> None:
+        """Unmap the ring file."""
+        with self._lock:
+            self._mmap.close()
+
+
+def _decode_ring(data: bytes, written: int, capacity: int) -> list[Event]:
+    count = min(written, capacity)
+    first = written - count
+    events = []
+    for n in range(first, written):
+        offset = _HEADER.size + (n % capacity) * _RECORD.size
+        events.append(_decode(_RECORD.unpack_from(data, offset)))
+    return events
+
+
+def read_events(path: str | Path) -> list[Event]:
+    """Read all retained events from a ring file, oldest first.
+
+    Raises:
+        ValueError: If *path* is not an event ring.
+    """
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not an event ring (too short)")
+    magic, version, record_size, capacity, written = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION or record_size != _RECORD.size:
+        raise ValueError(f"{path} is not a version {_VERSION} event ring")
+    return _decode_ring(data, written, capacity)
+
+
+# -- Process-wide log -----------------------------------------------------------
+
+_log: EventLog | None = None
+
+
+def set_event_log(log: EventLog | None) -> EventLog | None:
+    """Install the process-wide event log; return the previous one."""
+    global _log
+    previous, _log = _log, log
+    return previous
+
+
+def get_event_log() -> EventLog | None:
+    """The process-wide event log, if one is installed."""
+    return _log
+
+
+def record(
+    event: EventType,
+    result: EventResult = EventResult.OK,
+    duration: float = 0.0,
+    value: float = 0.0,
+    source: str = "",
+) -> None:
+    """Record an event in the process-wide log (no-op if none installed)."""
+    log = _log
+    if log is not None:
+        log.record(event, result, duration, value, source)
+
+
+# -- CLI ------------------------------------------------------------------------
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    return ordered[max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))]
+
+
+def summarize(events: Iterable[Event]) -> list[str]:
+    """Per (event, source) counts by result and duration percentiles."""
+    groups: dict[tuple[str, str], list[Event]] = defaultdict(list)
+    first = last = None
+    for ev in events:
+        groups[(ev.event_name, ev.source)].append(ev)
+        first = ev.timestamp if first is None else first
+        last = ev.timestamp
+    if first is None:
+        return ["no events"]
+    lines = [
+        f"{sum(len(g) for g in groups.values())} events from "
+        f"{datetime.fromtimestamp(first):%Y-%m-%d %H:%M:%S} to "
+        f"{datetime.fromtimestamp(last):%Y-%m-%d %H:%M:%S}"
+    ]
+    for (name, source), group in sorted(groups.items()):
+        results: dict[str, int] = defaultdict(int)
+        for ev in group:
+            results[ev.result_name] += 1
+        counts = " ".join(f"{k}={v}" for k, v in sorted(results.items()))
+        line = f"  {name:<17} {source:<15} n={len(group):<6} {counts}"
+        durations = sorted(ev.duration for ev in group if ev.duration > 0)
+        if durations:
+            line += (
+                f"  p50 {_percentile(durations, 0.5) * 1000:.0f} / "
+                f"p95 {_percentile(durations, 0.95) * 1000:.0f} / "
+                f"max {durations[-1] * 1000:.0f} ms"
+            )
+        lines.append(line)
+    return lines
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point: dump or summarise an event ring."""
+    parser = argparse.ArgumentParser(description="Inspect the dashboard event ring")
+    sub = parser.add_subparsers(dest="command", required=True)
+    dump = sub.add_parser("dump", help="print events, oldest first")
+    dump.add_argument("path", help="event ring file")
+    dump.add_argument("--last", type=int, default=None, help="only the N most recent events")
+    dump.add_argument(
+        "--event",
+        choices=[t.name.lower() for t in EventType],
+        default=None,
+        help="only events of this type",
+    )
+    summary = sub.add_parser("summary", help="counts and durations per event and source")
+    summary.add_argument("path", help="event ring file")
+    args = parser.parse_args(argv)
+
+    events = read_events(args.path)
+    if args.command == "summary":
+        print("\n".join(summarize(events)))
+        return
+    if args.event is not None:
+        wanted = EventType[args.event.upper()]
+        events = [ev for ev in events if ev.event == wanted]
+    if args.last is not None:
+        events = events[-args.last :]
+    for ev in events:
+        print(ev.format())
+
+
+if __name__ == "__main__":
+    main()
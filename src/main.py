@@ -8,62 +8,94 @@ Usage:
     python src/main.py --simulated --save-frame
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import importlib
+import itertools
 import logging
 import os
+import queue
 import signal
 import sys
 import threading
 import time
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 # Ensure project root is on sys.path so `src.*` imports work when run directly
 _project_root = str(Path(__file__).resolve().parent.parent)
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
+# Startup milestones are measured from here (before the src.* imports)
+_import_started = time.perf_counter()
+
+from src import config, events, timesource
 from src.circuit_breaker import CircuitBreaker
 from src.config import (
+    ANIM_SUBFRAMES,
+    ASYNC_RUNTIME,
     BIRTHDAY_DATES,
     BUS_QUAY_DIRECTION1,
     BUS_QUAY_DIRECTION2,
-    DEVICE_IP,
-    DISCORD_BOT_TOKEN,
+    DEVICE_IPS,
     DISCORD_CHANNEL_ID,
     DISCORD_MONITOR_CHANNEL_ID,
+    EVENT_LOG_CAPACITY,
+    EVENT_LOG_PATH,
     FONT_DIR,
     FONT_SMALL,
     FONT_TINY,
+    FRAME_CACHE_SIZE,
+    HEADLESS_RING_SIZE,
+    METRICS_PORT,
+    STAGE_TIMING_ENABLED,
+    STATE_SNAPSHOT_PATH,
+    WATCHDOG_REPORT_PATH,
     WATCHDOG_TIMEOUT,
     WEATHER_LAT,
     WEATHER_LON,
     validate_config,
+    validate_discord_config,
 )
+from src.dashboard_metrics import register_dashboard_metrics
 from src.dashboard_state import DashboardState
+from src.device.fanout import DeviceFanout
+from src.device.headless import RECORDING_SUFFIXES, FrameRecorder, HeadlessClient
 from src.device.keepalive import DeviceKeepAlive
+from src.device.payload import AnimationPayload, FramePayload
 from src.device.pixoo_client import PixooClient, PushResult
-from src.display.animation_selector import precip_category as _precip_category  # noqa: F401
-from src.display.animation_selector import (
-    should_swap_animation as _should_swap_animation,  # noqa: F401
-)
-from src.display.animation_selector import wind_category as _wind_category  # noqa: F401
+from src.display.anim_quality import AdaptiveAnimationQuality
 from src.display.fonts import load_fonts
+from src.display.frame_cache import FrameCache
 from src.display.renderer import render_frame
+from src.display.snapshot import load_snapshot, save_snapshot
 from src.display.state import DisplayState
+from src.metrics import MetricsRegistry, StageTimings
+from src.metrics_server import MetricsServer
+from src.profiler import SamplingProfiler
 from src.providers.bus import fetch_quay_name
-from src.providers.discord_bot import MessageBridge, start_discord_bot
-from src.providers.discord_monitor import (
-    HealthTracker,
-    MonitorBridge,
-    shutdown_embed,
-    startup_embed,
-)
-from src.providers.geocode import reverse_geocode as _reverse_geocode  # noqa: F401
 from src.providers.weather import WeatherData
 from src.staleness import StalenessTracker
-from src.watchdog import Heartbeat  # noqa: F401
-from src.watchdog import watchdog_thread as _watchdog_thread  # noqa: F401
+from src.watchdog import Heartbeat, load_hang_report, summarize_hang_report
+from src.watchdog import watchdog_thread as _watchdog_thread
+
+if TYPE_CHECKING:
+    from src.providers.discord_bot import MessageBridge
+    from src.providers.discord_monitor import HealthTracker, MonitorBridge
+
+# Backward-compatible aliases, resolved on first access so the animation
+# and geocoding modules stay off the startup path (see __getattr__ below)
+_LAZY_ALIASES = {
+    "_precip_category": ("src.display.animation_selector", "precip_category"),
+    "_should_swap_animation": ("src.display.animation_selector", "should_swap_animation"),
+    "_wind_category": ("src.display.animation_selector", "wind_category"),
+    "_reverse_geocode": ("src.providers.geocode", "reverse_geocode"),
+}
 
 logging.basicConfig(
     level=logging.INFO,
@@ -71,6 +103,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shortest retry sleep for a rate-limited frame, so a client reporting no
+# delay cannot turn the loop into a busy wait
+_MIN_RETRY_DELAY = 0.05
+
+
+def __getattr__(name: str):
+    """Resolve the lazy backward-compatible aliases in ``_LAZY_ALIASES``."""
+    try:
+        module_name, attr = _LAZY_ALIASES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _log_startup(marks: list[tuple[str, float]]) -> None:
+    """Log the time spent in each startup milestone and in total.
+
+    Args:
+        marks: ``(label, perf_counter())`` pairs in order, each taken when
+            its milestone finished; the first pair is the reference point.
+    """
+    steps = ", ".join(
+        f"{label} {(t - prev) * 1000:.0f} ms" for (_, prev), (label, t) in itertools.pairwise(marks)
+    )
+    logger.info("Startup: %s (total %.0f ms)", steps, (marks[-1][1] - marks[0][1]) * 1000)
+
 
 def _is_birthday(dt: datetime) -> bool:
     """Check if the given date is a configured birthday."""
@@ -100,35 +158,8 @@ def build_font_map(font_dir: str) -> dict:
     }
 
 
-def main_loop(
-    client: PixooClient,
-    fonts: dict,
-    *,
-    save_frame: bool = False,
-    message_bridge: MessageBridge | None = None,
-    health_tracker: HealthTracker | None = None,
-    bot_dead_event: threading.Event | None = None,
-    stop_event: threading.Event | None = None,
-) -> None:
-    """Run the dashboard main loop.
-
-    Checks time every iteration. Pushes a frame when the display state
-    changes or when the weather animation ticks a new frame.
-
-    When weather animation is active, the loop runs at ~1 FPS (1.0s sleep).
-    The Pixoo 64 device can only reliably handle ~1 HTTP push per second;
-    faster rates overwhelm its embedded HTTP server, causing connection
-    resets and eventual device freezes. Without animation, also sleeps 1s.
-
-    Args:
-        client: Pixoo device client for pushing frames.
-        fonts: Font dictionary with keys "small", "tiny".
-        save_frame: If True, save each rendered frame to debug_frame.png.
-        message_bridge: Optional MessageBridge from Discord bot for message override.
-        health_tracker: Optional HealthTracker for monitoring integration.
-        bot_dead_event: Optional threading.Event set when Discord bot thread dies.
-        stop_event: Optional threading.Event for graceful shutdown signalling.
-    """
+def _test_weather_data() -> WeatherData | None:
+    """Hardcoded weather for the TEST_WEATHER mode, or None when not set."""
     # --- TEST MODE: hardcode weather for visual testing ---
     # Set TEST_WEATHER env var to: clear, rain, snow, fog (cycles on restart)
     test_weather_mode = os.environ.get("TEST_WEATHER")
@@ -178,127 +209,582 @@ def main_loop(
             wind_from_direction=250.0,
         ),
     }
-    if test_weather_mode:
-        logger.info("TEST MODE: weather=%s, temp=30\u00b0C, daytime", test_weather_mode)
+    if not test_weather_mode:
+        return None
+    logger.info("TEST MODE: weather=%s, temp=30\u00b0C, daytime", test_weather_mode)
     # --- END TEST MODE ---
+    return test_weather_map.get(test_weather_mode)
 
-    # Encapsulated dashboard state (Issue 01)
-    ds = DashboardState()
-
-    # Watchdog: detect hung main loop and force-exit for launchd restart
-    heartbeat = Heartbeat()
-    if stop_event is None:
-        stop_event = threading.Event()
-    watchdog = threading.Thread(
-        target=_watchdog_thread, args=(heartbeat,), kwargs={"stop_event": stop_event}, daemon=True
-    )
-    watchdog.start()
-    logger.info("Watchdog started (timeout=%ds)", WATCHDOG_TIMEOUT)
 
-    # Delegate device keep-alive and staleness tracking to dedicated classes
-    keepalive = DeviceKeepAlive()
-    staleness = StalenessTracker()
+class DashboardLoop:
+    """Collaborators and steps of one dashboard run.
 
-    # Circuit breakers for external APIs (Issue 07)
-    bus_breaker = CircuitBreaker("Bus API", failure_threshold=3, reset_timeout=300)
-    weather_breaker = CircuitBreaker("Weather API", failure_threshold=3, reset_timeout=300)
+    Owns the keep-alive, staleness tracking, circuit breakers, frame cache
+    and watchdog heartbeat, and exposes each loop step as a method.
+    :func:`main_loop` drives the steps by polling once a second;
+    :func:`async_main_loop` drives them from events
+    (:mod:`src.async_runtime`). Arguments are those of :func:`main_loop`.
+    """
 
-    while not stop_event.is_set():
-        now_mono = time.monotonic()
-        now_utc = datetime.now(timezone.utc)
+    def __init__(
+        self,
+        client: PixooClient | DeviceFanout | HeadlessClient,
+        fonts: dict,
+        *,
+        save_frame: bool = False,
+        message_bridge: MessageBridge | None = None,
+        health_tracker: HealthTracker | None = None,
+        bot_dead_event: threading.Event | None = None,
+        stop_event: threading.Event | None = None,
+        dashboard_state: DashboardState | None = None,
+        timings: StageTimings | None = None,
+        registry: MetricsRegistry | None = None,
+        snapshot_path: str | Path | None = None,
+    ) -> None:
+        self.client = client
+        self.fonts = fonts
+        self.save_frame = save_frame
+        self.message_bridge = message_bridge
+        self.health_tracker = health_tracker
+        self.bot_dead_event = bot_dead_event
+        self.stop_event = stop_event if stop_event is not None else threading.Event()
+        self.snapshot_path = snapshot_path
+        self.test_weather = _test_weather_data()
+        # Set from other threads (e.g. a Discord message arriving) to cut the
+        # polling loop's sleep short
+        self.wake = threading.Event()
+        # Animation sub-frames per push; needs devices that play multi-frame
+        # uploads themselves
+        self.substeps = ANIM_SUBFRAMES if ANIM_SUBFRAMES > 1 and client.supports_multi_frame else 1
+
+        # Encapsulated dashboard state (Issue 01)
+        self.ds = ds = dashboard_state if dashboard_state is not None else DashboardState()
+        self.timings = timings = timings if timings is not None else StageTimings(enabled=False)
+        self.heartbeat = Heartbeat()
+
+        # Delegate device keep-alive and staleness tracking to dedicated classes.
+        # With a fan-out each device worker owns its keep-alive instead.
+        self.fanout = fanout = client if isinstance(client, DeviceFanout) else None
+        self.keepalive = DeviceKeepAlive()
+        self.staleness = StalenessTracker()
+
+        # Circuit breakers for external APIs (Issue 07)
+        self.bus_breaker = CircuitBreaker("Bus API", failure_threshold=3, reset_timeout=300)
+        self.weather_breaker = CircuitBreaker("Weather API", failure_threshold=3, reset_timeout=300)
+
+        # Rendered-frame memoisation for repeated display states
+        self.frame_cache = FrameCache(FRAME_CACHE_SIZE)
+        # Particle counts scaled down when animated frames run over budget
+        self.anim_quality = AdaptiveAnimationQuality()
+        if health_tracker:
+            health_tracker.register_stats("frame_cache", self.frame_cache.stats)
+            health_tracker.register_stats("animation", self.anim_quality.stats)
+            if timings.enabled:
+                health_tracker.register_stats("stages", timings.stats)
+            if fanout is not None:
+                health_tracker.register_stats("devices", fanout.stats)
+            else:
+                health_tracker.register_stats("push_rate", client.push_rate_stats)
+        if registry is not None:
+            register_dashboard_metrics(
+                registry,
+                devices=(
+                    {worker.name: worker.client for worker in fanout.workers}
+                    if fanout is not None
+                    else {"default": client}
+                ),
+                breakers={"bus": self.bus_breaker, "weather": self.weather_breaker},
+                staleness=self.staleness,
+                frame_cache=self.frame_cache,
+                anim_quality=self.anim_quality,
+                timings=timings,
+                dashboard_state=ds,
+                health_tracker=health_tracker,
+            )
+
+    def retry_delay(self) -> float:
+        """Seconds until a rate-limited frame can be pushed again."""
+        return max(self.client.next_push_delay(), _MIN_RETRY_DELAY)
+
+    def start_watchdog(self) -> None:
+        """Start the watchdog thread.
+
+        It detects a hung loop and force-exits for a launchd restart, leaving
+        a hang report (thread stacks, in-flight stage) for the next start.
+        """
+        watchdog = threading.Thread(
+            target=_watchdog_thread,
+            args=(self.heartbeat,),
+            kwargs={
+                "stop_event": self.stop_event,
+                "timings": self.timings,
+                "report_path": WATCHDOG_REPORT_PATH,
+            },
+            daemon=True,
+        )
+        watchdog.start()
+        logger.info("Watchdog started (timeout=%ds)", WATCHDOG_TIMEOUT)
+
+    def build_state(self, now: datetime) -> DisplayState:
+        """Display state for *now* from the current provider data and message."""
+        # Effective data from the staleness tracker (single source of truth -- Issue 10)
+        effective_bus, bus_stale, bus_too_old = self.staleness.get_effective_bus()
+        effective_weather, weather_stale, weather_too_old = self.staleness.get_effective_weather()
+        return DisplayState.from_now(
+            now,
+            bus_data=effective_bus,
+            weather_data=effective_weather,
+            is_birthday=_is_birthday(now),
+            # Read current message from Discord bot (thread-safe)
+            message_text=self.message_bridge.current_message if self.message_bridge else None,
+            bus_stale=bus_stale,
+            bus_too_old=bus_too_old,
+            weather_stale=weather_stale,
+            weather_too_old=weather_too_old,
+        )
 
-        # Detect Discord bot thread death
-        ds.detect_bot_death(bot_dead_event, message_bridge)
+    def remember_state(self, state: DisplayState) -> None:
+        """Record *state* as the last one pushed, persisting it for the next start."""
+        self.ds.last_state = state
+        if self.snapshot_path is None:
+            return
+        with self.timings.stage("snapshot"):
+            try:
+                save_snapshot(state, self.snapshot_path, timesource.now().timestamp())
+            except OSError as exc:
+                logger.warning("Display snapshot disabled: %s", exc)
+                self.snapshot_path = None
+
+    def paint_static(self, state: DisplayState, *, placeholder: bool = False) -> bool:
+        """Render (or reuse) and push a static frame outside the regular steps.
+
+        Used at startup. The placeholder/snapshot first paint does not count
+        as a render.
+
+        Returns:
+            True once the frame was delivered (or submitted to a fan-out).
+        """
+        with self.timings.stage("startup_paint"):
+            key = self.frame_cache.key_for(state)
+            cached = self.frame_cache.get(key)
+            if cached is None:
+                if not placeholder:
+                    self.ds.renders += 1
+                cached = self.frame_cache.put(key, render_frame(state, self.fonts, anim_frame=None))
+            if self.fanout is not None:
+                self.fanout.submit(cached.payload)
+                return True
+            if self.client.push_frame(cached.payload) is not PushResult.SUCCESS:
+                return False
+            self.keepalive.record_success()
+            return True
+
+    def first_paint(self, startup_marks: list[tuple[str, float]] | None = None) -> None:
+        """Paint the first frame, before any provider fetch can delay it.
+
+        Shows the last persisted state (its bus/weather data marked stale)
+        or, without one, the clock with placeholders. ``ds.last_state``
+        stays unset, so it is always replaced.
+        """
+        now = timesource.now()
+        first_state = None
+        if self.snapshot_path is not None:
+            first_state = load_snapshot(self.snapshot_path, now, is_birthday=_is_birthday(now))
+        self.paint_static(first_state or DisplayState.from_now(now), placeholder=True)
+        if startup_marks is not None:
+            startup_marks.append(("first frame", time.perf_counter()))
+            _log_startup(startup_marks)
+
+    def repaint(self) -> None:
+        """Push the current state right away if it changed (startup repaints).
+
+        With an animation active the next step paints it instead.
+        """
+        if self.ds.weather_anim is not None:
+            return
+        state = self.build_state(timesource.now())
+        if state != self.ds.last_state and self.paint_static(state):
+            self.remember_state(state)
+
+    def startup_refresh(self) -> None:
+        """Fetch bus and weather concurrently, repainting as each arrives.
+
+        Both network fetches run on helper threads and hand their results
+        back through a queue; this thread applies each result and repaints
+        as soon as it arrives, so neither API waits behind the other and
+        the dashboard state is only ever changed from the loop thread. A
+        frame the rate limiter skips is pushed by the first step.
+
+        Under a simulated clock the fetches run inline, weather first.
+        """
+        now_mono = timesource.monotonic()
+        now_utc = timesource.now(timezone.utc)
+        fetches: list[tuple[str, Callable[[], Any], Callable[[Any], None], Any]] = []
+        if self.weather_due(now_mono, now_utc):
+            fetches.append(
+                (
+                    "weather",
+                    self.ds.fetch_weather,
+                    lambda weather: self.apply_weather(weather, now_utc),
+                    None,
+                )
+            )
+        if self.ds.bus_due(now_mono, self.bus_breaker):
+            fetches.append(("bus", self.ds.fetch_bus, self.apply_bus, (None, None)))
 
-        # Independent data refresh cycles with circuit breakers
-        ds.refresh_bus(now_mono, staleness, health_tracker, bus_breaker)
+        results: queue.Queue[Callable[[], None]] = queue.Queue()
 
-        test_wd = test_weather_map.get(test_weather_mode) if test_weather_mode else None
-        ds.refresh_weather(
+        def fetch_into_queue(fetch: Callable[[], Any], apply: Callable, failed: Any) -> None:
+            result = failed
+            try:
+                result = fetch()
+            finally:
+                results.put(functools.partial(apply, result))
+
+        for name, fetch, apply, failed in fetches:
+            if timesource.is_simulated():
+                # Replays fetch in a fixed order instead of racing two threads
+                fetch_into_queue(fetch, apply, failed)
+                continue
+            threading.Thread(
+                target=fetch_into_queue,
+                args=(fetch, apply, failed),
+                name=f"startup-{name}-fetch",
+                daemon=True,
+            ).start()
+        for _ in fetches:
+            results.get()()
+            self.repaint()
+
+    def weather_due(self, now_mono: float, now_utc: datetime) -> bool:
+        """Whether a weather fetch should start now (test weather is applied instead)."""
+        return self.ds.weather_due(
             now_mono,
             now_utc,
-            staleness,
-            health_tracker,
-            weather_breaker,
-            test_weather_data=test_wd,
+            self.staleness,
+            self.weather_breaker,
+            test_weather_data=self.test_weather,
         )
 
-        # Get effective data from staleness tracker (single source of truth -- Issue 10)
-        effective_bus, bus_stale, bus_too_old = staleness.get_effective_bus()
-        effective_weather, weather_stale, weather_too_old = staleness.get_effective_weather()
+    def apply_bus(self, fresh_bus: tuple[list[int] | None, list[int] | None]) -> None:
+        """Record a bus fetch result; call on the loop thread."""
+        self.ds.apply_bus(fresh_bus, self.staleness, self.health_tracker, self.bus_breaker)
 
-        now = datetime.now()
+    def apply_weather(self, fresh_weather: WeatherData | None, now_utc: datetime) -> None:
+        """Record a weather fetch result, swapping the animation if needed; loop thread only."""
+        self.ds.apply_weather(
+            fresh_weather, now_utc, self.staleness, self.health_tracker, self.weather_breaker
+        )
+
+    def check_bot(self) -> None:
+        """Detect Discord bot thread death."""
+        self.ds.detect_bot_death(self.bot_dead_event, self.message_bridge)
+
+    def refresh_bus(self, now_mono: float) -> None:
+        """Refresh bus data when due (circuit breaker permitting)."""
+        with self.timings.stage("bus_refresh"):
+            self.ds.refresh_bus(now_mono, self.staleness, self.health_tracker, self.bus_breaker)
+
+    def refresh_weather(self, now_mono: float, now_utc: datetime) -> None:
+        """Refresh weather data when due, swapping the animation if needed."""
+        with self.timings.stage("weather_refresh"):
+            self.ds.refresh_weather(
+                now_mono,
+                now_utc,
+                self.staleness,
+                self.health_tracker,
+                self.weather_breaker,
+                test_weather_data=self.test_weather,
+            )
+
+    def step(self, now: datetime, now_utc: datetime) -> None:
+        """Rebuild the display state and push a frame if anything changed.
+
+        Adjusts brightness, compares the state with the last one pushed,
+        ticks the weather animation (on every call while one is active),
+        then renders and pushes when needed. A push skipped by the rate
+        limiter stays pending for the next call.
+
+        With ``substeps`` above 1 an animated tick is rendered as several
+        sub-frames and pushed as one :class:`AnimationPayload` that the
+        device plays back over the push interval. Animated frame time feeds
+        ``anim_quality``, which scales the animation's particle counts.
+        """
+        ds, timings, fanout = self.ds, self.timings, self.fanout
 
         # Auto-brightness
-        ds.update_brightness(client, now_utc)
+        with timings.stage("brightness"):
+            ds.update_brightness(self.client, now_utc)
 
-        # Read current message from Discord bot (thread-safe)
-        current_message = message_bridge.current_message if message_bridge else None
-
-        current_state = DisplayState.from_now(
-            now,
-            bus_data=effective_bus,
-            weather_data=effective_weather,
-            is_birthday=_is_birthday(now),
-            message_text=current_message,
-            bus_stale=bus_stale,
-            bus_too_old=bus_too_old,
-            weather_stale=weather_stale,
-            weather_too_old=weather_too_old,
-        )
+        with timings.stage("state"):
+            current_state = self.build_state(now)
 
         # Check if state changed (minute change, bus update, weather update)
         state_changed = current_state != ds.last_state
         if state_changed:
             ds.needs_push = True
-            ds.last_state = current_state
+            self.remember_state(current_state)
 
-        # Tick animation -- always produces a new frame when active
-        anim_frame = None
+        # Tick animation -- always produces a new frame when active.
+        # Particle animations return sparse records instead of RGBA images.
+        anim_frames = None
         if ds.weather_anim is not None:
-            anim_frame = ds.weather_anim.tick()
+            anim_started = time.perf_counter()
+            ds.weather_anim.set_quality(self.anim_quality.level)
+            with timings.stage("anim_tick"):
+                if self.substeps > 1:
+                    anim_frames = ds.weather_anim.tick_batch(self.substeps)
+                else:
+                    anim_frames = [ds.weather_anim.tick_layers()]
             ds.needs_push = True  # animation always triggers a re-render
 
-        if ds.needs_push:
-            frame = render_frame(current_state, fonts, anim_frame=anim_frame)
+        if not ds.needs_push:
+            return
+
+        # Animated frames are unique per tick, so only static frames are cached.
+        # Either way the device gets a pre-encoded payload, not a PIL image.
+        if anim_frames is None:
+            cache_key = self.frame_cache.key_for(current_state)
+            cached = self.frame_cache.get(cache_key)
+            if cached is None:
+                ds.renders += 1
+                with timings.stage("render"):
+                    rendered = render_frame(current_state, self.fonts, anim_frame=None)
+                cached = self.frame_cache.put(cache_key, rendered)
+            frame, payload = cached.image, cached.payload
+        else:
+            payloads = []
+            for anim_frame in anim_frames:
+                ds.renders += 1
+                with timings.stage("render"):
+                    frame = render_frame(current_state, self.fonts, anim_frame=anim_frame)
+                with timings.stage("encode"):
+                    payloads.append(FramePayload.from_image(frame))
+            if len(payloads) == 1:
+                payload = payloads[0]
+            else:
+                speed_ms = max(1, round(self.client.push_interval * 1000 / len(payloads)))
+                payload = AnimationPayload(tuple(payloads), speed_ms)
+            self.anim_quality.record(
+                time.perf_counter() - anim_started, deadline=self.client.push_interval
+            )
+
+        if self.save_frame:
+            frame.save("debug_frame.png")
+            logger.info("Saved debug_frame.png")
+
+        with timings.stage("push"):
+            if fanout is not None:
+                fanout.submit(payload)
+                push_result = None
+            else:
+                push_result = self.client.push_frame(payload)
+        if push_result is PushResult.SUCCESS:
+            self.keepalive.record_success()
+            if self.health_tracker:
+                self.health_tracker.record_success("device")
+            if state_changed:
+                logger.info(
+                    "Pushed frame: %s %s",
+                    current_state.time_str,
+                    current_state.date_str,
+                )
+        elif push_result is PushResult.ERROR:
+            self.keepalive.record_failure()
+            if self.health_tracker:
+                self.health_tracker.record_failure("device", "Device unreachable")
+        # PushResult.SKIPPED means rate limit / cooldown -- no health action,
+        # but keep the frame pending so a change right after a push (e.g.
+        # the first real frame after the placeholder) is not dropped
+        if push_result is not PushResult.SKIPPED:
+            ds.needs_push = False
 
-            if save_frame:
-                frame.save("debug_frame.png")
-                logger.info("Saved debug_frame.png")
+    def tick_keepalive(self, now_mono: float) -> None:
+        """Device keep-alive ping + auto-reboot recovery (single device only)."""
+        if self.fanout is None:
+            with self.timings.stage("keepalive"):
+                self.keepalive.tick(self.client, now_mono, health_tracker=self.health_tracker)
 
-            push_result = client.push_frame(frame)
-            if push_result is PushResult.SUCCESS:
-                keepalive.record_success()
-                if health_tracker:
-                    health_tracker.record_success("device")
-                if state_changed:
-                    logger.info(
-                        "Pushed frame: %s %s",
-                        current_state.time_str,
-                        current_state.date_str,
-                    )
-            elif push_result is PushResult.ERROR:
-                keepalive.record_failure()
-                if health_tracker:
-                    health_tracker.record_failure("device", "Device unreachable")
-            # PushResult.SKIPPED means rate limit / cooldown -- no health action
-            ds.needs_push = False
 
-        # Device keep-alive ping + auto-reboot recovery
-        keepalive.tick(client, now_mono, health_tracker=health_tracker)
+def main_loop(
+    client: PixooClient | DeviceFanout | HeadlessClient,
+    fonts: dict,
+    *,
+    save_frame: bool = False,
+    message_bridge: MessageBridge | None = None,
+    health_tracker: HealthTracker | None = None,
+    bot_dead_event: threading.Event | None = None,
+    stop_event: threading.Event | None = None,
+    dashboard_state: DashboardState | None = None,
+    timings: StageTimings | None = None,
+    registry: MetricsRegistry | None = None,
+    startup_marks: list[tuple[str, float]] | None = None,
+    snapshot_path: str | Path | None = None,
+) -> None:
+    """Run the dashboard main loop.
+
+    Checks time every iteration. Pushes a frame when the display state
+    changes or when the weather animation ticks a new frame.
+
+    When weather animation is active, the loop runs at the device's adaptive
+    push rate, ~1 FPS by default (1.0s sleep). The Pixoo 64 device can only
+    reliably handle ~1 HTTP push per second; faster rates overwhelm its
+    embedded HTTP server, causing connection resets and eventual device
+    freezes. Without animation, sleeps 1s.
+
+    A Discord message cuts the sleep short and is rendered for the device's
+    next push slot; a frame skipped by the rate limiter is retried as soon
+    as the device accepts one, not a full interval later.
+
+    Args:
+        client: Pixoo device client for pushing frames, or a DeviceFanout
+            driving several devices from their own push threads (the loop
+            then only renders and submits; pushes never block it), or a
+            HeadlessClient capturing frames without a device.
+        fonts: Font dictionary with keys "small", "tiny".
+        save_frame: If True, save each rendered frame to debug_frame.png.
+        message_bridge: Optional MessageBridge from Discord bot for message override.
+        health_tracker: Optional HealthTracker for monitoring integration.
+        bot_dead_event: Optional threading.Event set when Discord bot thread dies.
+        stop_event: Optional threading.Event for graceful shutdown signalling.
+        dashboard_state: Optional pre-built DashboardState (e.g. with replayed
+            providers); a fresh one is created if omitted.
+        timings: Optional per-stage timers; disabled (no-op) if omitted.
+        registry: Optional metrics registry; collectors for the loop's
+            devices, breakers, staleness, cache and timings are registered
+            on it and read from the metrics server thread.
+        startup_marks: Optional startup milestones from ``main()``; the
+            first paint is appended and the breakdown logged.
+        snapshot_path: Optional file the display state is persisted to on
+            every change; the state found there at startup is painted
+            first (marked stale) while bus and weather are fetched.
+    """
+    loop = DashboardLoop(
+        client,
+        fonts,
+        save_frame=save_frame,
+        message_bridge=message_bridge,
+        health_tracker=health_tracker,
+        bot_dead_event=bot_dead_event,
+        stop_event=stop_event,
+        dashboard_state=dashboard_state,
+        timings=timings,
+        registry=registry,
+        snapshot_path=snapshot_path,
+    )
+    ds, timings = loop.ds, loop.timings
+    loop.start_watchdog()
+    loop.first_paint(startup_marks)
+    loop.startup_refresh()
+    if message_bridge is not None:
+        message_bridge.add_listener(loop.wake.set)
+    try:
+        while not loop.stop_event.is_set():
+            iteration_start = time.perf_counter()
+            loop.wake.clear()
+            now_mono = timesource.monotonic()
+            now_utc = timesource.now(timezone.utc)
+
+            # Independent data refresh cycles with circuit breakers
+            loop.check_bot()
+            loop.refresh_bus(now_mono)
+            loop.refresh_weather(now_mono, now_utc)
+            loop.step(timesource.now(), now_utc)
+            loop.tick_keepalive(now_mono)
+
+            # Whole iteration, excluding the sleep below
+            iteration_s = time.perf_counter() - iteration_start
+            timings.record("iteration", iteration_s)
+
+            # Sleep 1s, or the device's adaptive push interval while animating if
+            # that is shorter. With the default 1.0s floor this stays at ~1 FPS:
+            # the Pixoo 64 can handle ~1 push/second max, and particles advance
+            # one step per tick, producing gentle motion the LED display renders
+            # smoothly. A lower floor lets newer firmware animate faster.
+            sleep_s = 1.0
+            if ds.weather_anim is not None:
+                sleep_s = min(sleep_s, client.push_interval)
+            if iteration_s > sleep_s:
+                ds.overruns += 1
+            if ds.needs_push:
+                # A rate-limited frame goes out as soon as the device accepts one
+                sleep_s = min(sleep_s, loop.retry_delay())
+            if timesource.wait(loop.wake, sleep_s):
+                # Woken early (a Discord message): render for the device's next
+                # push slot rather than one that would be skipped
+                timesource.sleep(client.next_push_delay())
+
+            # Update watchdog heartbeat after each successful iteration
+            loop.heartbeat.beat()
+            ds.iterations += 1
+    finally:
+        if message_bridge is not None:
+            message_bridge.remove_listener(loop.wake.set)
+
+
+def async_main_loop(
+    client: PixooClient | DeviceFanout | HeadlessClient,
+    fonts: dict,
+    *,
+    startup_marks: list[tuple[str, float]] | None = None,
+    **kwargs,
+) -> None:
+    """Run the dashboard on the event-driven asyncio runtime (blocking).
+
+    Renders only when the minute ticks, provider data arrives, a Discord
+    message changes or an animation frame is due, instead of polling every
+    second (see :mod:`src.async_runtime`). Takes the same arguments as
+    :func:`main_loop`.
+    """
+    # Imported here so the polling runtime does not pay for asyncio at startup
+    import asyncio
 
-        # Sleep 1s always.  The Pixoo 64 can handle ~1 push/second max.
-        # Animation particles advance one step per tick, producing gentle
-        # motion at 1 FPS that the LED display renders smoothly.
-        time.sleep(1.0)
+    from src.async_runtime import run_event_driven
 
-        # Update watchdog heartbeat after each successful iteration
-        heartbeat.beat()
+    loop = DashboardLoop(client, fonts, **kwargs)
+    loop.start_watchdog()
+    asyncio.run(run_event_driven(loop, startup_marks=startup_marks))
+
+
+def _start_metrics_server(
+    health_tracker: HealthTracker, timings: StageTimings, port: int
+) -> MetricsRegistry | None:
+    """Start the optional local metrics endpoint on *port*.
+
+    Returns:
+        The registry the loop should record into, or None if the port
+        could not be bound (the dashboard runs on without metrics).
+    """
+    registry = MetricsRegistry()
+    try:
+        server = MetricsServer(health_tracker, timings, port, registry=registry)
+    except OSError as exc:
+        logger.warning("Metrics endpoint disabled: %s", exc)
+        return None
+    server.start()
+    return registry
 
 
 def main() -> None:
-    """Parse arguments and start the dashboard."""
+    """Parse arguments and start the dashboard.
+
+    Only what the first frame needs (config, fonts, the device client) runs
+    before the main loop; the Discord bot token lookup (macOS Keychain) and
+    bot start happen on a background thread.
+    """
+    # The Discord integration is only wired up here; importers of this
+    # module (tests, replay, benchmarks) do not pay for it
+    from src.providers.discord_bot import MessageBridge, start_discord_bot
+    from src.providers.discord_monitor import (
+        HealthTracker,
+        MonitorBridge,
+        shutdown_embed,
+        startup_embed,
+    )
+
+    startup_marks = [("start", _import_started), ("imports", time.perf_counter())]
     validate_config()
+    startup_marks.append(("config", time.perf_counter()))
 
     stop_event = threading.Event()
 
@@ -308,11 +794,27 @@ def main() -> None:
 
     signal.signal(signal.SIGTERM, _sigterm_handler)
 
+    # Structured event ring; mmap-backed so it survives the watchdog's os._exit
+    if EVENT_LOG_PATH is not None:
+        try:
+            events.set_event_log(events.EventLog(EVENT_LOG_PATH, EVENT_LOG_CAPACITY))
+        except (OSError, ValueError) as exc:
+            logger.warning("Event log disabled: %s", exc)
+
+    # Runtime sampling profiler: SIGUSR1 starts/stops a profile of the loop
+    profiler = SamplingProfiler()
+    if hasattr(signal, "SIGUSR1"):
+        profiler.toggle_on_signal(signal.SIGUSR1)
+
     parser = argparse.ArgumentParser(description="Pixoo Dashboard - Pixoo 64 Dashboard")
     parser.add_argument(
         "--ip",
-        default=DEVICE_IP,
-        help=f"Pixoo 64 device IP address (default: {DEVICE_IP})",
+        nargs="+",
+        default=DEVICE_IPS,
+        help=(
+            "Pixoo 64 device IP address; pass several to mirror the dashboard "
+            f"(default: {' '.join(DEVICE_IPS)})"
+        ),
     )
     parser.add_argument(
         "--simulated",
@@ -326,19 +828,70 @@ def main() -> None:
         default=False,
         help="Save each rendered frame to debug_frame.png",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        default=False,
+        help="Capture frames in memory instead of pushing to a device (no display needed)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        default=None,
+        help="Write frames in the background to PATH (.gif, .png or .raw); implies --headless",
+    )
+    parser.add_argument(
+        "--async-runtime",
+        action=argparse.BooleanOptionalAction,
+        default=ASYNC_RUNTIME,
+        help="Event-driven asyncio loop instead of polling every second (default: ASYNC_RUNTIME)",
+    )
     args = parser.parse_args()
+    if args.record:
+        if Path(args.record).suffix.lower() not in RECORDING_SUFFIXES:
+            parser.error(f"--record needs a {', '.join(RECORDING_SUFFIXES)} file: {args.record}")
+        args.headless = True
+    if args.simulated and len(args.ip) > 1:
+        parser.error("--simulated supports a single device only")
+    if args.headless and args.simulated:
+        parser.error("--headless and --simulated are mutually exclusive")
 
     logger.info("Loading fonts from %s", FONT_DIR)
     fonts = build_font_map(FONT_DIR)
     logger.info("Fonts loaded: %s", list(fonts.keys()))
+    startup_marks.append(("fonts", time.perf_counter()))
 
-    logger.info("Connecting to Pixoo 64 at %s (simulated=%s)", args.ip, args.simulated)
-    client = PixooClient(ip=args.ip, simulated=args.simulated)
+    # Hang report left by a watchdog kill of the previous run, if any
+    hang_report = load_hang_report(WATCHDOG_REPORT_PATH)
+    previous_hang = summarize_hang_report(hang_report) if hang_report else None
+    if previous_hang:
+        logger.warning("Previous run was killed by the watchdog:\n%s", previous_hang)
 
     # Set up monitoring (optional -- requires DISCORD_MONITOR_CHANNEL_ID)
     monitor_bridge_ref: list[MonitorBridge | None] = [None]
     health_tracker = HealthTracker(monitor=None)
 
+    client: PixooClient | DeviceFanout | HeadlessClient
+    if args.headless:
+        recorder = None
+        if args.record:
+            try:
+                recorder = FrameRecorder(args.record)
+            except OSError as exc:
+                parser.error(f"--record cannot write {args.record}: {exc.strerror or exc}")
+        logger.info("Headless mode: capturing frames (recording to %s)", args.record)
+        client = HeadlessClient(HEADLESS_RING_SIZE, recorder=recorder)
+    elif len(args.ip) == 1:
+        logger.info("Connecting to Pixoo 64 at %s (simulated=%s)", args.ip[0], args.simulated)
+        client = PixooClient(ip=args.ip[0], simulated=args.simulated)
+    else:
+        logger.info("Connecting to %d Pixoo 64 devices: %s", len(args.ip), ", ".join(args.ip))
+        client = DeviceFanout(
+            {ip: PixooClient(ip=ip) for ip in args.ip}, health_tracker=health_tracker
+        )
+        client.start()
+    startup_marks.append(("client", time.perf_counter()))
+
     def on_ready_callback(bot_client):
         if DISCORD_MONITOR_CHANNEL_ID:
             bridge = MonitorBridge(bot_client, int(DISCORD_MONITOR_CHANNEL_ID))
@@ -355,7 +908,9 @@ def main() -> None:
                 logger.warning("Failed to fetch quay name for dir2: %s", exc)
                 bus_name2 = None
             try:
-                weather_location = _reverse_geocode(WEATHER_LAT, WEATHER_LON)
+                from src.providers.geocode import reverse_geocode
+
+                weather_location = reverse_geocode(WEATHER_LAT, WEATHER_LON)
             except (OSError, ValueError, KeyError) as exc:
                 logger.warning("Failed to reverse geocode location: %s", exc)
                 weather_location = None
@@ -364,7 +919,7 @@ def main() -> None:
             weather_location = weather_location or f"{WEATHER_LAT}, {WEATHER_LON}"
             try:
                 embed = startup_embed(
-                    pixoo_ip=args.ip,
+                    pixoo_ip="headless" if args.headless else ", ".join(args.ip),
                     bus_quay_dir1=BUS_QUAY_DIRECTION1,
                     bus_quay_dir2=BUS_QUAY_DIRECTION2,
                     weather_lat=WEATHER_LAT,
@@ -372,6 +927,7 @@ def main() -> None:
                     bus_name_dir1=bus_name1,
                     bus_name_dir2=bus_name2,
                     weather_location=weather_location,
+                    previous_hang=previous_hang,
                 )
                 if bridge.send_embed(embed):
                     logger.info(
@@ -386,30 +942,51 @@ def main() -> None:
             except (OSError, ValueError) as exc:
                 logger.warning("Failed to send startup embed: %s", exc)
 
-    # Start Discord bot in background thread (optional)
-    bot_dead_event = None
-    if DISCORD_MONITOR_CHANNEL_ID:
-        result = start_discord_bot(
-            DISCORD_BOT_TOKEN,
-            DISCORD_CHANNEL_ID,
-            monitor_channel_id=DISCORD_MONITOR_CHANNEL_ID,
-            health_tracker=health_tracker,
-            on_ready_callback=on_ready_callback,
-        )
-    else:
-        result = start_discord_bot(DISCORD_BOT_TOKEN, DISCORD_CHANNEL_ID)
-        logger.info("Discord monitoring not configured (no DISCORD_MONITOR_CHANNEL_ID)")
-
-    if result:
-        message_bridge, bot_dead_event = result
-        logger.info("Discord bot started for message override")
-    else:
-        message_bridge = None
-        logger.info("Discord bot not configured (no DISCORD_BOT_TOKEN/DISCORD_CHANNEL_ID)")
+    # The main loop reads the bot's message bridge from the start; the bot
+    # fills it once the deferred startup below has connected it
+    message_bridge = MessageBridge()
+    bot_dead_event = threading.Event()
 
-    logger.info("Starting dashboard main loop (Ctrl+C to stop)")
+    def deferred_startup() -> None:
+        # Token lookup may shell out to the Keychain; keep it off the first frame
+        validate_discord_config()
+        token = config.DISCORD_BOT_TOKEN
+        if DISCORD_MONITOR_CHANNEL_ID:
+            result = start_discord_bot(
+                token,
+                DISCORD_CHANNEL_ID,
+                monitor_channel_id=DISCORD_MONITOR_CHANNEL_ID,
+                health_tracker=health_tracker,
+                on_ready_callback=on_ready_callback,
+                profiler=profiler,
+                bridge=message_bridge,
+                bot_dead_event=bot_dead_event,
+            )
+        else:
+            result = start_discord_bot(
+                token, DISCORD_CHANNEL_ID, bridge=message_bridge, bot_dead_event=bot_dead_event
+            )
+            logger.info("Discord monitoring not configured (no DISCORD_MONITOR_CHANNEL_ID)")
+        if result:
+            logger.info("Discord bot started for message override")
+        else:
+            logger.info("Discord bot not configured (no DISCORD_BOT_TOKEN/DISCORD_CHANNEL_ID)")
+
+    # Optional local observability (per-stage timings + metrics endpoint)
+    timings = StageTimings(enabled=STAGE_TIMING_ENABLED)
+    registry = None
+    if METRICS_PORT is not None:
+        registry = _start_metrics_server(health_tracker, timings, METRICS_PORT)
+
+    threading.Thread(target=deferred_startup, name="deferred-startup", daemon=True).start()
+
+    logger.info(
+        "Starting dashboard %s loop (Ctrl+C to stop)",
+        "event-driven" if args.async_runtime else "main",
+    )
+    run_loop = async_main_loop if args.async_runtime else main_loop
     try:
-        main_loop(
+        run_loop(
             client,
             fonts,
             save_frame=args.save_frame,
@@ -417,10 +994,18 @@ def main() -> None:
             health_tracker=health_tracker,
             bot_dead_event=bot_dead_event,
             stop_event=stop_event,
+            timings=timings,
+            registry=registry,
+            startup_marks=startup_marks,
+            snapshot_path=STATE_SNAPSHOT_PATH,
         )
     except KeyboardInterrupt:
         stop_event.set()
         logger.info("Shutting down")
+        if isinstance(client, DeviceFanout):
+            client.stop()
+        elif isinstance(client, HeadlessClient):
+            client.close()
         # Best-effort shutdown embed -- wait briefly for delivery
         if monitor_bridge_ref[0]:
             try:
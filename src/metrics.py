@@ -0,0 +1,290 @@
+"""Per-stage timing of the main loop hot path.
+
+:class:`StageTimings` measures how long each stage of a main-loop
+iteration takes (provider refresh, state build, animation tick, render,
+push, keep-alive) and keeps a rolling window of recent durations per
+stage, summarised as p50/p95/p99/max on demand::
+
+    timings = StageTimings(enabled=True)
+    with timings.stage("render"):
+        frame = render_frame(...)
+    timings.summary()  # {"render": {"count": 1, "p50_ms": ..., ...}}
+
+When disabled, :meth:`StageTimings.stage` returns a shared no-op context
+manager, so instrumented code pays only a method call per stage.
+Summaries are computed at read time (status command, metrics endpoint),
+never on the loop thread's hot path.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# Recent samples kept per stage (~8 minutes of 1 FPS iterations)
+DEFAULT_WINDOW = 500
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class _StageTimer:
+    """Context manager recording one stage duration (cheaper than a generator)."""
+
+    __slots__ = ("_timings", "_name", "_start")
+
+    def __init__(self, timings: StageTimings, name: str) -> None:
+        self._timings = timings
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+        self._timings._current = (self._name, self._start)
+
+    def __exit__(self, *exc_info) -> None:
+        self._timings._current = None
+        self._timings.record(self._name, time.perf_counter() - self._start)
+
+
+class StageTimings:
+    """Rolling duration histograms for named stages.
+
+    Args:
+        enabled: Record timings; when False every call is a no-op.
+        window: Number of recent samples kept per stage.
+    """
+
+    def __init__(self, enabled: bool = True, window: int = DEFAULT_WINDOW) -> None:
+        self.enabled = enabled
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._totals: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._current: tuple[str, float] | None = None
+
+    def stage(self, name: str) -> contextlib.AbstractContextManager:
+        """Context manager timing the enclosed block as stage *name*."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _StageTimer(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one duration sample (seconds) for stage *name*."""
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self._window)
+                self._counts[name] = 0
+                self._totals[name] = 0.0
+            samples.append(seconds)
+            self._counts[name] += 1
+            self._totals[name] += seconds
+
+    def in_progress(self) -> tuple[str, float] | None:
+        """``(stage, seconds_running)`` for the stage currently executing, if any."""
+        current = self._current
+        if current is None:
+            return None
+        name, start = current
+        return name, time.perf_counter() - start
+
+    def recent(self, n: int) -> dict[str, list[float]]:
+        """The last *n* durations per stage in milliseconds, oldest first."""
+        with self._lock:
+            return {
+                name: [round(x * 1000, 2) for x in list(samples)[-n:]]
+                for name, samples in self._samples.items()
+            }
+
+    def summary(self) -> dict[str, dict]:
+        """Per-stage ``count`` and ``total_s`` (all time) and windowed percentiles in ms."""
+        with self._lock:
+            snapshot = {name: sorted(samples) for name, samples in self._samples.items()}
+            counts = dict(self._counts)
+            totals = dict(self._totals)
+        result = {}
+        for name, ordered in snapshot.items():
+            if not ordered:
+                continue
+            result[name] = {
+                "count": counts[name],
+                "total_s": totals[name],
+                "p50_ms": _percentile(ordered, 0.50) * 1000,
+                "p95_ms": _percentile(ordered, 0.95) * 1000,
+                "p99_ms": _percentile(ordered, 0.99) * 1000,
+                "max_ms": ordered[-1] * 1000,
+            }
+        return result
+
+    def stats(self) -> dict:
+        """Flat per-stage summary for HealthTracker status output."""
+        return {
+            name: (
+                f"p50 {s['p50_ms']:.1f} / p95 {s['p95_ms']:.1f} / "
+                f"p99 {s['p99_ms']:.1f} / max {s['max_ms']:.1f} ms"
+            )
+            for name, s in self.summary().items()
+        }
+
+
+# -- Prometheus exposition ------------------------------------------------------
+
+# Push round-trip buckets (seconds): healthy pushes are ~0.1-0.3s, a
+# struggling device climbs past 1s well before it stops answering.
+PUSH_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
+
+Labels = dict[str, str]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style (thread-safe)."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * len(self.buckets)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        with self._lock:
+            self._sum += value
+            self._count += 1
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+
+    def snapshot(self) -> tuple[list[tuple[float, int]], float, int]:
+        """``([(upper_bound, cumulative_count), ...], sum, count)``."""
+        with self._lock:
+            return list(zip(self.buckets, self._counts, strict=True)), self._sum, self._count
+
+
+class DeviceMetrics:
+    """Push outcome counters and latency histogram for one device client."""
+
+    def __init__(self) -> None:
+        self.results: dict[str, int] = {}
+        self.latency = Histogram(PUSH_LATENCY_BUCKETS)
+        self.reboots = 0
+
+    def record_result(self, result: str) -> None:
+        """Count one push outcome (a ``PushResult`` value)."""
+        self.results[result] = self.results.get(result, 0) + 1
+
+
+@dataclass
+class MetricFamily:
+    """One exposed metric with its samples.
+
+    Attributes:
+        name: Metric name without the ``pixoo_`` prefix (counters include
+            their ``_total`` suffix).
+        kind: ``counter``, ``gauge``, ``histogram`` or ``summary``.
+        help: One-line description.
+        samples: ``(sample_name, labels, value)`` triples, added through
+            :meth:`add`, :meth:`add_histogram` or :meth:`add_summary`.
+    """
+
+    name: str
+    kind: str
+    help: str
+    samples: list[tuple[str, Labels, float]] = field(default_factory=list)
+
+    def add(self, value: float, **labels: str) -> MetricFamily:
+        """Add a sample for this metric's own name."""
+        self.samples.append((self.name, labels, value))
+        return self
+
+    def add_histogram(self, histogram: Histogram, **labels: str) -> MetricFamily:
+        """Add bucket, ``_sum`` and ``_count`` samples from *histogram*."""
+        buckets, total, count = histogram.snapshot()
+        for bound, cumulative in buckets:
+            self.samples.append((f"{self.name}_bucket", {**labels, "le": f"{bound:g}"}, cumulative))
+        self.samples.append((f"{self.name}_bucket", {**labels, "le": "+Inf"}, count))
+        self.samples.append((f"{self.name}_sum", labels, total))
+        self.samples.append((f"{self.name}_count", labels, count))
+        return self
+
+    def add_summary(
+        self, quantiles: dict[float, float], total: float, count: int, **labels: str
+    ) -> MetricFamily:
+        """Add quantile, ``_sum`` and ``_count`` samples."""
+        for q, value in quantiles.items():
+            self.samples.append((self.name, {**labels, "quantile": f"{q:g}"}, value))
+        self.samples.append((f"{self.name}_sum", labels, total))
+        self.samples.append((f"{self.name}_count", labels, count))
+        return self
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+_METRIC_PREFIX = "pixoo_"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_sample(name: str, labels: Labels, value: float) -> str:
+    label_str = ""
+    if labels:
+        label_str = "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+    return f"{_METRIC_PREFIX}{name}{label_str} {float(value)!r}"
+
+
+class MetricsRegistry:
+    """Collectors producing :class:`MetricFamily` lists at scrape time.
+
+    Collectors run on the metrics server thread and should only read
+    counters/snapshots; a failing collector is skipped.
+    """
+
+    def __init__(self) -> None:
+        self._collectors: list[Collector] = []
+        self._lock = threading.Lock()
+
+    def register(self, collector: Collector) -> None:
+        """Add a collector."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self) -> list[MetricFamily]:
+        """Run all collectors and return their metric families."""
+        with self._lock:
+            collectors = list(self._collectors)
+        families: list[MetricFamily] = []
+        for collector in collectors:
+            try:
+                families.extend(collector())
+            except Exception as exc:  # scraping must never crash the server
+                logger.warning("Metrics collector %r failed: %s", collector, exc)
+        return families
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for family in self.collect():
+            name = family.name
+            if family.kind == "counter" and name.endswith("_total"):
+                name = name[: -len("_total")]
+            lines.append(f"# HELP {_METRIC_PREFIX}{name} {family.help}")
+            lines.append(f"# TYPE {_METRIC_PREFIX}{name} {family.kind}")
+            lines.extend(_format_sample(*sample) for sample in family.samples)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,128 @@
+"""Local HTTP endpoint exposing dashboard health and loop timings.
+
+Serves ``GET /metrics.json`` and, when a :class:`MetricsRegistry` is
+given, ``GET /metrics`` in the Prometheus text format from a daemon
+``ThreadingHTTPServer``: each request is handled on its own thread and
+only reads snapshots (``HealthTracker.get_status()``/``get_stats()``,
+``StageTimings.summary()``, registry collectors), so scraping never
+blocks the main loop.
+
+Enabled by setting ``METRICS_PORT``; binds to 127.0.0.1 by default since
+the payload is unauthenticated.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+from src.metrics import MetricsRegistry, StageTimings
+
+if TYPE_CHECKING:
+    from src.providers.discord_monitor import HealthTracker
+
+logger = logging.getLogger(__name__)
+
+_PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _MetricsHTTPServer
+
+    def do_GET(self) -> None:  # noqa: N802 -- http.server naming
+        path = self.path.split("?", 1)[0]
+        metrics = self.server.metrics
+        if path == "/metrics.json":
+            content_type = "application/json"
+            render = lambda: json.dumps(metrics.snapshot(), default=str)  # noqa: E731
+        elif path == "/metrics" and metrics.registry is not None:
+            content_type = _PROMETHEUS_CONTENT_TYPE
+            render = metrics.registry.render
+        else:
+            self.send_error(404)
+            return
+        try:
+            body = render().encode()
+        except Exception:  # a broken stats source must not kill the server thread
+            logger.exception("Metrics snapshot failed")
+            self.send_error(500)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        logger.debug("metrics: " + format, *args)
+
+
+class _MetricsHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], metrics: MetricsServer) -> None:
+        super().__init__(address, _Handler)
+        self.metrics = metrics
+
+
+class MetricsServer:
+    """Background HTTP server for local metrics.
+
+    Args:
+        health_tracker: Source of component status and registered stats.
+        timings: Main-loop stage timings.
+        port: TCP port (0 picks a free one).
+        host: Interface to bind.
+        registry: Optional Prometheus collectors served at ``/metrics``.
+    """
+
+    def __init__(
+        self,
+        health_tracker: HealthTracker,
+        timings: StageTimings,
+        port: int,
+        host: str = "127.0.0.1",
+        registry: MetricsRegistry | None = None,
+    ) -> None:
+        self.health_tracker = health_tracker
+        self.timings = timings
+        self.registry = registry
+        self._server = _MetricsHTTPServer((host, port), self)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> str:
+        """``host:port`` of the listening socket."""
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def snapshot(self) -> dict:
+        """Current health, stats and stage timings as a JSON-ready dict."""
+        in_progress = self.timings.in_progress()
+        return {
+            "uptime_s": self.health_tracker.uptime_s,
+            "components": self.health_tracker.get_status(),
+            "stats": self.health_tracker.get_stats(),
+            "stages": self.timings.summary(),
+            "in_progress": (
+                None
+                if in_progress is None
+                else {"stage": in_progress[0], "running_s": in_progress[1]}
+            ),
+        }
+
+    def start(self) -> None:
+        """Serve requests from a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        logger.info("Metrics endpoint at http://%s/metrics.json", self.address)
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,201 @@
+"""Low-overhead sampling profiler for the running main loop.
+
+:class:`SamplingProfiler` samples the main loop thread's Python stack
+from a background thread (``sys._current_frames()``) at a fixed interval
+for a bounded duration, then writes the aggregated samples as collapsed
+stacks -- one ``frame;frame;frame count`` line per unique stack, the input
+format of ``flamegraph.pl``, speedscope and inferno::
+
+    profiler = SamplingProfiler()
+    profiler.start(duration_s=30)   # returns immediately
+    ...
+    path = profiler.wait()          # profiles/profile-20260301-120000.collapsed
+
+Unlike cProfile nothing is installed in the profiled thread: the loop
+runs unmodified and only pays for the GIL hand-offs of the sampler
+(~20 us per sample, ~0.2% of a core at the default 100 Hz), so it is safe
+to trigger in production. Start/stop never block the caller; the sampler
+thread writes the output file when it finishes.
+
+Triggered at runtime by ``SIGUSR1`` (toggle) or the Discord monitor
+channel ``profile [seconds]`` command.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from types import CodeType, FrameType
+
+from src.config import PROFILE_DIR, PROFILE_DURATION, PROFILE_SAMPLE_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# Hard cap so a forgotten toggle cannot sample forever
+MAX_PROFILE_DURATION = 600.0
+
+
+# Frame labels by code object; formatting them dominated per-sample cost
+_labels: dict[CodeType, str] = {}
+
+
+def _code_label(code: CodeType) -> str:
+    label = _labels.get(code)
+    if label is None:
+        label = _labels[code] = (
+            f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        )
+    return label
+
+
+def collapse_stack(frame: FrameType | None) -> str:
+    """Collapsed ``root;...;leaf`` representation of *frame*'s stack."""
+    labels = []
+    while frame is not None:
+        labels.append(_code_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class SamplingProfiler:
+    """Sample one thread's stack in the background and write collapsed stacks.
+
+    Args:
+        interval: Seconds between samples.
+        output_dir: Directory receiving ``profile-<timestamp>.collapsed``.
+        thread_id: Thread to sample (default: the main thread, which runs
+            :func:`src.main.main_loop`).
+    """
+
+    def __init__(
+        self,
+        interval: float = PROFILE_SAMPLE_INTERVAL,
+        output_dir: str | Path = PROFILE_DIR,
+        thread_id: int | None = None,
+    ) -> None:
+        self.interval = interval
+        self.output_dir = Path(output_dir)
+        self.thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        self.last_path: Path | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._done = threading.Event()
+        self._done.set()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """True while a profile is being collected."""
+        return not self._done.is_set()
+
+    def start(self, duration_s: float = PROFILE_DURATION) -> bool:
+        """Begin sampling for *duration_s* seconds (non-blocking).
+
+        The duration is capped at MAX_PROFILE_DURATION.
+
+        Returns:
+            False if a profile is already running.
+        """
+        with self._lock:
+            if self.running:
+                return False
+            duration_s = max(0.0, min(duration_s, MAX_PROFILE_DURATION))
+            self._stop.clear()
+            self._done.clear()
+            self._thread = threading.Thread(
+                target=self._run, args=(duration_s,), name="sampling-profiler", daemon=True
+            )
+            self._thread.start()
+        logger.info(
+            "Profiling main loop for %.0fs (every %.0f ms)", duration_s, self.interval * 1000
+        )
+        return True
+
+    def stop(self) -> None:
+        """End the current profile early; the file is still written."""
+        self._stop.set()
+
+    def toggle(self) -> None:
+        """Start a profile with the default duration, or stop the running one.
+
+        Takes the start lock, so not for signal handlers; see
+        :meth:`toggle_on_signal`.
+        """
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+
+    def toggle_on_signal(self, signum: int) -> None:
+        """Install a handler that calls :meth:`toggle` each time *signum* arrives.
+
+        The handler runs on the main thread between bytecodes, possibly
+        inside :meth:`start` with the lock held, so it only writes a byte
+        to a pipe; a daemon thread reads it and does the toggle.
+        """
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(write_fd, False)
+
+        def serve() -> None:
+            while os.read(read_fd, 1):
+                self.toggle()
+
+        def handler(_signum: int, _frame: FrameType | None) -> None:
+            try:
+                os.write(write_fd, b"\0")
+            except BlockingIOError:
+                pass  # thousands of toggles already pending
+
+        threading.Thread(target=serve, name="profiler-signal", daemon=True).start()
+        signal.signal(signum, handler)
+
+    def wait(self, timeout: float | None = None) -> Path | None:
+        """Block until the current profile is written; return its path (None on failure)."""
+        self._done.wait(timeout)
+        return self.last_path
+
+    def sample_once(self, counts: Counter[str]) -> None:
+        """Take one sample of the target thread into *counts*."""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is not None:
+            counts[collapse_stack(frame)] += 1
+
+    def _run(self, duration_s: float) -> None:
+        counts: Counter[str] = Counter()
+        started = time.monotonic()
+        deadline = started + duration_s
+        path = None
+        try:
+            while not self._stop.is_set() and time.monotonic() < deadline:
+                self.sample_once(counts)
+                self._stop.wait(self.interval)
+            path = self._write(counts, time.monotonic() - started)
+        except Exception:
+            logger.exception("Sampling profiler failed")
+        finally:
+            self.last_path = path
+            self._done.set()
+
+    def _write(self, counts: Counter[str], elapsed_s: float) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = self.output_dir / f"profile-{stamp}.collapsed"
+        with open(path, "w") as f:
+            for stack, count in counts.most_common():
+                f.write(f"{stack} {count}\n")
+        logger.info(
+            "Wrote %d samples (%d unique stacks, %.1fs) to %s",
+            sum(counts.values()),
+            len(counts),
+            elapsed_s,
+            path,
+        )
+        return path
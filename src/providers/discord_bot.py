@@ -5,9 +5,10 @@ configured channel appear on the Pixoo display. Sending 'clear' removes
 the message. The bot is optional -- if DISCORD_BOT_TOKEN or DISCORD_CHANNEL_ID
 is not set, it simply does not start.
 
-Optionally supports a second monitoring channel for health alerts and on-demand
-status queries. Monitoring is purely additive -- if DISCORD_MONITOR_CHANNEL_ID
-is not set, the bot behaves exactly as before.
+Optionally supports a second monitoring channel for health alerts, on-demand
+status queries and runtime profiling ('profile [seconds]'). Monitoring is
+purely additive -- if DISCORD_MONITOR_CHANNEL_ID is not set, the bot behaves
+exactly as before.
 
 Thread safety: MessageBridge uses a threading.Lock to safely pass messages
 from the async Discord bot thread to the synchronous main rendering loop.
@@ -15,7 +16,6 @@ from the async Discord bot thread to the synchronous main rendering loop.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import random
 import threading
@@ -26,6 +26,7 @@ from typing import TYPE_CHECKING, Any
 from src.display.text_utils import sanitize_for_bdf
 
 if TYPE_CHECKING:
+    from src.profiler import SamplingProfiler
     from src.providers.discord_monitor import HealthTracker
 
 logger = logging.getLogger(__name__)
@@ -33,16 +34,38 @@ logger = logging.getLogger(__name__)
 MAX_MESSAGE_LENGTH = 200
 
 
+def parse_profile_command(content: str) -> float | None:
+    """Parse a monitor-channel ``profile [seconds]`` command.
+
+    Returns:
+        Requested duration in seconds (0 = profiler default), or None if
+        *content* is not a well-formed profile command.
+    """
+    parts = content.split()
+    if not parts or parts[0].lower() != "profile" or len(parts) > 2:
+        return None
+    if len(parts) == 1:
+        return 0.0
+    try:
+        seconds = float(parts[1])
+    except ValueError:
+        return None
+    return seconds if seconds > 0 else None
+
+
 class MessageBridge:
     """Thread-safe bridge for passing messages from Discord bot to main loop.
 
     The Discord bot writes messages via set_message(), and the main loop reads
     them via current_message. Both operations are protected by a threading.Lock.
+    Listeners (see add_listener) are notified of every change, so an
+    event-driven loop can repaint at once instead of on its next poll.
     """
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._message: str | None = None
+        self._listeners: list[Callable[[], None]] = []
 
     def set_message(self, text: str | None) -> None:
         """Set or clear the current display message.
@@ -56,6 +79,24 @@ class MessageBridge:
         """
         with self._lock:
             self._message = sanitize_for_bdf(text) if text is not None else None
+            listeners = list(self._listeners)
+        for callback in listeners:
+            callback()
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Call *callback* after each set_message, on the setting thread.
+
+        Callbacks must be quick and thread-safe (e.g. schedule work with
+        ``loop.call_soon_threadsafe``); they run outside the lock.
+        """
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]) -> None:
+        """Stop notifying *callback* (no-op if it is not registered)."""
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
 
     @property
     def current_message(self) -> str | None:
@@ -77,6 +118,7 @@ def run_discord_bot(
     health_tracker: HealthTracker | None = None,
     on_ready_callback: Callable[[Any], None] | None = None,
     bot_dead_event: threading.Event | None = None,
+    profiler: SamplingProfiler | None = None,
 ) -> None:
     """Run the Discord bot (blocking). Designed for background thread.
 
@@ -84,8 +126,9 @@ def run_discord_bot(
     the display message. 'clear', 'cls', or 'reset' clears it. Reacts with
     a checkmark to confirm receipt.
 
-    Optionally listens on a monitoring channel for 'status' commands and
-    delegates lifecycle events via on_ready_callback.
+    Optionally listens on a monitoring channel for 'status' and
+    'profile [seconds]' commands and delegates lifecycle events via
+    on_ready_callback.
 
     Args:
         bridge: MessageBridge to write messages to.
@@ -95,7 +138,12 @@ def run_discord_bot(
         health_tracker: Optional HealthTracker for status command responses.
         on_ready_callback: Optional callable(client) invoked when bot is ready.
         bot_dead_event: Optional threading.Event set when the bot thread exits.
+        profiler: Optional SamplingProfiler for the profile command; the
+            collapsed-stack file is uploaded to the channel when done.
     """
+    # Deferred with discord itself: neither is needed before the bot starts
+    import asyncio
+
     import discord
 
     intents = discord.Intents.none()
@@ -153,7 +201,11 @@ def run_discord_bot(
                 try:
                     from src.providers.discord_monitor import status_embed
 
-                    embed = status_embed(health_tracker.get_status(), health_tracker.uptime_s)
+                    embed = status_embed(
+                        health_tracker.get_status(),
+                        health_tracker.uptime_s,
+                        stats=health_tracker.get_stats(),
+                    )
                     await message.channel.send(embed=embed)
                 except discord.HTTPException:
                     logger.warning("Failed to send status embed")
@@ -164,6 +216,10 @@ def run_discord_bot(
                 except discord.HTTPException:
                     logger.debug("Could not add reaction to message %s", message.id)
 
+            duration = parse_profile_command(content)
+            if duration is not None and profiler is not None:
+                await _handle_profile_command(message, profiler, duration)
+
     try:
         client.run(token, log_handler=None)  # Suppress discord.py's own logging setup
         # client.run() returned normally -- bot disconnected
@@ -176,6 +232,30 @@ def run_discord_bot(
             bot_dead_event.set()
 
 
+async def _handle_profile_command(message, profiler: SamplingProfiler, duration: float) -> None:
+    """Run a profile without blocking the event loop and upload the result."""
+    import asyncio
+
+    import discord
+
+    started = profiler.start(duration) if duration else profiler.start()
+    try:
+        if not started:
+            await message.channel.send("A profile is already running")
+            return
+        await message.add_reaction("\u23f1")
+        path = await asyncio.get_running_loop().run_in_executor(None, profiler.wait)
+        if path is None:
+            await message.channel.send("Profiling failed -- see logs")
+            return
+        await message.channel.send(
+            f"Collapsed stacks ({path.name}) -- render with flamegraph.pl or speedscope",
+            file=discord.File(path),
+        )
+    except discord.HTTPException:
+        logger.warning("Failed to send profile result")
+
+
 def _run_discord_bot_with_retry(
     bridge: MessageBridge,
     token: str,
@@ -256,6 +336,9 @@ def start_discord_bot(
     monitor_channel_id: str | None = None,
     health_tracker: HealthTracker | None = None,
     on_ready_callback: Callable[[Any], None] | None = None,
+    profiler: SamplingProfiler | None = None,
+    bridge: MessageBridge | None = None,
+    bot_dead_event: threading.Event | None = None,
 ) -> tuple[MessageBridge, threading.Event] | None:
     """Start Discord bot in background thread. Returns (MessageBridge, Event) or None.
 
@@ -271,6 +354,11 @@ def start_discord_bot(
         monitor_channel_id: Optional monitoring channel ID string.
         health_tracker: Optional HealthTracker for status command.
         on_ready_callback: Optional callable(client) for bot ready event.
+        profiler: Optional SamplingProfiler for the monitor profile command.
+        bridge: Optional MessageBridge to write to (e.g. one the main loop
+            already reads while the bot is started in the background); a
+            new one is created if omitted.
+        bot_dead_event: Optional death event to use, likewise.
 
     Returns:
         Tuple of (MessageBridge, bot_dead_event) if bot started, None if
@@ -296,8 +384,10 @@ def start_discord_bot(
                 monitor_channel_id,
             )
 
-    bridge = MessageBridge()
-    bot_dead_event = threading.Event()
+    if bridge is None:
+        bridge = MessageBridge()
+    if bot_dead_event is None:
+        bot_dead_event = threading.Event()
     thread = threading.Thread(
         target=_run_discord_bot_with_retry,
         args=(bridge, token, parsed_channel_id),
@@ -306,6 +396,7 @@ def start_discord_bot(
             "health_tracker": health_tracker,
             "on_ready_callback": on_ready_callback,
             "bot_dead_event": bot_dead_event,
+            "profiler": profiler,
         },
         daemon=True,
         name="discord-bot",
@@ -21,6 +21,7 @@ timestamps use datetime.now(timezone.utc).
 import logging
 import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
@@ -112,6 +113,7 @@ def startup_embed(
     bus_name_dir1: str | None = None,
     bus_name_dir2: str | None = None,
     weather_location: str | None = None,
+    previous_hang: str | None = None,
 ):
     """Build a blue startup embed with config summary.
 
@@ -124,6 +126,8 @@ def startup_embed(
         bus_name_dir1: Human-readable name for bus stop direction 1.
         bus_name_dir2: Human-readable name for bus stop direction 2.
         weather_location: Human-readable weather location name.
+        previous_hang: Summary of the watchdog hang report left by the
+            previous run, if it was killed for hanging.
 
     Returns:
         discord.Embed with blue color and config fields.
@@ -149,6 +153,9 @@ def startup_embed(
         weather_val = f"{weather_lat}, {weather_lon}"
     embed.add_field(name="Weather", value=weather_val, inline=False)
 
+    if previous_hang:
+        embed.add_field(name="Previous run hung", value=previous_hang, inline=False)
+
     embed.set_footer(text="Divoom Hub Monitor")
     return embed
 
@@ -171,7 +178,14 @@ def shutdown_embed():
     return embed
 
 
-def status_embed(components_dict: dict, uptime_s: float):
+def _format_stat_value(value) -> str:
+    """Format a single stats value compactly for an embed field."""
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def status_embed(components_dict: dict, uptime_s: float, stats: dict | None = None):
     """Build a blue status embed showing per-component health.
 
     Args:
@@ -179,6 +193,8 @@ def status_embed(components_dict: dict, uptime_s: float):
             status (str "ok"/"down"), failure_count (int),
             downtime_s (float, if down), last_success (str).
         uptime_s: Total uptime in seconds since tracker creation.
+        stats: Optional dict of stats source name -> flat dict of counters
+            (e.g. frame cache hits/misses), one field per source.
 
     Returns:
         discord.Embed with blue color and per-component status fields.
@@ -203,6 +219,10 @@ def status_embed(components_dict: dict, uptime_s: float):
             value = "OK"
         embed.add_field(name=name, value=value, inline=True)
 
+    for name, values in (stats or {}).items():
+        text = ", ".join(f"{k}={_format_stat_value(v)}" for k, v in values.items())
+        embed.add_field(name=name, value=text or "-", inline=False)
+
     embed.set_footer(text="Divoom Hub Monitor")
     return embed
 
@@ -348,6 +368,7 @@ class HealthTracker:
         self._lock = threading.Lock()
         self._monitor = monitor
         self._components: dict[str, ComponentState] = {}
+        self._stats_sources: dict[str, Callable[[], dict]] = {}
         self._created_at = time.monotonic()
 
     def set_monitor(self, monitor: MonitorBridge | None) -> None:
@@ -355,6 +376,31 @@ class HealthTracker:
         with self._lock:
             self._monitor = monitor
 
+    def register_stats(self, name: str, source: Callable[[], dict]) -> None:
+        """Register a callable returning a flat dict of counters for status output.
+
+        Args:
+            name: Label for the stats group (e.g. "frame_cache").
+            source: Zero-argument callable returning the current counters.
+        """
+        with self._lock:
+            self._stats_sources[name] = source
+
+    def get_stats(self) -> dict[str, dict]:
+        """Collect counters from all registered stats sources.
+
+        Sources are called outside the lock; a failing source is skipped.
+        """
+        with self._lock:
+            sources = dict(self._stats_sources)
+        result = {}
+        for name, source in sources.items():
+            try:
+                result[name] = source()
+            except Exception as exc:  # monitoring must never crash the caller
+                logger.warning("Stats source %s failed: %s", name, exc)
+        return result
+
     @property
     def uptime_s(self) -> float:
         """Seconds since this HealthTracker was created."""
@@ -362,8 +408,13 @@ class HealthTracker:
             return time.monotonic() - self._created_at
 
     def _get_debounce(self, component: str) -> dict:
-        """Get debounce config for a component, with defaults for unknown."""
-        return self.DEBOUNCE.get(component, self._DEFAULT_DEBOUNCE)
+        """Get debounce config for a component, with defaults for unknown.
+
+        Per-instance components such as ``device:10.0.0.2`` share the
+        settings of their base name (``device``).
+        """
+        base = component.split(":", 1)[0]
+        return self.DEBOUNCE.get(component, self.DEBOUNCE.get(base, self._DEFAULT_DEBOUNCE))
 
     def _get_or_create_state(self, component: str) -> ComponentState:
         """Get existing component state or create a new one."""
@@ -0,0 +1,339 @@
+"""Time-compressed replay harness for the full dashboard main loop.
+
+Runs the real :func:`src.main.main_loop` against a :class:`SimulatedClock`
+(so every ``sleep`` advances virtual time instantly), scripted or synthetic
+provider responses and a :class:`HeadlessClient` sink. A simulated day --
+minute flips, staleness transitions, circuit breaker recovery, dusk
+brightness changes, weather animation swaps -- replays in seconds to
+minutes depending on how much of it is animated.
+
+Usage::
+
+    python -m src.replay --hours 24
+    python -m src.replay --hours 6 --bus-outage 3600:5400 --record replay.raw
+    python -m src.replay --hours 24 --responses recorded.json
+
+Recorded responses are JSON::
+
+    {"bus": [[0, [3, 13, 23], [8, 18]], [600, null, null]],
+     "weather": [[0, {"temperature": 4.5, "symbol_code": "rain", ...}]]}
+
+Each entry is ``[seconds_since_start, response]`` and stays in effect until
+the next entry; a null response simulates an API failure.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.config import FONT_DIR
+from src.dashboard_state import BusFetcher, DashboardState, WeatherFetcher
+from src.device.headless import FrameRecorder, HeadlessClient
+from src.main import build_font_map, main_loop
+from src.metrics import StageTimings
+from src.providers.weather import WeatherData
+from src.timesource import SimulatedClock, set_clock
+
+logger = logging.getLogger(__name__)
+
+Outage = tuple[float, float]  # (start_s, end_s) since replay start
+
+
+class ScriptedResponses:
+    """Provider responses keyed by simulated seconds since the start.
+
+    Args:
+        entries: ``(seconds, response)`` pairs; each response applies from
+            its time until the next entry.
+    """
+
+    def __init__(self, entries: Sequence[tuple[float, object]]) -> None:
+        ordered = sorted(entries, key=lambda entry: entry[0])
+        self._times = [t for t, _ in ordered]
+        self._responses = [r for _, r in ordered]
+
+    def at(self, elapsed: float) -> object:
+        """Response in effect at *elapsed* seconds (None before the first)."""
+        index = bisect.bisect_right(self._times, elapsed) - 1
+        return self._responses[index] if index >= 0 else None
+
+
+def _in_outage(elapsed: float, outages: Sequence[Outage]) -> bool:
+    return any(start <= elapsed < end for start, end in outages)
+
+
+def scripted_bus(clock: SimulatedClock, responses: ScriptedResponses) -> BusFetcher:
+    """Bus fetcher replaying recorded ``(dir1, dir2)`` responses."""
+
+    def fetch() -> tuple[list[int] | None, list[int] | None]:
+        response = responses.at(clock.elapsed)
+        return (None, None) if response is None else response
+
+    return fetch
+
+
+def scripted_weather(clock: SimulatedClock, responses: ScriptedResponses) -> WeatherFetcher:
+    """Weather fetcher replaying recorded WeatherData (None = failure)."""
+
+    def fetch(lat: float, lon: float) -> WeatherData | None:
+        return responses.at(clock.elapsed)
+
+    return fetch
+
+
+def synthetic_bus(
+    clock: SimulatedClock,
+    headway_min: int = 10,
+    departures: int = 3,
+    outages: Sequence[Outage] = (),
+) -> BusFetcher:
+    """Bus fetcher with regular departures (direction 2 offset by half a headway)."""
+
+    def countdown(offset: int) -> list[int]:
+        minute_of_day = int(clock.elapsed // 60) + offset
+        first = (-minute_of_day) % headway_min
+        return [first + i * headway_min for i in range(departures)]
+
+    def fetch() -> tuple[list[int] | None, list[int] | None]:
+        if _in_outage(clock.elapsed, outages):
+            return (None, None)
+        return countdown(0), countdown(headway_min // 2)
+
+    return fetch
+
+
+# Daily weather pattern for synthetic replays: (start hour, MET symbol, precip mm)
+_WEATHER_SCHEDULE = (
+    (0, "clearsky", 0.0),
+    (6, "partlycloudy", 0.0),
+    (10, "cloudy", 0.0),
+    (13, "rain", 2.5),
+    (16, "fog", 0.0),
+    (18, "snow", 1.0),
+    (21, "clearsky", 0.0),
+)
+_NEUTRAL_SYMBOLS = {"cloudy", "rain", "fog", "snow"}
+
+
+def synthetic_weather(clock: SimulatedClock, outages: Sequence[Outage] = ()) -> WeatherFetcher:
+    """Weather fetcher cycling through a fixed daily pattern of conditions."""
+
+    def fetch(lat: float, lon: float) -> WeatherData | None:
+        if _in_outage(clock.elapsed, outages):
+            return None
+        local = clock.now()
+        hour = local.hour
+        symbol, precip = next(
+            (sym, mm) for start, sym, mm in reversed(_WEATHER_SCHEDULE) if hour >= start
+        )
+        is_day = 7 <= hour < 19
+        if symbol not in _NEUTRAL_SYMBOLS:
+            symbol = f"{symbol}_{'day' if is_day else 'night'}"
+        temperature = 5.0 + 6.0 * math.sin((hour - 9) / 24 * 2 * math.pi)
+        return WeatherData(
+            temperature=round(temperature, 1),
+            symbol_code=symbol,
+            high_temp=11.0,
+            low_temp=-1.0,
+            precipitation_mm=precip,
+            is_day=is_day,
+            wind_speed=4.0,
+            wind_from_direction=220.0,
+        )
+
+    return fetch
+
+
+def load_responses(path: str | Path) -> tuple[ScriptedResponses, ScriptedResponses]:
+    """Load recorded bus and weather responses from a JSON file."""
+    data = json.loads(Path(path).read_text())
+    bus = ScriptedResponses(
+        [(t, None if d1 is None and d2 is None else (d1, d2)) for t, d1, d2 in data["bus"]]
+    )
+    weather = ScriptedResponses(
+        [(t, None if w is None else WeatherData(**w)) for t, w in data["weather"]]
+    )
+    return bus, weather
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    """Outcome of a replay run."""
+
+    simulated_s: float
+    wall_s: float
+    cpu_s: float
+    iterations: int
+    renders: int
+    pushes: int
+    stages: dict[str, dict] = field(default_factory=dict)
+
+    @property
+    def speedup(self) -> float:
+        """Simulated seconds per real second."""
+        return self.simulated_s / self.wall_s if self.wall_s > 0 else math.inf
+
+    def format(self) -> str:
+        """Human-readable multi-line summary."""
+        return "\n".join(
+            [
+                f"simulated:  {self.simulated_s / 3600:.2f} h ({self.speedup:,.0f}x real time)",
+                f"wall time:  {self.wall_s:.2f} s",
+                f"cpu time:   {self.cpu_s:.2f} s",
+                f"iterations: {self.iterations}",
+                f"renders:    {self.renders}",
+                f"pushes:     {self.pushes}",
+            ]
+            + [
+                f"  {name:<16} n={s['count']:<6} p50 {s['p50_ms']:.2f} / "
+                f"p95 {s['p95_ms']:.2f} / p99 {s['p99_ms']:.2f} / max {s['max_ms']:.2f} ms"
+                for name, s in self.stages.items()
+            ]
+        )
+
+
+class _ReplayClock(SimulatedClock):
+    """Simulated clock that ends the replay once the duration has elapsed."""
+
+    def __init__(self, start: datetime, duration_s: float, stop_event: threading.Event) -> None:
+        super().__init__(start)
+        self._duration_s = duration_s
+        self._stop_event = stop_event
+
+    def sleep(self, seconds: float) -> None:
+        super().sleep(seconds)
+        if self.elapsed >= self._duration_s:
+            self._stop_event.set()
+
+
+def run_replay(
+    duration_s: float,
+    *,
+    start: datetime | None = None,
+    fonts: dict | None = None,
+    bus_fetcher: Callable[[SimulatedClock], BusFetcher] | None = None,
+    weather_fetcher: Callable[[SimulatedClock], WeatherFetcher] | None = None,
+    recorder: FrameRecorder | None = None,
+) -> ReplayReport:
+    """Replay *duration_s* simulated seconds of the main loop.
+
+    Args:
+        duration_s: Simulated duration to run.
+        start: Aware start datetime (default: today 00:00 UTC).
+        fonts: Font map for rendering (loaded from FONT_DIR if omitted).
+        bus_fetcher: Factory taking the replay clock and returning a bus
+            fetcher (default: :func:`synthetic_bus`).
+        weather_fetcher: Factory for the weather fetcher (default:
+            :func:`synthetic_weather`).
+        recorder: Optional recorder for the replayed frames.
+
+    Returns:
+        Render/push counts, the wall and CPU time consumed and per-stage
+        timings of the loop (percentiles over the last samples).
+    """
+    if start is None:
+        start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if fonts is None:
+        fonts = build_font_map(FONT_DIR)
+
+    stop_event = threading.Event()
+    clock = _ReplayClock(start, duration_s, stop_event)
+    ds = DashboardState(
+        bus_fetcher=(bus_fetcher or synthetic_bus)(clock),
+        weather_fetcher=(weather_fetcher or synthetic_weather)(clock),
+    )
+    client = HeadlessClient(ring_size=1, recorder=recorder, push_interval=1.0)
+    timings = StageTimings(enabled=True)
+
+    previous = set_clock(clock)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        main_loop(client, fonts, stop_event=stop_event, dashboard_state=ds, timings=timings)
+    finally:
+        wall_s = time.perf_counter() - wall_start
+        cpu_s = time.process_time() - cpu_start
+        stop_event.set()  # release the watchdog thread
+        set_clock(previous)
+        client.close()
+
+    return ReplayReport(
+        simulated_s=clock.elapsed,
+        wall_s=wall_s,
+        cpu_s=cpu_s,
+        iterations=ds.iterations,
+        renders=ds.renders,
+        pushes=client.pushed,
+        stages=timings.summary(),
+    )
+
+
+def _parse_outage(value: str) -> Outage:
+    start, _, end = value.partition(":")
+    return float(start), float(end)
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Replay the dashboard loop in simulated time")
+    parser.add_argument("--hours", type=float, default=24.0, help="simulated hours to run")
+    parser.add_argument(
+        "--start",
+        type=datetime.fromisoformat,
+        default=None,
+        help="start time, ISO 8601 with offset (default: today 00:00 UTC)",
+    )
+    parser.add_argument("--responses", help="JSON file of recorded provider responses")
+    parser.add_argument(
+        "--bus-outage",
+        type=_parse_outage,
+        action="append",
+        default=[],
+        metavar="START:END",
+        help="synthetic bus API outage window in seconds since start (repeatable)",
+    )
+    parser.add_argument(
+        "--weather-outage",
+        type=_parse_outage,
+        action="append",
+        default=[],
+        metavar="START:END",
+        help="synthetic weather API outage window in seconds since start (repeatable)",
+    )
+    parser.add_argument("--record", metavar="PATH", help="write frames to .raw/.gif/.png")
+    args = parser.parse_args()
+
+    # The loop logs every minute flip; keep replay output to the report
+    logging.getLogger().setLevel(logging.WARNING)
+
+    if args.responses:
+        bus_responses, weather_responses = load_responses(args.responses)
+        bus_factory = lambda clock: scripted_bus(clock, bus_responses)  # noqa: E731
+        weather_factory = lambda clock: scripted_weather(clock, weather_responses)  # noqa: E731
+    else:
+        bus_factory = lambda clock: synthetic_bus(clock, outages=args.bus_outage)  # noqa: E731
+        weather_factory = lambda clock: synthetic_weather(  # noqa: E731
+            clock, outages=args.weather_outage
+        )
+
+    report = run_replay(
+        args.hours * 3600,
+        start=args.start,
+        bus_fetcher=bus_factory,
+        weather_fetcher=weather_factory,
+        recorder=FrameRecorder(args.record) if args.record else None,
+    )
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,8 @@ when it exceeds a second, higher threshold, it is discarded (show dashes).
 from __future__ import annotations
 
 import logging
-import time
 
+from src import events, timesource
 from src.config import (
     BUS_STALE_THRESHOLD,
     BUS_TOO_OLD_THRESHOLD,
@@ -39,12 +39,31 @@ class StalenessTracker:
         self._last_good_weather: WeatherData | None = None
         self._last_good_weather_time: float = 0.0
 
+        # Last reported (is_stale, is_too_old) per source, for event transitions
+        self._freshness: dict[str, tuple[bool, bool]] = {}
+
+    def _note_freshness(self, source: str, is_stale: bool, is_too_old: bool, age: float) -> None:
+        """Record an event when a source's staleness flags change."""
+        flags = (is_stale, is_too_old)
+        previous = self._freshness.get(source)
+        self._freshness[source] = flags
+        if previous is None or previous == flags:
+            return
+        if is_too_old:
+            event = events.EventType.DATA_EXPIRED
+        elif is_stale:
+            event = events.EventType.DATA_STALE
+        else:
+            event = events.EventType.DATA_FRESH
+        events.record(event, value=age, source=source)
+
     # -- Bus ------------------------------------------------------------------
 
     def update_bus(self, data: BusData) -> None:
         """Record a successful bus fetch, updating per-direction timestamps."""
         dir1, dir2 = data
-        now = time.monotonic()
+        events.record(events.EventType.DATA_UPDATE, value=self.bus_data_age, source="bus")
+        now = timesource.monotonic()
         if dir1 is not None:
             self._last_good_bus_dir1 = dir1
             self._last_good_bus_dir1_time = now
@@ -60,7 +79,7 @@ class StalenessTracker:
     @property
     def bus_data_age(self) -> float:
         """Return age in seconds of the oldest per-direction data, or 0 if never fetched."""
-        now = time.monotonic()
+        now = timesource.monotonic()
         ages = []
         if self._last_good_bus_dir1_time > 0:
             ages.append(now - self._last_good_bus_dir1_time)
@@ -77,7 +96,7 @@ class StalenessTracker:
         * *is_too_old*: any direction's data exceeds the too-old threshold --
           caller should show dash placeholders for that direction.
         """
-        now = time.monotonic()
+        now = timesource.monotonic()
 
         def _dir_flags(t: float) -> tuple[bool, bool]:
             if t <= 0:
@@ -93,6 +112,7 @@ class StalenessTracker:
 
         is_stale = stale1 or stale2
         is_too_old = too_old1 or too_old2
+        self._note_freshness("bus", is_stale, is_too_old, self.bus_data_age)
 
         return (dir1, dir2), is_stale, is_too_old
 
@@ -100,8 +120,9 @@ class StalenessTracker:
 
     def update_weather(self, data: WeatherData) -> None:
         """Record a successful weather fetch."""
+        events.record(events.EventType.DATA_UPDATE, value=self.weather_data_age, source="weather")
         self._last_good_weather = data
-        self._last_good_weather_time = time.monotonic()
+        self._last_good_weather_time = timesource.monotonic()
 
     @property
     def last_good_weather(self) -> WeatherData | None:
@@ -112,7 +133,7 @@ class StalenessTracker:
     def weather_data_age(self) -> float:
         """Return age in seconds of last good weather data, or 0 if never fetched."""
         if self._last_good_weather_time > 0:
-            return time.monotonic() - self._last_good_weather_time
+            return timesource.monotonic() - self._last_good_weather_time
         return 0.0
 
     def get_effective_weather(self) -> tuple[WeatherData | None, bool, bool]:
@@ -126,6 +147,7 @@ class StalenessTracker:
 
         is_stale = age > WEATHER_STALE_THRESHOLD and self._last_good_weather_time > 0
         is_too_old = age > WEATHER_TOO_OLD_THRESHOLD and self._last_good_weather_time > 0
+        self._note_freshness("weather", is_stale, is_too_old, age)
 
         effective = None if is_too_old else self._last_good_weather
         return effective, is_stale, is_too_old
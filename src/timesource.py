@@ -0,0 +1,157 @@
+"""Injectable clock for the dashboard loop.
+
+Code that drives the dashboard's timing (the main loop, staleness
+tracking, circuit breakers, device keep-alive) reads time through this
+module instead of calling ``time`` / ``datetime`` directly::
+
+    from src import timesource
+
+    now_mono = timesource.monotonic()
+    now_utc = timesource.now(timezone.utc)
+    timesource.sleep(1.0)
+    woken = timesource.wait(wake_event, 1.0)
+
+By default these delegate to the real ``time.monotonic``, ``datetime.now``,
+``time.sleep`` and ``threading.Event.wait``, looked up at call time so
+tests that patch ``time`` keep working. :func:`set_clock` installs a
+:class:`SimulatedClock`, whose ``sleep`` (and ``wait`` on an unset event)
+advances virtual time instantly, so a day of operation can be replayed in
+seconds (see :mod:`src.replay`).
+
+The watchdog and device I/O deliberately stay on real time: they guard
+against real hangs and real network behaviour.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, tzinfo
+
+
+class Clock:
+    """Real wall-clock and monotonic time."""
+
+    def monotonic(self) -> float:
+        """Seconds from an arbitrary fixed point (like ``time.monotonic``)."""
+        return time.monotonic()
+
+    def now(self, tz: tzinfo | None = None) -> datetime:
+        """Current datetime (like ``datetime.now``; naive local if *tz* is None)."""
+        return datetime.now(tz)
+
+    def sleep(self, seconds: float) -> None:
+        """Block for *seconds* (like ``time.sleep``)."""
+        time.sleep(seconds)
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """Block until *event* is set or *timeout* seconds pass.
+
+        Returns:
+            True if the event was set (woken early), False on timeout.
+        """
+        return event.wait(timeout)
+
+
+class SimulatedClock(Clock):
+    """Virtual clock that only moves when slept on or advanced.
+
+    Args:
+        start: Aware datetime the simulation starts at.
+        monotonic_start: Initial ``monotonic()`` value. Non-zero by default
+            because several trackers treat a zero timestamp as "never".
+        local_tz: Zone for naive ``now()`` results; None uses the host's
+            local zone, matching ``datetime.now()``.
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        monotonic_start: float = 1000.0,
+        local_tz: tzinfo | None = None,
+    ) -> None:
+        if start.tzinfo is None:
+            raise ValueError("SimulatedClock start must be timezone-aware")
+        self._start = start
+        self._monotonic_start = monotonic_start
+        self._local_tz = local_tz
+        self._elapsed = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self) -> float:
+        """Simulated seconds since the start."""
+        with self._lock:
+            return self._elapsed
+
+    def advance(self, seconds: float) -> None:
+        """Move virtual time forward by *seconds*."""
+        if seconds < 0:
+            raise ValueError("cannot move a clock backwards")
+        with self._lock:
+            self._elapsed += seconds
+
+    def monotonic(self) -> float:
+        with self._lock:
+            return self._monotonic_start + self._elapsed
+
+    def now(self, tz: tzinfo | None = None) -> datetime:
+        current = self._start + timedelta(seconds=self.elapsed)
+        if tz is None:
+            return current.astimezone(self._local_tz).replace(tzinfo=None)
+        return current.astimezone(tz)
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        # Nothing else runs while virtual time moves, so an event that is
+        # not already set stays unset for the whole timeout
+        if event.is_set():
+            return True
+        self.sleep(timeout)
+        return False
+
+
+_clock: Clock = Clock()
+
+
+def get_clock() -> Clock:
+    """Return the active clock."""
+    return _clock
+
+
+def is_simulated() -> bool:
+    """True while a :class:`SimulatedClock` is installed (replay runs).
+
+    Work normally spread over helper threads runs inline instead, so a
+    replay does not depend on thread timing.
+    """
+    return isinstance(_clock, SimulatedClock)
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Install *clock* as the active clock and return the previous one."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+
+def monotonic() -> float:
+    """``monotonic()`` of the active clock."""
+    return _clock.monotonic()
+
+
+def now(tz: tzinfo | None = None) -> datetime:
+    """``now()`` of the active clock."""
+    return _clock.now(tz)
+
+
+def sleep(seconds: float) -> None:
+    """``sleep()`` on the active clock."""
+    _clock.sleep(seconds)
+
+
+def wait(event: threading.Event, timeout: float) -> bool:
+    """``wait()`` on the active clock: True if *event* woke it early."""
+    return _clock.wait(event, timeout)
@@ -2,18 +2,44 @@
 
 Monitors a heartbeat timestamp and force-kills the process if the
 main loop stops updating it, allowing launchd to restart the service.
+
+Before killing, the watchdog captures a hang report -- the stacks of all
+threads, the stage the loop was executing (from :class:`StageTimings`),
+recent stage durations and recent structured events -- and writes it
+atomically to disk. The next startup loads it once
+(:func:`load_hang_report`) and attaches :func:`summarize_hang_report` to
+the startup embed.
 """
 
 from __future__ import annotations
 
+import faulthandler
+import json
 import logging
 import os
 import signal
+import sys
 import threading
 import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src import events
+
+if TYPE_CHECKING:
+    from src.metrics import StageTimings
 
 logger = logging.getLogger(__name__)
 
+# Recent stage durations and events kept in a hang report
+HANG_REPORT_RECENT = 20
+# Frames per thread shown in the startup summary (innermost last)
+_SUMMARY_FRAMES = 4
+# Discord embed field values are limited to 1024 characters
+_SUMMARY_MAX_CHARS = 1000
+
 
 class Heartbeat:
     """Thread-safe monotonic timestamp for watchdog heartbeat."""
@@ -31,17 +57,138 @@ class Heartbeat:
         return time.monotonic() - self._timestamp
 
 
+def capture_hang_report(
+    elapsed: float,
+    timings: StageTimings | None = None,
+    recent: int = HANG_REPORT_RECENT,
+) -> dict:
+    """Snapshot where every thread is and what the loop was doing.
+
+    Args:
+        elapsed: Seconds since the last heartbeat.
+        timings: Main-loop stage timings, for the in-flight stage and the
+            most recent durations per stage.
+        recent: Number of recent stage durations and events to include.
+
+    Returns:
+        JSON-ready dict.
+    """
+    main_ident = threading.main_thread().ident
+    names = {t.ident: t.name for t in threading.enumerate()}
+    threads = [
+        {
+            "name": names.get(ident, f"thread-{ident}"),
+            "main": ident == main_ident,
+            "frames": [
+                [os.path.basename(fs.filename), fs.lineno, fs.name]
+                for fs in traceback.extract_stack(frame)
+            ],
+        }
+        for ident, frame in sys._current_frames().items()
+    ]
+    report: dict = {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "hung_s": round(elapsed, 1),
+        "threads": threads,
+        "in_progress": None,
+        "recent_stages_ms": {},
+        "recent_events": [],
+    }
+    if timings is not None:
+        in_progress = timings.in_progress()
+        if in_progress is not None:
+            report["in_progress"] = {"stage": in_progress[0], "running_s": in_progress[1]}
+        report["recent_stages_ms"] = timings.recent(recent)
+    log = events.get_event_log()
+    if log is not None:
+        report["recent_events"] = [ev.format() for ev in log.events()[-recent:]]
+    return report
+
+
+def write_hang_report(report: dict, path: str | Path) -> None:
+    """Write *report* atomically and durably (it must outlive ``os._exit``)."""
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(report, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_hang_report(path: str | Path) -> dict | None:
+    """Load the report left by a watchdog kill, once.
+
+    The file is renamed to ``<name>.prev`` so the next clean restart does
+    not report the same hang again.
+    """
+    path = Path(path)
+    try:
+        report = json.loads(path.read_text())
+        os.replace(path, path.with_suffix(path.suffix + ".prev"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning("Could not read hang report %s: %s", path, exc)
+        return None
+    return report
+
+
+def summarize_hang_report(report: dict) -> str:
+    """Short text summary of a hang report for the startup embed."""
+    lines = [f"Watchdog restart at {report.get('time')}: loop hung {report.get('hung_s')}s"]
+    in_progress = report.get("in_progress")
+    if in_progress:
+        lines[0] += f" in stage '{in_progress['stage']}' ({in_progress['running_s']:.0f}s)"
+    for thread in report.get("threads", []):
+        if not thread.get("main"):
+            continue
+        frames = thread.get("frames", [])[-_SUMMARY_FRAMES:]
+        lines.append(
+            f"{thread['name']}: "
+            + " > ".join(f"{func} ({filename}:{lineno})" for filename, lineno, func in frames)
+        )
+    slowest = sorted(
+        ((max(samples), stage) for stage, samples in report.get("recent_stages_ms", {}).items()),
+        reverse=True,
+    )[:3]
+    if slowest:
+        lines.append("Slowest recent: " + ", ".join(f"{s} {ms:.0f}ms" for ms, s in slowest))
+    summary = "\n".join(lines)
+    if len(summary) > _SUMMARY_MAX_CHARS:
+        summary = summary[: _SUMMARY_MAX_CHARS - 3] + "..."
+    return summary
+
+
+def _persist_hang_report(
+    elapsed: float, timings: StageTimings | None, report_path: str | Path | None
+) -> None:
+    """Log and persist a hang report; never raises (the kill must proceed)."""
+    try:
+        report = capture_hang_report(elapsed, timings)
+        if report_path is not None:
+            write_hang_report(report, report_path)
+            logger.critical("Watchdog: hang report written to %s", report_path)
+        logger.critical("Watchdog: %s", summarize_hang_report(report))
+    except Exception:
+        logger.exception("Watchdog: failed to capture hang report")
+        faulthandler.dump_traceback(all_threads=True)
+
+
 def watchdog_thread(
     heartbeat: Heartbeat,
     timeout: float = 120,
     stop_event: threading.Event | None = None,
+    timings: StageTimings | None = None,
+    report_path: str | Path | None = None,
 ) -> None:
     """Monitor main loop heartbeat; force-kill if stale.
 
     Runs as a daemon thread. Checks every 30s whether the main loop
     has updated its heartbeat timestamp. If the heartbeat is older than
-    *timeout* seconds, logs a critical message and calls os._exit(1)
-    so launchd can restart the process.
+    *timeout* seconds, captures a hang report (written to *report_path*
+    if given), logs a critical message and calls os._exit(1) so launchd
+    can restart the process.
 
     If *stop_event* is provided and set, the watchdog exits cleanly.
     """
@@ -59,6 +206,7 @@ def watchdog_thread(
                 elapsed,
                 timeout,
             )
+            _persist_hang_report(elapsed, timings, report_path)
             os.kill(os.getpid(), signal.SIGTERM)
             time.sleep(10)
             logger.critical("Watchdog: still alive after SIGTERM grace period, forcing exit")
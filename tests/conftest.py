@@ -0,0 +1,24 @@
+"""Shared fixtures for the test suite."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.device.pixoo_client import PushResult
+
+
+@pytest.fixture
+def make_client():
+    """Factory for a mock PixooClient that accepts every push.
+
+    ``make_client(next_push_delay=0.3)`` reports a rate-limited device.
+    """
+
+    def make(next_push_delay: float = 0.0) -> MagicMock:
+        client = MagicMock()
+        client.push_frame.return_value = PushResult.SUCCESS
+        client.push_interval = 1.0
+        client.next_push_delay.return_value = next_push_delay
+        return client
+
+    return make
@@ -0,0 +1,96 @@
+"""Tests for the adaptive animation quality governor and its effect on animations."""
+
+import pytest
+
+from src.display.anim_quality import _MIN_SAMPLES, _RECOVER_FRAMES, AdaptiveAnimationQuality
+from src.display.weather_anim import (
+    CompositeAnimation,
+    FogAnimation,
+    RainAnimation,
+    WindEffect,
+    get_animation,
+)
+
+
+class TestAdaptiveAnimationQuality:
+    def test_starts_at_full_quality(self):
+        assert AdaptiveAnimationQuality(budget=0.1).level == 1.0
+
+    def test_sustained_overrun_steps_down_one_level(self):
+        quality = AdaptiveAnimationQuality(budget=0.1)
+        levels = [quality.record(0.15) for _ in range(_MIN_SAMPLES)]
+        assert levels[-1] == 0.75
+        assert quality.stats()["decreases"] == 1
+
+    def test_single_spike_is_smoothed(self):
+        quality = AdaptiveAnimationQuality(budget=0.1)
+        for _ in range(_MIN_SAMPLES):
+            quality.record(0.02)
+        assert quality.record(0.2) == 1.0
+
+    def test_missed_deadline_drops_to_lowest_level(self):
+        quality = AdaptiveAnimationQuality(budget=0.1)
+        assert quality.record(1.5, deadline=1.0) == 0.25
+
+    def test_recovers_after_sustained_headroom(self):
+        quality = AdaptiveAnimationQuality(budget=0.1)
+        quality.record(1.5, deadline=1.0)
+        for _ in range(_MIN_SAMPLES + _RECOVER_FRAMES - 2):
+            quality.record(0.01)
+        assert quality.level == 0.25
+        assert quality.record(0.01) == 0.5
+        assert quality.stats()["increases"] == 1
+
+    def test_near_budget_holds_level(self):
+        quality = AdaptiveAnimationQuality(budget=0.1)
+        for _ in range(_RECOVER_FRAMES * 2):
+            quality.record(0.08)
+        assert quality.level == 1.0
+
+    def test_invalid_budget_rejected(self):
+        with pytest.raises(ValueError):
+            AdaptiveAnimationQuality(budget=0)
+
+
+class TestSetQuality:
+    def test_particles_trimmed_and_restored(self):
+        rain = RainAnimation(precipitation_mm=6.0, seed=1)
+        full = (len(rain.far_drops), len(rain.near_drops))
+
+        rain.set_quality(0.25)
+        assert (len(rain.far_drops), len(rain.near_drops)) == (
+            round(full[0] * 0.25),
+            round(full[1] * 0.25),
+        )
+        rain.tick_layers()
+        rain.set_quality(1.0)
+        assert (len(rain.far_drops), len(rain.near_drops)) == full
+
+    def test_reset_keeps_quality(self):
+        rain = RainAnimation(precipitation_mm=6.0, seed=1)
+        rain.set_quality(0.5)
+        count = len(rain.far_drops)
+        rain.reset()
+        assert len(rain.far_drops) == count
+
+    def test_wrappers_pass_quality_to_children(self):
+        rain = RainAnimation(seed=1)
+        WindEffect(rain, wind_speed=8.0).set_quality(0.5)
+        assert rain.quality == 0.5
+
+    def test_composite_drops_overlay_at_lowest_quality(self):
+        fog = FogAnimation(seed=2)
+        comp = CompositeAnimation([RainAnimation(seed=1), fog])
+        assert not comp.supports_sparse
+
+        comp.set_quality(0.25)
+        comp.tick_layers()
+        assert comp.supports_sparse
+        assert fog.frame == 0
+
+    @pytest.mark.parametrize("group", ["rain", "snow", "thunder", "clear", "fog", "cloudy"])
+    def test_every_animation_ticks_at_every_level(self, group):
+        anim = get_animation(group, precipitation_mm=6.0, seed=3)
+        for level in (0.25, 0.5, 0.75, 1.0):
+            anim.set_quality(level)
+            anim.tick_layers()
@@ -0,0 +1,131 @@
+"""Tests for the event-driven asyncio runtime."""
+
+import asyncio
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from src.async_runtime import run_event_driven, seconds_to_next_minute
+from src.device.pixoo_client import PushResult
+from src.main import DashboardLoop
+from src.providers.discord_bot import MessageBridge
+
+
+@pytest.fixture
+def patched():
+    """Fast housekeeping, instant providers, mocked rendering."""
+    with (
+        patch("src.async_runtime.HOUSEKEEPING_INTERVAL", 0.01),
+        patch("src.main.render_frame", return_value=Image.new("RGB", (64, 64))) as render,
+        patch("src.dashboard_state.fetch_bus_data", return_value=([5], [7])) as bus,
+        patch("src.dashboard_state.fetch_weather_safe", return_value=None),
+        patch("src.dashboard_state.get_target_brightness", return_value=80),
+    ):
+        yield render, bus
+
+
+def _run(loop, until):
+    """Run the runtime until *until(loop)* holds (or 2s pass), then stop it."""
+
+    async def scenario():
+        runner = asyncio.create_task(run_event_driven(loop))
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if until(loop) or runner.done():
+                break
+        loop.stop_event.set()
+        await asyncio.wait_for(runner, 2)
+
+    asyncio.run(scenario())
+
+
+class TestRunEventDriven:
+    def test_renders_fetched_data_and_stops(self, patched, make_client):
+        render, bus = patched
+        loop = DashboardLoop(make_client(), {})
+
+        _run(loop, lambda lp: lp.ds.last_state is not None)
+
+        bus.assert_called_once()
+        assert loop.ds.last_state.bus_direction1 == (5,)
+        assert loop.ds.iterations >= 1
+
+    def test_idle_without_events(self, patched, make_client):
+        loop = DashboardLoop(make_client(), {})
+        ticks = []
+
+        # Let many housekeeping ticks pass; only the two fetch completions
+        # (and at most one minute tick) should have produced a step
+        _run(loop, lambda lp: ticks.append(1) or len(ticks) > 30)
+
+        assert 1 <= loop.ds.iterations <= 3
+
+    def test_message_triggers_immediate_repaint(self, patched, make_client):
+        render, _ = patched
+        bridge = MessageBridge()
+        loop = DashboardLoop(make_client(), {}, message_bridge=bridge)
+        sent = []
+
+        def until(lp):
+            if lp.ds.last_state is not None and not sent:
+                threading.Thread(target=bridge.set_message, args=("hei",)).start()
+                sent.append(True)
+            return lp.ds.last_state is not None and lp.ds.last_state.message_text == "hei"
+
+        _run(loop, until)
+
+        assert loop.ds.last_state.message_text == "hei"
+        assert bridge._listeners == []  # unsubscribed on stop
+
+    def test_skipped_push_retried_after_delay(self, patched, make_client):
+        client = make_client()
+        client.push_frame.side_effect = [PushResult.SKIPPED] * 3 + [PushResult.SUCCESS]
+        loop = DashboardLoop(client, {})
+
+        # The two fetch completions wake the renderer at most twice; the
+        # later pushes come only from the needs_push retry, a timed-out wait
+        _run(loop, lambda lp: client.push_frame.call_count >= 4)
+
+        assert client.push_frame.call_count == 4
+        assert loop.ds.needs_push is False
+
+    def test_fetch_results_applied_on_the_loop_thread(self, patched, make_client):
+        loop = DashboardLoop(make_client(), {})
+        fetch_threads, apply_threads = [], []
+        fetch_bus, apply_bus = loop.ds.fetch_bus, loop.apply_bus
+
+        def record_fetch():
+            fetch_threads.append(threading.current_thread())
+            return fetch_bus()
+
+        def record_apply(fresh_bus):
+            apply_threads.append(threading.current_thread())
+            apply_bus(fresh_bus)
+
+        with (
+            patch.object(loop.ds, "fetch_bus", record_fetch),
+            patch.object(loop, "apply_bus", record_apply),
+        ):
+            _run(loop, lambda lp: lp.ds.last_state is not None)
+
+        assert fetch_threads and fetch_threads[0] is not threading.main_thread()
+        assert apply_threads == [threading.main_thread()]
+        assert loop.ds.last_state.bus_direction1 == (5,)
+
+    def test_crashed_task_propagates(self, patched, make_client):
+        loop = DashboardLoop(make_client(), {})
+        loop.step = MagicMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            _run(loop, lambda lp: False)
+
+
+class TestSecondsToNextMinute:
+    def test_lands_just_after_the_boundary(self):
+        with patch(
+            "src.async_runtime.timesource.now", return_value=datetime(2026, 3, 1, 12, 0, 45)
+        ):
+            assert seconds_to_next_minute() == pytest.approx(15.05)
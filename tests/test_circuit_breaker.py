@@ -68,7 +68,7 @@ class TestCircuitBreakerHalfOpen:
         cb.record_failure()
         assert cb.state == "open"
 
-        with patch("src.circuit_breaker.time.monotonic", return_value=cb._opened_at + 11):
+        with patch("src.timesource.time.monotonic", return_value=cb._opened_at + 11):
             assert cb.should_attempt() is True
             assert cb.state == "half_open"
 
@@ -77,7 +77,7 @@ class TestCircuitBreakerHalfOpen:
         cb.record_failure()
         cb.record_failure()
 
-        with patch("src.circuit_breaker.time.monotonic", return_value=cb._opened_at + 11):
+        with patch("src.timesource.time.monotonic", return_value=cb._opened_at + 11):
             cb.should_attempt()
 
         cb.record_success()
@@ -89,7 +89,7 @@ class TestCircuitBreakerHalfOpen:
         cb.record_failure()
         cb.record_failure()
 
-        with patch("src.circuit_breaker.time.monotonic", return_value=cb._opened_at + 11):
+        with patch("src.timesource.time.monotonic", return_value=cb._opened_at + 11):
             cb.should_attempt()
 
         cb.record_failure()
@@ -100,7 +100,7 @@ class TestCircuitBreakerHalfOpen:
         cb.record_failure()
         cb.record_failure()
 
-        with patch("src.circuit_breaker.time.monotonic", return_value=cb._opened_at + 50):
+        with patch("src.timesource.time.monotonic", return_value=cb._opened_at + 50):
             assert cb.should_attempt() is False
             assert cb.state == "open"
 
@@ -96,3 +96,30 @@ class TestMessageBridgeSanitization:
         bridge = MessageBridge()
         bridge.set_message("H\u00e6rlig v\u00e6r p\u00e5 \u00d8ya!")
         assert bridge.current_message == "H\u00e6rlig v\u00e6r p\u00e5 \u00d8ya!"
+
+
+class TestMessageBridgeListeners:
+    """Tests for MessageBridge change notification."""
+
+    def test_listener_sees_new_message(self):
+        """Listeners run after the message is stored."""
+        bridge = MessageBridge()
+        seen = []
+        bridge.add_listener(lambda: seen.append(bridge.current_message))
+        bridge.set_message("Hei")
+        bridge.set_message(None)
+        assert seen == ["Hei", None]
+
+    def test_removed_listener_not_called(self):
+        """remove_listener stops notifications and ignores unknown callbacks."""
+        bridge = MessageBridge()
+        seen = []
+
+        def listener():
+            seen.append(True)
+
+        bridge.add_listener(listener)
+        bridge.remove_listener(listener)
+        bridge.remove_listener(listener)
+        bridge.set_message("Hei")
+        assert seen == []
@@ -93,6 +93,14 @@ class TestEmbedBuilders:
         assert "Bus Stop 2" in field_names
         assert "Weather" in field_names
 
+    def test_startup_embed_reports_previous_hang(self):
+        """A hang summary from the previous run is shown as its own field."""
+        embed = startup_embed(
+            "192.168.1.100", "NSR:123", "NSR:456", 63.43, 10.39, previous_hang="hung 130s"
+        )
+        fields = {f.name: f.value for f in embed.fields}
+        assert fields["Previous run hung"] == "hung 130s"
+
     def test_startup_embed_with_names(self):
         """Startup embed uses human-readable names when provided."""
         embed = startup_embed(
@@ -183,6 +191,13 @@ class TestEmbedBuilders:
         embed = status_embed({}, 7200.0)
         assert "2h" in embed.description
 
+    def test_status_embed_includes_stats_fields(self):
+        """Registered stats groups appear as extra embed fields."""
+        embed = status_embed({}, 0.0, stats={"frame_cache": {"hits": 3, "hit_rate": 0.75}})
+        field = next(f for f in embed.fields if f.name == "frame_cache")
+        assert "hits=3" in field.value
+        assert "hit_rate=0.75" in field.value
+
     def test_colors_dict_has_expected_keys(self):
         """COLORS dict has error, recovery, startup, shutdown keys."""
         assert "error" in COLORS
@@ -316,6 +331,17 @@ class TestHealthTracker:
         tracker = HealthTracker(monitor=None)
         assert tracker.get_status() == {}
 
+    def test_get_stats_collects_registered_sources(self):
+        """get_stats() calls each registered source and skips failing ones."""
+        tracker = HealthTracker(monitor=None)
+        tracker.register_stats("frame_cache", lambda: {"hits": 1})
+
+        def broken():
+            raise RuntimeError("boom")
+
+        tracker.register_stats("broken", broken)
+        assert tracker.get_stats() == {"frame_cache": {"hits": 1}}
+
     def test_uptime_increases(self):
         """uptime_s property increases over time."""
         tracker = HealthTracker(monitor=None)
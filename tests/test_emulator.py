@@ -0,0 +1,125 @@
+"""Tests for the local Pixoo HTTP emulator, driven through a real PixooClient."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+from PIL import Image
+
+from src.device.emulator import PixooEmulator
+from src.device.payload import AnimationPayload, FramePayload
+from src.device.pixoo_client import PixooClient, PushResult
+
+
+@pytest.fixture
+def emulator():
+    with PixooEmulator(seed=1) as emu:
+        yield emu
+
+
+def _push(client: PixooClient, payload: FramePayload) -> PushResult:
+    client._last_push_time = 0.0  # bypass the 1s rate limit between test pushes
+    return client.push_frame(payload)
+
+
+@pytest.fixture
+def payload():
+    return FramePayload.from_image(Image.new("RGB", (64, 64), (10, 20, 30)))
+
+
+class TestEmulatedTransport:
+    def test_frames_are_recorded(self, emulator, payload):
+        client = PixooClient(ip=emulator.address)
+        assert _push(client, payload) is PushResult.SKIPPED  # the counter reset's slot
+        for _ in range(3):
+            assert _push(client, payload) is PushResult.SUCCESS
+        assert [f.pic_id for f in emulator.frames] == [1, 2, 3]
+        assert emulator.frames[0].to_image().getpixel((5, 5)) == (10, 20, 30)
+        assert "Draw/ResetHttpGifId" in emulator.commands
+
+    def test_animation_uploaded_in_one_request(self, emulator):
+        frames = tuple(
+            FramePayload.from_image(Image.new("RGB", (64, 64), (shade, 0, 0)))
+            for shade in (10, 20, 30)
+        )
+        client = PixooClient(ip=emulator.address)
+        animation = AnimationPayload(frames, speed_ms=333)
+
+        assert _push(client, animation) is PushResult.SKIPPED  # the counter reset's slot
+        assert _push(client, animation) is PushResult.SUCCESS
+
+        assert emulator.commands[-1] == "Draw/CommandList"
+        assert "Draw/SendHttpGif" not in emulator.commands
+        assert [(f.pic_num, f.offset, f.pic_id) for f in emulator.frames] == [
+            (3, 0, 1),
+            (3, 1, 1),
+            (3, 2, 1),
+        ]
+        assert emulator.frames[2].to_image().getpixel((0, 0)) == (30, 0, 0)
+
+    def test_brightness_and_ping(self, emulator):
+        client = PixooClient(ip=emulator.address)
+        client.set_brightness(40)
+        assert emulator.brightness == 40
+        assert client.ping() is PushResult.SUCCESS
+
+    def test_dropped_connection_is_a_push_error(self, payload):
+        with PixooEmulator() as emu:
+            client = PixooClient(ip=emu.address)
+            emu.drop_probability = 1.0
+            assert _push(client, payload) is PushResult.ERROR
+            assert emu.stats()["dropped"] == 1
+
+    def test_counter_reset_takes_its_own_push_slot(self, payload):
+        with PixooEmulator() as emu:
+            client = PixooClient(ip=emu.address)
+            emu.max_rate = 10.0
+            time.sleep(0.15)  # past the init requests
+            assert _push(client, payload) is PushResult.SKIPPED
+            time.sleep(0.15)  # the next push slot
+            assert _push(client, payload) is PushResult.SUCCESS
+            assert emu.stats()["rate_limited"] == 0
+            assert emu.commands[-2:] == ["Draw/ResetHttpGifId", "Draw/SendHttpGif"]
+
+    def test_requests_above_max_rate_are_dropped(self, payload):
+        with PixooEmulator() as emu:
+            client = PixooClient(ip=emu.address)
+            emu.max_rate = 0.5  # init requests were just made, so the next one is too fast
+            assert _push(client, payload) is PushResult.ERROR
+            assert emu.stats()["rate_limited"] >= 1
+
+
+class TestEmulatedFreeze:
+    @patch("src.device.pixoo_client._DEVICE_TIMEOUT", 0.3)
+    def test_freeze_times_out_until_reboot(self, payload):
+        with PixooEmulator(freeze_after=2) as emu:
+            client = PixooClient(ip=emu.address)
+            assert _push(client, payload) is PushResult.SKIPPED  # the counter reset's slot
+            assert _push(client, payload) is PushResult.SUCCESS
+            assert _push(client, payload) is PushResult.SUCCESS
+            assert emu.frozen
+            client._error_until = 0.0
+            assert _push(client, payload) is PushResult.ERROR
+
+            assert client.reboot() is True
+            assert not emu.frozen
+            client._error_until = 0.0
+            assert _push(client, payload) is PushResult.SKIPPED  # counter resync after the error
+            assert _push(client, payload) is PushResult.SUCCESS
+
+    def test_counter_reset_prevents_pic_id_lockup(self, payload):
+        """PixooClient resets PicID every 32 pushes, so the lockup never triggers."""
+        with PixooEmulator(pic_id_limit=40) as emu:
+            client = PixooClient(ip=emu.address)
+            results = [_push(client, payload) for _ in range(100)]
+            assert PushResult.ERROR not in results
+            assert not emu.frozen
+            assert max(f.pic_id for f in emu.frames) <= 32
+
+    def test_unreset_counter_reproduces_lockup(self, payload):
+        with PixooEmulator(pic_id_limit=40) as emu:
+            url = f"http://{emu.address}/post"
+            for pic_id in range(1, 42):
+                requests.post(url, data=payload.body(pic_id), timeout=5)
+            assert emu.frozen
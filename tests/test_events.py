@@ -0,0 +1,122 @@
+"""Tests for the memory-mapped structured event ring."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src import events
+from src.circuit_breaker import CircuitBreaker
+from src.events import EventLog, EventResult, EventType, read_events, summarize
+from src.staleness import StalenessTracker
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def ring(tmp_path):
+    log = EventLog(tmp_path / "events.ring", capacity=4)
+    previous = events.set_event_log(log)
+    yield log
+    events.set_event_log(previous)
+    log.close()
+
+
+class TestEventLog:
+    def test_round_trip(self, ring):
+        ring.record(EventType.PUSH, EventResult.ERROR, duration=0.25, value=3, source="10.0.0.2")
+        (ev,) = read_events(ring.path)
+        assert ev.event is EventType.PUSH
+        assert ev.result is EventResult.ERROR
+        assert ev.duration == pytest.approx(0.25)
+        assert ev.value == 3
+        assert ev.source == "10.0.0.2"
+
+    def test_wraps_keeping_newest(self, ring):
+        for i in range(6):
+            ring.record(EventType.PING, value=i)
+        assert [ev.value for ev in ring.events()] == [2, 3, 4, 5]
+        assert ring.written == 6
+
+    def test_reopen_appends(self, ring):
+        ring.record(EventType.PING, value=1)
+        reopened = EventLog(ring.path, capacity=4)
+        reopened.record(EventType.PING, value=2)
+        assert [ev.value for ev in read_events(ring.path)] == [1, 2]
+        reopened.close()
+
+    def test_capacity_change_recreates(self, ring):
+        ring.record(EventType.PING)
+        resized = EventLog(ring.path, capacity=8)
+        assert resized.events() == []
+        resized.close()
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "not-a-ring"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            read_events(path)
+
+    def test_survives_os_exit(self, tmp_path):
+        path = tmp_path / "events.ring"
+        code = (
+            "import os\n"
+            "from src.events import EventLog, EventType\n"
+            f"EventLog({str(path)!r}, 16).record(EventType.REBOOT, source='dev')\n"
+            "os._exit(1)\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], cwd=PROJECT_ROOT, check=False
+        )
+        assert result.returncode == 1
+        assert [ev.event for ev in read_events(path)] == [EventType.REBOOT]
+
+
+class TestModuleRecorder:
+    def test_noop_without_log(self):
+        previous = events.set_event_log(None)
+        try:
+            events.record(EventType.PUSH)  # must not raise
+        finally:
+            events.set_event_log(previous)
+
+    def test_circuit_breaker_transitions(self, ring):
+        breaker = CircuitBreaker("Bus API", failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        breaker.should_attempt()
+        breaker.record_success()
+        assert [ev.event for ev in ring.events()] == [
+            EventType.BREAKER_OPEN,
+            EventType.BREAKER_HALF_OPEN,
+            EventType.BREAKER_CLOSED,
+        ]
+        assert {ev.source for ev in ring.events()} == {"Bus API"}
+
+    def test_staleness_update_and_transition(self, ring, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("src.timesource.time.monotonic", lambda: clock[0])
+        tracker = StalenessTracker()
+        tracker.update_bus(([3], [5]))
+        tracker.get_effective_bus()  # fresh: first observation, no event
+        clock[0] += 10_000
+        tracker.get_effective_bus()  # now expired
+        kinds = [(ev.event, ev.source) for ev in ring.events()]
+        assert kinds == [(EventType.DATA_UPDATE, "bus"), (EventType.DATA_EXPIRED, "bus")]
+        assert ring.events()[-1].value == pytest.approx(10_000)
+
+
+class TestCli:
+    def test_summary(self, ring):
+        ring.record(EventType.PUSH, duration=0.1, source="a")
+        ring.record(EventType.PUSH, EventResult.ERROR, duration=0.3, source="a")
+        lines = summarize(ring.events())
+        assert lines[0].startswith("2 events from ")
+        assert "push" in lines[1] and "error=1 ok=1" in lines[1]
+
+    def test_dump_filters(self, ring, capsys):
+        ring.record(EventType.PING, source="a")
+        ring.record(EventType.PUSH, source="b")
+        events.main(["dump", str(ring.path), "--event", "push"])
+        out = capsys.readouterr().out.splitlines()
+        assert len(out) == 1 and " push " in out[0]
@@ -0,0 +1,156 @@
+"""Tests for multi-device fan-out (DeviceWorker / DeviceFanout)."""
+
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from src.device.fanout import DeviceFanout, DeviceWorker
+from src.device.keepalive import DeviceKeepAlive
+from src.device.payload import FramePayload
+from src.device.pixoo_client import PushResult
+from src.providers.discord_monitor import HealthTracker
+
+
+def _payload(color=(0, 0, 0)) -> FramePayload:
+    return FramePayload.from_image(Image.new("RGB", (64, 64), color))
+
+
+def _mock_client(result=PushResult.SUCCESS):
+    client = MagicMock()
+    client.push_frame.return_value = result
+    client.next_push_delay.return_value = 0.0
+    client.push_interval = 1.0
+    return client
+
+
+class TestDeviceWorker:
+    def test_latest_frame_wins(self):
+        client = _mock_client()
+        worker = DeviceWorker(client, "10.0.0.2")
+        first, second = _payload((1, 0, 0)), _payload((2, 0, 0))
+        worker.submit(first)
+        worker.submit(second)
+        worker.run_once()
+        client.push_frame.assert_called_once_with(second)
+        assert worker.dropped == 1
+        assert worker.pushed == 1
+
+    def test_no_pending_frame_does_not_push(self):
+        client = _mock_client()
+        worker = DeviceWorker(client, "10.0.0.2")
+        assert worker.run_once() is None
+        client.push_frame.assert_not_called()
+
+    def test_skipped_frame_is_retried(self):
+        client = _mock_client(PushResult.SKIPPED)
+        worker = DeviceWorker(client, "10.0.0.2")
+        payload = _payload()
+        worker.submit(payload)
+        worker.run_once()
+        client.push_frame.return_value = PushResult.SUCCESS
+        worker.run_once()
+        assert client.push_frame.call_count == 2
+        assert client.push_frame.call_args[0][0] is payload
+
+    def test_results_recorded_per_device(self):
+        tracker = HealthTracker(monitor=None)
+        ok = DeviceWorker(_mock_client(), "10.0.0.2", health_tracker=tracker)
+        bad = DeviceWorker(_mock_client(PushResult.ERROR), "10.0.0.3", health_tracker=tracker)
+        for worker in (ok, bad):
+            worker.submit(_payload())
+            worker.run_once()
+        status = tracker.get_status()
+        assert status["device:10.0.0.2"]["failure_count"] == 0
+        assert status["device:10.0.0.3"]["failure_count"] == 1
+        assert bad.keepalive.consecutive_failures == 1
+
+    def test_brightness_applied_from_worker(self):
+        client = _mock_client()
+        worker = DeviceWorker(client, "10.0.0.2")
+        worker.set_brightness(40)
+        worker.run_once()
+        client.set_brightness.assert_called_once_with(40)
+
+
+class TestDeviceFanout:
+    def test_slow_device_does_not_block_others(self):
+        release = threading.Event()
+        fast_done = threading.Event()
+
+        slow = _mock_client()
+        slow.push_frame.side_effect = lambda p: release.wait(5) and PushResult.SUCCESS
+        fast = _mock_client()
+        fast.push_frame.side_effect = lambda p: fast_done.set() or PushResult.SUCCESS
+
+        fanout = DeviceFanout({"slow": slow, "fast": fast})
+        fanout.start()
+        try:
+            fanout.submit(_payload())
+            assert fast_done.wait(2), "fast device was held back by the slow one"
+        finally:
+            release.set()
+            fanout.stop()
+
+    def test_submit_and_brightness_reach_every_worker(self):
+        fanout = DeviceFanout({"a": _mock_client(), "b": _mock_client()})
+        payload = _payload()
+        fanout.submit(payload)
+        fanout.set_brightness(20)
+        for worker in fanout.workers:
+            worker.run_once()
+            worker.client.push_frame.assert_called_once_with(payload)
+            worker.client.set_brightness.assert_called_once_with(20)
+
+    def test_stats_per_device(self):
+        fanout = DeviceFanout({"a": _mock_client()})
+        fanout.submit(_payload())
+        fanout.workers[0].run_once()
+        assert fanout.stats() == {
+            "a pushed": 1,
+            "a dropped": 0,
+            "a errors": 0,
+            "a interval_s": 1.0,
+        }
+
+
+class TestPerDeviceHealth:
+    def test_device_instances_share_device_debounce(self):
+        tracker = HealthTracker(monitor=None)
+        assert tracker._get_debounce("device:10.0.0.2") == tracker._get_debounce("device")
+
+    def test_keepalive_reports_under_its_component(self):
+        tracker = MagicMock()
+        client = MagicMock()
+        client.ping.return_value = PushResult.SUCCESS
+        keepalive = DeviceKeepAlive(component="device:10.0.0.2")
+        keepalive.last_success_time = 1.0
+        keepalive.tick(client, 1000.0, health_tracker=tracker)
+        tracker.record_success.assert_called_once_with("device:10.0.0.2")
+
+
+class TestMainLoopFanout:
+    @patch.dict(os.environ, {"TEST_WEATHER": "cloudy"})
+    @patch("src.dashboard_state.fetch_bus_data", return_value=(None, None))
+    @patch("src.dashboard_state.get_target_brightness", return_value=80)
+    @patch("src.main.render_frame", return_value=Image.new("RGB", (64, 64)))
+    def test_main_loop_submits_instead_of_pushing(self, mock_render, mock_bright, mock_bus):
+        """With a fan-out the loop renders once and never pushes synchronously."""
+        from src.main import main_loop
+
+        clients = {"a": _mock_client(), "b": _mock_client()}
+        fanout = DeviceFanout(clients)
+        with (
+            patch("src.main.timesource.wait", side_effect=KeyboardInterrupt),
+            patch("src.main.DashboardLoop.start_watchdog"),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            main_loop(fanout, {"small": MagicMock(), "tiny": MagicMock()})
+
+        for client in clients.values():
+            client.push_frame.assert_not_called()
+        for worker in fanout.workers:
+            assert worker._pending is not None
+            assert worker._brightness == 80
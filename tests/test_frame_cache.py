@@ -0,0 +1,71 @@
+"""Tests for the bounded rendered-frame cache."""
+
+import base64
+
+from PIL import Image
+
+from src.display.frame_cache import FrameCache
+from src.display.state import DisplayState
+
+
+def _state(time_str: str = "14:32") -> DisplayState:
+    return DisplayState(time_str=time_str, date_str="lor 21. mar")
+
+
+class TestStableHash:
+    def test_equal_states_have_equal_hash(self):
+        assert _state().stable_hash() == _state().stable_hash()
+
+    def test_different_states_have_different_hash(self):
+        assert _state("14:32").stable_hash() != _state("14:33").stable_hash()
+
+    def test_hash_covers_nested_tuples(self):
+        a = DisplayState(time_str="t", date_str="d", bus_direction1=(1, 2))
+        b = DisplayState(time_str="t", date_str="d", bus_direction1=(1, 3))
+        assert a.stable_hash() != b.stable_hash()
+
+
+class TestFrameCache:
+    def test_miss_then_hit(self):
+        cache = FrameCache(max_entries=4)
+        key = cache.key_for(_state())
+        assert cache.get(key) is None
+        image = Image.new("RGB", (64, 64))
+        cache.put(key, image)
+        entry = cache.get(key)
+        assert entry is not None and entry.image is image
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_animation_frame_id_is_part_of_key(self):
+        cache = FrameCache()
+        cache.put(cache.key_for(_state(), anim_frame_id=1), Image.new("RGB", (64, 64)))
+        assert cache.get(cache.key_for(_state(), anim_frame_id=2)) is None
+
+    def test_evicts_least_recently_used(self):
+        cache = FrameCache(max_entries=2)
+        keys = [cache.key_for(_state(f"00:0{i}")) for i in range(3)]
+        cache.put(keys[0], Image.new("RGB", (64, 64)))
+        cache.put(keys[1], Image.new("RGB", (64, 64)))
+        cache.get(keys[0])  # keys[1] is now least recently used
+        cache.put(keys[2], Image.new("RGB", (64, 64)))
+        assert len(cache) == 2
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+
+    def test_payload_is_base64_rgb_and_encoded_once(self):
+        cache = FrameCache()
+        image = Image.new("RGB", (64, 64), (1, 2, 3))
+        entry = cache.put(cache.key_for(_state()), image)
+        payload = entry.payload
+        assert base64.b64decode(payload.pic_data) == image.tobytes()
+        assert entry.payload is payload
+
+    def test_hit_rate(self):
+        cache = FrameCache()
+        key = cache.key_for(_state())
+        cache.get(key)
+        cache.put(key, Image.new("RGB", (64, 64)))
+        cache.get(key)
+        cache.get(key)
+        assert cache.stats()["hit_rate"] == 2 / 3
@@ -0,0 +1,117 @@
+"""Tests for the headless frame sink and background recorder."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from src.device.headless import FrameRecorder, HeadlessClient, read_raw_frames
+from src.device.payload import FramePayload
+from src.device.pixoo_client import PushResult
+
+
+def _frame(value: int) -> Image.Image:
+    return Image.new("RGB", (64, 64), (value, value, value))
+
+
+class TestHeadlessClient:
+    def test_ring_buffer_keeps_latest_frames(self):
+        client = HeadlessClient(ring_size=3)
+        for value in range(5):
+            assert client.push_frame(_frame(value)) is PushResult.SUCCESS
+        assert len(client.frames) == 3
+        assert [f.to_image().getpixel((0, 0))[0] for f in client.frames] == [2, 3, 4]
+        assert client.pushed == 5
+
+    def test_payload_stored_without_reencoding(self):
+        client = HeadlessClient(ring_size=2)
+        payload = FramePayload.from_image(_frame(9))
+        client.push_frame(payload)
+        assert client.frames[-1].payload is payload
+
+    def test_device_calls_are_harmless(self):
+        client = HeadlessClient(ring_size=2)
+        client.set_brightness(30)
+        assert client.brightness == 30
+        assert client.ping() is PushResult.SUCCESS
+        assert client.next_push_delay() == 0.0
+
+
+class TestFrameRecorder:
+    def test_raw_dump_round_trips(self, tmp_path):
+        path = tmp_path / "frames.raw"
+        client = HeadlessClient(ring_size=2, recorder=FrameRecorder(path))
+        for value in (10, 20, 30):
+            client.push_frame(_frame(value))
+        client.close()
+        frames = list(read_raw_frames(path))
+        assert [img.getpixel((1, 1)) for _, img in frames] == [(v, v, v) for v in (10, 20, 30)]
+        assert frames[0][0] <= frames[-1][0]
+
+    @pytest.mark.parametrize("suffix", [".gif", ".png"])
+    def test_animated_recording(self, tmp_path, suffix):
+        path = tmp_path / f"dash{suffix}"
+        client = HeadlessClient(ring_size=2, recorder=FrameRecorder(path))
+        for value in (0, 128, 255):
+            client.push_frame(_frame(value))
+        client.close()
+        with Image.open(path) as img:
+            assert img.n_frames == 3
+
+    def test_animated_recording_streams_frames_to_a_spool(self, tmp_path):
+        path = tmp_path / "dash.gif"
+        recorder = FrameRecorder(path)
+        client = HeadlessClient(ring_size=2, recorder=recorder)
+        for value in (10, 20):
+            client.push_frame(_frame(value))
+        deadline = time.monotonic() + 2
+        while recorder.written < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # On disk before close, so a crashed capture keeps its frames
+        assert recorder.spool_path == tmp_path / "dash.gif.raw"
+        assert recorder.spool_path.stat().st_size > 0
+        assert not path.exists()
+
+        client.close()
+        assert path.exists()
+        assert not recorder.spool_path.exists()
+
+    def test_empty_animated_recording_leaves_no_files(self, tmp_path):
+        recorder = FrameRecorder(tmp_path / "dash.png")
+        recorder.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unsupported_suffix_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            FrameRecorder(tmp_path / "frames.mp4")
+
+    def test_unwritable_path_raises_to_the_caller(self, tmp_path):
+        with pytest.raises(OSError):
+            FrameRecorder(tmp_path / "missing" / "frames.raw")
+
+    def test_close_returns_when_the_writer_died(self, tmp_path):
+        recorder = FrameRecorder(tmp_path / "frames.raw")
+        recorder._raw_file.close()  # writes now fail, killing the writer thread
+        client = HeadlessClient(ring_size=2, recorder=recorder)
+        with patch("threading.excepthook"):
+            client.push_frame(_frame(1))
+            recorder._thread.join(2)
+            for value in range(300):  # fill the queue nobody drains
+                client.push_frame(_frame(value))
+
+        closer = threading.Thread(target=recorder.close)
+        closer.start()
+        closer.join(2)
+        assert not closer.is_alive()
+        assert recorder.dropped > 0
+
+    def test_stats_report_recording(self, tmp_path):
+        client = HeadlessClient(ring_size=2, recorder=FrameRecorder(tmp_path / "f.raw"))
+        client.push_frame(_frame(1))
+        client.close()
+        stats = client.push_rate_stats()
+        assert stats["pushed"] == 1
+        assert stats["recorded"] == 1
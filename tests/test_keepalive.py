@@ -12,6 +12,8 @@ from PIL import Image
 from requests.exceptions import ConnectionError
 
 from src.device.pixoo_client import _ERROR_COOLDOWN_BASE, PixooClient, PushResult
+from src.device.rate_controller import AdaptivePushRate
+from src.metrics import DeviceMetrics
 
 
 @pytest.fixture
@@ -25,6 +27,8 @@ def client():
         c._error_until = 0.0
         c._ip = "192.168.0.193"
         c._current_cooldown = _ERROR_COOLDOWN_BASE
+        c._rate = AdaptivePushRate()
+        c.metrics = DeviceMetrics()
         return c
 
 
@@ -2,16 +2,22 @@
 
 Covers the helper functions (_reverse_geocode, _precip_category, _wind_category,
 _should_swap_animation, build_font_map), the watchdog thread, staleness logic,
-and TEST_WEATHER environment variable activation.
+TEST_WEATHER environment variable activation, the fast startup path and
+animation sub-frame batching and quality scaling.
 """
 
 import os
 import threading
 import time
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+import pytest
+from PIL import Image
+
 from src.device.pixoo_client import PushResult
 from src.main import (
+    DashboardLoop,
     _precip_category,
     _reverse_geocode,
     _should_swap_animation,
@@ -19,6 +25,7 @@ from src.main import (
     build_font_map,
 )
 from src.providers.weather import WeatherData
+from src.staleness import StalenessTracker
 from src.watchdog import Heartbeat
 from src.watchdog import watchdog_thread as _watchdog_thread
 
@@ -685,7 +692,7 @@ class TestTestWeatherMode:
     """Tests for TEST_WEATHER environment variable activation in main_loop.
 
     Since main_loop runs an infinite loop, we test it by letting exactly one
-    iteration execute, then breaking out via a side effect on time.sleep.
+    iteration execute, then breaking out via a side effect on timesource.wait.
     """
 
     def _make_mock_client(self):
@@ -693,6 +700,7 @@ class TestTestWeatherMode:
         client = MagicMock()
         client.push_frame.return_value = PushResult.SUCCESS
         client.set_brightness.return_value = None
+        client.push_interval = 1.0
         return client
 
     def _make_mock_fonts(self):
@@ -725,7 +733,7 @@ class TestTestWeatherMode:
         mock_state.__ne__ = lambda s, o: True
         mock_from_now.return_value = mock_state
 
-        mock_render.return_value = MagicMock()  # fake PIL Image
+        mock_render.return_value = Image.new("RGB", (64, 64))
         mock_get_anim.return_value = MagicMock()  # fake animation
         mock_get_anim.return_value.tick.return_value = MagicMock()  # fake frame
 
@@ -735,18 +743,15 @@ class TestTestWeatherMode:
         # Let one iteration run then break out
         call_count = [0]
 
-        def break_after_one(seconds):
+        def break_after_one(event, seconds):
             call_count[0] += 1
             if call_count[0] >= 1:
                 raise KeyboardInterrupt
 
         with (
-            patch("src.main.time.sleep", side_effect=break_after_one),
-            patch("src.main.threading.Thread") as mock_thread,
+            patch("src.main.timesource.wait", side_effect=break_after_one),
+            patch("src.main.DashboardLoop.start_watchdog"),
         ):
-            # Prevent watchdog thread from actually starting
-            mock_thread.return_value = MagicMock()
-
             try:
                 main_loop(client, fonts)
             except KeyboardInterrupt:
@@ -781,7 +786,7 @@ class TestTestWeatherMode:
         mock_state.__ne__ = lambda s, o: True
         mock_from_now.return_value = mock_state
 
-        mock_render.return_value = MagicMock()
+        mock_render.return_value = Image.new("RGB", (64, 64))
         mock_get_anim.return_value = MagicMock()
         mock_get_anim.return_value.tick.return_value = MagicMock()
 
@@ -790,18 +795,16 @@ class TestTestWeatherMode:
 
         call_count = [0]
 
-        def break_after_one(seconds):
+        def break_after_one(event, seconds):
             call_count[0] += 1
             if call_count[0] >= 1:
                 raise KeyboardInterrupt
 
         with (
-            patch("src.main.time.sleep", side_effect=break_after_one),
-            patch("src.main.threading.Thread") as mock_thread,
+            patch("src.main.timesource.wait", side_effect=break_after_one),
+            patch("src.main.DashboardLoop.start_watchdog"),
             patch("src.dashboard_state.fetch_weather_safe") as mock_weather_api,
         ):
-            mock_thread.return_value = MagicMock()
-
             try:
                 main_loop(client, fonts)
             except KeyboardInterrupt:
@@ -880,3 +883,394 @@ class TestTestWeatherMode:
             }
             assert mode in data, f"Missing test weather mode: {mode}"
             assert isinstance(data[mode], WeatherData)
+
+
+# ---------------------------------------------------------------------------
+# Fast startup path
+# ---------------------------------------------------------------------------
+
+
+def _no_data(*args):
+    return None
+
+
+class TestStartupPath:
+    """First paint before provider fetches, and deferred startup work."""
+
+    def _run_iterations(self, client, n, *, fetch_weather=None, **kwargs):
+        from src.main import main_loop
+
+        calls = [0]
+
+        def stop_after_n(event, seconds):
+            calls[0] += 1
+            if calls[0] >= n:
+                raise KeyboardInterrupt
+
+        stop_event = threading.Event()
+        with (
+            patch("src.main.timesource.wait", side_effect=stop_after_n),
+            patch("src.main.DashboardLoop.start_watchdog"),
+            patch("src.main.render_frame", return_value=Image.new("RGB", (64, 64))) as render,
+            patch("src.dashboard_state.get_target_brightness", return_value=80),
+            patch("src.dashboard_state.fetch_weather_safe", side_effect=fetch_weather or _no_data),
+        ):
+            try:
+                main_loop(
+                    client,
+                    {"small": MagicMock(), "tiny": MagicMock()},
+                    stop_event=stop_event,
+                    **kwargs,
+                )
+            except KeyboardInterrupt:
+                pass
+            finally:
+                stop_event.set()  # release the watchdog thread
+        return render
+
+    def test_first_frame_pushed_before_provider_fetch(self, make_client):
+        client = make_client()
+        pushes_at_fetch = []
+
+        def fetch(*args):
+            pushes_at_fetch.append(client.push_frame.call_count)
+
+        def fetch_bus():
+            fetch()
+            return None, None
+
+        with patch("src.dashboard_state.fetch_bus_data", side_effect=fetch_bus):
+            self._run_iterations(client, 1, fetch_weather=fetch)
+
+        assert len(pushes_at_fetch) == 2
+        assert min(pushes_at_fetch) == 1
+        # The placeholder is followed by the frame for the fetched (absent) data
+        assert client.push_frame.call_count == 2
+
+    def test_startup_fetches_on_helper_threads(self, make_client):
+        fetch_threads = []
+
+        def fetch_bus():
+            fetch_threads.append(threading.current_thread().name)
+            return [5, 12], [3]
+
+        def fetch_weather(*args):
+            fetch_threads.append(threading.current_thread().name)
+
+        with patch("src.dashboard_state.fetch_bus_data", side_effect=fetch_bus):
+            render = self._run_iterations(make_client(), 1, fetch_weather=fetch_weather)
+
+        assert sorted(fetch_threads) == ["startup-bus-fetch", "startup-weather-fetch"]
+        last_state = render.call_args_list[-1].args[0]
+        assert last_state.bus_direction1 == (5, 12)
+        assert not last_state.bus_stale
+
+    def test_faster_fetch_painted_without_waiting_for_the_slower(self, make_client):
+        weather_started = threading.Event()
+        release_weather = threading.Event()
+
+        def slow_weather(*args):
+            weather_started.set()
+            release_weather.wait(2)
+
+        paint_static = DashboardLoop.paint_static
+
+        def paint(loop, state, **kwargs):
+            if state.bus_direction1 == (5, 12) and weather_started.is_set():
+                release_weather.set()
+            return paint_static(loop, state, **kwargs)
+
+        with (
+            patch("src.dashboard_state.fetch_bus_data", return_value=([5, 12], [3])),
+            patch.object(DashboardLoop, "paint_static", paint),
+        ):
+            self._run_iterations(make_client(), 1, fetch_weather=slow_weather)
+
+        # Bus data painted while the weather fetch was still blocked
+        assert release_weather.is_set()
+
+    def test_results_applied_on_the_loop_thread(self, make_client):
+        applied_on = []
+        update_bus = StalenessTracker.update_bus
+
+        def record_thread(self, data):
+            applied_on.append(threading.current_thread())
+            update_bus(self, data)
+
+        with (
+            patch("src.dashboard_state.fetch_bus_data", return_value=([5], [3])),
+            patch.object(StalenessTracker, "update_bus", record_thread),
+        ):
+            self._run_iterations(make_client(), 1)
+
+        assert applied_on == [threading.current_thread()]
+
+    def test_snapshot_painted_first_and_saved(self, tmp_path, make_client):
+        path = tmp_path / "display_state.json"
+
+        with patch("src.dashboard_state.fetch_bus_data", return_value=([5, 12], [3])):
+            self._run_iterations(make_client(), 1, snapshot_path=path)
+        assert path.exists()
+
+        with patch("src.dashboard_state.fetch_bus_data", return_value=(None, None)):
+            render = self._run_iterations(make_client(), 1, snapshot_path=path)
+
+        first_state = render.call_args_list[0].args[0]
+        assert first_state.bus_direction1 == (5, 12)
+        assert first_state.bus_stale
+
+    def test_skipped_push_is_retried(self, make_client):
+        client = make_client()
+        client.push_frame.side_effect = [
+            PushResult.SUCCESS,  # first paint
+            PushResult.SKIPPED,  # startup repaint after the weather fetch
+            PushResult.SKIPPED,  # startup repaint after the bus fetch
+            PushResult.SKIPPED,  # first iteration, rate limited
+            PushResult.SUCCESS,
+            PushResult.SUCCESS,
+        ]
+
+        with (
+            patch("src.dashboard_state.fetch_bus_data", return_value=(None, None)),
+            patch("src.display.state.DisplayState.from_now") as from_now,
+        ):
+            from_now.return_value = MagicMock()
+            self._run_iterations(client, 3)
+
+        # Unchanged state, but the skipped frame is pushed on the next iteration
+        # (and not again on the third)
+        assert client.push_frame.call_count == 5
+
+    def test_startup_milestones_logged_after_first_frame(self, caplog, make_client):
+        marks = [("start", 0.0)]
+        with (
+            patch("src.dashboard_state.fetch_bus_data", return_value=(None, None)),
+            caplog.at_level("INFO", logger="src.main"),
+        ):
+            self._run_iterations(make_client(), 1, startup_marks=marks)
+
+        assert [label for label, _ in marks] == ["start", "first frame"]
+        assert any("Startup: first frame" in r.message for r in caplog.records)
+
+    def test_lazy_aliases_resolve_and_unknown_names_raise(self):
+        import src.main
+        from src.display.animation_selector import wind_category
+
+        assert src.main._wind_category is wind_category
+        with pytest.raises(AttributeError):
+            src.main._not_an_alias  # noqa: B018
+
+    def test_busy_metrics_port_disables_endpoint(self, caplog):
+        import socket
+
+        from src.main import _start_metrics_server
+        from src.metrics import StageTimings
+        from src.providers.discord_monitor import HealthTracker
+
+        with socket.socket() as busy:
+            busy.bind(("127.0.0.1", 0))
+            busy.listen()
+            port = busy.getsockname()[1]
+            registry = _start_metrics_server(HealthTracker(monitor=None), StageTimings(), port)
+
+        assert registry is None
+        assert any("Metrics endpoint disabled" in r.message for r in caplog.records)
+
+    @patch("src.config._get_keychain_secret", return_value="keychain-token")
+    def test_bot_token_skips_keychain_off_macos(self, mock_keychain):
+        from src.config import Config
+
+        with (
+            patch("src.config.sys.platform", "linux"),
+            patch.dict(os.environ, {"DISCORD_BOT_TOKEN": "env-token"}),
+        ):
+            resolved = Config().DISCORD_BOT_TOKEN
+        assert resolved == "env-token"
+        mock_keychain.assert_not_called()
+
+    @patch("src.config._get_keychain_secret", return_value="keychain-token")
+    def test_bot_token_prefers_keychain_on_macos_and_is_cached(self, mock_keychain):
+        from src.config import Config
+
+        cfg = Config()
+        with patch("src.config.sys.platform", "darwin"):
+            resolved = [cfg.DISCORD_BOT_TOKEN, cfg.DISCORD_BOT_TOKEN]
+        assert resolved == ["keychain-token"] * 2
+        mock_keychain.assert_called_once()
+
+
+class TestValidateConfig:
+    _VALID_ENV = {
+        "DIVOOM_IP": "192.168.1.50",
+        "BUS_QUAY_DIR1": "NSR:Quay:1",
+        "BUS_QUAY_DIR2": "NSR:Quay:2",
+        "WEATHER_LAT": "59.9",
+        "WEATHER_LON": "10.7",
+    }
+
+    def _validate(self, capsys, **env):
+        from src.config import Config, validate_config
+
+        with (
+            patch.dict(os.environ, {**self._VALID_ENV, **env}),
+            patch.object(Config, "_instance", None),
+        ):
+            Config._instance = Config()
+            try:
+                validate_config()
+            except SystemExit as exc:
+                return exc.code, capsys.readouterr().err
+        return 0, ""
+
+    def test_valid_config_passes(self, capsys):
+        assert self._validate(capsys, DIVOOM_MIN_PUSH_INTERVAL="0.5") == (0, "")
+
+    def test_non_numeric_push_interval_is_reported_not_raised(self, capsys):
+        code, err = self._validate(capsys, DIVOOM_MIN_PUSH_INTERVAL="fast")
+        assert code == 1
+        assert "DIVOOM_MIN_PUSH_INTERVAL (not a valid number: 'fast')" in err
+
+    def test_non_integer_subframes_is_reported_not_raised(self, capsys):
+        code, err = self._validate(capsys, ANIM_SUBFRAMES="2.5")
+        assert code == 1
+        assert "ANIM_SUBFRAMES (not a valid number: '2.5')" in err
+
+    @pytest.mark.parametrize(
+        ("value", "message"),
+        [
+            ("metrics", "METRICS_PORT (not a valid number: 'metrics')"),
+            ("70000", "METRICS_PORT (not a valid port: 70000)"),
+        ],
+    )
+    def test_bad_metrics_port_is_reported(self, capsys, value, message):
+        code, err = self._validate(capsys, METRICS_PORT=value)
+        assert code == 1
+        assert message in err
+
+    @pytest.mark.parametrize("value", ["0", "-1", "7.5"])
+    def test_push_interval_out_of_range(self, capsys, value):
+        code, err = self._validate(capsys, DIVOOM_MIN_PUSH_INTERVAL=value)
+        assert code == 1
+        assert "DIVOOM_MIN_PUSH_INTERVAL (must be > 0 and <= 5" in err
+
+
+# ---------------------------------------------------------------------------
+# Wake-up path for messages and rate-limited frames
+# ---------------------------------------------------------------------------
+
+
+class TestWakePath:
+    def _run(self, client, wait, **kwargs):
+        from src.main import main_loop
+
+        stop_event = threading.Event()
+        with (
+            patch("src.main.timesource.wait", side_effect=wait),
+            patch("src.main.timesource.sleep") as sleep,
+            patch("src.main.DashboardLoop.start_watchdog"),
+            patch("src.main.render_frame", return_value=Image.new("RGB", (64, 64))),
+            patch("src.dashboard_state.get_target_brightness", return_value=80),
+            patch("src.dashboard_state.fetch_bus_data", return_value=(None, None)),
+            patch("src.dashboard_state.fetch_weather_safe", side_effect=_no_data),
+        ):
+            try:
+                main_loop(
+                    client,
+                    {"small": MagicMock(), "tiny": MagicMock()},
+                    stop_event=stop_event,
+                    **kwargs,
+                )
+            except KeyboardInterrupt:
+                pass
+            finally:
+                stop_event.set()
+        return sleep
+
+    def test_message_wakes_loop_and_renders_in_next_push_slot(self, make_client):
+        from src.dashboard_state import DashboardState
+        from src.providers.discord_bot import MessageBridge
+
+        bridge = MessageBridge()
+        ds = DashboardState()
+        waits = []
+
+        def wait(event, seconds):
+            waits.append(seconds)
+            if len(waits) == 1:
+                bridge.set_message("hei")  # arrives mid-sleep
+                return event.is_set()
+            raise KeyboardInterrupt
+
+        sleep = self._run(
+            make_client(next_push_delay=0.4), wait, message_bridge=bridge, dashboard_state=ds
+        )
+
+        sleep.assert_called_once_with(0.4)
+        assert ds.last_state.message_text == "hei"
+        assert bridge._listeners == []  # unsubscribed on exit
+
+    def test_rate_limited_frame_retried_when_device_accepts(self, make_client):
+        client = make_client(next_push_delay=0.3)
+        client.push_frame.side_effect = [PushResult.SUCCESS] + [PushResult.SKIPPED] * 3
+        waits = []
+
+        def wait(event, seconds):
+            waits.append(seconds)
+            raise KeyboardInterrupt
+
+        self._run(client, wait)
+
+        assert waits == [0.3]
+
+
+class TestAnimatedStep:
+    def _step(self, client, substeps):
+        from src.display.weather_anim import RainAnimation
+        from src.main import DashboardLoop
+
+        loop = DashboardLoop(client, {"small": MagicMock(), "tiny": MagicMock()})
+        loop.substeps = substeps
+        loop.ds.weather_anim = RainAnimation(seed=4)
+        now = datetime(2026, 3, 1, 12, 0)
+        with (
+            patch("src.main.render_frame", return_value=Image.new("RGB", (64, 64))) as render,
+            patch("src.dashboard_state.get_target_brightness", return_value=80),
+        ):
+            loop.step(now, now.replace(tzinfo=timezone.utc))
+        return loop, render
+
+    def test_substeps_pushed_as_one_animation(self, make_client):
+        from src.device.payload import AnimationPayload
+
+        client = make_client()
+        loop, render = self._step(client, 4)
+
+        assert render.call_count == 4
+        assert loop.ds.renders == 4
+        client.push_frame.assert_called_once()
+        payload = client.push_frame.call_args.args[0]
+        assert isinstance(payload, AnimationPayload)
+        assert len(payload.frames) == 4 and payload.speed_ms == 250
+
+    def test_single_step_pushes_one_frame(self, make_client):
+        from src.device.payload import FramePayload
+
+        client = make_client()
+        _, render = self._step(client, 1)
+
+        assert render.call_count == 1
+        assert isinstance(client.push_frame.call_args.args[0], FramePayload)
+
+    def test_missed_deadline_scales_animation_down(self, make_client):
+        client = make_client()
+        client.push_interval = 1e-9  # every animated frame misses it
+        loop, _ = self._step(client, 1)
+        assert loop.anim_quality.level == 0.25
+
+        now = datetime(2026, 3, 1, 12, 0, 1)
+        with (
+            patch("src.main.render_frame", return_value=Image.new("RGB", (64, 64))),
+            patch("src.dashboard_state.get_target_brightness", return_value=80),
+        ):
+            loop.step(now, now.replace(tzinfo=timezone.utc))
+        assert loop.ds.weather_anim.quality == 0.25
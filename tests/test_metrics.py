@@ -0,0 +1,188 @@
+"""Tests for per-stage loop timings, Prometheus metrics and the local metrics endpoint."""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.circuit_breaker import CircuitBreaker
+from src.dashboard_metrics import register_dashboard_metrics
+from src.dashboard_state import DashboardState
+from src.device.headless import HeadlessClient
+from src.display.anim_quality import AdaptiveAnimationQuality
+from src.display.frame_cache import FrameCache
+from src.metrics import Histogram, MetricFamily, MetricsRegistry, StageTimings
+from src.metrics_server import MetricsServer
+from src.providers.discord_monitor import HealthTracker
+from src.staleness import StalenessTracker
+
+
+class TestStageTimings:
+    def test_disabled_records_nothing(self):
+        timings = StageTimings(enabled=False)
+        with timings.stage("render"):
+            pass
+        timings.record("push", 0.5)
+        assert timings.summary() == {}
+        assert timings.in_progress() is None
+
+    def test_percentiles_over_window(self):
+        timings = StageTimings(window=100)
+        for ms in range(1, 101):
+            timings.record("render", ms / 1000)
+        s = timings.summary()["render"]
+        assert s["count"] == 100
+        assert s["p50_ms"] == pytest.approx(50)
+        assert s["p95_ms"] == pytest.approx(95)
+        assert s["p99_ms"] == pytest.approx(99)
+        assert s["max_ms"] == pytest.approx(100)
+
+    def test_window_is_rolling_but_count_is_total(self):
+        timings = StageTimings(window=3)
+        for seconds in (9.0, 0.001, 0.001, 0.001):
+            timings.record("push", seconds)
+        s = timings.summary()["push"]
+        assert s["count"] == 4
+        assert s["max_ms"] == pytest.approx(1)
+
+    def test_stage_context_records_and_tracks_in_progress(self):
+        timings = StageTimings()
+        with timings.stage("anim_tick"):
+            name, running = timings.in_progress()
+            assert name == "anim_tick" and running >= 0
+        assert timings.in_progress() is None
+        assert timings.summary()["anim_tick"]["count"] == 1
+
+    def test_stats_are_flat_strings(self):
+        timings = StageTimings()
+        timings.record("render", 0.002)
+        assert timings.stats()["render"].startswith("p50 2.0 /")
+
+
+class TestMetricsServer:
+    @pytest.fixture
+    def server(self):
+        tracker = HealthTracker(monitor=None)
+        tracker.record_success("device")
+        tracker.register_stats("frame_cache", lambda: {"hits": 3})
+        timings = StageTimings()
+        timings.record("render", 0.004)
+        registry = MetricsRegistry()
+        registry.register(lambda: [MetricFamily("renders_total", "counter", "Renders").add(7)])
+        srv = MetricsServer(tracker, timings, port=0, registry=registry)
+        srv.start()
+        yield srv
+        srv.stop()
+
+    def test_metrics_json(self, server):
+        with urllib.request.urlopen(f"http://{server.address}/metrics.json", timeout=5) as resp:
+            data = json.loads(resp.read())
+        assert data["components"]["device"]["status"] == "ok"
+        assert data["stats"]["frame_cache"] == {"hits": 3}
+        assert data["stages"]["render"]["p50_ms"] == pytest.approx(4)
+        assert data["in_progress"] is None
+
+    def test_unknown_path_is_404(self, server):
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(f"http://{server.address}/nope", timeout=5)
+        assert exc_info.value.code == 404
+
+    def test_prometheus_text(self, server):
+        with urllib.request.urlopen(f"http://{server.address}/metrics", timeout=5) as resp:
+            assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            text = resp.read().decode()
+        assert "# TYPE pixoo_renders counter" in text
+        assert "pixoo_renders_total 7.0" in text
+
+    def test_prometheus_404_without_registry(self):
+        srv = MetricsServer(HealthTracker(monitor=None), StageTimings(), port=0)
+        srv.start()
+        try:
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(f"http://{srv.address}/metrics", timeout=5)
+            assert exc_info.value.code == 404
+        finally:
+            srv.stop()
+
+
+class TestHistogram:
+    def test_buckets_are_cumulative(self):
+        hist = Histogram((0.1, 0.5, 1.0))
+        for value in (0.05, 0.3, 0.3, 2.0):
+            hist.observe(value)
+        buckets, total, count = hist.snapshot()
+        assert buckets == [(0.1, 1), (0.5, 3), (1.0, 3)]
+        assert total == pytest.approx(2.65)
+        assert count == 4
+
+
+class TestMetricsRegistry:
+    def test_render_histogram_and_labels(self):
+        hist = Histogram((0.5,))
+        hist.observe(0.2)
+        registry = MetricsRegistry()
+        registry.register(
+            lambda: [
+                MetricFamily("push_latency_seconds", "histogram", "Latency").add_histogram(
+                    hist, device='a"b'
+                )
+            ]
+        )
+        lines = registry.render().splitlines()
+        assert lines[:2] == [
+            "# HELP pixoo_push_latency_seconds Latency",
+            "# TYPE pixoo_push_latency_seconds histogram",
+        ]
+        assert 'pixoo_push_latency_seconds_bucket{device="a\\"b",le="0.5"} 1.0' in lines
+        assert 'pixoo_push_latency_seconds_bucket{device="a\\"b",le="+Inf"} 1.0' in lines
+        assert 'pixoo_push_latency_seconds_count{device="a\\"b"} 1.0' in lines
+
+    def test_failing_collector_is_skipped(self):
+        registry = MetricsRegistry()
+        registry.register(lambda: 1 / 0)
+        registry.register(lambda: [MetricFamily("up", "gauge", "Up").add(1)])
+        assert registry.render() == "# HELP pixoo_up Up\n# TYPE pixoo_up gauge\npixoo_up 1.0\n"
+
+
+class TestDashboardMetrics:
+    def test_collects_loop_state(self):
+        client = HeadlessClient(ring_size=1)
+        client.metrics.record_result("success")
+        client.metrics.latency.observe(0.2)
+        client.metrics.reboots = 2
+        bus_breaker = CircuitBreaker("Bus API", failure_threshold=1)
+        bus_breaker.record_failure()
+        cache = FrameCache(4)
+        cache.get(("missing", None))
+        ds = DashboardState()
+        ds.iterations, ds.overruns = 10, 1
+        timings = StageTimings()
+        timings.record("render", 0.004)
+        registry = MetricsRegistry()
+        register_dashboard_metrics(
+            registry,
+            devices={"default": client},
+            breakers={"bus": bus_breaker, "weather": CircuitBreaker("Weather API")},
+            staleness=StalenessTracker(),
+            frame_cache=cache,
+            timings=timings,
+            dashboard_state=ds,
+            anim_quality=AdaptiveAnimationQuality(),
+            health_tracker=HealthTracker(monitor=None),
+        )
+        text = registry.render()
+        assert 'pixoo_pushes_total{device="default",result="success"} 1.0' in text
+        assert 'pixoo_pushes_total{device="default",result="error"} 0.0' in text
+        assert 'pixoo_push_latency_seconds_bucket{device="default",le="0.25"} 1.0' in text
+        assert 'pixoo_device_reboots_total{device="default"} 2.0' in text
+        assert 'pixoo_circuit_breaker_state{api="bus"} 2.0' in text
+        assert 'pixoo_circuit_breaker_state{api="weather"} 0.0' in text
+        assert 'pixoo_data_age_seconds{source="bus"} 0.0' in text
+        assert "pixoo_frame_cache_misses_total 1.0" in text
+        assert "pixoo_loop_iterations_total 10.0" in text
+        assert "pixoo_loop_overruns_total 1.0" in text
+        assert 'pixoo_stage_duration_seconds{stage="render",quantile="0.5"} 0.004' in text
+        assert 'pixoo_stage_duration_seconds_count{stage="render"} 1.0' in text
+        assert "pixoo_animation_quality 1.0" in text
+        assert 'pixoo_animation_quality_changes_total{direction="down"} 0.0' in text
@@ -5,13 +5,25 @@ Verifies that push_frame() and set_brightness() catch network errors
 crashing the process.
 """
 
+import base64
+import json
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 from PIL import Image
-from requests.exceptions import ConnectionError, ReadTimeout
+from requests.exceptions import ConnectionError, HTTPError, ReadTimeout
 
-from src.device.pixoo_client import _ERROR_COOLDOWN_BASE, PixooClient, PushResult
+from src.device.payload import FramePayload
+from src.device.pixoo_client import (
+    _ERROR_COOLDOWN_BASE,
+    _MIN_PUSH_INTERVAL,
+    _PIC_ID_REFRESH_LIMIT,
+    PixooClient,
+    PushResult,
+)
+from src.device.rate_controller import AdaptivePushRate
+from src.metrics import DeviceMetrics
 
 
 @pytest.fixture
@@ -25,6 +37,13 @@ def client():
         c._error_until = 0.0
         c._ip = "192.168.0.193"
         c._current_cooldown = _ERROR_COOLDOWN_BASE
+        c._rate = AdaptivePushRate()
+        c.metrics = DeviceMetrics()
+        c._http = MagicMock()
+        c._http.post.return_value.json.return_value = {"error_code": 0}
+        c._url = "http://192.168.0.193/post"
+        c._simulated = False
+        c._pic_id = None
         return c
 
 
@@ -394,3 +413,129 @@ class TestExponentialBackoff:
         client._error_until = 0.0
         client.ping()
         assert client._current_cooldown == 12.0
+
+
+class TestPushPayload:
+    """Pre-encoded FramePayloads are posted directly, bypassing draw_image/push."""
+
+    @staticmethod
+    def _posted(client) -> list[dict]:
+        return [json.loads(c.kwargs["data"]) for c in client._http.post.call_args_list]
+
+    def test_payload_body_is_valid_send_gif_json(self, test_image):
+        body = json.loads(FramePayload.from_image(test_image).body(7))
+        assert body["Command"] == "Draw/SendHttpGif"
+        assert body["PicID"] == 7
+        assert body["PicWidth"] == 64
+        assert base64.b64decode(body["PicData"]) == test_image.tobytes()
+
+    def test_payload_round_trips_to_image(self, test_image):
+        payload = FramePayload.from_image(test_image)
+        assert payload.to_image().tobytes() == test_image.tobytes()
+
+    def test_first_push_resets_device_counter(self, client, test_image):
+        payload = FramePayload.from_image(test_image)
+        assert client.push_frame(payload) is PushResult.SKIPPED
+        assert [p["Command"] for p in self._posted(client)] == ["Draw/ResetHttpGifId"]
+        client._last_push_time = 0.0
+        assert client.push_frame(payload) is PushResult.SUCCESS
+        assert self._posted(client)[1]["PicID"] == 1
+        client._pixoo.draw_image.assert_not_called()
+        client._pixoo.push.assert_not_called()
+
+    def test_counter_reset_uses_a_push_slot(self, client, test_image):
+        client.push_frame(FramePayload.from_image(test_image))
+        # The device drops a frame sent straight after the reset
+        assert client.next_push_delay() > 0
+        assert client.push_frame(FramePayload.from_image(test_image)) is PushResult.SKIPPED
+        assert client._http.post.call_count == 1
+
+    def test_pic_id_increments_without_reset(self, client, test_image):
+        payload = FramePayload.from_image(test_image)
+        for _ in range(3):
+            client._last_push_time = 0.0
+            client.push_frame(payload)
+        commands = [p["Command"] for p in self._posted(client)]
+        assert commands.count("Draw/ResetHttpGifId") == 1
+        assert self._posted(client)[-1]["PicID"] == 2
+
+    def test_counter_resets_at_refresh_limit(self, client, test_image):
+        client._pic_id = _PIC_ID_REFRESH_LIMIT
+        payload = FramePayload.from_image(test_image)
+        assert client.push_frame(payload) is PushResult.SKIPPED
+        client._last_push_time = 0.0
+        assert client.push_frame(payload) is PushResult.SUCCESS
+        posted = self._posted(client)
+        assert posted[0]["Command"] == "Draw/ResetHttpGifId"
+        assert posted[1]["PicID"] == 1
+
+    def test_error_forces_counter_resync(self, client, test_image):
+        client._pic_id = 5
+        client._http.post.side_effect = ConnectionError("refused")
+        result = client.push_frame(FramePayload.from_image(test_image))
+        assert result is PushResult.ERROR
+        assert client._pic_id is None
+
+    def test_rejected_payload_is_a_push_error(self, client, test_image, caplog):
+        client._pic_id = 5
+        client._http.post.return_value.json.return_value = {"error_code": 1}
+        result = client.push_frame(FramePayload.from_image(test_image))
+        assert result is PushResult.ERROR
+        assert "error_code 1" in caplog.text
+        assert client._error_until > 0
+        assert client._pic_id is None
+
+    def test_http_error_status_is_a_push_error(self, client, test_image):
+        client._pic_id = 5
+        client._http.post.return_value.raise_for_status.side_effect = HTTPError("500")
+        assert client.push_frame(FramePayload.from_image(test_image)) is PushResult.ERROR
+
+    def test_simulated_payload_uses_library_buffer(self, client, test_image):
+        client._simulated = True
+        client.push_frame(FramePayload.from_image(test_image))
+        drawn = client._pixoo.draw_image.call_args[0][0]
+        assert drawn.tobytes() == test_image.tobytes()
+        client._pixoo.push.assert_called_once()
+        client._http.post.assert_not_called()
+
+
+class TestAdaptivePushInterval:
+    """push_frame skips based on the adaptive controller's current interval."""
+
+    def test_error_widens_push_interval(self, client, test_image):
+        client._pixoo.push.side_effect = ConnectionError("refused")
+        client.push_frame(test_image)
+        assert client.push_interval > _MIN_PUSH_INTERVAL
+
+    def test_push_skipped_within_adaptive_interval(self, client, test_image):
+        client._rate.record_error()  # interval now 2x the floor
+        client._last_push_time = time.monotonic() - _MIN_PUSH_INTERVAL * 1.5
+        assert client.push_frame(test_image) is PushResult.SKIPPED
+
+    def test_slow_push_feeds_latency(self, client, test_image):
+        clock = iter([100.0, 100.0, 103.0])
+        with patch("src.device.pixoo_client.time.monotonic", side_effect=lambda: next(clock)):
+            client.push_frame(test_image)
+        assert client.push_rate_stats()["latency_ms"] == 3000
+        assert client.push_interval > _MIN_PUSH_INTERVAL
+
+
+class TestDeviceMetrics:
+    """push_frame and reboot feed the client's Prometheus counters."""
+
+    def test_push_results_counted(self, client, test_image):
+        client.push_frame(test_image)
+        client.push_frame(test_image)  # within the interval -> skipped
+        assert client.metrics.results == {"success": 1, "skipped": 1}
+        assert client.metrics.latency.snapshot()[2] == 1
+
+    def test_error_counted_without_latency(self, client, test_image):
+        client._pixoo.push.side_effect = ConnectionError("refused")
+        client.push_frame(test_image)
+        assert client.metrics.results == {"error": 1}
+        assert client.metrics.latency.snapshot()[2] == 0
+
+    def test_reboot_attempts_counted(self, client):
+        with patch("src.device.pixoo_client._requests_module.post", side_effect=OSError):
+            client.reboot()
+        assert client.metrics.reboots == 1
@@ -0,0 +1,98 @@
+"""Tests for the runtime sampling profiler."""
+
+import os
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+from src.profiler import SamplingProfiler, collapse_stack
+from src.providers.discord_bot import parse_profile_command
+
+
+def _busy_target(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class TestCollapseStack:
+    def test_root_first_leaf_last(self):
+        def inner():
+            return collapse_stack(sys._getframe())
+
+        stack = inner().split(";")
+        assert stack[-1].startswith("inner (test_profiler.py:")
+        assert stack[-2].startswith("test_root_first_leaf_last (test_profiler.py:")
+
+
+class TestSamplingProfiler:
+    def test_profiles_target_thread(self, tmp_path):
+        stop = threading.Event()
+        worker = threading.Thread(target=_busy_target, args=(stop,))
+        worker.start()
+        try:
+            profiler = SamplingProfiler(interval=0.001, output_dir=tmp_path, thread_id=worker.ident)
+            assert profiler.start(duration_s=0.2)
+            path = profiler.wait(timeout=5)
+        finally:
+            stop.set()
+            worker.join()
+        lines = path.read_text().splitlines()
+        assert path.parent == tmp_path and path.suffix == ".collapsed"
+        assert any("_busy_target (test_profiler.py:" in line for line in lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+
+    def test_stop_ends_profile_early(self, tmp_path):
+        profiler = SamplingProfiler(interval=0.001, output_dir=tmp_path)
+        profiler.start(duration_s=60)
+        assert profiler.running
+        profiler.stop()
+        assert profiler.wait(timeout=5) is not None
+        assert not profiler.running
+
+    def test_single_profile_at_a_time(self, tmp_path):
+        profiler = SamplingProfiler(interval=0.001, output_dir=tmp_path)
+        assert profiler.start(duration_s=60)
+        assert not profiler.start(duration_s=1)
+        profiler.toggle()  # stops the running profile
+        profiler.wait(timeout=5)
+        assert not profiler.running
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+    def test_signal_while_lock_held_does_not_deadlock(self, tmp_path):
+        profiler = SamplingProfiler(interval=0.001, output_dir=tmp_path)
+        previous = signal.getsignal(signal.SIGUSR1)
+        try:
+            profiler.toggle_on_signal(signal.SIGUSR1)
+            # As if the signal interrupted start() on the main thread
+            with profiler._lock:
+                os.kill(os.getpid(), signal.SIGUSR1)
+                time.sleep(0.05)  # let the handler run while the lock is held
+            deadline = time.monotonic() + 5
+            while not profiler.running and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert profiler.running
+
+            os.kill(os.getpid(), signal.SIGUSR1)
+            assert profiler.wait(timeout=5) is not None
+        finally:
+            signal.signal(signal.SIGUSR1, previous)
+            profiler.stop()
+
+
+class TestParseProfileCommand:
+    def test_default_duration(self):
+        assert parse_profile_command("profile") == 0.0
+        assert parse_profile_command("Profile") == 0.0
+
+    def test_explicit_duration(self):
+        assert parse_profile_command("profile 45") == 45.0
+
+    def test_rejects_other_messages(self):
+        assert parse_profile_command("status") is None
+        assert parse_profile_command("profile soon") is None
+        assert parse_profile_command("profile -5") is None
+        assert parse_profile_command("profile 5 10") is None
@@ -0,0 +1,55 @@
+"""Tests for the adaptive (AIMD) device push-rate controller."""
+
+import pytest
+
+from src.device.rate_controller import AdaptivePushRate
+
+
+class TestAdaptivePushRate:
+    def test_starts_at_floor(self):
+        rate = AdaptivePushRate(floor=1.0, ceiling=5.0, latency_target=0.5)
+        assert rate.interval == pytest.approx(1.0)
+
+    def test_error_halves_rate(self):
+        rate = AdaptivePushRate(floor=1.0, ceiling=5.0, latency_target=0.5)
+        rate.record_error()
+        assert rate.interval == pytest.approx(2.0)
+
+    def test_backoff_is_capped_at_ceiling(self):
+        rate = AdaptivePushRate(floor=1.0, ceiling=5.0, latency_target=0.5)
+        for _ in range(10):
+            rate.record_error()
+        assert rate.interval == pytest.approx(5.0)
+
+    def test_slow_pushes_back_off_before_errors(self):
+        """Rising latency alone slows the push rate (early congestion signal)."""
+        rate = AdaptivePushRate(floor=1.0, ceiling=5.0, latency_target=0.5)
+        rate.record_success(0.9)
+        assert rate.interval > 1.0
+        assert rate.stats()["decreases"] == 1
+
+    def test_healthy_pushes_recover_additively(self):
+        rate = AdaptivePushRate(floor=1.0, ceiling=5.0, latency_target=0.5)
+        rate.record_error()
+        before = rate.interval
+        rate.record_success(0.1)
+        assert 1.0 < rate.interval < before
+        for _ in range(100):
+            rate.record_success(0.1)
+        assert rate.interval == pytest.approx(1.0)
+
+    def test_latency_is_smoothed(self):
+        """One slow outlier among fast pushes does not trigger a back-off."""
+        rate = AdaptivePushRate(floor=1.0, ceiling=5.0, latency_target=0.5)
+        for _ in range(5):
+            rate.record_success(0.1)
+        rate.record_success(1.0)
+        assert rate.interval == pytest.approx(1.0)
+
+    def test_lower_floor_allows_faster_pushes(self):
+        rate = AdaptivePushRate(floor=0.25, ceiling=5.0, latency_target=0.5)
+        assert rate.interval == pytest.approx(0.25)
+
+    def test_invalid_bounds_rejected(self):
+        with pytest.raises(ValueError):
+            AdaptivePushRate(floor=2.0, ceiling=1.0)
@@ -8,6 +8,7 @@ from src.config import FONT_DIR, FONT_SMALL, FONT_TINY
 from src.display.fonts import load_fonts
 from src.display.layout import BUS_ZONE, COLOR_STALE_INDICATOR, WEATHER_ZONE
 from src.display.renderer import render_frame
+from src.display.sparse_layer import SparseLayer
 from src.display.state import DisplayState
 
 # Load actual fonts for integration testing
@@ -343,6 +344,15 @@ class TestWeatherZoneRendering:
         assert frame.size == (64, 64)
         assert frame.mode == "RGB"
 
+    def test_render_frame_accepts_sparse_anim_frame(self):
+        """Sparse layers are blitted into the weather zone like RGBA layers."""
+        state = DisplayState(time_str="14:32", date_str="lor 21. mar", weather_temp=8)
+        bg_layer = SparseLayer()
+        fg_layer = SparseLayer()
+        fg_layer.point((40, 20), fill=(50, 120, 255, 255))
+        frame = render_frame(state, FONTS, anim_frame=(bg_layer, fg_layer))
+        assert frame.getpixel((40, WEATHER_ZONE.y + 20)) == (50, 120, 255)
+
     def test_rain_indicator_with_precipitation(self):
         """Weather zone should show rain indicator when precip > 0."""
         state = DisplayState(
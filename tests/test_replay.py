@@ -0,0 +1,82 @@
+"""Tests for the time-compressed main-loop replay harness."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.config import FONT_DIR
+from src.main import build_font_map
+from src.replay import (
+    ScriptedResponses,
+    run_replay,
+    scripted_bus,
+    synthetic_bus,
+    synthetic_weather,
+)
+from src.timesource import Clock, SimulatedClock, get_clock
+
+START = datetime(2026, 3, 21, 6, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def fonts():
+    return build_font_map(FONT_DIR)
+
+
+def _no_weather(clock):
+    return lambda lat, lon: None
+
+
+class TestProviders:
+    def test_scripted_responses_hold_until_next_entry(self):
+        responses = ScriptedResponses([(60, "b"), (0, "a")])
+        assert responses.at(0) == "a"
+        assert responses.at(59.9) == "a"
+        assert responses.at(3600) == "b"
+
+    def test_scripted_bus_none_is_failure(self):
+        clock = SimulatedClock(START)
+        fetch = scripted_bus(clock, ScriptedResponses([(0, ([1], [2])), (60, None)]))
+        assert fetch() == ([1], [2])
+        clock.advance(60)
+        assert fetch() == (None, None)
+
+    def test_synthetic_bus_counts_down_and_has_outages(self):
+        clock = SimulatedClock(START)
+        fetch = synthetic_bus(clock, headway_min=10, outages=[(120, 180)])
+        assert fetch()[0] == [0, 10, 20]
+        clock.advance(60)
+        assert fetch()[0] == [9, 19, 29]
+        clock.advance(60)
+        assert fetch() == (None, None)
+
+    def test_synthetic_weather_follows_time_of_day(self):
+        clock = SimulatedClock(START, local_tz=timezone.utc)
+        fetch = synthetic_weather(clock)
+        morning = fetch(0, 0)
+        clock.advance(8 * 3600)  # 14:00
+        assert morning.symbol_code == "partlycloudy_night"
+        assert fetch(0, 0).symbol_code == "rain"
+
+
+class TestRunReplay:
+    def test_static_replay_renders_once_per_minute(self, fonts):
+        report = run_replay(2 * 3600, start=START, fonts=fonts, weather_fetcher=_no_weather)
+        assert report.simulated_s == pytest.approx(2 * 3600)
+        assert report.iterations == 2 * 3600
+        # Minute flips and bus countdown changes; static frames are cached
+        assert 120 <= report.renders <= 2 * 120
+        assert report.pushes >= report.renders
+        assert report.speedup > 100
+        assert report.cpu_s > 0
+
+    def test_animated_replay_renders_every_tick(self, fonts):
+        report = run_replay(300, start=START, fonts=fonts)
+        assert report.renders == report.iterations == 300
+        assert report.stages["render"]["count"] == 300
+        assert "anim_tick" in report.stages
+
+    def test_real_clock_restored(self, fonts):
+        run_replay(60, start=START, fonts=fonts, weather_fetcher=_no_weather)
+        clock = get_clock()
+        assert isinstance(clock, Clock) and not isinstance(clock, SimulatedClock)
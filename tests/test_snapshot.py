@@ -0,0 +1,108 @@
+"""Tests for the persisted display state painted at startup."""
+
+import json
+from datetime import datetime, timedelta
+
+from src.display.snapshot import load_snapshot, save_snapshot
+from src.display.state import DisplayState
+
+SAVED = datetime(2026, 3, 21, 14, 32, 10)
+
+
+def _state(**kwargs) -> DisplayState:
+    fields = dict(
+        time_str="14:32",
+        date_str="lor 21. mar",
+        bus_direction1=(5, 12),
+        bus_direction2=(1, 8),
+        weather_temp=7,
+        weather_symbol="rain",
+        weather_high=9,
+        weather_low=2,
+        weather_precip_mm=1.2,
+        message_text="hei",
+    )
+    fields.update(kwargs)
+    return DisplayState(**fields)
+
+
+def _save(tmp_path, state=None):
+    path = tmp_path / "display_state.json"
+    save_snapshot(state or _state(), path, SAVED.timestamp())
+    return path
+
+
+class TestLoadSnapshot:
+    def test_round_trip_marks_data_stale_and_uses_current_time(self, tmp_path):
+        path = _save(tmp_path)
+        now = SAVED + timedelta(seconds=20)
+
+        state = load_snapshot(path, now)
+
+        assert state.time_str == "14:32"
+        assert state.bus_direction1 == (5, 12)
+        assert state.weather_symbol == "rain"
+        assert state.bus_stale and state.weather_stale
+        assert not state.bus_too_old and not state.weather_too_old
+        assert state.message_text is None
+
+    def test_time_and_birthday_come_from_now(self, tmp_path):
+        path = _save(tmp_path)
+        state = load_snapshot(path, SAVED + timedelta(minutes=3), is_birthday=True)
+        assert state.time_str == "14:35"
+        assert state.is_birthday
+
+    def test_bus_countdowns_shift_by_elapsed_minutes(self, tmp_path):
+        path = _save(tmp_path)
+        state = load_snapshot(path, SAVED + timedelta(minutes=2, seconds=30))
+        assert state.bus_direction1 == (3, 10)
+        assert state.bus_direction2 == (6,)  # departed bus dropped
+
+    def test_old_bus_data_dropped_weather_kept(self, tmp_path):
+        path = _save(tmp_path)
+        state = load_snapshot(path, SAVED + timedelta(minutes=20))
+        assert state.bus_direction1 is None and state.bus_direction2 is None
+        assert state.bus_too_old and not state.bus_stale
+        assert state.weather_temp == 7 and state.weather_stale
+
+    def test_old_weather_data_dropped(self, tmp_path):
+        path = _save(tmp_path)
+        state = load_snapshot(path, SAVED + timedelta(hours=2))
+        assert state.weather_temp is None and state.weather_symbol is None
+        assert state.weather_too_old and not state.weather_stale
+
+    def test_missing_data_is_not_marked_stale(self, tmp_path):
+        path = _save(tmp_path, DisplayState(time_str="14:32", date_str="lor 21. mar"))
+        state = load_snapshot(path, SAVED)
+        assert not state.bus_stale and not state.weather_stale
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert load_snapshot(tmp_path / "nope.json", SAVED) is None
+
+    def test_corrupt_file_returns_none(self, tmp_path, caplog):
+        path = tmp_path / "display_state.json"
+        path.write_text("{not json")
+        assert load_snapshot(path, SAVED) is None
+        assert "unreadable display snapshot" in caplog.text
+
+    def test_unknown_fields_return_none(self, tmp_path):
+        path = _save(tmp_path)
+        data = json.loads(path.read_text())
+        data["state"]["renamed_field"] = 1
+        path.write_text(json.dumps(data))
+        assert load_snapshot(path, SAVED) is None
+
+    def test_other_version_returns_none(self, tmp_path):
+        path = _save(tmp_path)
+        data = json.loads(path.read_text())
+        data["version"] = 99
+        path.write_text(json.dumps(data))
+        assert load_snapshot(path, SAVED) is None
+
+
+class TestSaveSnapshot:
+    def test_replaces_atomically(self, tmp_path):
+        path = _save(tmp_path)
+        save_snapshot(_state(time_str="14:33"), path, SAVED.timestamp() + 60)
+        assert json.loads(path.read_text())["state"]["time_str"] == "14:33"
+        assert list(tmp_path.iterdir()) == [path]
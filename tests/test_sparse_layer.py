@@ -0,0 +1,155 @@
+"""Tests for sparse RGBA pixel layers and their use by particle animations."""
+
+import random
+
+from PIL import Image
+
+from src.display.sparse_layer import SparseLayer
+from src.display.weather_anim import (
+    ClearNightAnimation,
+    CompositeAnimation,
+    FogAnimation,
+    RainAnimation,
+    SnowAnimation,
+    SunAnimation,
+    WindEffect,
+)
+
+
+def _lit_positions(img: Image.Image) -> set[tuple[int, int]]:
+    """Return the (x, y) coordinates of all pixels with alpha > 0."""
+    alpha = img.split()[3]
+    return {(x, y) for y in range(img.height) for x in range(img.width) if alpha.getpixel((x, y))}
+
+
+class TestSparseLayer:
+    def test_point_records_pixel(self):
+        layer = SparseLayer()
+        layer.point((3, 4), fill=(10, 20, 30, 200))
+        assert list(layer) == [(3, 4, 10, 20, 30, 200)]
+
+    def test_point_outside_bounds_is_clipped(self):
+        layer = SparseLayer(64, 24)
+        layer.point((64, 0), fill=(255, 255, 255, 255))
+        layer.point((0, 24), fill=(255, 255, 255, 255))
+        layer.point((-1, 5), fill=(255, 255, 255, 255))
+        assert len(layer) == 0
+
+    def test_vertical_line_matches_imagedraw(self):
+        from PIL import ImageDraw
+
+        layer = SparseLayer()
+        layer.line([(5, 2), (5, 6)], fill=(1, 2, 3, 100))
+        img = Image.new("RGBA", (64, 24), (0, 0, 0, 0))
+        ImageDraw.Draw(img).line([(5, 2), (5, 6)], fill=(1, 2, 3, 100))
+        assert layer.to_image().tobytes() == img.tobytes()
+
+    def test_extend_concatenates_records(self):
+        a = SparseLayer()
+        b = SparseLayer()
+        a.point((1, 1), fill=(1, 1, 1, 1))
+        b.point((2, 2), fill=(2, 2, 2, 2))
+        a.extend(b)
+        assert len(a) == 2
+        assert list(a)[1] == (2, 2, 2, 2, 2, 2)
+
+    def test_composite_onto_matches_alpha_composite(self):
+        """Blitting onto an opaque frame matches PIL's alpha_composite result."""
+        layer = SparseLayer()
+        layer.point((10, 5), fill=(50, 120, 255, 230))
+        layer.point((11, 5), fill=(220, 230, 255, 100))
+        base = Image.new("RGB", (64, 64), (40, 40, 40))
+
+        expected_zone = Image.alpha_composite(
+            base.crop((0, 40, 64, 64)).convert("RGBA"), layer.to_image()
+        ).convert("RGB")
+
+        layer.composite_onto(base, (0, 40))
+        actual_zone = base.crop((0, 40, 64, 64))
+        for x, y in ((10, 5), (11, 5), (0, 0)):
+            got = actual_zone.getpixel((x, y))
+            want = expected_zone.getpixel((x, y))
+            assert all(abs(g - w) <= 1 for g, w in zip(got, want, strict=True))
+
+    def test_empty_layer_leaves_image_unchanged(self):
+        base = Image.new("RGB", (64, 64), (7, 8, 9))
+        SparseLayer().composite_onto(base, (0, 40))
+        assert base.getpixel((0, 40)) == (7, 8, 9)
+
+
+class TestScatter:
+    def test_one_record_per_lit_pixel_clipped(self):
+        layer = SparseLayer(4, 4)
+        layer.scatter([0, 1, 2, 9, -1], [0, 1, 2, 0, 0], (5, 6, 7), [10, 0, 30, 40, 50])
+        assert list(layer) == [(0, 0, 5, 6, 7, 10), (2, 2, 5, 6, 7, 30)]
+
+
+class TestSparseAnimations:
+    def test_particle_animations_support_sparse(self):
+        assert RainAnimation().supports_sparse
+        assert SnowAnimation().supports_sparse
+        assert ClearNightAnimation().supports_sparse
+
+    def test_shape_animations_do_not_support_sparse(self):
+        assert not SunAnimation().supports_sparse
+        assert not FogAnimation().supports_sparse
+
+    def test_tick_layers_falls_back_to_images(self):
+        bg, fg = SunAnimation().tick_layers()
+        assert isinstance(bg, Image.Image) and isinstance(fg, Image.Image)
+
+    def test_tick_layers_prefers_sparse(self):
+        bg, fg = RainAnimation().tick_layers()
+        assert isinstance(bg, SparseLayer) and isinstance(fg, SparseLayer)
+
+    def test_sparse_rain_lights_same_pixels_as_image_rain(self):
+        random.seed(1234)
+        img_bg, img_fg = RainAnimation(precipitation_mm=4.0).tick()
+        random.seed(1234)
+        sp_bg, sp_fg = RainAnimation(precipitation_mm=4.0).tick_sparse()
+        assert _lit_positions(sp_bg.to_image()) == _lit_positions(img_bg)
+        assert _lit_positions(sp_fg.to_image()) == _lit_positions(img_fg)
+
+    def test_sparse_night_lights_same_pixels_as_image_night(self):
+        random.seed(99)
+        anim_img = ClearNightAnimation()
+        for _ in range(10):
+            img_bg, img_fg = anim_img.tick()
+        random.seed(99)
+        anim_sparse = ClearNightAnimation()
+        for _ in range(10):
+            sp_bg, sp_fg = anim_sparse.tick_sparse()
+        assert _lit_positions(sp_bg.to_image()) == _lit_positions(img_bg)
+        assert _lit_positions(sp_fg.to_image()) == _lit_positions(img_fg)
+
+    def test_composite_merges_sparse_children(self):
+        comp = CompositeAnimation([RainAnimation(), SnowAnimation()])
+        assert comp.supports_sparse
+        bg, fg = comp.tick_sparse()
+        assert isinstance(bg, SparseLayer)
+        assert len(bg) > 0 and len(fg) > 0
+
+    def test_composite_with_fog_is_not_sparse(self):
+        comp = CompositeAnimation([RainAnimation(), FogAnimation()])
+        assert not comp.supports_sparse
+        bg, _ = comp.tick_layers()
+        assert isinstance(bg, Image.Image)
+
+    def test_wind_effect_drifts_sparse_particles(self):
+        rain = RainAnimation(precipitation_mm=2.0)
+        wind = WindEffect(rain, wind_speed=10.0, wind_direction=270.0)
+        assert wind.supports_sparse
+        initial_x = [d[0] for d in rain.far_drops]
+        for _ in range(5):
+            wind.tick_sparse()
+        assert [d[0] for d in rain.far_drops] != initial_x
+
+
+class TestFaded:
+    def test_scales_alpha_and_leaves_original(self):
+        layer = SparseLayer()
+        layer.point((1, 2), (10, 20, 30, 200))
+        layer.point((3, 4), (10, 20, 30, 255))
+        faded = layer.faded(0.5)
+        assert list(faded) == [(1, 2, 10, 20, 30, 100), (3, 4, 10, 20, 30, 128)]
+        assert [rec[5] for rec in layer] == [200, 255]
@@ -51,7 +51,7 @@ class TestBusStaleness:
     def test_bus_becomes_stale_over_time(self):
         st = StalenessTracker()
         base = 1000.0
-        mock_time = patch("src.staleness.time.monotonic")
+        mock_time = patch("src.timesource.time.monotonic")
         mono = mock_time.start()
         try:
             mono.return_value = base
@@ -68,7 +68,7 @@ class TestBusStaleness:
     def test_bus_becomes_too_old(self):
         st = StalenessTracker()
         base = 1000.0
-        mock_time = patch("src.staleness.time.monotonic")
+        mock_time = patch("src.timesource.time.monotonic")
         mono = mock_time.start()
         try:
             mono.return_value = base
@@ -86,7 +86,7 @@ class TestBusStaleness:
     def test_per_direction_staleness(self):
         st = StalenessTracker()
         base = 1000.0
-        mock_time = patch("src.staleness.time.monotonic")
+        mock_time = patch("src.timesource.time.monotonic")
         mono = mock_time.start()
         try:
             mono.return_value = base
@@ -131,7 +131,7 @@ class TestWeatherStaleness:
         st = StalenessTracker()
         wd = _make_weather()
         base = 1000.0
-        mock_time = patch("src.staleness.time.monotonic")
+        mock_time = patch("src.timesource.time.monotonic")
         mono = mock_time.start()
         try:
             mono.return_value = base
@@ -150,7 +150,7 @@ class TestWeatherStaleness:
         st = StalenessTracker()
         wd = _make_weather()
         base = 1000.0
-        mock_time = patch("src.staleness.time.monotonic")
+        mock_time = patch("src.timesource.time.monotonic")
         mono = mock_time.start()
         try:
             mono.return_value = base
@@ -168,7 +168,7 @@ class TestWeatherStaleness:
     def test_weather_update_refreshes_timestamp(self):
         st = StalenessTracker()
         base = 1000.0
-        mock_time = patch("src.staleness.time.monotonic")
+        mock_time = patch("src.timesource.time.monotonic")
         mono = mock_time.start()
         try:
             mono.return_value = base
@@ -0,0 +1,72 @@
+"""Tests for the injectable clock."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src import timesource
+from src.timesource import Clock, SimulatedClock, get_clock, set_clock
+
+START = datetime(2026, 3, 21, 12, 0, tzinfo=timezone.utc)
+
+
+class TestSimulatedClock:
+    def test_sleep_advances_instantly(self):
+        clock = SimulatedClock(START)
+        before = time.perf_counter()
+        clock.sleep(3600)
+        assert time.perf_counter() - before < 0.5
+        assert clock.elapsed == 3600
+        assert clock.now(timezone.utc) == START + timedelta(hours=1)
+
+    def test_wait_advances_unless_event_already_set(self):
+        clock = SimulatedClock(START)
+        event = threading.Event()
+        assert clock.wait(event, 2.5) is False
+        assert clock.elapsed == 2.5
+        event.set()
+        assert clock.wait(event, 2.5) is True
+        assert clock.elapsed == 2.5
+
+    def test_monotonic_starts_non_zero(self):
+        clock = SimulatedClock(START)
+        first = clock.monotonic()
+        clock.advance(5)
+        assert first > 0
+        assert clock.monotonic() == first + 5
+
+    def test_naive_now_uses_local_zone(self):
+        clock = SimulatedClock(START, local_tz=timezone(timedelta(hours=1)))
+        assert clock.now() == datetime(2026, 3, 21, 13, 0)
+
+    def test_rejects_naive_start_and_negative_advance(self):
+        with pytest.raises(ValueError):
+            SimulatedClock(datetime(2026, 1, 1))
+        with pytest.raises(ValueError):
+            SimulatedClock(START).advance(-1)
+
+
+class TestActiveClock:
+    def test_module_functions_follow_installed_clock(self):
+        clock = SimulatedClock(START)
+        previous = set_clock(clock)
+        try:
+            assert get_clock() is clock
+            timesource.sleep(90)
+            assert timesource.monotonic() == clock.monotonic()
+            assert timesource.now(timezone.utc) == START + timedelta(seconds=90)
+        finally:
+            set_clock(previous)
+        assert isinstance(get_clock(), Clock)
+        assert not isinstance(get_clock(), SimulatedClock)
+
+
+class TestRealClock:
+    def test_wait_returns_early_when_event_set(self):
+        event = threading.Event()
+        threading.Timer(0.01, event.set).start()
+        before = time.perf_counter()
+        assert timesource.wait(event, 5.0) is True
+        assert time.perf_counter() - before < 1.0
@@ -0,0 +1,146 @@
+"""Tests for cross-fade transitions between weather animations."""
+
+from datetime import datetime, timezone
+
+from PIL import Image
+
+from src import timesource
+from src.dashboard_state import DashboardState
+from src.display.sparse_layer import SparseLayer
+from src.display.transition import CrossFade
+from src.display.weather_anim import FogAnimation, RainAnimation, WeatherAnimation
+
+
+class _Dot(WeatherAnimation):
+    """One pixel at a fixed alpha; counts its frames."""
+
+    supports_sparse = True
+
+    def __init__(self, x: int) -> None:
+        super().__init__(seed=0)
+        self.x = x
+
+    def _draw(self, bg_draw, fg_draw) -> None:
+        bg_draw.point((self.x, 0), fill=(255, 255, 255, 200))
+        fg_draw.point((self.x, 1), fill=(255, 255, 255, 200))
+
+
+def _alphas(layer: SparseLayer) -> dict[int, int]:
+    return {x: a for x, _, _, _, _, a in layer}
+
+
+class TestCrossFade:
+    def test_blends_with_rising_incoming_weight_then_hands_over(self):
+        old, new = _Dot(1), _Dot(2)
+        fade = CrossFade(old, new, frames=4)
+        fade.prewarm()
+        assert new.frame == 4  # pre-warmed, not ticked during the fade
+
+        blended = [_alphas(fade.tick_layers()[0]) for _ in range(4)]
+        assert [b[2] for b in blended] == [40, 80, 120, 160]
+        assert [b[1] for b in blended] == [160, 120, 80, 40]
+        assert fade.finished
+
+        bg, _ = fade.tick_layers()
+        assert _alphas(bg) == {2: 200}
+        assert (old.frame, new.frame) == (4, 5)
+
+    def test_outgoing_plays_alone_until_prewarm_ready(self):
+        old, new = _Dot(1), _Dot(2)
+        fade = CrossFade(old, new, frames=2)
+        fade._prewarm_lock.acquire()  # pre-warm thread still busy
+        try:
+            waiting = [_alphas(fade.tick_layers()[0]) for _ in range(3)]
+        finally:
+            fade._prewarm_lock.release()
+
+        # The loop never waits for the pre-warm, nor computes it inline
+        assert waiting == [{1: 200}] * 3
+        fade.prewarm()  # joins the pre-warm started by the first tick
+        assert new.frame == 2
+        assert set(_alphas(fade.tick_layers()[0])) == {1, 2}
+
+    def test_over_budget_blend_is_not_started(self):
+        old, new = _Dot(1), _Dot(2)
+        fade = CrossFade(old, new, frames=4, budget_s=0.05)
+        fade.prewarm()
+        fade._blend_cost = 0.06  # measured on the previous frame
+
+        frames = [_alphas(fade.tick_layers()[0]) for _ in range(5)]
+
+        assert frames == [{2: 200}] * 5  # four pre-warmed frames, then live
+        assert old.frame == 0 and new.frame == 5
+        assert fade.finished
+
+    def test_blend_cost_measured_each_frame(self):
+        fade = CrossFade(_Dot(1), _Dot(2), frames=4, budget_s=0.05)
+        fade.prewarm()
+        first = _alphas(fade.tick_layers()[0])
+        assert set(first) == {1, 2}
+        assert 0 < fade._blend_cost < 0.05
+
+        fade.budget_s = fade._blend_cost / 2  # the next blend no longer fits
+        assert _alphas(fade.tick_layers()[0]) == {2: 200}
+        assert fade.finished is False  # two pre-warmed frames left
+
+    def test_background_prewarm(self):
+        fade = CrossFade(_Dot(1), _Dot(2), frames=3)
+        fade.start_prewarm()
+        fade.prewarm()  # waits for the thread
+        assert len(fade._prewarmed) == 3
+
+    def test_prewarm_inline_under_simulated_clock(self):
+        fade = CrossFade(_Dot(1), _Dot(2), frames=3)
+        previous = timesource.set_clock(
+            timesource.SimulatedClock(datetime(2026, 3, 1, tzinfo=timezone.utc))
+        )
+        try:
+            fade.start_prewarm()
+        finally:
+            timesource.set_clock(previous)
+        assert len(fade._prewarmed) == 3
+
+    def test_image_and_sparse_animations_blend_as_images(self):
+        fade = CrossFade(FogAnimation(seed=1), RainAnimation(seed=2), frames=2)
+        fade.prewarm()
+        assert not fade.supports_sparse
+        bg, fg = fade.tick()
+        assert isinstance(bg, Image.Image) and bg.mode == "RGBA"
+        assert isinstance(fg, Image.Image)
+
+    def test_substeps_only_once_finished(self):
+        fade = CrossFade(RainAnimation(seed=1), RainAnimation(seed=2), frames=1)
+        fade.prewarm()
+        assert not fade.supports_substeps
+        assert len(fade.tick_batch(4)) == 1
+        assert fade.finished and fade.supports_substeps
+        assert len(fade.tick_batch(4)) == 4
+
+    def test_snapshot_is_the_incoming_animation(self):
+        new = RainAnimation(seed=3)
+        fade = CrossFade(RainAnimation(seed=1), new)
+        assert fade.snapshot()["seed"] == 3
+
+
+class TestDashboardStateTransitions:
+    def test_first_animation_installed_directly_then_cross_faded(self):
+        ds = DashboardState()
+        first = _Dot(1)
+        ds.weather_anim = ds._transition_to(first)
+        assert ds.weather_anim is first
+
+        second = _Dot(2)
+        ds.weather_anim = ds._transition_to(second)
+        assert isinstance(ds.weather_anim, CrossFade)
+        assert ds.weather_anim.outgoing is first and ds.weather_anim.incoming is second
+
+    def test_finished_fade_is_unwrapped_on_next_swap(self):
+        ds = DashboardState()
+        ds.weather_anim = CrossFade(_Dot(1), _Dot(2), frames=1)
+        ds.weather_anim.prewarm()
+        ds.weather_anim.tick_layers()
+        assert ds.weather_anim.finished
+
+        previous_target = ds.weather_anim.incoming
+        fade = ds._transition_to(_Dot(3))
+        assert fade.outgoing is previous_target
@@ -1,10 +1,18 @@
 """Tests for the internal watchdog thread that detects hung main loops."""
 
+import json
 import threading
 import time
 from unittest.mock import patch
 
-from src.watchdog import Heartbeat
+from src.metrics import StageTimings
+from src.watchdog import (
+    Heartbeat,
+    capture_hang_report,
+    load_hang_report,
+    summarize_hang_report,
+    write_hang_report,
+)
 from src.watchdog import watchdog_thread as _watchdog_thread
 
 
@@ -61,3 +69,75 @@ class TestWatchdog:
         heartbeat = Heartbeat()
         t = threading.Thread(target=_watchdog_thread, args=(heartbeat,), daemon=True)
         assert t.daemon is True
+
+
+class TestHangReport:
+    """The watchdog leaves evidence of where the loop was stuck."""
+
+    def test_capture_includes_main_thread_and_stage(self):
+        timings = StageTimings()
+        timings.record("push", 0.2)
+        with timings.stage("bus_refresh"):
+            report = capture_hang_report(130.0, timings)
+        main = [t for t in report["threads"] if t["main"]]
+        assert len(main) == 1
+        assert main[0]["frames"][-1][2] == "capture_hang_report"
+        assert report["in_progress"]["stage"] == "bus_refresh"
+        assert report["recent_stages_ms"]["push"] == [200.0]
+        assert report["hung_s"] == 130.0
+
+    def test_write_then_load_once(self, tmp_path):
+        path = tmp_path / "hang_report.json"
+        write_hang_report({"hung_s": 125}, path)
+        assert load_hang_report(path) == {"hung_s": 125}
+        assert load_hang_report(path) is None
+        assert json.loads((tmp_path / "hang_report.json.prev").read_text()) == {"hung_s": 125}
+
+    def test_summary_names_stage_and_frames(self):
+        report = {
+            "time": "2026-03-01T03:12:44",
+            "hung_s": 125.0,
+            "in_progress": {"stage": "push", "running_s": 124.6},
+            "threads": [
+                {
+                    "name": "MainThread",
+                    "main": True,
+                    "frames": [
+                        ["main.py", 330, "main_loop"],
+                        ["pixoo_client.py", 201, "push_frame"],
+                    ],
+                },
+                {"name": "discord-bot", "main": False, "frames": [["x.py", 1, "run"]]},
+            ],
+            "recent_stages_ms": {"push": [120.0, 4000.0], "render": [3.0]},
+        }
+        summary = summarize_hang_report(report)
+        assert "hung 125.0s in stage 'push' (125s)" in summary
+        assert "MainThread: main_loop (main.py:330) > push_frame (pixoo_client.py:201)" in summary
+        assert "discord-bot" not in summary
+        assert "Slowest recent: push 4000ms, render 3ms" in summary
+
+    def test_watchdog_writes_report_before_exit(self, tmp_path):
+        heartbeat = Heartbeat()
+        heartbeat._timestamp = time.monotonic() - 200
+        path = tmp_path / "hang_report.json"
+
+        class _WatchdogFired(Exception):
+            pass
+
+        def mock_exit(code):
+            raise _WatchdogFired
+
+        with (
+            patch("src.watchdog.os._exit", side_effect=mock_exit),
+            patch("src.watchdog.os.kill"),
+            patch("src.watchdog.time.sleep", return_value=None),
+        ):
+            try:
+                _watchdog_thread(heartbeat, timeout=1.0, report_path=path)
+            except _WatchdogFired:
+                pass
+
+        report = json.loads(path.read_text())
+        assert report["hung_s"] >= 200
+        assert any(t["main"] for t in report["threads"])
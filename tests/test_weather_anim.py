@@ -10,12 +10,23 @@ to prevent weather text/particle color clashes from recurring.
 Animations return (bg_layer, fg_layer) tuples for 3D depth effect.
 """
 
+import json
 import math
+import random
 
-from PIL import Image
+import pytest
+from PIL import Image, ImageDraw
 
 from src.display.layout import COLOR_WEATHER_RAIN
+from src.display.sparse_layer import SparseLayer
 from src.display.weather_anim import (
+    _THUNDER_BANK_SEED,
+    NIGHT_FAR_STAR_COUNT,
+    SUN_NEAR_RAY_ALPHA,
+    SUN_RAY_ANGLE_STEP,
+    SUN_RAY_DISTANCE_STEP,
+    THUNDER_BOLT_VARIANTS,
+    THUNDER_STRIKE_ALPHA,
     ClearNightAnimation,
     CloudAnimation,
     CompositeAnimation,
@@ -25,6 +36,9 @@ from src.display.weather_anim import (
     SunAnimation,
     ThunderAnimation,
     WindEffect,
+    _generate_bolt,
+    _sun_ray_path,
+    _thunder_bolt_bank,
     get_animation,
 )
 
@@ -371,6 +385,10 @@ class TestNightAnimations:
             )
 
 
+def _star_count(anim: ClearNightAnimation) -> int:
+    return len(anim.far_stars["x"]) + len(anim.near_stars["x"])
+
+
 class TestStarRandomness:
     """Verify ClearNightAnimation produces organic, non-uniform twinkle patterns.
 
@@ -381,22 +399,18 @@ class TestStarRandomness:
     def test_stars_have_varied_peak_alphas(self):
         """Different stars should have different peak brightness levels."""
         anim = ClearNightAnimation()
-        peak_alphas = set()
-        for star in anim.far_stars + anim.near_stars:
-            peak_alphas.add(star["peak_alpha"])
-        # With 20 stars, random peak_alpha should produce at least 5 distinct values
+        peak_alphas = set(anim.far_stars["peak_alpha"] + anim.near_stars["peak_alpha"])
+        # With 20+ stars, random peak_alpha should produce at least 5 distinct values
         assert len(peak_alphas) >= 5, (
             f"Only {len(peak_alphas)} distinct peak alphas "
-            f"across {len(anim.far_stars) + len(anim.near_stars)} "
+            f"across {_star_count(anim)} "
             f"stars -- not enough variation"
         )
 
     def test_stars_have_varied_dark_durations(self):
         """Stars should have different dark (off) interval durations."""
         anim = ClearNightAnimation()
-        dark_durations = set()
-        for star in anim.far_stars + anim.near_stars:
-            dark_durations.add(star["dark_ticks"])
+        dark_durations = set(anim.far_stars["dark_ticks"] + anim.near_stars["dark_ticks"])
         # Should have at least 4 distinct dark durations
         assert len(dark_durations) >= 4, (
             f"Only {len(dark_durations)} distinct dark durations -- stars will blink too uniformly"
@@ -405,9 +419,7 @@ class TestStarRandomness:
     def test_stars_not_all_in_same_state(self):
         """At initialization, stars should be in different states (not all synchronized)."""
         anim = ClearNightAnimation()
-        states = set()
-        for star in anim.far_stars + anim.near_stars:
-            states.add(star["state"])
+        states = set(anim.far_stars["state"] + anim.near_stars["state"])
         # Should have at least 2 different states at init (ideally all 4)
         assert len(states) >= 2, (
             f"All stars start in same state ({states}) -- will look synchronized"
@@ -430,11 +442,11 @@ class TestStarRandomness:
                 for a in alpha_band.getdata():
                     if a > 0:
                         visible_count += 1
-            # Total star count: 14 far + 6 near = 20 stars
+            # Total star count: NIGHT_FAR_STAR_COUNT + NIGHT_NEAR_STAR_COUNT
             # If some are dark, visible_count < total star pixels at full brightness
-            # With 20 stars, if all were visible, we'd see 20+ pixels (near stars have cross arms)
+            # If all were visible, we'd see at least one pixel per star (near stars have arms)
             # If some are dark, we see fewer
-            total_stars = len(anim.far_stars) + len(anim.near_stars)
+            total_stars = _star_count(anim)
             if visible_count < total_stars:
                 found_mixed_frame = True
                 break
@@ -452,8 +464,7 @@ class TestStarRandomness:
         anim = ClearNightAnimation()
         # Track alpha values for one specific near star across 50 ticks
         # We do this by reading the pixel at the star's position from the fg layer
-        test_star = anim.near_stars[0]
-        x, y = test_star["x"], test_star["y"]
+        x, y = anim.near_stars["x"][0], anim.near_stars["y"][0]
         alphas_seen = set()
         for _ in range(50):
             bg, fg = anim.tick()
@@ -471,28 +482,31 @@ class TestStarRandomness:
         This ensures each blink cycle is different from the last.
         """
         anim = ClearNightAnimation()
-        star = anim.far_stars[0]
-        # Force star into a known state: start of DARK phase
-        star["state"] = ClearNightAnimation._DARK
-        star["timer"] = 1  # will transition to BRIGHTEN on next tick
-        initial_brighten = star["brighten_ticks"]
-        initial_peak = star["peak_ticks"]
-        initial_dim = star["dim_ticks"]
+        stars = anim.far_stars
+        # Force star 0 into a known state: end of DARK phase
+        stars["state"][0] = ClearNightAnimation._DARK
+        stars["timer"][0] = 1  # will transition to BRIGHTEN on next tick
+        initial_brighten = stars["brighten_ticks"][0]
+        initial_peak = stars["peak_ticks"][0]
+        initial_dim = stars["dim_ticks"][0]
 
         # Tick through: DARK(1) -> BRIGHTEN -> PEAK -> DIM -> DARK (re-randomized)
         max_ticks = 200  # safety limit
         for _ in range(max_ticks):
-            anim._tick_star(star, is_near=False)
+            anim._advance(stars, is_near=False)
             # Check if we've re-entered DARK (meaning one full cycle completed)
-            if star["state"] == ClearNightAnimation._DARK and star["timer"] == star["dark_ticks"]:
+            if (
+                stars["state"][0] == ClearNightAnimation._DARK
+                and stars["timer"][0] == stars["dark_ticks"][0]
+            ):
                 break
 
         # After a full cycle, durations should have been re-randomized
         # At least one duration should be different (probabilistically near-certain)
         changed = (
-            star["brighten_ticks"] != initial_brighten
-            or star["peak_ticks"] != initial_peak
-            or star["dim_ticks"] != initial_dim
+            stars["brighten_ticks"][0] != initial_brighten
+            or stars["peak_ticks"][0] != initial_peak
+            or stars["dim_ticks"][0] != initial_dim
         )
         # This could theoretically fail if random produces same values, but probability
         # is extremely low given the ranges involved
@@ -713,6 +727,140 @@ class TestRadialRays:
             "All ray distances identical -- should have random variation"
         )
 
+    def test_path_table_matches_polar_geometry(self):
+        """Table segments equal the head/tail computed from the angle directly."""
+        bucket, step = 40, 30  # 115 degrees, 7.5 px out
+        rad = math.radians(SunAnimation._FAN_MIN_DEG + bucket * SUN_RAY_ANGLE_STEP)
+        distance = step * SUN_RAY_DISTANCE_STEP
+        x = SunAnimation._SUN_X + math.cos(rad) * distance
+        y = SunAnimation._SUN_Y + math.sin(rad) * distance
+        tail = (int(x - math.cos(rad) * 3), int(y - math.sin(rad) * 3))
+
+        assert _sun_ray_path(64, 24, 3, bucket)[step] == (tail, (int(x), int(y)))
+
+    def test_path_table_marks_points_outside_the_zone(self):
+        # 95 degrees runs almost straight down: off the bottom before 30 px
+        path = _sun_ray_path(64, 24, 2, 0)
+        assert path[0] is not None
+        assert path[-1] is None
+
+    def test_sun_body_sprite_matches_drawn_ellipses(self):
+        anim = SunAnimation()
+        anim.far_rays.clear()
+        anim.near_rays.clear()
+        bg, _ = anim.tick()
+
+        expected = Image.new("RGBA", (64, 24), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(expected)
+        cx, cy, r = SunAnimation._SUN_X, SunAnimation._SUN_Y, SunAnimation._SUN_RADIUS
+        draw.ellipse([cx - r - 2, cy - r - 2, cx + r + 2, cy + r + 2], fill=(255, 200, 40, 60))
+        draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=(255, 220, 60, 200))
+        assert bg.tobytes() == expected.tobytes()
+
+    def test_respawn_keeps_the_ray_depth(self):
+        anim = SunAnimation(seed=4)
+        for ray in anim.near_rays:
+            ray[1] = ray[3]
+        anim.tick()
+        for ray in anim.near_rays:
+            assert ray[1] == 0.0
+            assert SUN_NEAR_RAY_ALPHA[0] <= ray[4] <= SUN_NEAR_RAY_ALPHA[1]
+
+
+class TestThunderStrikes:
+    """Verify the pre-rendered bolt bank and flash frames in ThunderAnimation."""
+
+    def _strike_frames(self, anim):
+        """Tick up to and through the first strike: (flash, afterglow, fade)."""
+        for _ in range(3):
+            anim.tick()
+        return [anim.tick() for _ in range(3)]
+
+    def test_bolt_sprites_match_drawn_segments(self):
+        rng = random.Random(_THUNDER_BANK_SEED)  # noqa: S311
+        for strike, afterglow, mask, offset in _thunder_bolt_bank(64, 24):
+            segments = _generate_bolt(rng, rng.randint(10, 54), 64, 24)
+            for sprite, alpha in ((strike, THUNDER_STRIKE_ALPHA), (afterglow, 150)):
+                drawn = Image.new("RGBA", (64, 24), (0, 0, 0, 0))
+                draw = ImageDraw.Draw(drawn)
+                for x1, y1, x2, y2 in segments:
+                    draw.line([(x1, y1), (x2, y2)], fill=(255, 255, 200, alpha))
+                pasted = Image.new("RGBA", (64, 24), (0, 0, 0, 0))
+                pasted.paste(sprite, offset, mask)
+                assert pasted.tobytes() == drawn.tobytes()
+
+    def test_strike_cycle_flash_afterglow_fade(self):
+        (flash_bg, strike_fg), (_, glow_fg), (fade_bg, _) = self._strike_frames(
+            ThunderAnimation(seed=2)
+        )
+        assert set(flash_bg.getdata()) == {(255, 255, 180, 120)}
+        assert set(fade_bg.getdata()) == {(200, 200, 150, 40)}
+        assert (255, 255, 200, THUNDER_STRIKE_ALPHA) in set(strike_fg.getdata())
+        assert (255, 255, 200, 150) in set(glow_fg.getdata())
+
+    def test_bolt_pick_follows_the_seed(self):
+        def picks(seed):
+            anim = ThunderAnimation(seed=seed)
+            indices = []
+            for _ in range(6):
+                for _ in range(4):  # one strike every fourth tick
+                    anim.tick()
+                indices.append(anim._bolt_index)
+            return indices
+
+        assert picks(3) == picks(3)
+        assert len({tuple(picks(seed)) for seed in range(6)}) > 1
+        assert all(0 <= i < THUNDER_BOLT_VARIANTS for i in picks(4))
+
+
+class TestScrollingTextures:
+    """Verify the wrap-around fog and cloud textures."""
+
+    def test_first_cloud_frame_matches_drawn_ellipses(self):
+        bg, _ = CloudAnimation(seed=1).tick()
+        expected = Image.new("RGBA", (64, 24), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(expected)
+        for x, y, w, h in ((5, 4, 12, 6), (40, 14, 10, 5)):
+            draw.ellipse([x, y, x + w, y + h], fill=(150, 160, 180, 90))
+            draw.ellipse([x + w // 3, y - 1, x + w + w // 3, y + h - 1], fill=(150, 160, 180, 70))
+        assert bg.getchannel("A").tobytes() == expected.getchannel("A").tobytes()
+
+    def test_half_pixel_offset_blends_neighbouring_columns(self):
+        anim = CloudAnimation(seed=1)
+        whole = anim._layer(anim.far_clouds, 10.0, (150, 160, 180), (90, 70))
+        half = anim._layer(anim.far_clouds, 10.5, (150, 160, 180), (90, 70))
+        nxt = anim._layer(anim.far_clouds, 11.0, (150, 160, 180), (90, 70))
+
+        assert half.tobytes() not in (whole.tobytes(), nxt.tobytes())
+        for x in range(64):
+            a, b, mid = (img.getpixel((x, 6))[3] for img in (whole, nxt, half))
+            assert abs(mid - (a + b) / 2) <= 1
+        # One colour per layer: blending only moves alpha
+        assert {px[:3] for px in half.getdata()} == {(150, 160, 180)}
+
+    def test_texture_wraps_around(self):
+        anim = CloudAnimation(seed=1)
+        period = anim._period(anim.far_clouds)
+        rgb, alphas = (150, 160, 180), (90, 70)
+        start = anim._layer(anim.far_clouds, 0.0, rgb, alphas)
+        wrapped = anim._layer(anim.far_clouds, period - 1.0, rgb, alphas)
+        assert wrapped.crop((1, 0, 64, 24)).tobytes() == start.crop((0, 0, 63, 24)).tobytes()
+
+    def test_clouds_drift_right_and_fog_left(self):
+        cloud = CloudAnimation(seed=1)
+        fog = FogAnimation(seed=1)
+        for _ in range(3):
+            cloud.tick()
+            fog.tick()
+        assert cloud.far_offset == pytest.approx(cloud._period(cloud.far_clouds) - 0.21)
+        assert fog.near_offset == pytest.approx(3 * fog.near_speed)
+
+    def test_fog_stays_right_of_the_text(self):
+        anim = FogAnimation(seed=4)
+        for _ in range(40):
+            for layer in anim.tick():
+                assert layer.crop((0, 0, FogAnimation._LEFT, 24)).getbbox() is None
+
 
 class TestSnowIntensity:
     """Verify snow particle count scales with precipitation amount."""
@@ -873,3 +1021,150 @@ class TestAnimationCombos:
     def test_backward_compat_no_wind_params(self):
         anim = get_animation("rain", precipitation_mm=2.0)
         assert isinstance(anim, RainAnimation)
+
+
+# Conditions covering every animation class and both wrappers
+_SEEDED_CASES = [
+    dict(weather_group="rain", precipitation_mm=6.0, wind_speed=8.0, wind_direction=270.0),
+    dict(weather_group="snow", precipitation_mm=2.0, wind_speed=4.0),
+    dict(weather_group="thunder", precipitation_mm=5.0),
+    dict(weather_group="clear"),
+    dict(weather_group="clear", is_night=True),
+    dict(weather_group="cloudy"),
+    dict(weather_group="fog"),
+]
+
+
+def _frames(anim, n):
+    return [tuple(layer.tobytes() for layer in anim.tick()) for _ in range(n)]
+
+
+def _layers(frames):
+    """Layer pairs (images or sparse records) as comparable bytes."""
+    return [
+        tuple(
+            (layer.to_image() if isinstance(layer, SparseLayer) else layer).tobytes()
+            for layer in pair
+        )
+        for pair in frames
+    ]
+
+
+class TestSeededAnimation:
+    @pytest.mark.parametrize("conditions", _SEEDED_CASES, ids=lambda c: c["weather_group"])
+    def test_same_seed_same_frames(self, conditions):
+        first = _frames(get_animation(**conditions, seed=42), 12)
+        second = _frames(get_animation(**conditions, seed=42), 12)
+        assert first == second
+
+    def test_different_seeds_differ(self):
+        first = _frames(get_animation("rain", precipitation_mm=2.0, seed=1), 3)
+        second = _frames(get_animation("rain", precipitation_mm=2.0, seed=2), 3)
+        assert first != second
+
+    @pytest.mark.parametrize("conditions", _SEEDED_CASES, ids=lambda c: c["weather_group"])
+    def test_restore_continues_identically(self, conditions):
+        original = get_animation(**conditions, seed=7)
+        _frames(original, 5)
+        saved = json.loads(json.dumps(original.snapshot()))
+        expected = _frames(original, 10)
+
+        resumed = get_animation(**conditions, seed=99)
+        resumed.restore(saved)
+
+        assert resumed.frame == 5
+        assert _frames(resumed, 10) == expected
+
+    def test_restore_rejects_other_kind(self):
+        snapshot = RainAnimation(seed=1).snapshot()
+        with pytest.raises(ValueError, match="RainAnimation"):
+            SnowAnimation(seed=1).restore(snapshot)
+        with pytest.raises(ValueError):
+            WindEffect(RainAnimation(seed=1), wind_speed=8.0).restore(snapshot)
+
+    def test_reset_replays_from_frame_zero(self):
+        anim = ClearNightAnimation(seed=3)
+        expected = _frames(anim, 8)
+        anim.reset()
+        assert _frames(anim, 8) == expected
+
+    def test_global_random_untouched(self):
+        before = random.getstate()
+        _frames(SunAnimation(seed=1), 20)
+        assert random.getstate() == before
+
+
+class TestSubstepBatch:
+    def test_single_step_matches_tick_layers(self):
+        batched, plain = RainAnimation(seed=5), RainAnimation(seed=5)
+        for _ in range(5):
+            assert _layers(batched.tick_batch(1)) == _layers([plain.tick_layers()])
+
+    def test_thunder_falls_back_to_single_frames(self):
+        anim = ThunderAnimation(seed=5)
+        assert len(anim.tick_batch(5)) == 1
+        assert anim.frame == 1
+
+    def test_substeps_split_one_tick_of_motion(self):
+        anim = RainAnimation(seed=5)
+        start = [drop[1] for drop in anim.far_drops]
+
+        frames = anim.tick_batch(5)
+
+        assert len(frames) == 5
+        for y0, drop in zip(start, anim.far_drops, strict=True):
+            if y0 < anim.height - 1:  # not wrapped to the top
+                assert drop[1] == pytest.approx(y0 + 1)
+        assert anim._dt == 1.0
+
+    def test_wind_drift_accumulates_across_substeps(self):
+        rain = RainAnimation(seed=5)
+        wind = WindEffect(rain, wind_speed=10.0, wind_direction=270.0)
+        assert wind.supports_substeps
+        wind.tick_batch(3)  # 2/3 px of drift per sub-step
+        assert any(drop[0] != int(drop[0]) for drop in rain.far_drops)
+
+    @pytest.mark.parametrize("conditions", _SEEDED_CASES, ids=lambda c: c["weather_group"])
+    def test_batches_are_deterministic(self, conditions):
+        first = get_animation(**conditions, seed=11).tick_batch(6)
+        second = get_animation(**conditions, seed=11).tick_batch(6)
+        assert _layers(first) == _layers(second)
+
+
+class TestStarField:
+    def test_fields_are_parallel_lists(self):
+        anim = ClearNightAnimation(seed=2)
+        for stars in (anim.far_stars, anim.near_stars):
+            assert len({len(values) for values in stars.values()}) == 1
+        for _ in range(40):
+            anim.tick_sparse()
+        assert len({len(values) for values in anim.near_stars.values()}) == 1
+
+    def test_phases_cycle_in_order(self):
+        anim = ClearNightAnimation(seed=2)
+        stars = anim.near_stars
+        stars["state"][0], stars["timer"][0] = ClearNightAnimation._DARK, 1
+        seen = [stars["state"][0]]
+        while len(seen) < 5:
+            anim._advance(stars, is_near=True)
+            if stars["state"][0] != seen[-1]:
+                seen.append(stars["state"][0])
+        assert seen == [0, 1, 2, 3, 0]
+
+    def test_brighten_alpha_rises_to_peak(self):
+        anim = ClearNightAnimation(seed=2)
+        stars = anim.near_stars
+        stars["state"][0] = ClearNightAnimation._BRIGHTEN
+        stars["brighten_ticks"][0] = stars["timer"][0] = 4
+        stars["peak_alpha"][0] = 200
+        alphas = [anim._advance(stars, is_near=True)[0] for _ in range(5)]
+        assert alphas == [0, 50, 100, 150, 200]
+
+    def test_quality_trims_every_field(self):
+        anim = ClearNightAnimation(seed=2)
+        anim.set_quality(0.5)
+        assert {len(values) for values in anim.far_stars.values()} == {
+            round(NIGHT_FAR_STAR_COUNT * 0.5)
+        }
+        anim.set_quality(1.0)
+        assert len(anim.far_stars["timer"]) == NIGHT_FAR_STAR_COUNT